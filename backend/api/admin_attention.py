@@ -26,6 +26,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from auth import require_admin
 from dao.admin_attention_dao import AdminAttentionDAO
 from dao.match_dao import SupabaseConnection as DbConnectionHolder
+from threadpool_route import ThreadpoolRoute
 
 logger = structlog.get_logger(__name__)
 
@@ -42,7 +43,7 @@ else:
 
 _dao = AdminAttentionDAO(_conn_holder)
 
-router = APIRouter(prefix="/api/admin/attention", tags=["admin-attention"])
+router = APIRouter(prefix="/api/admin/attention", tags=["admin-attention"], route_class=ThreadpoolRoute)
 
 
 class AttentionCounts(BaseModel):
@@ -35,6 +35,7 @@ from dao.email_messages_dao import EmailMessagesDAO
 from dao.email_threads_dao import EmailThreadsDAO
 from dao.match_dao import SupabaseConnection as DbConnectionHolder
 from services.email_outbound import send_admin_reply
+from threadpool_route import ThreadpoolRoute
 
 logger = structlog.get_logger(__name__)
 
@@ -55,7 +56,7 @@ else:
 _threads_dao = EmailThreadsDAO(_conn_holder)
 _messages_dao = EmailMessagesDAO(_conn_holder)
 
-router = APIRouter(prefix="/api/admin/emails", tags=["admin-emails"])
+router = APIRouter(prefix="/api/admin/emails", tags=["admin-emails"], route_class=ThreadpoolRoute)
 
 
 # ── Constants ────────────────────────────────────────────────────────────────
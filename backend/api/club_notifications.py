@@ -27,10 +27,11 @@ from pydantic import BaseModel, Field
 from auth import get_current_user_required
 from dao.club_notifications_dao import VALID_PLATFORMS, ClubNotificationsDAO
 from dao.match_dao import SupabaseConnection
+from threadpool_route import ThreadpoolRoute
 
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(prefix="/api/clubs", tags=["club-notifications"])
+router = APIRouter(prefix="/api/clubs", tags=["club-notifications"], route_class=ThreadpoolRoute)
 
 
 # ---------------------------------------------------------------------------
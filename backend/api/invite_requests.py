@@ -21,6 +21,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from auth import get_current_user_required
 from dao.match_dao import SupabaseConnection as DbConnectionHolder
 from services.email_service import EmailService
+from threadpool_route import ThreadpoolRoute
 
 # Initialize database connection with service role for admin operations
 supabase_url = os.getenv("SUPABASE_URL", "")
@@ -34,7 +35,7 @@ else:
     db_conn_holder_obj = DbConnectionHolder()
     service_client = db_conn_holder_obj.client
 
-router = APIRouter(prefix="/api/invite-requests", tags=["invite-requests"])
+router = APIRouter(prefix="/api/invite-requests", tags=["invite-requests"], route_class=ThreadpoolRoute)
 
 
 # Pydantic models
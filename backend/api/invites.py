@@ -17,6 +17,7 @@ logger = structlog.get_logger(__name__)
 from auth import get_current_user_required
 from dao.match_dao import SupabaseConnection as DbConnectionHolder
 from services import InviteService, TeamManagerService
+from threadpool_route import ThreadpoolRoute
 from supabase import create_client
 
 _service_client = None
@@ -51,7 +52,7 @@ class _ServiceClientProxy:
 
 service_client = _ServiceClientProxy()
 
-router = APIRouter(prefix="/api/invites", tags=["invites"])
+router = APIRouter(prefix="/api/invites", tags=["invites"], route_class=ThreadpoolRoute)
 
 
 # Pydantic models
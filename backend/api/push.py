@@ -42,10 +42,11 @@ from notifications.web_push_sender import (
 from notifications.web_push_sender import (
     send_push,
 )
+from threadpool_route import ThreadpoolRoute
 
 logger = structlog.get_logger(__name__)
 
-router = APIRouter(prefix="/api", tags=["push-notifications"])
+router = APIRouter(prefix="/api", tags=["push-notifications"], route_class=ThreadpoolRoute)
 
 
 # ---------------------------------------------------------------------------
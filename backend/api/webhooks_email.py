@@ -33,6 +33,7 @@ from services.email_inbound import (
     verify_webhook,
 )
 from services.email_service import ensure_resend_api_key
+from threadpool_route import ThreadpoolRoute
 
 logger = structlog.get_logger(__name__)
 
@@ -42,7 +43,7 @@ _db_conn = DbConnectionHolder()
 _threads_dao = EmailThreadsDAO(_db_conn)
 _messages_dao = EmailMessagesDAO(_db_conn)
 
-router = APIRouter(prefix="/api/webhooks", tags=["webhooks"])
+router = APIRouter(prefix="/api/webhooks", tags=["webhooks"], route_class=ThreadpoolRoute)
 
 _INBOUND_EVENT_TYPE = "email.received"
 
@@ -9,7 +9,9 @@ Provides a comprehensive client with:
 - Error handling
 """
 
+import json
 import logging
+from collections.abc import Iterator
 from typing import Any, TypeVar
 from urllib.parse import urljoin
 
@@ -378,8 +380,9 @@ class MissingTableClient:
         upcoming: bool | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Get matches (games) with optional filters."""
+        """Get matches (games) with optional filters, optionally only some fields."""
         params = {}
         if season_id is not None:
             params["season_id"] = season_id
@@ -399,24 +402,85 @@ class MissingTableClient:
             params["start_date"] = start_date
         if end_date is not None:
             params["end_date"] = end_date
+        if fields:
+            params["fields"] = ",".join(fields)
 
         response = self._request("GET", "/api/matches", params=params)
         return response.json()
 
+    def get_games_page(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        team_id: int | None = None,
+    ) -> dict[str, Any]:
+        """Get one page of matches, newest first; pass next_cursor back until it is None."""
+        params: dict[str, Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        if season_id is not None:
+            params["season_id"] = season_id
+        if age_group_id is not None:
+            params["age_group_id"] = age_group_id
+        if team_id is not None:
+            params["team_id"] = team_id
+
+        response = self._request("GET", "/api/matches", params=params)
+        return {"matches": response.json(), "next_cursor": response.headers.get("X-Next-Cursor")}
+
+    def iter_games(
+        self,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        team_id: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream every match, newest first, as NDJSON; for bulk exports of whole seasons."""
+        params: dict[str, Any] = {}
+        if season_id is not None:
+            params["season_id"] = season_id
+        if age_group_id is not None:
+            params["age_group_id"] = age_group_id
+        if team_id is not None:
+            params["team_id"] = team_id
+        if cursor is not None:
+            params["cursor"] = cursor
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        headers = {**self._get_headers(), "Accept": "application/x-ndjson"}
+        url = urljoin(self.base_url, "/api/matches")
+        with self._client.stream("GET", url, headers=headers, params=params) as response:
+            if not response.is_success:
+                response.read()
+                self._handle_response_error(response)
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
     def get_game(self, game_id: int) -> dict[str, Any]:
         """Get a specific match (game) by ID."""
         response = self._request("GET", f"/api/matches/{game_id}")
         return response.json()
 
     def get_games_by_team(
-        self, team_id: int, season_id: int | None = None, age_group_id: int | None = None
+        self,
+        team_id: int,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Get all matches (games) for a specific team."""
+        """Get all matches (games) for a specific team, optionally only some fields."""
         params = {}
         if season_id:
             params["season_id"] = season_id
         if age_group_id:
             params["age_group_id"] = age_group_id
+        if fields:
+            params["fields"] = ",".join(fields)
         response = self._request("GET", f"/api/matches/team/{team_id}", params=params)
         return response.json()
 
@@ -544,8 +608,9 @@ class MissingTableClient:
         age_group_id: int | None = None,
         game_type_id: int | None = None,
         division_id: int | None = None,
+        as_of: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Get league standings table."""
+        """Get league standings table, optionally as it stood on a date (YYYY-MM-DD)."""
         params = {}
         if season_id is not None:
             params["season_id"] = season_id
@@ -555,10 +620,21 @@ class MissingTableClient:
             params["game_type_id"] = game_type_id
         if division_id is not None:
             params["division_id"] = division_id
+        if as_of is not None:
+            params["as_of"] = as_of
 
         response = self._request("GET", "/api/table", params=params)
         return response.json()
 
+    def get_all_tables(self, season_id: int | None = None) -> dict[str, Any]:
+        """Get the league table of every age group, division and match type in a season."""
+        params = {}
+        if season_id is not None:
+            params["season_id"] = season_id
+
+        response = self._request("GET", "/api/table/all", params=params)
+        return response.json()
+
     # Admin endpoints
 
     def get_users(self) -> list[dict[str, Any]]:
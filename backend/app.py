@@ -1,12 +1,17 @@
 import asyncio
+import hashlib
+import inspect
+import json
 import os
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable, Iterable, Iterator
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
 import httpx
 from dotenv import load_dotenv
 from fastapi import BackgroundTasks, Depends, FastAPI, File, HTTPException, Query, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials
 from gotrue.errors import AuthApiError
 from pydantic import BaseModel
@@ -34,7 +39,8 @@ from auth import (
 )
 from constants.positions import PLAYER_POSITIONS
 from csrf_protection import provide_csrf_token
-from middleware import TraceMiddleware
+from json_responses import FastJSONResponse, etag_matches, payload_response
+from middleware import CachedRoute, ResponseCacheMiddleware, TraceMiddleware
 from models import (
     AdminPlayerTeamAssignment,
     AdminPlayerUpdate,
@@ -90,23 +96,32 @@ from models import (
 from notifications.score_change import is_new_final_score
 from notifications.tasks import notify_event_task
 from services import EmailService, InviteService
+from threadpool_route import ThreadpoolRoute, in_threadpool
 
 # Legacy flag kept for backwards compatibility so existing envs keep working.
 DISABLE_SECURITY = os.getenv("DISABLE_SECURITY", "false").lower() == "true"
 
+from dao import cache_codec
+from dao.async_base_dao import AsyncSupabaseConnection, ThreadpoolDAO, offload
+from dao.async_cache import async_cache_get_payload, async_cache_set_payload, async_get_data_versions
+from dao.async_match_dao import AsyncMatchDAO
+from dao.async_team_dao import AsyncTeamDAO
 from dao.audit_dao import AuditDAO
+from dao.base_dao import get_cache_computed_at, get_data_versions
 from dao.club_dao import ClubDAO
 from dao.exceptions import DuplicateRecordError
 from dao.league_dao import LeagueDAO
 from dao.lineup_dao import LineupDAO
-from dao.match_dao import MatchDAO
+from dao.match_dao import MatchDAO, decode_match_cursor
 from dao.match_dao import SupabaseConnection as DbConnectionHolder
 from dao.match_event_dao import MatchEventDAO
+from dao.match_fields import CARD_FIELDS, parse_match_fields
 from dao.match_type_dao import MatchTypeDAO
 from dao.player_dao import PlayerDAO
 from dao.player_stats_dao import PlayerStatsDAO
 from dao.playoff_dao import PlayoffDAO
 from dao.qop_rankings_dao import QoPRankingsDAO
+from dao.query_group import ENRICHMENT_TIMEOUT_SECONDS, QueryGroup
 from dao.roster_dao import RosterDAO
 from dao.season_dao import SeasonDAO
 from dao.team_dao import TeamDAO
@@ -142,6 +157,10 @@ logger = get_logger(__name__)
 
 app = FastAPI(title="Enhanced Sports League API", version="2.0.0")
 
+# async def routes that never await only call sync DAOs: run them in the
+# threadpool so their database round trips do not block the event loop
+app.router.route_class = ThreadpoolRoute
+
 # Setup Prometheus metrics - exposes /metrics endpoint for Grafana
 from metrics_config import setup_metrics
 
@@ -195,12 +214,48 @@ def get_cors_origins():
 
 origins = get_cors_origins()
 
+# Response cache for public reads (middleware/response_cache.py). Each route
+# lists the cache families it reads; their data versions retire its entries.
+RESPONSE_CACHE_ROUTES = [
+    CachedRoute(r"/api/table", ("matches", "teams", "seasons", "qop"), ttl=300),
+    CachedRoute(r"/api/table/all", ("matches", "teams", "seasons"), ttl=300),
+    CachedRoute(r"/api/playoffs/bracket", ("playoffs", "matches", "teams"), ttl=300),
+    CachedRoute(r"/api/leaderboards/goals", ("stats", "matches", "players"), ttl=300),
+    CachedRoute(r"/api/clubs", ("clubs", "teams"), ttl=600),
+    CachedRoute(r"/api/tournaments", ("tournaments", "matches", "teams"), ttl=300, public=True),
+    CachedRoute(r"/api/tournaments/\d+", ("tournaments", "matches", "teams"), ttl=300, public=True),
+]
+
+
+def _response_cache_audience(request: Request, public: bool) -> str | None:
+    """Response cache partition of a request: "test" or "real" (viewer_sees_test_content).
+
+    Anonymous requests are "real" on public routes. Signed-in viewers are
+    partitioned from their (checked) token and the audience auth_manager
+    remembers for them; None sends the request to the route uncached.
+    """
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return "real" if public else None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    sees_test = auth_manager.viewer_audience(token)
+    if sees_test is None:
+        return None
+    return "test" if sees_test else "real"
+
+
+# Added before CORS so CORS headers are set per request, not replayed from the cache
+app.add_middleware(ResponseCacheMiddleware, routes=RESPONSE_CACHE_ROUTES, audience=_response_cache_audience)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Cache-Computed-At", "X-Next-Cursor"],
 )
 
 # Add trace middleware for distributed logging (session_id, request_id)
@@ -235,6 +290,12 @@ playoff_dao = PlayoffDAO(db_conn_holder_obj)
 audit_dao = AuditDAO(db_conn_holder_obj)
 tournament_dao = TournamentDAO(db_conn_holder_obj)
 
+# Async DAOs for the hot read paths (dao/async_base_dao.py). Async routes reach
+# the other DAOs through ThreadpoolDAO.
+async_db_conn_holder_obj = AsyncSupabaseConnection(db_conn_holder_obj)
+async_match_dao = AsyncMatchDAO(async_db_conn_holder_obj)
+async_team_dao = AsyncTeamDAO(async_db_conn_holder_obj)
+
 
 # === Simple Redis Caching ===
 # Initialize Authentication Manager with a dedicated service client
@@ -331,11 +392,11 @@ async def _update_existing_user_role(user_data, invite_info, audit_logger):
         logger.info(f"Updating existing user {user_data.username} role via invite code")
 
         # Get the user's ID from user_profiles
-        existing_profile = player_dao.get_user_profile_by_username(user_data.username)
+        existing_profile = await offload(player_dao.get_user_profile_by_username, user_data.username)
         if not existing_profile:
             # Try to find by internal email in auth.users
             internal_email = username_to_internal_email(user_data.username)
-            auth_response = auth_service_client.auth.admin.list_users()
+            auth_response = await offload(auth_service_client.auth.admin.list_users)
             existing_user = None
             for user in auth_response:
                 if user.email == internal_email:
@@ -358,11 +419,11 @@ async def _update_existing_user_role(user_data, invite_info, audit_logger):
             "team_id": invite_info.get("team_id"),
             "club_id": invite_info.get("club_id"),
         }
-        player_dao.update_user_profile(user_id, update_data)
+        await offload(player_dao.update_user_profile, user_id, update_data)
 
         # Redeem the invitation
         invite_service = InviteService(db_conn_holder_obj.client)
-        invite_service.redeem_invitation(user_data.invite_code, user_id)
+        await offload(invite_service.redeem_invitation, user_data.invite_code, user_id)
 
         logger.info(f"Updated existing user {user_id} role to {new_role} via invite code")
         audit_logger.info("auth_role_update_success", user_id=user_id, new_role=new_role)
@@ -394,7 +455,7 @@ async def signup(request: Request, user_data: UserSignup):
         invite_info = None
         if user_data.invite_code:
             invite_service = InviteService(db_conn_holder_obj.client)
-            invite_info = invite_service.validate_invite_code(user_data.invite_code)
+            invite_info = await offload(invite_service.validate_invite_code, user_data.invite_code)
             if not invite_info:
                 raise HTTPException(status_code=400, detail="Invalid or expired invite code")
 
@@ -433,7 +494,8 @@ async def signup(request: Request, user_data: UserSignup):
 
         # Create Supabase Auth user with internal email
         # Use auth_ops_client to avoid modifying the match_dao client
-        response = auth_ops_client.auth.sign_up(
+        response = await offload(
+            auth_ops_client.auth.sign_up,
             {
                 "email": internal_email,
                 "password": user_data.password,
@@ -444,7 +506,7 @@ async def signup(request: Request, user_data: UserSignup):
                         "is_username_auth": True,
                     }
                 },
-            }
+            },
         )
 
         if response.user:
@@ -467,11 +529,11 @@ async def signup(request: Request, user_data: UserSignup):
                 profile_data["club_id"] = invite_info.get("club_id")
 
             # Insert user profile
-            player_dao.create_or_update_user_profile(profile_data)
+            await offload(player_dao.create_or_update_user_profile, profile_data)
 
             # Redeem invitation if used
             if invite_info:
-                invite_service.redeem_invitation(user_data.invite_code, response.user.id)
+                await offload(invite_service.redeem_invitation, user_data.invite_code, response.user.id)
                 logger.info(f"User {response.user.id} assigned role {profile_data['role']} via invite code")
 
             audit_logger.info(
@@ -507,7 +569,7 @@ async def signup(request: Request, user_data: UserSignup):
 
                 internal_email = username_to_internal_email(user_data.username)
                 # Query auth.users to get user_id
-                auth_response = auth_service_client.auth.admin.list_users()
+                auth_response = await offload(auth_service_client.auth.admin.list_users)
                 existing_user = None
                 for user in auth_response:
                     if user.email == internal_email:
@@ -525,11 +587,11 @@ async def signup(request: Request, user_data: UserSignup):
                         "team_id": invite_info.get("team_id"),
                         "club_id": invite_info.get("club_id"),
                     }
-                    player_dao.update_user_profile(existing_user.id, update_data)
+                    await offload(player_dao.update_user_profile, existing_user.id, update_data)
 
                     # Redeem the invitation
                     invite_service = InviteService(db_conn_holder_obj.client)
-                    invite_service.redeem_invitation(user_data.invite_code, existing_user.id)
+                    await offload(invite_service.redeem_invitation, user_data.invite_code, existing_user.id)
 
                     logger.info(f"Updated existing user {existing_user.id} role to {new_role} via invite code")
                     role_display = invite_info["invite_type"].replace("_", " ")
@@ -843,8 +905,8 @@ async def oauth_callback(callback_data: OAuthCallbackData, request: Request):
         from supabase import create_client
 
         temp_client = create_client(os.getenv("SUPABASE_URL", ""), os.getenv("SUPABASE_ANON_KEY", ""))
-        temp_client.auth.set_session(callback_data.access_token, callback_data.refresh_token or "")
-        user_response = temp_client.auth.get_user()
+        await offload(temp_client.auth.set_session, callback_data.access_token, callback_data.refresh_token or "")
+        user_response = await offload(temp_client.auth.get_user)
 
         if not user_response or not user_response.user:
             oauth_logger.warning("oauth_callback_failed", reason="invalid_token")
@@ -858,12 +920,14 @@ async def oauth_callback(callback_data: OAuthCallbackData, request: Request):
         oauth_logger = oauth_logger.bind(user_id=user_id, email=email)
 
         # Check if user profile exists by email or user_id
-        email_profile_response = (
-            db_conn_holder_obj.client.table("user_profiles").select("*").eq("email", email).execute()
+        email_profile_response = await offload(
+            db_conn_holder_obj.client.table("user_profiles").select("*").eq("email", email).execute
         )
         existing_by_email = email_profile_response.data[0] if email_profile_response.data else None
 
-        profile_response = db_conn_holder_obj.client.table("user_profiles").select("*").eq("id", user_id).execute()
+        profile_response = await offload(
+            db_conn_holder_obj.client.table("user_profiles").select("*").eq("id", user_id).execute
+        )
         existing_by_id = profile_response.data[0] if profile_response.data else None
 
         # Check if it's a trigger stub (incomplete profile)
@@ -904,7 +968,7 @@ async def oauth_callback(callback_data: OAuthCallbackData, request: Request):
         # ===== SIGNUP FLOW (with invite code) =====
         # Validate the invite code
         invite_service = InviteService(db_conn_holder_obj.client)
-        invite_info = invite_service.validate_invite_code(callback_data.invite_code)
+        invite_info = await offload(invite_service.validate_invite_code, callback_data.invite_code)
 
         if not invite_info:
             oauth_logger.warning("oauth_callback_failed", reason="invalid_invite_code")
@@ -981,15 +1045,17 @@ async def oauth_callback(callback_data: OAuthCallbackData, request: Request):
         if is_trigger_stub:
             # Update the stub profile created by Supabase trigger
             oauth_logger.info("oauth_updating_trigger_stub", user_id=user_id)
-            db_conn_holder_obj.client.table("user_profiles").update(profile_data).eq("id", user_id).execute()
+            await offload(
+                db_conn_holder_obj.client.table("user_profiles").update(profile_data).eq("id", user_id).execute
+            )
         else:
             # Create new profile (shouldn't happen if trigger exists, but handle it)
             profile_data["id"] = user_id
             profile_data["created_at"] = datetime.utcnow().isoformat()
-            db_conn_holder_obj.client.table("user_profiles").insert(profile_data).execute()
+            await offload(db_conn_holder_obj.client.table("user_profiles").insert(profile_data).execute)
 
         # Redeem the invite (marks as used) - do this for both update and insert
-        invite_service.redeem_invitation(callback_data.invite_code, user_id)
+        await offload(invite_service.redeem_invitation, callback_data.invite_code, user_id)
 
         oauth_logger.info("oauth_signup_success", username=username, role=role)
 
@@ -1250,7 +1316,7 @@ async def upload_player_photo(
 
     try:
         # Upload to player-photos bucket using direct HTTP API
-        storage_helper.upload("player-photos", file_path, content, file.content_type)
+        await offload(storage_helper.upload, "player-photos", file_path, content, file.content_type)
 
         # Get public URL
         public_url = storage_helper.get_public_url("player-photos", file_path)
@@ -1262,14 +1328,14 @@ async def upload_player_photo(
         update_data = {photo_column: public_url, "updated_at": datetime.now(UTC).isoformat()}
 
         # If no profile photo is set, set this as the profile photo
-        profile = player_dao.get_user_profile_with_relationships(user_id)
+        profile = await offload(player_dao.get_user_profile_with_relationships, user_id)
         if not profile.get("profile_photo_slot"):
             update_data["profile_photo_slot"] = slot
 
-        player_dao.update_user_profile(user_id, update_data)
+        await offload(player_dao.update_user_profile, user_id, update_data)
 
         # Return updated profile
-        updated_profile = player_dao.get_user_profile_with_relationships(user_id)
+        updated_profile = await offload(player_dao.get_user_profile_with_relationships, user_id)
         return {
             "message": f"Photo uploaded to slot {slot}",
             "photo_url": public_url,
@@ -2043,12 +2109,124 @@ async def get_csrf_token_endpoint(request: Request, response: Response):
     return await provide_csrf_token(request, response)
 
 
+# === Conditional GET ===
+
+
+def _etag(request: Request, families: tuple[str, ...], audience: object = None) -> str | None:
+    """Strong ETag of a read: its path and query, audience and the families' data versions.
+
+    None without Redis (no data versions), in which case no ETag is sent.
+    """
+    return _etag_of(request, get_data_versions(families), audience)
+
+
+async def _async_etag(request: Request, families: tuple[str, ...], audience: object = None) -> str | None:
+    """_etag() for routes on the event loop: the versions are read with redis.asyncio."""
+    return _etag_of(request, await async_get_data_versions(families), audience)
+
+
+def _etag_of(request: Request, versions: dict[str, int] | None, audience: object) -> str | None:
+    if versions is None:
+        return None
+    state = [request.url.path, sorted(request.query_params.multi_items()), audience, sorted(versions.items())]
+    digest = hashlib.sha256(json.dumps(state, default=str).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def _not_modified(
+    request: Request, response: Response, families: tuple[str, ...], audience: object = None
+) -> Response | None:
+    """Answer a conditional GET from the data versions alone.
+
+    Sets ETag (and Cache-Control: private, no-cache, so browsers keep the body
+    and revalidate every poll) on the response. Returns a 304 when
+    If-None-Match already names that ETag; the route returns it untouched,
+    without reading any DAO. Call this before reading the data, so a write in
+    between leaves the response with the older ETag rather than the newer one.
+
+    Routes that await (and so run on the event loop) use _async_not_modified().
+
+    Args:
+        families: Cache families the response is built from, e.g. ("matches", "teams")
+        audience: Anything else the body depends on besides the URL, e.g. the
+            viewer's test-content partition
+    """
+    return _conditional_response(request, response, _etag(request, families, audience))
+
+
+async def _async_not_modified(
+    request: Request, response: Response, families: tuple[str, ...], audience: object = None
+) -> Response | None:
+    """_not_modified() for routes on the event loop."""
+    return _conditional_response(request, response, await _async_etag(request, families, audience))
+
+
+def _conditional_response(request: Request, response: Response, etag: str | None) -> Response | None:
+    if etag is None:
+        return None
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+# Seconds a pre-serialized response payload is kept. Its key carries the data
+# versions, so this only bounds how long superseded payloads linger.
+RESPONSE_PAYLOAD_TTL = int(os.getenv("RESPONSE_PAYLOAD_TTL", "300"))
+
+
+async def _cached_json(
+    request: Request, families: tuple[str, ...], build: Callable[[], Any], audience: object = None
+) -> Response:
+    """Serve build()'s JSON from a pre-serialized, pre-compressed payload.
+
+    The payload is cached as mt:dao:<families[0]>:resp:<etag>, next to the
+    family's DAO entries (and cleared with them), so a hit skips the DAO
+    calls, the jsonable_encoder pass and JSON serialization; a gzip payload
+    is sent as-is to clients accepting gzip. A miss serializes with orjson.
+    Conditional GETs are answered as by _not_modified(). Without Redis this
+    is just an orjson response.
+
+    Args:
+        families: Cache families the response is built from; the first names
+            the payload's key family
+        build: Computes the response body; an async function, or a sync one
+            that is run in the threadpool
+        audience: As for _not_modified()
+    """
+    etag = await _async_etag(request, families, audience)
+    if etag is None:
+        return FastJSONResponse(await _run_build(build))
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    digest = etag.strip('"')
+    key = f"mt:dao:{families[0]}:resp:{digest}"
+    payload = await async_cache_get_payload(key)
+    if payload is None:
+        payload = cache_codec.encode_response(await _run_build(build))
+        await async_cache_set_payload(key, payload, RESPONSE_PAYLOAD_TTL, pattern=f"{families[0]}:resp:*")
+    return payload_response(payload, request, headers)
+
+
+async def _run_build(build: Callable[[], Any]) -> Any:
+    """Await an async build(), or run a sync one in the threadpool."""
+    if inspect.iscoroutinefunction(build):
+        return await build()
+    return await offload(build)
+
+
 # === Reference Data Endpoints ===
 
 
 @app.get("/api/age-groups")
-async def get_age_groups(current_user: dict[str, Any] = Depends(get_current_user_required)):
+async def get_age_groups(
+    request: Request, response: Response, current_user: dict[str, Any] = Depends(get_current_user_required)
+):
     """Get all age groups."""
+    if not_modified := _not_modified(request, response, ("age_groups",)):
+        return not_modified
     try:
         logger.info(f"age-groups endpoint - current_user: {current_user}")
         age_groups = season_dao.get_all_age_groups()
@@ -2062,8 +2240,12 @@ async def get_age_groups(current_user: dict[str, Any] = Depends(get_current_user
 
 
 @app.get("/api/seasons")
-async def get_seasons(current_user: dict[str, Any] = Depends(get_current_user_required)):
+async def get_seasons(
+    request: Request, response: Response, current_user: dict[str, Any] = Depends(get_current_user_required)
+):
     """Get all seasons."""
+    if not_modified := _not_modified(request, response, ("seasons",)):
+        return not_modified
     try:
         seasons = season_dao.get_all_seasons()
         return seasons
@@ -2119,8 +2301,12 @@ async def get_active_seasons(current_user: dict[str, Any] = Depends(get_current_
 
 
 @app.get("/api/match-types")
-async def get_match_types(current_user: dict[str, Any] = Depends(get_current_user_required)):
+async def get_match_types(
+    request: Request, response: Response, current_user: dict[str, Any] = Depends(get_current_user_required)
+):
     """Get all match types."""
+    if not_modified := _not_modified(request, response, ("match_types",)):
+        return not_modified
     try:
         match_types = match_type_dao.get_all_match_types()
         return match_types
@@ -2131,9 +2317,14 @@ async def get_match_types(current_user: dict[str, Any] = Depends(get_current_use
 
 @app.get("/api/divisions")
 async def get_divisions(
-    current_user: dict[str, Any] = Depends(get_current_user_required), league_id: int | None = None
+    request: Request,
+    response: Response,
+    current_user: dict[str, Any] = Depends(get_current_user_required),
+    league_id: int | None = None,
 ):
     """Get all divisions, optionally filtered by league."""
+    if not_modified := _not_modified(request, response, ("divisions", "leagues")):
+        return not_modified
     try:
         divisions = league_dao.get_divisions_by_league(league_id) if league_id else league_dao.get_all_divisions()
         return divisions
@@ -2145,8 +2336,13 @@ async def get_divisions(
 # === Enhanced Team Endpoints ===
 
 
+# Cache families behind GET /api/teams (game counts come from matches)
+TEAM_LIST_FAMILIES = ("teams", "clubs", "matches", "match_types")
+
+
 @app.get("/api/teams")
 async def get_teams(
+    request: Request,
     current_user: dict[str, Any] = Depends(get_current_user_required),
     match_type_id: int | None = None,
     age_group_id: int | None = None,
@@ -2169,6 +2365,8 @@ async def get_teams(
         for_match_edit: If true, return all teams (for match editing dropdowns)
 
     Note: Club managers automatically see only their club's teams unless for_match_edit=true.
+
+    Served from a pre-serialized payload cached per ETag (see _cached_json).
     """
     try:
         # Club managers should only see their club's teams (unless editing matches)
@@ -2179,65 +2377,70 @@ async def get_teams(
             # Override any club_id filter - club managers only see their own club
             club_id = user_club_id
 
-        # Get teams based on filters
-        if match_type_id and age_group_id:
-            teams = team_dao.get_teams_by_match_type_and_age_group(match_type_id, age_group_id, division_id=division_id)
-            # Tournament opponents (created via get_or_create_opponent_team)
-            # have only a team_mappings row for the age group and no
-            # team_match_types row, so the strict filter above skips them.
-            # For Tournament match edits, union them in.
-            if for_match_edit:
-                match_type = match_type_dao.get_match_type_by_id(match_type_id)
-                if match_type and (match_type.get("name") or "").lower() == "tournament":
-                    extra = team_dao.get_teams_by_age_group_mapping(age_group_id)
-                    seen = {t["id"] for t in teams}
-                    teams = teams + [t for t in extra if t["id"] not in seen]
-                    teams.sort(key=lambda t: (t.get("name") or "").lower())
-        elif club_id:
-            teams = team_dao.get_club_teams(club_id)
-        else:
-            teams = team_dao.get_all_teams()
+        async def build():
+            # Get teams based on filters
+            if match_type_id and age_group_id:
+                teams = await ThreadpoolDAO(team_dao).get_teams_by_match_type_and_age_group(
+                    match_type_id, age_group_id, division_id=division_id
+                )
+                # Tournament opponents (created via get_or_create_opponent_team)
+                # have only a team_mappings row for the age group and no
+                # team_match_types row, so the strict filter above skips them.
+                # For Tournament match edits, union them in.
+                if for_match_edit:
+                    match_type = await ThreadpoolDAO(match_type_dao).get_match_type_by_id(match_type_id)
+                    if match_type and (match_type.get("name") or "").lower() == "tournament":
+                        extra = await ThreadpoolDAO(team_dao).get_teams_by_age_group_mapping(age_group_id)
+                        seen = {t["id"] for t in teams}
+                        teams = teams + [t for t in extra if t["id"] not in seen]
+                        teams.sort(key=lambda t: (t.get("name") or "").lower())
+            elif club_id:
+                teams = await ThreadpoolDAO(team_dao).get_club_teams(club_id)
+            else:
+                teams = await async_team_dao.get_all_teams()
 
-        # Enrich teams with additional data if requested
-        if include_parent or include_game_count:
-            enriched_teams = []
+            # Enrich teams with additional data if requested
+            if include_parent or include_game_count:
+                enriched_teams = []
 
-            # Get game counts for all teams in one query (performance optimization)
-            game_counts = {}
-            if include_game_count:
-                game_counts = team_dao.get_team_game_counts()
+                # Get game counts for all teams in one query (performance optimization)
+                game_counts = {}
+                if include_game_count:
+                    game_counts = await ThreadpoolDAO(team_dao).get_team_game_counts()
 
-            # Pre-fetch clubs once (not inside loop!) for parent club lookup
-            clubs_by_id = {}
-            if include_parent:
-                clubs = club_dao.get_all_clubs()
-                clubs_by_id = {c["id"]: c for c in clubs}
+                # Pre-fetch clubs once (not inside loop!) for parent club lookup
+                clubs_by_id = {}
+                if include_parent:
+                    clubs = await ThreadpoolDAO(club_dao).get_all_clubs()
+                    clubs_by_id = {c["id"]: c for c in clubs}
 
-            for team in teams:
-                team_data = {**team}
+                for team in teams:
+                    team_data = {**team}
 
-                # Add parent club info if requested
-                if include_parent:
-                    if team.get("club_id"):
-                        team_data["parent_club"] = clubs_by_id.get(team["club_id"])
-                    else:
-                        team_data["parent_club"] = None
-
-                    # Check if this team is itself a parent club
-                    if hasattr(team_dao, "is_parent_club"):
-                        team_data["is_parent_club"] = team_dao.is_parent_club(team["id"])
-                    else:
-                        team_data["is_parent_club"] = False
-
-                # Add game count if requested
-                if include_game_count:
-                    team_data["game_count"] = game_counts.get(team["id"], 0)
+                    # Add parent club info if requested
+                    if include_parent:
+                        if team.get("club_id"):
+                            team_data["parent_club"] = clubs_by_id.get(team["club_id"])
+                        else:
+                            team_data["parent_club"] = None
 
-                enriched_teams.append(team_data)
+                        # Check if this team is itself a parent club
+                        if hasattr(team_dao, "is_parent_club"):
+                            team_data["is_parent_club"] = await ThreadpoolDAO(team_dao).is_parent_club(team["id"])
+                        else:
+                            team_data["is_parent_club"] = False
 
-            return enriched_teams
+                    # Add game count if requested
+                    if include_game_count:
+                        team_data["game_count"] = game_counts.get(team["id"], 0)
 
-        return teams
+                    enriched_teams.append(team_data)
+
+                return enriched_teams
+
+            return teams
+
+        return await _cached_json(request, TEAM_LIST_FAMILIES, build, audience=club_id)
     except Exception as e:
         logger.error(f"Error retrieving teams: {e!s}", exc_info=True)
         raise HTTPException(
@@ -2321,9 +2524,69 @@ async def add_team(
 # === Enhanced Match Endpoints ===
 
 
+def _attach_card_events(matches: list[dict], fields: tuple[str, ...]) -> None:
+    """Add the requested red_cards/yellow_cards lists to each match, in place."""
+    wanted = [field for field in CARD_FIELDS if field in fields]
+    match_ids = [m["id"] for m in matches if m.get("id")]
+    if not wanted or not match_ids:
+        return
+    card_events = match_event_dao.get_card_events_for_matches(match_ids)
+    for m in matches:
+        cards = card_events.get(m["id"], [])
+        for field in wanted:
+            event_type = {"red_cards": "red_card", "yellow_cards": "yellow_card"}[field]
+            m[field] = [
+                {"team_id": c["team_id"], "player_name": c["player_name"]}
+                for c in cards
+                if c["event_type"] == event_type
+            ]
+
+
+def _parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    """Parse a fields= sparse fieldset, as a 400 if it names an unknown field."""
+    try:
+        return parse_match_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Cache families behind a match list (ETag data versions); match_events covers cards
+MATCH_LIST_FAMILIES = ("matches", "teams", "match_events")
+
+
+def _wants_ndjson(request: Request) -> bool:
+    """True if the client asked for newline-delimited JSON (Accept: application/x-ndjson)."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _ndjson_response(pages: Iterable[list[dict]]) -> StreamingResponse:
+    """Stream rows as NDJSON, one object per line, one chunk per page.
+
+    The first page is fetched before the response starts, so a failure there
+    (bad filters, database down) is still an ordinary HTTP error. A failure
+    after that can only abort the stream; clients see a truncated body.
+    """
+    pages = iter(pages)
+    first = next(pages, [])
+
+    def lines(pages: Iterator[list[dict]], first: list[dict]):
+        page = first
+        while True:
+            if page:
+                yield "".join(json.dumps(row, separators=(",", ":"), default=str) + "\n" for row in page)
+            page = next(pages, None)
+            if page is None:
+                return
+
+    return StreamingResponse(lines(pages, first), media_type=NDJSON_MEDIA_TYPE)
+
+
 @app.get("/api/matches")
 async def get_matches(
     request: Request,
+    response: Response,
     current_user: dict[str, Any] = Depends(get_current_user_required),
     season_id: int | None = Query(None, description="Filter by season ID"),
     age_group_id: int | None = Query(None, description="Filter by age group ID"),
@@ -2332,37 +2595,77 @@ async def get_matches(
     match_type: str | None = Query(None, description="Filter by match type name"),
     start_date: str | None = Query(None, description="Filter by start date (YYYY-MM-DD)"),
     end_date: str | None = Query(None, description="Filter by end date (YYYY-MM-DD)"),
+    limit: int | None = Query(None, ge=1, le=500, description="Page size (default 100 with a cursor)"),
+    cursor: str | None = Query(None, description="X-Next-Cursor header of the previous page"),
+    fields: str | None = Query(None, description="Comma-separated fields to return (default: all)"),
 ):
-    """Get all matches with optional filters (requires authentication)."""
+    """Get all matches with optional filters (requires authentication).
+
+    Without limit/cursor the full list is returned. With either, the list is
+    one page, newest first (match_date, then id), and the X-Next-Cursor
+    header carries the cursor for the next page; it is absent on the last.
+
+    With Accept: application/x-ndjson every matching row is streamed, one
+    JSON object per line, in the same order, starting after cursor if given;
+    limit does not apply.
+
+    JSON responses carry an ETag; If-None-Match with it gets 304 Not Modified.
+    The full list is served from a pre-serialized payload (see _cached_json).
+    """
+    paginated = limit is not None or cursor is not None
+    field_set = _parse_fields(fields)
+    filters = {
+        "season_id": season_id,
+        "age_group_id": age_group_id,
+        "division_id": division_id,
+        "team_id": team_id,
+        "match_type": match_type,
+        "start_date": start_date,
+        "end_date": end_date,
+        "include_test": viewer_sees_test_content(current_user),
+        "fields": field_set,
+    }
+    if cursor is not None:
+        try:
+            decode_match_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    if (
+        paginated
+        and not _wants_ndjson(request)
+        and (not_modified := await _async_not_modified(request, response, MATCH_LIST_FAMILIES, filters["include_test"]))
+    ):
+        return not_modified
     try:
-        matches = match_dao.get_all_matches(
-            season_id=season_id,
-            age_group_id=age_group_id,
-            division_id=division_id,
-            team_id=team_id,
-            match_type=match_type,
-            start_date=start_date,
-            end_date=end_date,
-            include_test=viewer_sees_test_content(current_user),
-        )
+        if _wants_ndjson(request):
+            card_fields = CARD_FIELDS if field_set is None else field_set
+
+            def pages():
+                for page in match_dao.iter_match_pages(**filters, cursor=cursor):
+                    _attach_card_events(page, card_fields)
+                    yield page
+
+            # The first page is read before streaming starts (see _ndjson_response)
+            return await offload(_ndjson_response, pages())
+
+        if not paginated:
+
+            async def build():
+                matches = await async_match_dao.get_all_matches(**filters)
+                # Enrich matches with card event data
+                await offload(_attach_card_events, matches, CARD_FIELDS if field_set is None else field_set)
+                return matches
+
+            return await _cached_json(request, MATCH_LIST_FAMILIES, build, audience=filters["include_test"])
+
+        page = await async_match_dao.get_matches_page(**filters, limit=limit or 100, cursor=cursor)
+        matches = page["matches"]
 
         # Enrich matches with card event data
-        match_ids = [m["id"] for m in matches if m.get("id")]
-        if match_ids:
-            card_events = match_event_dao.get_card_events_for_matches(match_ids)
-            for m in matches:
-                cards = card_events.get(m["id"], [])
-                m["red_cards"] = [
-                    {"team_id": c["team_id"], "player_name": c["player_name"]}
-                    for c in cards
-                    if c["event_type"] == "red_card"
-                ]
-                m["yellow_cards"] = [
-                    {"team_id": c["team_id"], "player_name": c["player_name"]}
-                    for c in cards
-                    if c["event_type"] == "yellow_card"
-                ]
+        await offload(_attach_card_events, matches, CARD_FIELDS if field_set is None else field_set)
 
+        if page["next_cursor"]:
+            response.headers["X-Next-Cursor"] = page["next_cursor"]
         return matches
     except Exception as e:
         logger.error(f"Error retrieving matches: {e!s}", exc_info=True)
@@ -2381,7 +2684,7 @@ async def get_live_matches(
     Returns minimal data for efficient polling.
     """
     try:
-        live_matches = match_dao.get_live_matches(include_test=viewer_sees_test_content(current_user))
+        live_matches = await async_match_dao.get_live_matches(include_test=viewer_sees_test_content(current_user))
         return live_matches
     except Exception as e:
         logger.error(f"Error getting live matches: {e!s}", exc_info=True)
@@ -2402,27 +2705,22 @@ async def get_match_preview(
     Returns recent form for each team, common opponents (with match results),
     head-to-head history spanning all seasons, and QoP ranking data for both teams.
     """
-    try:
-        preview = match_dao.get_match_preview(
-            home_team_id=home_team_id,
-            away_team_id=away_team_id,
-            season_id=season_id,
-            age_group_id=age_group_id,
-            recent_count=recent_count,
-            include_test=viewer_sees_test_content(current_user),
-        )
+    # Augment preview with QoP ranking data
+    qop_defaults = {
+        "has_qop_data": False,
+        "home_qop_rank": None,
+        "home_qop_rank_change": None,
+        "away_qop_rank": None,
+        "away_qop_rank_change": None,
+    }
 
-        # Augment preview with QoP ranking data
-        qop_defaults = {
-            "has_qop_data": False,
-            "home_qop_rank": None,
-            "home_qop_rank_change": None,
-            "away_qop_rank": None,
-            "away_qop_rank_change": None,
-        }
+    async def preview_qop() -> dict:
+        """QoP ranks of both teams when they share a division, else qop_defaults."""
         try:
-            home_team = team_dao.get_team_with_details(home_team_id)
-            away_team = team_dao.get_team_with_details(away_team_id)
+            async with QueryGroup() as teams:
+                home_task = teams.spawn(ThreadpoolDAO(team_dao).get_team_with_details(home_team_id))
+                away_task = teams.spawn(ThreadpoolDAO(team_dao).get_team_with_details(away_team_id))
+            home_team, away_team = home_task.result(), away_task.result()
 
             home_division = home_team.get("division") if home_team else None
             away_division = away_team.get("division") if away_team else None
@@ -2437,42 +2735,62 @@ async def get_match_preview(
                 or home_division_id != away_division_id
                 or home_age_group_id is None
             ):
-                preview.update(qop_defaults)
-            else:
-                qop_data = QoPRankingsDAO.get_latest_with_delta(match_dao.client, home_division_id, home_age_group_id)
-                if not qop_data.get("has_data"):
-                    preview.update(qop_defaults)
-                else:
-                    rankings = qop_data["rankings"]
-
-                    def find_team_rank(team_id: int, team_name: str | None) -> tuple[int | None, int | None]:
-                        """Find rank and rank_change for a team, by team_id first then name."""
-                        for entry in rankings:
-                            if entry.get("team_id") == team_id:
-                                return entry["rank"], entry.get("rank_change")
-                        if team_name:
-                            for entry in rankings:
-                                if entry.get("team_name", "").lower() == team_name.lower():
-                                    return entry["rank"], entry.get("rank_change")
-                        return None, None
-
-                    home_name = home_team.get("name") if home_team else None
-                    away_name = away_team.get("name") if away_team else None
-                    home_rank, home_rank_change = find_team_rank(home_team_id, home_name)
-                    away_rank, away_rank_change = find_team_rank(away_team_id, away_name)
-
-                    preview.update(
-                        {
-                            "has_qop_data": True,
-                            "home_qop_rank": home_rank,
-                            "home_qop_rank_change": home_rank_change,
-                            "away_qop_rank": away_rank,
-                            "away_qop_rank_change": away_rank_change,
-                        }
-                    )
+                return qop_defaults
+
+            qop_data = await offload(
+                QoPRankingsDAO.get_latest_with_delta, match_dao.client, home_division_id, home_age_group_id
+            )
+            if not qop_data.get("has_data"):
+                return qop_defaults
+            rankings = qop_data["rankings"]
+
+            def find_team_rank(team_id: int, team_name: str | None) -> tuple[int | None, int | None]:
+                """Find rank and rank_change for a team, by team_id first then name."""
+                for entry in rankings:
+                    if entry.get("team_id") == team_id:
+                        return entry["rank"], entry.get("rank_change")
+                if team_name:
+                    for entry in rankings:
+                        if entry.get("team_name", "").lower() == team_name.lower():
+                            return entry["rank"], entry.get("rank_change")
+                return None, None
+
+            home_name = home_team.get("name") if home_team else None
+            away_name = away_team.get("name") if away_team else None
+            home_rank, home_rank_change = find_team_rank(home_team_id, home_name)
+            away_rank, away_rank_change = find_team_rank(away_team_id, away_name)
+
+            return {
+                "has_qop_data": True,
+                "home_qop_rank": home_rank,
+                "home_qop_rank_change": home_rank_change,
+                "away_qop_rank": away_rank,
+                "away_qop_rank_change": away_rank_change,
+            }
         except Exception:
             logger.warning("Failed to fetch QoP data for match preview", exc_info=True)
-            preview.update(qop_defaults)
+            return qop_defaults
+
+    try:
+        # The team lookups and QoP rankings do not depend on the preview, so
+        # they run alongside it rather than after it
+        async with QueryGroup() as group:
+            preview_task = group.spawn(
+                ThreadpoolDAO(match_dao).get_match_preview(
+                    home_team_id=home_team_id,
+                    away_team_id=away_team_id,
+                    season_id=season_id,
+                    age_group_id=age_group_id,
+                    recent_count=recent_count,
+                    include_test=viewer_sees_test_content(current_user),
+                ),
+                name="match_preview",
+            )
+            qop_task = group.spawn(
+                preview_qop(), timeout=ENRICHMENT_TIMEOUT_SECONDS, default=qop_defaults, name="preview_qop"
+            )
+        preview = preview_task.result()
+        preview.update(qop_task.result())
 
         return preview
     except Exception as e:
@@ -2818,7 +3136,9 @@ async def upload_match_photo(
             detail=f"Invalid file type. Allowed: PNG, JPG. Got: {file.content_type}",
         )
 
-    current_match = match_dao.get_match_by_id(match_id, include_test=viewer_sees_test_content(current_user))
+    current_match = await offload(
+        match_dao.get_match_by_id, match_id, include_test=viewer_sees_test_content(current_user)
+    )
     if not current_match:
         raise HTTPException(status_code=404, detail="Match not found")
 
@@ -2833,7 +3153,7 @@ async def upload_match_photo(
         )
 
     try:
-        resized = _resize_photo_to_jpeg(content)
+        resized = await offload(_resize_photo_to_jpeg, content)
     except Exception as e:
         logger.error(f"Failed to resize match photo: {e!s}", exc_info=True)
         raise HTTPException(status_code=400, detail="Could not process image file") from e
@@ -2846,7 +3166,7 @@ async def upload_match_photo(
     old_key = current_match.get("photo_key")
     if old_key:
         try:
-            r2_client.delete_photo(old_key)
+            await offload(r2_client.delete_photo, old_key)
         except Exception:
             logger.warning(
                 "Failed to delete previous match photo (continuing)",
@@ -2855,7 +3175,7 @@ async def upload_match_photo(
             )
 
     try:
-        signed_url = r2_client.upload_photo(key, resized, content_type="image/jpeg")
+        signed_url = await offload(r2_client.upload_photo, key, resized, content_type="image/jpeg")
     except Exception as e:
         logger.error(f"R2 upload failed for match {match_id}: {e!s}", exc_info=True)
         raise HTTPException(status_code=502, detail="Failed to upload photo to storage") from e
@@ -2863,11 +3183,8 @@ async def upload_match_photo(
     # Persist photo_key (canonical) and photo_url (cache of latest signed URL).
     # photo_url is the convenient form for the immediate IG-card generation;
     # callers needing a fresh URL later should re-mint from photo_key.
-    response = (
-        match_dao.client.table("matches")
-        .update({"photo_url": signed_url, "photo_key": key})
-        .eq("id", match_id)
-        .execute()
+    response = await offload(
+        match_dao.client.table("matches").update({"photo_url": signed_url, "photo_key": key}).eq("id", match_id).execute
     )
     if not response.data:
         raise HTTPException(status_code=500, detail="Failed to persist photo metadata")
@@ -2918,38 +3235,33 @@ async def delete_match_photo(
 
 @app.get("/api/matches/team/{team_id}")
 async def get_matches_by_team(
+    request: Request,
+    response: Response,
     team_id: int,
     current_user: dict[str, Any] = Depends(get_current_user_required),
     season_id: int | None = Query(None, description="Filter by season ID"),
     age_group_id: int | None = Query(None, description="Filter by age group ID"),
+    fields: str | None = Query(None, description="Comma-separated fields to return (default: all)"),
 ):
-    """Get matches for a specific team."""
-    try:
-        matches = match_dao.get_matches_by_team(
+    """Get matches for a specific team (ETag / If-None-Match like /api/matches)."""
+    field_set = _parse_fields(fields)
+    if not_modified := await _async_not_modified(
+        request, response, MATCH_LIST_FAMILIES, viewer_sees_test_content(current_user)
+    ):
+        return not_modified
+    try:
+        matches = await async_match_dao.get_matches_by_team(
             team_id,
             season_id=season_id,
             age_group_id=age_group_id,
             include_test=viewer_sees_test_content(current_user),
+            fields=field_set,
         )
         if not matches:
             return []
 
         # Enrich matches with card event data
-        match_ids = [m["id"] for m in matches if m.get("id")]
-        if match_ids:
-            card_events = match_event_dao.get_card_events_for_matches(match_ids)
-            for m in matches:
-                cards = card_events.get(m["id"], [])
-                m["red_cards"] = [
-                    {"team_id": c["team_id"], "player_name": c["player_name"]}
-                    for c in cards
-                    if c["event_type"] == "red_card"
-                ]
-                m["yellow_cards"] = [
-                    {"team_id": c["team_id"], "player_name": c["player_name"]}
-                    for c in cards
-                    if c["event_type"] == "yellow_card"
-                ]
+        await offload(_attach_card_events, matches, CARD_FIELDS if field_set is None else field_set)
 
         return matches
     except Exception as e:
@@ -4339,34 +4651,80 @@ async def post_match_update_stats(
 # === Enhanced League Table Endpoint ===
 
 
+def _set_cache_computed_at_header(response: Response) -> None:
+    """Report when the cached aggregate in this response was computed (may be briefly stale)."""
+    computed_at = get_cache_computed_at()
+    if computed_at is not None:
+        response.headers["X-Cache-Computed-At"] = datetime.fromtimestamp(computed_at, UTC).isoformat()
+
+
 @app.get("/api/table")
 async def get_table(
+    request: Request,
+    response: Response,
     current_user: dict[str, Any] = Depends(get_current_user_required),
     season_id: int | None = Query(None, description="Filter by season ID"),
     age_group_id: int | None = Query(None, description="Filter by age group ID"),
     division_id: int | None = Query(None, description="Filter by division ID"),
     match_type: str | None = Query("League", description="Match type (League, Tournament, etc.)"),
+    as_of: date | None = Query(None, description="Table as it stood on this date (YYYY-MM-DD)"),
 ):
-    """Get league table with enhanced filtering."""
-    try:
+    """Get league table with enhanced filtering, optionally as of a past date."""
+    include_test = viewer_sees_test_content(current_user)
+    if not_modified := await _async_not_modified(
+        request, response, ("matches", "teams", "seasons", "qop"), include_test
+    ):
+        return not_modified
+
+    async def league_table() -> list[dict]:
+        nonlocal season_id
         # If no season specified, use current season (or most recent as fallback)
         if not season_id:
-            current_season = season_dao.get_current_season()
+            current_season = await ThreadpoolDAO(season_dao).get_current_season()
             if current_season:
                 season_id = current_season["id"]
             else:
                 # Fallback to most recent season (sorted by start_date desc)
-                seasons = season_dao.get_all_seasons()
+                seasons = await ThreadpoolDAO(season_dao).get_all_seasons()
                 if seasons:
                     season_id = seasons[0]["id"]
 
-        table = match_dao.get_league_table(
-            season_id=season_id,
-            age_group_id=age_group_id,
-            division_id=division_id,
-            match_type=match_type,
-            include_test=viewer_sees_test_content(current_user),
-        )
+        if as_of:
+            table = await ThreadpoolDAO(match_dao).get_league_table_as_of(
+                as_of.isoformat(),
+                season_id=season_id,
+                age_group_id=age_group_id,
+                division_id=division_id,
+                match_type=match_type,
+                include_test=include_test,
+            )
+        else:
+            table = await ThreadpoolDAO(match_dao).get_league_table(
+                season_id=season_id,
+                age_group_id=age_group_id,
+                division_id=division_id,
+                match_type=match_type,
+                include_test=include_test,
+            )
+        # In this task: the computed-at context variable is set in its context only
+        _set_cache_computed_at_header(response)
+        return table
+
+    try:
+        # The QoP rankings do not depend on the season, so they are fetched
+        # alongside the season lookup and table rather than after them
+        async with QueryGroup() as group:
+            table_task = group.spawn(league_table(), name="league_table")
+            qop_task = None
+            if division_id and age_group_id:
+                qop_task = group.spawn(
+                    offload(QoPRankingsDAO.get_latest_with_delta, match_dao.client, division_id, age_group_id),
+                    timeout=ENRICHMENT_TIMEOUT_SECONDS,
+                    default=None,
+                    name="qop_rankings",
+                )
+        table = table_task.result()
+        qop_data = qop_task.result() if qop_task else None
 
         logger.info(
             "League table query",
@@ -4374,18 +4732,17 @@ async def get_table(
             age_group_id=age_group_id,
             division_id=division_id,
             match_type=match_type,
+            as_of=as_of,
             rows_returned=len(table) if isinstance(table, list) else "N/A",
         )
 
         # Enrich standings with QoP rankings data when division and age group are known
         has_qop_data = False
         qop_week_of = None
-        if division_id and age_group_id:
+        if qop_data is not None:
             try:
-                qop_data = QoPRankingsDAO.get_latest_with_delta(match_dao.client, division_id, age_group_id)
                 has_qop_data = qop_data.get("has_data", False)
                 qop_week_of = qop_data.get("week_of")
-
                 if has_qop_data:
                     # Build lookups: team_id -> entry and team_name -> entry
                     qop_by_team_id: dict[int, dict] = {}
@@ -4441,8 +4798,37 @@ async def get_table(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.get("/api/table/all")
+async def get_all_tables(
+    response: Response,
+    current_user: dict[str, Any] = Depends(get_current_user_required),
+    season_id: int | None = Query(None, description="Season ID (defaults to the current season)"),
+):
+    """Get the league table of every age group, division and match type in a season."""
+    try:
+        if not season_id:
+            current_season = season_dao.get_current_season()
+            if not current_season:
+                raise HTTPException(status_code=404, detail="No current season")
+            season_id = current_season["id"]
+
+        tables = match_dao.get_season_standings(
+            season_id=season_id,
+            include_test=viewer_sees_test_content(current_user),
+        )
+        _set_cache_computed_at_header(response)
+        logger.info("All league tables query", season_id=season_id, tables_returned=len(tables))
+        return {"season_id": season_id, "tables": tables}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating league tables: {e!s}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @app.get("/api/leaderboards/goals")
 async def get_goals_leaderboard(
+    response: Response,
     current_user: dict[str, Any] = Depends(get_current_user_required),
     season_id: int = Query(..., description="Season ID (required)"),
     league_id: int | None = Query(None, description="Filter by league ID"),
@@ -4464,6 +4850,7 @@ async def get_goals_leaderboard(
             limit=limit,
             include_test=viewer_sees_test_content(current_user),
         )
+        _set_cache_computed_at_header(response)
 
         logger.info(
             "Goals leaderboard query",
@@ -4823,16 +5210,21 @@ async def remove_team_match_type_participation(
 
 
 @app.get("/api/clubs")
-async def get_clubs(include_teams: bool = True, current_user: dict[str, Any] = Depends(get_current_user_required)):
+async def get_clubs(
+    request: Request, include_teams: bool = True, current_user: dict[str, Any] = Depends(get_current_user_required)
+):
     """Get all clubs.
 
+    Served from a pre-serialized payload cached per ETag (see _cached_json).
+
     Args:
         include_teams: If true, enriches clubs with their teams list (default: true)
 
     Returns:
         List of clubs with optional team details
     """
-    try:
+
+    def build():
         # Get all clubs from clubs table
         logger.info(f"/api/clubs: Calling get_all_clubs DAO with include_team_counts: {not include_teams}")
         clubs = club_dao.get_all_clubs(include_team_counts=not include_teams)
@@ -4864,6 +5256,9 @@ async def get_clubs(include_teams: bool = True, current_user: dict[str, Any] = D
             logger.debug(f"Club '{club.get('name')}' has {len(club_teams)} teams")
 
         return enriched_clubs
+
+    try:
+        return await _cached_json(request, ("clubs", "teams"), build)
     except Exception as e:
         logger.error(f"Error fetching clubs: {e!s}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -5045,20 +5440,23 @@ async def upload_club_logo(
         storage = match_dao.client.storage
 
         # Upload base image to club-logos bucket (upsert to overwrite existing)
-        storage.from_("club-logos").upload(
-            file_path, content, file_options={"content-type": file.content_type, "upsert": "true"}
+        await offload(
+            storage.from_("club-logos").upload,
+            file_path,
+            content,
+            file_options={"content-type": file.content_type, "upsert": "true"},
         )
 
         # Generate and upload size variants (_sm=64px, _md=128px) for PNGs
         if ext == "png":
-            _upload_logo_png_variants(storage, "club-logos", str(club_id), content)
+            await offload(_upload_logo_png_variants, storage, "club-logos", str(club_id), content)
             logger.info(f"Uploaded size variants for club {club_id}")
 
         # Get public URL (points to base image)
         public_url = storage.from_("club-logos").get_public_url(file_path)
 
         # Update the club with the new logo URL
-        updated_club = club_dao.update_club(club_id=club_id, logo_url=public_url)
+        updated_club = await offload(club_dao.update_club, club_id=club_id, logo_url=public_url)
 
         if not updated_club:
             raise HTTPException(status_code=404, detail=f"Club with id {club_id} not found")
@@ -5263,12 +5661,14 @@ async def add_or_update_scraped_match(
         logger.info(f"POST /api/match-scraper/matches - Match data: {match.model_dump()}")
 
         # Validate division_id for League matches
-        match_type = match_type_dao.get_match_type_by_id(match.match_type_id)
+        match_type = await offload(match_type_dao.get_match_type_by_id, match.match_type_id)
         if match_type and match_type.get("name") == "League" and match.division_id is None:
             raise HTTPException(status_code=422, detail="division_id is required for League matches")
 
-        # Check if match already exists by external_match_id
-        existing_match_response = await check_match(
+        # Check if match already exists by external_match_id; check_match never
+        # awaits, so its sync form runs in a worker thread
+        existing_match_response = await offload(
+            in_threadpool(check_match),
             date=match.match_date,
             homeTeam=str(match.home_team_id),
             awayTeam=str(match.away_team_id),
@@ -5284,7 +5684,8 @@ async def add_or_update_scraped_match(
             logger.info(f"Updating existing match {existing_match_id} with external_match_id {external_match_id}")
 
             # Update existing match
-            updated_match = match_dao.update_match(
+            updated_match = await offload(
+                match_dao.update_match,
                 match_id=existing_match_id,
                 home_team_id=match.home_team_id,
                 away_team_id=match.away_team_id,
@@ -5311,7 +5712,8 @@ async def add_or_update_scraped_match(
             logger.info(f"Creating new match with external_match_id {external_match_id}")
 
             # Create new match with external_match_id
-            success = match_dao.add_match_with_external_id(
+            success = await offload(
+                match_dao.add_match_with_external_id,
                 home_team_id=match.home_team_id,
                 away_team_id=match.away_team_id,
                 match_date=match.match_date,
@@ -6045,82 +6447,101 @@ async def get_player_profile(user_id: str, current_user: dict[str, Any] = Depend
     - Team info
     - Recent games (player's team matches)
     """
-    try:
-        # Get the target player's profile first
-        target_profile = player_dao.get_user_profile_with_relationships(user_id)
-        if not target_profile:
-            raise HTTPException(status_code=404, detail="Player not found")
+    is_self = user_id == current_user["user_id"]
+
+    def club_ids(player_teams: list[dict]) -> set:
+        """Club IDs of a player's current teams."""
+        ids = set()
+        for team_entry in player_teams:
+            team_data = team_entry.get("team", {})
+            club_data = team_data.get("club", {})
+            if club_data and club_data.get("id"):
+                ids.add(club_data["id"])
+        return ids
+
+    try:
+        # The profile, both sides' club lookups and the recent games are
+        # independent queries, so they run together. Recent games need only
+        # the profile's team_id; a 404 or 403 below cancels whatever is left.
+        async with QueryGroup() as group:
+            profile_task = group.spawn(
+                ThreadpoolDAO(player_dao).get_user_profile_with_relationships(user_id), name="player_profile"
+            )
 
-        # Allow viewing own profile
-        if user_id == current_user["user_id"]:
-            pass  # No authorization check needed
-        else:
-            # Get target player's teams and club IDs
-            target_teams = player_dao.get_all_current_player_teams(user_id)
-            target_club_ids = set()
-            for team_entry in target_teams:
-                team_data = team_entry.get("team", {})
-                club_data = team_data.get("club", {})
-                if club_data and club_data.get("id"):
-                    target_club_ids.add(club_data["id"])
-
-            # The viewer's clubs, from every source that can establish one.
-            #
-            # This used to read player_team_history alone, which meant it
-            # authorized almost nobody: 32 of 33 accounts have no history rows.
-            # Club managers and fans carry club_id and never appear in that
-            # table, team managers carry team_id, and admins carry neither — so
-            # the intersection below was empty and the endpoint refused
-            # everyone except the one account with history, plus self-views
-            # (SB-797). Mirrors the resolution in get_team_players.
-            user_club_ids = set()
-
-            if current_user.get("club_id"):
-                user_club_ids.add(current_user["club_id"])
-
-            if current_user.get("team_id"):
-                viewer_team = team_dao.get_team_by_id(current_user["team_id"])
-                if viewer_team and viewer_team.get("club_id"):
-                    user_club_ids.add(viewer_team["club_id"])
-
-            if not user_club_ids:
-                user_teams = player_dao.get_all_current_player_teams(current_user["user_id"])
-                for team_entry in user_teams:
-                    team_data = team_entry.get("team", {})
-                    club_data = team_data.get("club", {})
-                    if club_data and club_data.get("id"):
-                        user_club_ids.add(club_data["id"])
-
-            # Admins belong to no club, so no intersection can ever succeed for
-            # them. They browse any profile by design.
-            is_admin = current_user.get("role") == "admin"
-
-            # Authorization: must share at least one club
-            if not is_admin and not (user_club_ids & target_club_ids):
-                raise HTTPException(status_code=403, detail="You can only view profiles of players in your club")
-
-        target_team_id = target_profile.get("team_id")
-
-        # Get recent games for the player's team (if they have a team)
-        recent_games = []
-        if target_team_id:
-            try:
-                # Get matches for the team (already sorted by date desc, take first 5)
-                matches = match_dao.get_matches_by_team(target_team_id)[:5]
-                for match in matches:
-                    recent_games.append(
-                        {
-                            "id": match.get("id"),
-                            "match_date": match.get("match_date"),
-                            "home_team": match.get("home_team"),
-                            "away_team": match.get("away_team"),
-                            "home_score": match.get("home_score"),
-                            "away_score": match.get("away_score"),
-                            "status": match.get("status"),
-                        }
+            async def recent_team_matches() -> list[dict]:
+                target_team_id = (await profile_task or {}).get("team_id")
+                if not target_team_id:
+                    return []
+                return await async_match_dao.get_matches_by_team(target_team_id)
+
+            matches_task = group.spawn(
+                recent_team_matches(), timeout=ENRICHMENT_TIMEOUT_SECONDS, default=[], name="recent_games"
+            )
+
+            if not is_self:
+                target_teams_task = group.spawn(ThreadpoolDAO(player_dao).get_all_current_player_teams(user_id))
+                viewer_team_task = viewer_teams_task = None
+                if current_user.get("team_id"):
+                    viewer_team_task = group.spawn(ThreadpoolDAO(team_dao).get_team_by_id(current_user["team_id"]))
+                if not current_user.get("club_id"):
+                    # Needed only if club_id and team_id establish no club,
+                    # but fetched now rather than after the team lookup
+                    viewer_teams_task = group.spawn(
+                        ThreadpoolDAO(player_dao).get_all_current_player_teams(current_user["user_id"])
                     )
-            except Exception as e:
-                logger.warning(f"Could not fetch recent games: {e}")
+
+            target_profile = await profile_task
+            if not target_profile:
+                raise HTTPException(status_code=404, detail="Player not found")
+
+            # Allow viewing own profile
+            if not is_self:
+                # Get target player's club IDs
+                target_club_ids = club_ids(await target_teams_task)
+
+                # The viewer's clubs, from every source that can establish one.
+                #
+                # This used to read player_team_history alone, which meant it
+                # authorized almost nobody: 32 of 33 accounts have no history rows.
+                # Club managers and fans carry club_id and never appear in that
+                # table, team managers carry team_id, and admins carry neither — so
+                # the intersection below was empty and the endpoint refused
+                # everyone except the one account with history, plus self-views
+                # (SB-797). Mirrors the resolution in get_team_players.
+                user_club_ids = set()
+
+                if current_user.get("club_id"):
+                    user_club_ids.add(current_user["club_id"])
+
+                if viewer_team_task:
+                    viewer_team = await viewer_team_task
+                    if viewer_team and viewer_team.get("club_id"):
+                        user_club_ids.add(viewer_team["club_id"])
+
+                if not user_club_ids:
+                    user_club_ids = club_ids(await viewer_teams_task)
+
+                # Admins belong to no club, so no intersection can ever succeed for
+                # them. They browse any profile by design.
+                is_admin = current_user.get("role") == "admin"
+
+                # Authorization: must share at least one club
+                if not is_admin and not (user_club_ids & target_club_ids):
+                    raise HTTPException(status_code=403, detail="You can only view profiles of players in your club")
+
+        # Recent games for the player's team (already sorted by date desc, take first 5)
+        recent_games = [
+            {
+                "id": match.get("id"),
+                "match_date": match.get("match_date"),
+                "home_team": match.get("home_team"),
+                "away_team": match.get("away_team"),
+                "home_score": match.get("home_score"),
+                "away_score": match.get("away_score"),
+                "status": match.get("status"),
+            }
+            for match in matches_task.result()[:5]
+        ]
 
         return {
             "success": True,
@@ -6164,14 +6585,19 @@ async def get_player_profile(user_id: str, current_user: dict[str, Any] = Depend
 
 @app.get("/api/playoffs/bracket")
 async def get_playoff_bracket(
+    request: Request,
+    response: Response,
     current_user: dict[str, Any] = Depends(get_current_user_required),
     league_id: int = Query(..., description="League ID"),
     season_id: int = Query(..., description="Season ID"),
     age_group_id: int = Query(..., description="Age group ID"),
 ):
     """Get playoff bracket for a league/season/age group."""
+    if not_modified := _not_modified(request, response, ("playoffs", "matches", "teams")):
+        return not_modified
     try:
         bracket = playoff_dao.get_bracket(league_id, season_id, age_group_id)
+        _set_cache_computed_at_header(response)
         return bracket
     except Exception as e:
         logger.error(f"Error fetching playoff bracket: {e!s}", exc_info=True)
@@ -6431,6 +6857,7 @@ async def delete_playoff_bracket(
 
 @app.get("/api/admin/goals")
 async def get_goal_events(
+    request: Request,
     current_user: dict[str, Any] = Depends(require_match_management_permission),
     season_id: int | None = Query(None, description="Filter by season"),
     age_group_id: int | None = Query(None, description="Filter by age group"),
@@ -6439,8 +6866,22 @@ async def get_goal_events(
     limit: int = Query(100, le=500, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
 ):
-    """List goal events with match context for admin management."""
+    """List goal events with match context for admin management.
+
+    With Accept: application/x-ndjson every matching goal is streamed, one
+    JSON object per line, newest first; limit and offset do not apply.
+    """
     try:
+        if _wants_ndjson(request):
+            return _ndjson_response(
+                match_event_dao.iter_goal_events(
+                    season_id=season_id,
+                    age_group_id=age_group_id,
+                    match_type_id=match_type_id,
+                    team_id=team_id,
+                )
+            )
+
         goals = match_event_dao.get_goal_events(
             season_id=season_id,
             age_group_id=age_group_id,
@@ -6559,7 +7000,7 @@ async def update_goal_event(
 @app.get("/api/admin/cache")
 async def get_cache_stats(current_user: dict[str, Any] = Depends(require_admin)):
     """Get cache statistics and keys grouped by type (admin only)."""
-    from dao.base_dao import get_redis_client
+    from dao.base_dao import get_cache_size_stats, get_local_cache, get_redis_client
 
     redis_client = get_redis_client()
     if not redis_client:
@@ -6570,8 +7011,13 @@ async def get_cache_stats(current_user: dict[str, Any] = Depends(require_admin))
         }
 
     try:
-        # Get all cache keys
-        all_keys = list(redis_client.scan_iter(match="mt:dao:*", count=1000))
+        # Get all cache keys, minus internal bookkeeping (tag sets, etc.).
+        # The DAO client is binary-safe, so keys come back as bytes.
+        all_keys = [
+            key.decode()
+            for key in redis_client.scan_iter(match="mt:dao:*", count=1000)
+            if not key.startswith(b"mt:dao:_")
+        ]
 
         # Group by type
         groups = {}
@@ -6585,10 +7031,16 @@ async def get_cache_stats(current_user: dict[str, Any] = Depends(require_admin))
             groups[cache_type]["count"] += 1
             groups[cache_type]["keys"].append(key)
 
+        # In-process L1 stats are for the worker that served this request
+        local_cache = get_local_cache()
+
         return {
             "enabled": True,
             "total_keys": len(all_keys),
             "groups": groups,
+            "local": local_cache.stats() if local_cache else None,
+            # Payload sizes per key pattern since the last flush, largest first
+            "sizes": get_cache_size_stats(),
         }
     except Exception as e:
         logger.error(f"Error getting cache stats: {e}", exc_info=True)
@@ -6647,26 +7099,52 @@ async def clear_cache_by_type(
 async def get_all_users(current_user: dict[str, Any] = Depends(require_admin)):
     """Get all users with their last login time (admin only)."""
     try:
-        profiles_resp = (
+        profiles_resp = await offload(
             auth_service_client.table("user_profiles")
             .select("id, username, display_name, role, email, team_id, club_id, created_at")
             .order("username")
-            .execute()
+            .execute
         )
         profiles = profiles_resp.data or []
 
-        # Get last login time for each user
-        if profiles:
-            user_ids = [p["id"] for p in profiles]
+        user_ids = [p["id"] for p in profiles]
+        team_ids = {p["team_id"] for p in profiles if p.get("team_id")}
+        club_ids = {p["club_id"] for p in profiles if p.get("club_id")}
+
+        # Last logins and affiliation names all key off the profiles but not
+        # off each other, so the (up to) three lookups run together.
+        async with QueryGroup() as group:
             # Fetch most recent login event per user_id
-            events_resp = (
-                auth_service_client.table("login_events")
-                .select("user_id, success, created_at")
-                .in_("user_id", user_ids)
-                .order("created_at", desc=True)
-                .execute()
-            )
-            events = events_resp.data or []
+            events_task = teams_task = clubs_task = None
+            if user_ids:
+                events_task = group.spawn(
+                    offload(
+                        auth_service_client.table("login_events")
+                        .select("user_id, success, created_at")
+                        .in_("user_id", user_ids)
+                        .order("created_at", desc=True)
+                        .execute
+                    ),
+                    name="login_events",
+                )
+            # Resolve affiliation to names (SB-803). The list previously carried
+            # team_id and club_id but the UI showed neither, so an admin could not
+            # see that an account named for a club was attached to nothing. Ids
+            # alone do not fix that — a column of integers is no more readable.
+            if team_ids:
+                teams_task = group.spawn(
+                    offload(auth_service_client.table("teams").select("id, name").in_("id", list(team_ids)).execute),
+                    name="team_names",
+                )
+            if club_ids:
+                clubs_task = group.spawn(
+                    offload(auth_service_client.table("clubs").select("id, name").in_("id", list(club_ids)).execute),
+                    name="club_names",
+                )
+
+        # Get last login time for each user
+        if events_task:
+            events = events_task.result().data or []
 
             # Build a map of user_id -> last login info
             last_login_map: dict[str, dict] = {}
@@ -6683,20 +7161,12 @@ async def get_all_users(current_user: dict[str, Any] = Depends(require_admin)):
                 profile["last_login_at"] = info.get("last_login_at")
                 profile["last_login_success"] = info.get("last_login_success")
 
-        # Resolve affiliation to names (SB-803). The list previously carried
-        # team_id and club_id but the UI showed neither, so an admin could not
-        # see that an account named for a club was attached to nothing. Ids
-        # alone do not fix that — a column of integers is no more readable.
         team_names: dict[int, str] = {}
         club_names: dict[int, str] = {}
-        team_ids = {p["team_id"] for p in profiles if p.get("team_id")}
-        club_ids = {p["club_id"] for p in profiles if p.get("club_id")}
-        if team_ids:
-            teams_resp = auth_service_client.table("teams").select("id, name").in_("id", list(team_ids)).execute()
-            team_names = {t["id"]: t["name"] for t in (teams_resp.data or [])}
-        if club_ids:
-            clubs_resp = auth_service_client.table("clubs").select("id, name").in_("id", list(club_ids)).execute()
-            club_names = {c["id"]: c["name"] for c in (clubs_resp.data or [])}
+        if teams_task:
+            team_names = {t["id"]: t["name"] for t in (teams_task.result().data or [])}
+        if clubs_task:
+            club_names = {c["id"]: c["name"] for c in (clubs_task.result().data or [])}
         for profile in profiles:
             profile["team_name"] = team_names.get(profile.get("team_id"))
             profile["club_name"] = club_names.get(profile.get("club_id"))
@@ -7036,6 +7506,7 @@ async def get_agent_match_summary(
             score_from=score_from,
             score_to=score_to,
             include_test=viewer_sees_test_content(current_user),
+            today=date.today(),
         )
         return {
             "season": season,
@@ -7049,6 +7520,7 @@ async def get_agent_match_summary(
 
 @app.get("/api/agent/matches")
 async def get_agent_matches(
+    request: Request,
     team: str = Query(..., description="MT canonical team name, e.g. 'IFA'"),
     age_group: str = Query(..., description="e.g. 'U14'"),
     league: str = Query(..., description="e.g. 'Homegrown'"),
@@ -7064,8 +7536,25 @@ async def get_agent_matches(
     age-group/league/division/season. Optional start_date/end_date narrow the
     results to a specific segment (e.g. spring only) to avoid false extra_in_mt
     findings from matches in a different season segment.
+
+    With Accept: application/x-ndjson the matches are streamed one JSON object
+    per line instead of wrapped in {"matches": [...]}.
     """
     try:
+        if _wants_ndjson(request):
+            return _ndjson_response(
+                match_dao.iter_agent_matches(
+                    team=team,
+                    age_group=age_group,
+                    league=league,
+                    division=division,
+                    season=season,
+                    start_date=start_date,
+                    end_date=end_date,
+                    include_test=viewer_sees_test_content(current_user),
+                )
+            )
+
         matches = match_dao.get_agent_matches(
             team=team,
             age_group=age_group,
@@ -7472,18 +7961,21 @@ async def admin_upload_tournament_logo(
     try:
         storage = match_dao.client.storage
 
-        storage.from_("tournament-logos").upload(
-            file_path, content, file_options={"content-type": file.content_type, "upsert": "true"}
+        await offload(
+            storage.from_("tournament-logos").upload,
+            file_path,
+            content,
+            file_options={"content-type": file.content_type, "upsert": "true"},
         )
 
         # Size variants — only for PNGs, same as club logos.
         if ext == "png":
-            _upload_logo_png_variants(storage, "tournament-logos", str(tournament_id), content)
+            await offload(_upload_logo_png_variants, storage, "tournament-logos", str(tournament_id), content)
             logger.info(f"Uploaded size variants for tournament {tournament_id}")
 
         public_url = storage.from_("tournament-logos").get_public_url(file_path)
 
-        updated = tournament_dao.update_tournament(tournament_id=tournament_id, logo_url=public_url)
+        updated = await offload(tournament_dao.update_tournament, tournament_id=tournament_id, logo_url=public_url)
         if not updated:
             raise HTTPException(status_code=404, detail=f"Tournament with id {tournament_id} not found")
 
@@ -7626,11 +8118,11 @@ async def ingest_qop_rankings(
     the response reports `status="unchanged"`.
     """
     try:
-        result = QoPRankingsDAO.record_snapshot(match_dao.client, snapshot.model_dump())
+        result = await offload(QoPRankingsDAO.record_snapshot, match_dao.client, snapshot.model_dump())
         if result.get("status") == "inserted":
-            from dao.base_dao import clear_cache
+            from dao.async_cache import async_clear_cache
 
-            clear_cache("mt:dao:qop:*")
+            await async_clear_cache("mt:dao:qop:*")
         return result
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
@@ -7659,21 +8151,21 @@ async def get_qop_rankings(
     Cached in Redis for 1 hour. Invalidated by POST /api/qop-rankings when a
     new snapshot is inserted, or via DELETE /api/admin/cache/qop.
     """
-    from dao.base_dao import cache_get, cache_set
+    from dao.async_cache import async_cache_get, async_cache_set
 
     cache_key = (
         f"mt:dao:qop:{division_id}:{age_group_id}:{snapshot_id}"
         if snapshot_id is not None
         else f"mt:dao:qop:{division_id}:{age_group_id}"
     )
-    cached = cache_get(cache_key)
+    cached = await async_cache_get(cache_key)
     if cached is not None:
         return cached
 
     try:
-        result = QoPRankingsDAO.get_with_delta(match_dao.client, division_id, age_group_id, snapshot_id)
+        result = await offload(QoPRankingsDAO.get_with_delta, match_dao.client, division_id, age_group_id, snapshot_id)
         if result.get("has_data"):
-            cache_set(cache_key, result, ttl=3600)
+            await async_cache_set(cache_key, result, ttl=3600)
         return result
     except Exception as e:
         logger.error(f"Error retrieving QoP rankings: {e!s}", exc_info=True)
@@ -5,6 +5,8 @@ Authentication and authorization utilities for the sports league backend.
 import logging
 import os
 import secrets
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 from functools import wraps
 from typing import Any
@@ -17,11 +19,17 @@ from jwt import PyJWKClient
 
 from supabase import Client
 
+from dao.async_base_dao import offload
+
 load_dotenv()
 
 # JWKS client for ES256 token verification (cached)
 _jwks_client: PyJWKClient | None = None
 
+# Seconds a verified user's test-content audience is remembered, so the
+# response cache can partition their requests without reading user_profiles
+VIEWER_AUDIENCE_TTL = int(os.getenv("VIEWER_AUDIENCE_TTL", "60"))
+
 logger = logging.getLogger(__name__)
 
 # Canonical role for each invite_type (SB-798).
@@ -94,7 +102,8 @@ async def check_username_available(supabase_client: Client, username: str) -> bo
     Returns True if username is available, False if taken.
     """
     try:
-        result = supabase_client.table("user_profiles").select("id").eq("username", username.lower()).execute()
+        query = supabase_client.table("user_profiles").select("id").eq("username", username.lower())
+        result = await offload(query.execute)
 
         return len(result.data) == 0
     except Exception as e:
@@ -111,37 +120,52 @@ class AuthManager:
         if not self.jwt_secret:
             raise ValueError("SUPABASE_JWT_SECRET environment variable is required. Please set it in your .env file.")
 
+        # user_id -> (viewer_sees_test_content, expires_at), see viewer_audience().
+        # In expiry order (every entry has the same TTL), so expired entries are
+        # always at the front; _remember_audience() drops them on each insert.
+        self._audiences: dict[str, tuple[bool, float]] = {}
+        self._audiences_lock = threading.Lock()
+
+    def decode_token(self, token: str) -> dict[str, Any]:
+        """Check a Supabase JWT's signature, expiry and audience; return its claims.
+
+        Raises:
+            jwt.InvalidTokenError: If the token is not valid
+        """
+        global _jwks_client
+        # Check token header to determine algorithm
+        unverified_header = jwt.get_unverified_header(token)
+        alg = unverified_header.get("alg", "HS256")
+
+        if alg == "ES256":
+            # Use JWKS for ES256 tokens (new Supabase CLI)
+            supabase_url = os.getenv("SUPABASE_URL", "http://127.0.0.1:55321")
+            jwks_url = f"{supabase_url}/auth/v1/.well-known/jwks.json"
+
+            if _jwks_client is None:
+                _jwks_client = PyJWKClient(jwks_url)
+
+            signing_key = _jwks_client.get_signing_key_from_jwt(token)
+            payload = jwt.decode(
+                token,
+                signing_key.key,
+                algorithms=["ES256"],
+                audience="authenticated",
+            )
+        else:
+            # Use symmetric secret for HS256 tokens (legacy/cloud)
+            payload = jwt.decode(
+                token,
+                self.jwt_secret,
+                algorithms=["HS256"],
+                audience="authenticated",
+            )
+        return payload
+
     def verify_token(self, token: str) -> dict[str, Any] | None:
         """Verify JWT token and return user data."""
-        global _jwks_client
         try:
-            # Check token header to determine algorithm
-            unverified_header = jwt.get_unverified_header(token)
-            alg = unverified_header.get("alg", "HS256")
-
-            if alg == "ES256":
-                # Use JWKS for ES256 tokens (new Supabase CLI)
-                supabase_url = os.getenv("SUPABASE_URL", "http://127.0.0.1:55321")
-                jwks_url = f"{supabase_url}/auth/v1/.well-known/jwks.json"
-
-                if _jwks_client is None:
-                    _jwks_client = PyJWKClient(jwks_url)
-
-                signing_key = _jwks_client.get_signing_key_from_jwt(token)
-                payload = jwt.decode(
-                    token,
-                    signing_key.key,
-                    algorithms=["ES256"],
-                    audience="authenticated",
-                )
-            else:
-                # Use symmetric secret for HS256 tokens (legacy/cloud)
-                payload = jwt.decode(
-                    token,
-                    self.jwt_secret,
-                    algorithms=["HS256"],
-                    audience="authenticated",
-                )
+            payload = self.decode_token(token)
 
             user_id = payload.get("sub")
             if not user_id:
@@ -177,7 +201,7 @@ class AuthManager:
                 # Legacy user with real email in JWT
                 real_email = jwt_email
 
-            return {
+            user_data = {
                 "user_id": user_id,
                 "username": username,  # Primary identifier for username auth users
                 "email": real_email,  # Real email (optional, for notifications)
@@ -187,6 +211,8 @@ class AuthManager:
                 "display_name": profile.get("display_name"),
                 "is_test": profile.get("is_test", False),  # SB-85 test partition
             }
+            self._remember_audience(user_id, viewer_sees_test_content(user_data))
+            return user_data
 
         except jwt.ExpiredSignatureError:
             logger.warning("Token has expired")
@@ -198,6 +224,35 @@ class AuthManager:
             logger.error(f"Error verifying token: {e}")
             return None
 
+    def _remember_audience(self, user_id: str, sees_test_content: bool) -> None:
+        """Record a user's audience for viewer_audience(), evicting expired entries."""
+        now = time.monotonic()
+        with self._audiences_lock:
+            # Re-inserted rather than updated in place, to keep expiry order
+            self._audiences.pop(user_id, None)
+            self._audiences[user_id] = (sees_test_content, now + VIEWER_AUDIENCE_TTL)
+            while next(iter(self._audiences.values()))[1] < now:
+                del self._audiences[next(iter(self._audiences))]
+
+    def viewer_audience(self, token: str) -> bool | None:
+        """viewer_sees_test_content() of a token's user, without reading user_profiles.
+
+        Known only for users verify_token() has resolved in this process in the
+        last VIEWER_AUDIENCE_TTL seconds; the token itself is still checked.
+
+        Returns:
+            The user's audience, or None if the token is invalid or the user unknown
+        """
+        try:
+            user_id = self.decode_token(token).get("sub")
+        except Exception:
+            return None
+        with self._audiences_lock:
+            entry = self._audiences.get(user_id)
+        if entry is None or entry[1] < time.monotonic():
+            return None
+        return entry[0]
+
     def create_service_account_token(self, service_name: str, permissions: list[str], expires_days: int = 365) -> str:
         """Create a service account JWT token for automated systems."""
         expiration = datetime.now(UTC) + timedelta(days=expires_days)
@@ -25,6 +25,9 @@ from rich.table import Table
 from rich.text import Text
 from rich.tree import Tree
 
+from dao import cache_codec
+from dao.base_dao import CACHE_SIZES_KEY
+
 app = typer.Typer(
     name="cache-cli",
     help="Inspect and manage the Redis cache for MissingTable",
@@ -53,13 +56,17 @@ def get_redis_source():
     return f"local ({config.get('local_context', 'rancher-desktop')})"
 
 
-def get_redis_client():
-    """Get Redis client from environment or default."""
+def get_redis_client(decode_responses: bool = True):
+    """Get Redis client from environment or default.
+
+    Args:
+        decode_responses: False to read raw cache values (codec bytes)
+    """
     import redis
 
     url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     try:
-        client = redis.from_url(url, decode_responses=True)
+        client = redis.from_url(url, decode_responses=decode_responses)
         client.ping()
         console.print(f"[dim]Redis: {get_redis_source()} ({url})[/dim]")
         return client
@@ -159,10 +166,11 @@ def stats():
         except Exception:
             size = 0
 
-        # Extract domain from key (e.g., "mt:clubs:all" -> "clubs")
+        # Extract domain from key (e.g., "mt:clubs:all" -> "clubs",
+        # "mt:dao:teams:all" -> "teams")
         parts = key.split(":")
         if len(parts) >= 2:
-            domain = parts[1]
+            domain = parts[2] if parts[1] == "dao" and len(parts) >= 3 else parts[1]
             if domain not in by_domain:
                 by_domain[domain] = {"count": 0, "size": 0}
             by_domain[domain]["count"] += 1
@@ -199,6 +207,33 @@ def stats():
 
         console.print(domain_table)
 
+    # Payload sizes per DAO key pattern, recorded by cache_set since the last flush
+    sizes = r.hgetall(CACHE_SIZES_KEY)
+    if sizes:
+        by_pattern = {}
+        for field, value in sizes.items():
+            pattern, _, counter = field.rpartition("|")
+            by_pattern.setdefault(pattern, {})[counter] = int(value)
+
+        pattern_table = Table(title="By Key Pattern (payloads written)", box=box.ROUNDED)
+        pattern_table.add_column("Pattern", style="cyan", overflow="fold")
+        pattern_table.add_column("Writes", justify="right")
+        pattern_table.add_column("Avg Size", justify="right")
+        pattern_table.add_column("Last Size", justify="right")
+        pattern_table.add_column("Total Written", justify="right")
+
+        for pattern, data in sorted(by_pattern.items(), key=lambda item: item[1].get("bytes", 0), reverse=True):
+            writes = data.get("writes", 0)
+            pattern_table.add_row(
+                Text(pattern, style="cyan"),
+                str(writes),
+                format_bytes(data.get("bytes", 0) // writes if writes else 0),
+                format_bytes(data.get("last", 0)),
+                format_bytes(data.get("bytes", 0)),
+            )
+
+        console.print(pattern_table)
+
 
 @app.command()
 def get(
@@ -216,9 +251,9 @@ def get(
     ttl = r.ttl(key)
 
     if key_type == "string":
-        value = r.get(key)
+        value = get_redis_client(decode_responses=False).get(key)
         try:
-            data = json.loads(value)
+            data = cache_codec.decode(value)
             if raw:
                 console.print_json(json.dumps(data))
             else:
@@ -274,7 +309,8 @@ def get(
                     console.print(Panel(meta_table, title="Cache Entry", border_style="green"))
                     console.print(data)
 
-        except json.JSONDecodeError:
+        except ValueError:
+            # JSONDecodeError (and orjson's error) are ValueErrors
             console.print("[yellow]Raw string value:[/yellow]")
             console.print(value[:500])
     else:
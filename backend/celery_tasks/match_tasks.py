@@ -16,10 +16,8 @@ from celery import Task
 
 from celery_app import app
 from celery_tasks.validation_tasks import validate_match_data
-from dao.league_dao import LeagueDAO
 from dao.match_dao import MatchDAO, SupabaseConnection
-from dao.season_dao import SeasonDAO
-from dao.team_dao import TeamDAO
+from dao.reference_registry import get_reference_registry
 from logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -35,9 +33,6 @@ class DatabaseTask(Task):
 
     _connection = None
     _dao = None
-    _team_dao = None
-    _season_dao = None
-    _league_dao = None
 
     @property
     def dao(self):
@@ -49,31 +44,9 @@ class DatabaseTask(Task):
         return self._dao
 
     @property
-    def team_dao(self):
-        """Lazy initialization of TeamDAO for team lookups."""
-        if self._team_dao is None:
-            if self._connection is None:
-                self._connection = SupabaseConnection()
-            self._team_dao = TeamDAO(self._connection)
-        return self._team_dao
-
-    @property
-    def season_dao(self):
-        """Lazy initialization of SeasonDAO for season/age-group lookups."""
-        if self._season_dao is None:
-            if self._connection is None:
-                self._connection = SupabaseConnection()
-            self._season_dao = SeasonDAO(self._connection)
-        return self._season_dao
-
-    @property
-    def league_dao(self):
-        """Lazy initialization of LeagueDAO for division lookups."""
-        if self._league_dao is None:
-            if self._connection is None:
-                self._connection = SupabaseConnection()
-            self._league_dao = LeagueDAO(self._connection)
-        return self._league_dao
+    def registry(self):
+        """Reference-data registry for team/age group/division/season name lookups."""
+        return get_reference_registry(self.dao.client)
 
     @staticmethod
     def _build_scheduled_kickoff(match_data: dict[str, Any]) -> str | None:
@@ -228,6 +201,9 @@ class DatabaseTask(Task):
 
             if response.data:
                 logger.info(f"Successfully updated match {match_id}: {update_data}")
+                # Direct table write: apply standings deltas and invalidate the
+                # match's cached reads like the MatchDAO write methods do
+                self.dao.invalidate_match_rows(response.data)
                 return True
             else:
                 logger.error(f"Update returned no data for match {match_id}")
@@ -305,12 +281,12 @@ def process_match_data(self: DatabaseTask, match_data: dict[str, Any]) -> dict[s
         logger.debug(f"Looking up teams: {home_team_name}, {away_team_name}")
 
         # Get or create teams
-        home_team = self.team_dao.get_team_by_name(home_team_name)
+        home_team = self.registry.team(home_team_name)
         if not home_team:
             logger.warning(f"Home team not found: {home_team_name}. Creating placeholder.")
             raise ValueError(f"Team not found: {home_team_name}")
 
-        away_team = self.team_dao.get_team_by_name(away_team_name)
+        away_team = self.registry.team(away_team_name)
         if not away_team:
             logger.warning(f"Away team not found: {away_team_name}. Creating placeholder.")
             raise ValueError(f"Team not found: {away_team_name}")
@@ -331,7 +307,7 @@ def process_match_data(self: DatabaseTask, match_data: dict[str, Any]) -> dict[s
             # Look up age_group_id if age_group is provided
             age_group_id = None
             if match_data.get("age_group"):
-                age_group = self.season_dao.get_age_group_by_name(match_data["age_group"])
+                age_group = self.registry.age_group(match_data["age_group"])
                 if age_group:
                     age_group_id = age_group["id"]
                 else:
@@ -401,12 +377,12 @@ def process_match_data(self: DatabaseTask, match_data: dict[str, Any]) -> dict[s
             logger.info(f"Creating new match (MLS ID: {external_match_id}): {home_team_name} vs {away_team_name}")
 
             # Resolve names to IDs before calling create_match
-            current_season = self.season_dao.get_current_season()
+            current_season = self.registry.current_season()
             season_id = current_season["id"] if current_season else 1
 
             age_group_id_for_create = 1  # Default fallback
             if match_data.get("age_group"):
-                ag_record = self.season_dao.get_age_group_by_name(match_data["age_group"])
+                ag_record = self.registry.age_group(match_data["age_group"])
                 if ag_record:
                     age_group_id_for_create = ag_record["id"]
                 else:
@@ -414,7 +390,7 @@ def process_match_data(self: DatabaseTask, match_data: dict[str, Any]) -> dict[s
 
             division_id_for_create = None
             if match_data.get("division"):
-                div_record = self.league_dao.get_division_by_name(match_data["division"])
+                div_record = self.registry.division(match_data["division"])
                 if div_record:
                     division_id_for_create = div_record["id"]
                 else:
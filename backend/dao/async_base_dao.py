@@ -0,0 +1,266 @@
+"""
+Async DAO base for async endpoints.
+
+SupabaseConnection wraps a synchronous httpx.Client, so a sync DAO method
+called from an ``async def`` route holds the event loop for the whole
+PostgREST round trip. AsyncBaseDAO runs on the async Supabase client
+(supabase.acreate_client) instead: its queries are built exactly like the
+sync ones and only ``execute()`` is awaited:
+
+    client = await self.get_client()
+    response = await client.table("teams").select("*").order("name").execute()
+
+Migrated DAOs (dao/async_match_dao.py, dao/async_team_dao.py) reuse the sync
+DAO's query builders and row shaping, and cache with @async_dao_cache under
+the same keys, so sync and async reads share entries.
+
+Until a DAO is migrated, ThreadpoolDAO gives an async route an awaitable view
+of it: every method call runs in a worker thread.
+
+    season = await ThreadpoolDAO(season_dao).get_current_season()
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+
+import httpx
+import structlog
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
+
+from dao.base_dao import _cache_computed_at
+
+logger = structlog.get_logger(__name__)
+
+
+class AsyncSupabaseConnection:
+    """Async Supabase client with the same URL, key, timeouts and retries as SupabaseConnection.
+
+    The client is created on first use and recreated if the running event
+    loop changes, since its pooled connections cannot move between loops.
+    """
+
+    def __init__(self, connection_holder):
+        """
+        Initialize from the process's SupabaseConnection.
+
+        Args:
+            connection_holder: SupabaseConnection instance
+
+        Raises:
+            TypeError: If connection_holder is not a SupabaseConnection
+        """
+        from dao.match_dao import SupabaseConnection
+
+        if not isinstance(connection_holder, SupabaseConnection):
+            raise TypeError("connection_holder must be a SupabaseConnection instance")
+
+        self.url = connection_holder.url
+        self.key = connection_holder.key
+        self._client: AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def get_client(self) -> AsyncClient:
+        """Get the async Supabase client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is loop:
+            return self._client
+
+        http_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(retries=3),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=int(os.getenv("SUPABASE_ASYNC_MAX_CONNECTIONS", "50"))),
+        )
+        # Stateless like the auth clients: no stored session, no refresh task
+        options = AsyncClientOptions(httpx_client=http_client, auto_refresh_token=False, persist_session=False)
+        self._client = await acreate_client(self.url, self.key, options=options)
+        self._loop = loop
+        logger.debug("Async connection to Supabase established")
+        return self._client
+
+
+class AsyncBaseDAO:
+    """Base for async DAOs: BaseDAO's common utilities, awaitable."""
+
+    def __init__(self, connection_holder: AsyncSupabaseConnection):
+        """
+        Initialize with an AsyncSupabaseConnection.
+
+        Args:
+            connection_holder: AsyncSupabaseConnection instance
+
+        Raises:
+            TypeError: If connection_holder is not an AsyncSupabaseConnection
+        """
+        if not isinstance(connection_holder, AsyncSupabaseConnection):
+            raise TypeError("connection_holder must be an AsyncSupabaseConnection instance")
+
+        self.connection_holder = connection_holder
+
+    async def get_client(self) -> AsyncClient:
+        """Get the async Supabase client to build queries on."""
+        return await self.connection_holder.get_client()
+
+    async def execute_query(self, query, operation_name: str = "database operation"):
+        """
+        Execute a Supabase query with common error handling.
+
+        Args:
+            query: Query built on get_client() (result of .select(), .insert(), etc.)
+            operation_name: Description of the operation for logging
+
+        Returns:
+            Query response
+
+        Raises:
+            Exception: Re-raises any database errors after logging
+        """
+        try:
+            return await query.execute()
+        except Exception as e:
+            logger.exception(
+                f"Error during {operation_name}",
+                operation=operation_name,
+                error_type=type(e).__name__,
+                error_message=str(e),
+            )
+            raise
+
+    async def safe_execute(self, query, operation_name: str = "database operation", default=None):
+        """
+        Execute a query, returning a default value on error.
+
+        Args:
+            query: Query built on get_client()
+            operation_name: Description of the operation for logging
+            default: Value to return if query fails (default: None)
+
+        Returns:
+            Query response or default value on error
+        """
+        try:
+            return await query.execute()
+        except Exception as e:
+            logger.warning(
+                f"Non-critical error during {operation_name}",
+                operation=operation_name,
+                error_type=type(e).__name__,
+                error_message=str(e),
+                returning_default=default,
+            )
+            return default
+
+    async def get_by_id(self, table: str, record_id: int, id_field: str = "id") -> dict | None:
+        """
+        Generic method to get a single record by ID.
+
+        Args:
+            table: Table name
+            record_id: Record ID to fetch
+            id_field: Name of the ID field (default: "id")
+
+        Returns:
+            dict: Record data or None if not found
+
+        Raises:
+            Exception: If database query fails
+        """
+        try:
+            client = await self.get_client()
+            response = await client.table(table).select("*").eq(id_field, record_id).execute()
+            return response.data[0] if response.data else None
+        except Exception:
+            logger.exception(
+                f"Error fetching record from {table}",
+                table=table,
+                record_id=record_id,
+                id_field=id_field,
+            )
+            raise
+
+    async def get_all(self, table: str, order_by: str | None = None) -> list[dict]:
+        """
+        Generic method to get all records from a table.
+
+        Args:
+            table: Table name
+            order_by: Optional field name to order by
+
+        Returns:
+            list[dict]: List of records
+
+        Raises:
+            Exception: If database query fails
+        """
+        try:
+            client = await self.get_client()
+            query = client.table(table).select("*")
+            if order_by:
+                query = query.order(order_by)
+            response = await query.execute()
+            return response.data
+        except Exception:
+            logger.exception(f"Error fetching all records from {table}", table=table, order_by=order_by)
+            raise
+
+    async def exists(self, table: str, field: str, value) -> bool:
+        """
+        Check if a record exists with the given field value.
+
+        Args:
+            table: Table name
+            field: Field name to check
+            value: Value to match
+
+        Returns:
+            bool: True if record exists, False otherwise
+        """
+        try:
+            client = await self.get_client()
+            response = await client.table(table).select("id").eq(field, value).limit(1).execute()
+            return len(response.data) > 0
+        except Exception:
+            logger.exception(f"Error checking existence in {table}", table=table, field=field, value=value)
+            return False
+
+
+async def offload(func, /, *args, **kwargs):
+    """Run a blocking call in a worker thread and await its result.
+
+    Like asyncio.to_thread(), but if the call served a stale_ttl cached value,
+    the caller's get_cache_computed_at() reports it afterwards. No other
+    context variable the call sets reaches the caller.
+    """
+
+    def call():
+        return func(*args, **kwargs), _cache_computed_at.get()
+
+    loop = asyncio.get_running_loop()
+    result, computed_at = await loop.run_in_executor(None, contextvars.copy_context().run, call)
+    if computed_at is not _cache_computed_at.get():
+        _cache_computed_at.set(computed_at)
+    return result
+
+
+class ThreadpoolDAO:
+    """Awaitable view of a sync DAO: each method call runs in a worker thread (see offload()).
+
+    Args:
+        dao: The sync DAO
+    """
+
+    def __init__(self, dao):
+        self._dao = dao
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._dao, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def call(*args, **kwargs):
+            return await offload(attribute, *args, **kwargs)
+
+        return call
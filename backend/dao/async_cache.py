@@ -0,0 +1,393 @@
+"""
+Async DAO cache for async endpoints.
+
+Mirrors the cache helpers in dao/base_dao.py on redis.asyncio, so an
+``async def`` route or DAO method awaits cache I/O instead of blocking the
+event loop for a Redis round trip:
+
+    @async_dao_cache("qop:{division_id}:{age_group_id}", ttl=3600)
+    async def get_rankings(self, division_id: int, age_group_id: int): ...
+
+Keys, tags, the value encoding (dao/cache_codec.py), size accounting and L1
+invalidation broadcasts are shared with the sync helpers, so sync and async
+code read and invalidate the same entries. All connections come from one
+pool per process (CACHE_ASYNC_MAX_CONNECTIONS, default 50). Like the sync
+client, everything degrades to "no cache" when Redis is unavailable.
+
+The in-process L1 cache is used once the sync side has brought it up; the
+async helpers never open the sync connection themselves.
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import time
+
+import structlog
+
+from dao import cache_codec, cache_metrics
+from dao.base_dao import (
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_TAG_PREFIX,
+    _as_str,
+    _bind_call_args,
+    _build_cache_key,
+    _cache_family,
+    _drop_local_entries,
+    _family_tag_for_pattern,
+    _parse_version_read,
+    _queue_cache_write,
+    _queue_version_bumps,
+    _queue_version_read,
+    _version_families_for_pattern,
+    _version_families_for_tags,
+    get_local_cache,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Shared async client, and the event loop its pool belongs to
+_async_redis_client = None
+_async_redis_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def get_async_redis_client():
+    """Get the shared redis.asyncio client for DAO-level caching.
+
+    Returns None if caching is disabled or Redis is unavailable. The client is
+    recreated if the running event loop changes, since pooled connections
+    cannot move between loops.
+    """
+    global _async_redis_client, _async_redis_loop
+    loop = asyncio.get_running_loop()
+    if _async_redis_client is not None and _async_redis_loop is loop:
+        return _async_redis_client
+
+    if os.getenv("CACHE_ENABLED", "false").lower() != "true":
+        return None
+
+    try:
+        import redis.asyncio as aioredis
+
+        url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        client = aioredis.from_url(
+            url,
+            decode_responses=False,
+            max_connections=int(os.getenv("CACHE_ASYNC_MAX_CONNECTIONS", "50")),
+        )
+        await client.ping()
+        _async_redis_client = client
+        _async_redis_loop = loop
+        return client
+    except Exception as e:
+        logger.warning("dao_async_redis_connection_failed", error=str(e))
+        return None
+
+
+async def async_cache_get(key: str):
+    """Get a value from cache.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Deserialized value or None if not found/error
+    """
+    payload = await async_cache_get_payload(key)
+    return None if payload is None else cache_codec.decode(payload)
+
+
+async def async_cache_get_payload(key: str) -> bytes | None:
+    """Get a cached payload still encoded (see dao/cache_codec.py), or None."""
+    redis_client = await get_async_redis_client()
+    if not redis_client:
+        return None
+    family = _cache_family(key) or "other"
+    started = time.perf_counter()
+    local = get_local_cache(connect=False)
+    generation = None
+    if local is not None:
+        payload = local.get(key)
+        if payload is not None:
+            logger.debug("dao_cache_local_hit", key=key)
+            cache_metrics.record_lookup(family, "local", time.perf_counter() - started)
+            return payload
+        generation = local.generation
+    try:
+        cached = await redis_client.get(key)
+        if cached:
+            logger.debug("dao_cache_hit", key=key)
+            cache_metrics.record_lookup(family, "redis", time.perf_counter() - started)
+            if local is not None:
+                local.set(key, cached, generation=generation)
+            return cached
+        cache_metrics.record_lookup(family, None, time.perf_counter() - started)
+    except Exception as e:
+        logger.warning("dao_cache_get_error", key=key, error=str(e))
+        cache_metrics.record_error(family, "get")
+    return None
+
+
+async def async_cache_set(
+    key: str, value, ttl: int = 86400, tags: tuple[str, ...] = (), pattern: str | None = None
+) -> bool:
+    """Set a value in cache, registering its tags in the same MULTI.
+
+    Args:
+        key: Cache key
+        value: Value to cache (encoded by dao/cache_codec.py)
+        ttl: Time to live in seconds (default 24 hours)
+        tags: Extra tags to register the key under
+        pattern: Key pattern to account the payload size under
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not await get_async_redis_client():
+        return False
+    try:
+        payload = cache_codec.encode(value)
+    except Exception as e:
+        logger.warning("dao_cache_set_error", key=key, error=str(e))
+        cache_metrics.record_error(_cache_family(key) or "other", "set")
+        return False
+    return await async_cache_set_payload(key, payload, ttl, tags, pattern)
+
+
+async def async_cache_set_payload(
+    key: str,
+    payload: bytes,
+    ttl: int = 86400,
+    tags: tuple[str, ...] = (),
+    pattern: str | None = None,
+    local: bool = True,
+) -> bool:
+    """Set an already-encoded payload (see base_dao.cache_set_payload)."""
+    redis_client = await get_async_redis_client()
+    if not redis_client:
+        return False
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        _queue_cache_write(pipe, key, payload, ttl, tags, pattern)
+        await pipe.execute()
+        logger.debug("dao_cache_set", key=key, bytes=len(payload))
+        cache_metrics.record_set(_cache_family(key) or "other", len(payload))
+        local_cache = get_local_cache(connect=False) if local else None
+        if local_cache is not None:
+            local_cache.set(key, payload)
+        return True
+    except Exception as e:
+        logger.warning("dao_cache_set_error", key=key, error=str(e))
+        cache_metrics.record_error(_cache_family(key) or "other", "set")
+        return False
+
+
+async def async_clear_cache(pattern: str) -> int:
+    """Clear cache entries matching a pattern (tag set for family patterns, else SCAN).
+
+    Args:
+        pattern: Redis key pattern (e.g., "mt:dao:clubs:*")
+
+    Returns:
+        Number of keys deleted
+    """
+    redis_client = await get_async_redis_client()
+    if not redis_client:
+        return 0
+    deleted = 0
+    family = _family_tag_for_pattern(pattern)
+    try:
+        if family:
+            keys = await _pop_tagged_keys(redis_client, (family,))
+            if keys:
+                deleted = await _unlink_keys(redis_client, keys)
+        else:
+            cursor = 0
+            while True:
+                cursor, keys = await redis_client.scan(cursor, match=pattern, count=100)
+                if keys:
+                    deleted += await redis_client.delete(*keys)
+                if cursor == 0:
+                    break
+        if deleted > 0:
+            logger.info("dao_cache_cleared", pattern=pattern, deleted=deleted)
+    except Exception as e:
+        logger.warning("dao_cache_clear_error", pattern=pattern, error=str(e))
+        cache_metrics.record_error(family or "other", "clear")
+    await _broadcast_invalidation(redis_client, patterns=(pattern,))
+    await _bump_versions(redis_client, _version_families_for_pattern(pattern))
+    return deleted
+
+
+async def async_invalidate_tags(*tags: str) -> int:
+    """Delete every cache entry carrying any of the given tags.
+
+    Returns:
+        Number of keys deleted
+    """
+    redis_client = await get_async_redis_client()
+    if not redis_client or not tags:
+        return 0
+    keys: list[str] = []
+    deleted = 0
+    try:
+        keys = await _pop_tagged_keys(redis_client, tags)
+        if keys:
+            deleted = await _unlink_keys(redis_client, keys)
+        if deleted > 0:
+            logger.info("dao_cache_tags_invalidated", tags=tags, deleted=deleted)
+    except Exception as e:
+        logger.warning("dao_cache_tag_invalidation_error", tags=tags, error=str(e))
+    await _broadcast_invalidation(redis_client, keys=keys)
+    await _bump_versions(redis_client, _version_families_for_tags(tags))
+    return deleted
+
+
+async def async_get_data_versions(families) -> dict[str, int] | None:
+    """Current data version of each family (see base_dao.get_data_versions).
+
+    Returns:
+        Family -> version, or None without Redis
+    """
+    read = await _read_versions(families)
+    return None if read is None else read[0]
+
+
+async def async_get_versioned_payload(key: str, families) -> tuple[dict[str, int], bytes | None] | None:
+    """async_get_data_versions() plus the raw value at key (see base_dao.get_versioned_payload).
+
+    Returns:
+        (versions, payload or None), or None without Redis
+    """
+    return await _read_versions(families, key)
+
+
+async def _read_versions(families, payload_key: str | None = None) -> tuple[dict[str, int], bytes | None] | None:
+    redis_client = await get_async_redis_client()
+    if not redis_client:
+        return None
+    pipe = redis_client.pipeline(transaction=True)
+    names = _queue_version_read(pipe, families, payload_key)
+    try:
+        values = (await pipe.execute())[-1]
+    except Exception as e:
+        logger.warning("dao_cache_version_read_error", families=names, error=str(e))
+        return None
+    return _parse_version_read(names, values, payload_key)
+
+
+async def _pop_tagged_keys(redis_client, tags) -> list[str]:
+    """Atomically read and delete the tag sets, returning the keys they listed."""
+    pipe = redis_client.pipeline(transaction=True)
+    for tag in tags:
+        tag_key = f"{CACHE_TAG_PREFIX}{tag}"
+        pipe.smembers(tag_key)
+        pipe.delete(tag_key)
+    results = await pipe.execute()
+    keys: set[str] = set()
+    for members in results[0::2]:
+        keys.update(_as_str(member) for member in members or ())
+    return sorted(keys)
+
+
+async def _unlink_keys(redis_client, keys: list[str], batch_size: int = 500) -> int:
+    """UNLINK keys in batches. Returns the number that existed."""
+    deleted = 0
+    for i in range(0, len(keys), batch_size):
+        deleted += await redis_client.unlink(*keys[i : i + batch_size])
+    return deleted
+
+
+async def _bump_versions(redis_client, families) -> None:
+    """Advance the data versions of the families (see base_dao.get_data_versions)."""
+    if not families:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        _queue_version_bumps(pipe, families)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning("dao_cache_version_bump_error", families=sorted(families), error=str(e))
+
+
+async def _broadcast_invalidation(redis_client, patterns: tuple[str, ...] = (), keys: list[str] | None = None) -> None:
+    """Drop local L1 entries and tell every other process to do the same."""
+    message = _drop_local_entries(patterns, keys)
+    if message is None:
+        return
+    try:
+        await redis_client.publish(CACHE_INVALIDATION_CHANNEL, message)
+    except Exception as e:
+        logger.warning("dao_cache_invalidation_publish_error", patterns=patterns, error=str(e))
+
+
+# =============================================================================
+# CACHING DECORATORS
+# =============================================================================
+
+
+def async_dao_cache(key_pattern: str, ttl: int = 86400, tags: tuple[str, ...] = ()):
+    """Decorator to cache async DAO method results.
+
+    Same key and tag semantics as @dao_cache, so both can share entries.
+
+    Args:
+        key_pattern: Cache key pattern with optional {arg} placeholders
+        ttl: Time to live in seconds (default 24 hours)
+        tags: Extra tag patterns the key is registered under
+    """
+
+    def decorator(func):
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"@async_dao_cache needs an async function, got {func.__qualname__}")
+        sig = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key_values = _bind_call_args(sig, args, kwargs)
+            try:
+                cache_key, cache_tags = _build_cache_key(key_pattern, tags, key_values)
+            except KeyError as e:
+                logger.warning("dao_cache_key_error", pattern=key_pattern, missing=str(e))
+                return await func(self, *args, **kwargs)
+
+            cached = await async_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            logger.debug("dao_cache_miss", key=cache_key, method=func.__name__)
+            result = await func(self, *args, **kwargs)
+            if result is not None:
+                await async_cache_set(cache_key, result, ttl, tags=cache_tags, pattern=key_pattern)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def async_invalidates_cache(*patterns: str, tags: tuple[str, ...] = ()):
+    """Decorator to clear cache after an async write operation succeeds.
+
+    Args:
+        *patterns: Cache key patterns to clear, e.g. "mt:dao:teams:*"
+        tags: Tag patterns to invalidate, with {arg} placeholders
+    """
+
+    def decorator(func):
+        sig = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            result = await func(self, *args, **kwargs)
+            for pattern in patterns:
+                await async_clear_cache(pattern)
+            if tags:
+                call_values = _bind_call_args(sig, args, kwargs)
+                await async_invalidate_tags(*(tag.format(**call_values) for tag in tags))
+            return result
+
+        return wrapper
+
+    return decorator
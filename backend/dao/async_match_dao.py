@@ -0,0 +1,134 @@
+"""
+Async Match Data Access Object.
+
+The hot match reads of MatchDAO (match lists, a team's matches, the LIVE tab)
+on the async Supabase client. Queries and row shaping are MatchDAO's, so both
+return the same data; see dao/async_base_dao.py.
+"""
+
+import structlog
+
+from dao.async_base_dao import AsyncBaseDAO
+from dao.match_dao import (
+    MATCHES_PAGE_SIZE,
+    _flatten_live_match,
+    _live_matches_query,
+    _matches_page,
+    _matches_page_query,
+    _team_matches,
+    _team_matches_query,
+)
+
+logger = structlog.get_logger()
+
+
+class AsyncMatchDAO(AsyncBaseDAO):
+    """Async data access object for match reads."""
+
+    # === Match Methods ===
+
+    async def get_all_matches(
+        self,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        division_id: int | None = None,
+        team_id: int | None = None,
+        match_type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        include_test: bool = False,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[dict]:
+        """Get all matches with optional filters (see MatchDAO.get_all_matches)."""
+        try:
+            matches: list[dict] = []
+            cursor = None
+            while True:
+                page = await self.get_matches_page(
+                    season_id=season_id,
+                    age_group_id=age_group_id,
+                    division_id=division_id,
+                    team_id=team_id,
+                    match_type=match_type,
+                    start_date=start_date,
+                    end_date=end_date,
+                    include_test=include_test,
+                    limit=MATCHES_PAGE_SIZE,
+                    cursor=cursor,
+                    fields=fields,
+                )
+                matches.extend(page["matches"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    return matches
+
+        except Exception:
+            logger.exception("Error querying matches")
+            return []
+
+    async def get_matches_page(
+        self,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        division_id: int | None = None,
+        team_id: int | None = None,
+        match_type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        include_test: bool = False,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> dict:
+        """Get one page of matches, newest first (see MatchDAO.get_matches_page).
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = _matches_page_query(
+            await self.get_client(),
+            season_id=season_id,
+            age_group_id=age_group_id,
+            division_id=division_id,
+            team_id=team_id,
+            match_type=match_type,
+            start_date=start_date,
+            end_date=end_date,
+            include_test=include_test,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+        )
+        response = await query.execute()
+        return _matches_page(response.data, limit, fields)
+
+    async def get_matches_by_team(
+        self,
+        team_id: int,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        include_test: bool = False,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[dict]:
+        """Get all matches for a specific team (see MatchDAO.get_matches_by_team)."""
+        try:
+            client = await self.get_client()
+            query = _team_matches_query(client, team_id, season_id, age_group_id, include_test, fields)
+            response = await query.execute()
+            return _team_matches(response.data, fields)
+
+        except Exception:
+            logger.exception("Error querying matches by team")
+            return []
+
+    # === Live Match Methods ===
+
+    async def get_live_matches(self, include_test: bool = False) -> list[dict]:
+        """Get all matches with status 'live' (see MatchDAO.get_live_matches)."""
+        try:
+            response = await _live_matches_query(await self.get_client(), include_test).execute()
+            return [_flatten_live_match(match) for match in response.data or []]
+
+        except Exception:
+            logger.exception("Error getting live matches")
+            return []
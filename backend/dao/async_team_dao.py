@@ -0,0 +1,27 @@
+"""
+Async Team Data Access Object.
+
+The hot team reads of TeamDAO on the async Supabase client, cached under the
+same keys as TeamDAO's (and so invalidated by its writes); see
+dao/async_base_dao.py.
+"""
+
+import structlog
+
+from dao.async_base_dao import AsyncBaseDAO
+from dao.async_cache import async_dao_cache
+from dao.team_dao import _all_teams_query, _flatten_team
+
+logger = structlog.get_logger()
+
+
+class AsyncTeamDAO(AsyncBaseDAO):
+    """Async data access object for team reads."""
+
+    # === Team Query Methods ===
+
+    @async_dao_cache("teams:all")
+    async def get_all_teams(self) -> list[dict]:
+        """Get all teams with their age groups (see TeamDAO.get_all_teams)."""
+        response = await _all_teams_query(await self.get_client()).execute()
+        return [_flatten_team(team) for team in response.data]
@@ -30,24 +30,102 @@ The decorator:
         return self.client.table("teams").insert({...}).execute()
 
 After successful completion, clears all keys matching the pattern(s).
+
+### Tags
+
+Every cached key is added to a Redis set for its family (the segment after
+"mt:dao:", e.g. "matches"), plus any extra tags given to @dao_cache:
+
+    @dao_cache("matches:table:{season_id}:{division_id}", tags=("matches:season:{season_id}",))
+
+Invalidating a family pattern such as "mt:dao:matches:*" reads and deletes the
+family's tag set in one MULTI and UNLINKs its members, which is O(keys in the
+tag) instead of a SCAN over the whole keyspace. Any other glob pattern still
+falls back to SCAN. Extra tags are invalidated with invalidate_tags() or
+@invalidates_cache(tags=...).
+
+### Single-flight
+
+    @dao_cache("matches:table:{season_id}", single_flight=True)
+
+On a miss, only one caller recomputes the value. Callers in the same process
+wait on the leader's future; callers in other processes see the leader's
+short Redis lock (mt:dao:_lock:<key>) and poll for the value it writes. A
+waiter that gives up after wait_timeout computes the value itself, so a slow
+or crashed leader never turns into an outage.
+
+### Stale-while-revalidate
+
+    @dao_cache("playoffs:bracket:{league_id}", ttl=300, stale_ttl=3600)
+
+The entry is stored with its computed-at time and kept in Redis for
+ttl + stale_ttl. Once it is older than ttl, callers still get it immediately
+while one background thread (CACHE_REFRESH_WORKERS, default 2) recomputes
+and rewrites the key. get_cache_computed_at() reports when the value returned
+to the current request was computed, for freshness headers.
+
+### Encoding and size accounting
+
+Values are stored via dao/cache_codec.py: a format-version byte followed by
+JSON, zlib-compressed above CACHE_COMPRESS_MIN_BYTES. Each write also bumps
+per-pattern counters in CACHE_SIZES_KEY (writes, bytes written, last size),
+read back by get_cache_size_stats() for cache_cli.py stats and
+/api/admin/cache.
+
+### Metrics
+
+Hits (per layer), misses, errors, payload sizes and lookup latency are
+exported per key family as Prometheus metrics (dao/cache_metrics.py) once
+setup_metrics() enables them. Per-hit log lines are debug-level.
+
+### Data versions
+
+Every clear_cache() / invalidate_tags() also increments a version counter per
+family it touched (mt:ver:<family>), after the entries are deleted.
+get_data_versions() reads them in one round trip; the API hashes them into
+ETags so an unchanged resource can be answered with 304 Not Modified without
+touching a DAO. Writes to data that is not cached (card events) bump their
+family with bump_data_versions(). Versions need Redis: without it there are
+no ETags.
+
+### In-process L1 cache
+
+With CACHE_L1_ENABLED=true each worker process keeps a small LRU of serialized
+payloads in front of Redis (see dao/local_cache.py), so hot reference data is
+served without a round trip. clear_cache() drops matching local entries and
+broadcasts the pattern on CACHE_INVALIDATION_CHANNEL; every process subscribes
+and drops its own copies. Tuning: CACHE_L1_MAX_ENTRIES, CACHE_L1_MAX_BYTES,
+CACHE_L1_TTL (seconds, the staleness bound if a broadcast is ever missed).
 """
 
+import contextlib
+import contextvars
 import functools
 import inspect
 import json
 import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import TYPE_CHECKING
 
 import structlog
 
+from dao import cache_codec, cache_metrics
+from dao.local_cache import LocalCache
+
 if TYPE_CHECKING:
     from supabase import Client
 
 logger = structlog.get_logger()
 
 # SB-591 Phase 2 test partition. Match READS go through this view, which carries
-# a derived is_test flag (the match's league, tournament, either club, or either
-# team's league is is_test); WRITES stay on the "matches" table. Embedded selects
+# the is_test flag (the match's league, tournament, either club, or either team's
+# league is is_test; a trigger-maintained matches column since
+# 20261016100000_matches_is_test_column.sql); WRITES stay on the "matches" table. Embedded selects
 # resolve identically from either relation, so callers swap only the relation
 # name and add `.eq("is_test", False)` for non-test viewers. Defined here rather
 # than in match_dao so every DAO can share it without importing match_dao.
@@ -56,6 +134,68 @@ MATCHES_READ_RELATION = "matches_with_test"
 # Shared Redis client for all DAOs
 _redis_client = None
 
+# Redis sets listing the keys carrying each tag. The underscore keeps them out
+# of the per-family views (admin cache stats, cache_cli) while the "mt:dao:"
+# prefix lets the deploy-time flush of mt:dao:* clear them with the data.
+CACHE_TAG_PREFIX = "mt:dao:_tag:"
+
+# Per-family data version counters behind the API's ETags ("mt:ver:matches").
+# Outside "mt:dao:" so clear_cache("mt:dao:*") cannot reset them.
+CACHE_VERSION_PREFIX = "mt:ver:"
+
+# Version family bumped by a wildcard invalidation ("mt:dao:*"); every ETag
+# includes it
+ALL_FAMILIES_VERSION = "*"
+
+# Hash of per-pattern payload counters: "<pattern>|writes", "<pattern>|bytes",
+# "<pattern>|last" (pattern is the dao_cache key pattern, or "<family>:*")
+CACHE_SIZES_KEY = "mt:dao:_meta:sizes"
+
+# Short-lived Redis locks electing the single process that recomputes a cold
+# key (single-flight); see _compute_single_flight.
+CACHE_LOCK_PREFIX = "mt:dao:_lock:"
+
+# Deletes the lock only if we still own it, so a leader that overran its lock
+# TTL cannot release a lock since taken by another process.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Cold keys currently being computed in this process -> future of the result
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Stale-while-revalidate entries are wrapped in {_SWR_MARKER: 1, "v": value,
+# "t": computed_at} so a stale hit can tell its age.
+_SWR_MARKER = "__swr__"
+
+# Background refreshes of stale entries; keys queued or running in this process
+_refresh_executor: ThreadPoolExecutor | None = None
+_refresh_executor_pid: int | None = None
+_refreshing: set[str] = set()
+_refresh_lock = threading.Lock()
+
+# Epoch seconds when the last stale_ttl value returned in this context was computed
+_cache_computed_at: contextvars.ContextVar[float | None] = contextvars.ContextVar("dao_cache_computed_at", default=None)
+
+# Pub/sub channel carrying cache invalidations to every worker process, so
+# their in-process (L1) copies are dropped along with the Redis keys.
+CACHE_INVALIDATION_CHANNEL = "mt:dao:invalidate"
+
+# Called with each invalidated key pattern: this process's clear_cache() calls,
+# and other processes' when the L1 pub/sub listener is running. In-process
+# copies outside the DAO cache (dao/reference_registry.py) register here.
+_invalidation_listeners: list[Callable[[str], None]] = []
+
+# In-process L1 cache and the pub/sub listener that keeps it honest
+_local_cache: LocalCache | None = None
+_local_cache_pid: int | None = None
+_invalidation_listener = None
+_local_cache_lock = threading.Lock()
+
 
 def get_redis_client():
     """Get sync Redis client for DAO-level caching.
@@ -74,7 +214,8 @@ def get_redis_client():
         import redis
 
         url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        _redis_client = redis.from_url(url, decode_responses=True)
+        # Binary-safe: cache values are codec bytes (see dao/cache_codec.py)
+        _redis_client = redis.from_url(url, decode_responses=False)
         _redis_client.ping()
         return _redis_client
     except Exception as e:
@@ -82,33 +223,366 @@ def get_redis_client():
         return None
 
 
+def _local_cache_enabled() -> bool:
+    return os.getenv("CACHE_L1_ENABLED", "false").lower() == "true"
+
+
+def get_local_cache(connect: bool = True) -> LocalCache | None:
+    """Get the in-process L1 cache for this worker.
+
+    Returns None if L1 is disabled, Redis is unavailable, or this process is
+    not currently subscribed to invalidation broadcasts. Without the listener a
+    write in another process could leave a stale copy here, so the layer
+    switches itself off rather than serve it.
+
+    Args:
+        connect: If False, only return an L1 that is already running; never
+                 touch Redis (for callers on an event loop)
+    """
+    global _local_cache, _local_cache_pid, _invalidation_listener
+    if not _local_cache_enabled():
+        return None
+    pid = os.getpid()
+    if _local_cache is not None and _local_cache_pid == pid and _invalidation_listener is not None:
+        return _local_cache
+    if not connect:
+        return None
+    redis_client = get_redis_client()
+    if not redis_client:
+        return None
+
+    with _local_cache_lock:
+        if _local_cache is None or _local_cache_pid != pid:
+            # First use, or a forked worker that inherited the parent's cache
+            # but not its listener thread.
+            _local_cache = LocalCache(
+                max_entries=int(os.getenv("CACHE_L1_MAX_ENTRIES", "2048")),
+                max_bytes=int(os.getenv("CACHE_L1_MAX_BYTES", str(32 * 1024 * 1024))),
+                ttl=float(os.getenv("CACHE_L1_TTL", "30")),
+            )
+            _local_cache_pid = pid
+            _invalidation_listener = None
+        if _invalidation_listener is None:
+            # Anything cached before (re)subscribing may have missed a broadcast
+            _local_cache.clear()
+            try:
+                pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{CACHE_INVALIDATION_CHANNEL: _on_invalidation_message})
+                _invalidation_listener = pubsub.run_in_thread(
+                    sleep_time=1.0, daemon=True, exception_handler=_on_invalidation_listener_error
+                )
+            except Exception as e:
+                logger.warning("dao_cache_invalidation_subscribe_failed", error=str(e))
+                return None
+    return _local_cache
+
+
+def add_invalidation_listener(listener: Callable[[str], None]) -> None:
+    """Call listener with every key pattern invalidated (see _invalidation_listeners)."""
+    _invalidation_listeners.append(listener)
+
+
+def _notify_invalidation_listeners(pattern: str) -> None:
+    for listener in list(_invalidation_listeners):
+        try:
+            listener(pattern)
+        except Exception as e:
+            logger.warning("dao_cache_invalidation_listener_failed", pattern=pattern, error=str(e))
+
+
+def _on_invalidation_message(message: dict) -> None:
+    """Pub/sub handler: drop local entries named by a broadcast."""
+    local = _local_cache
+    if local is None:
+        return
+    try:
+        invalidation = json.loads(message.get("data") or "{}")
+    except (TypeError, ValueError):
+        logger.warning("dao_cache_invalidation_message_invalid", data=message.get("data"))
+        local.clear()
+        _notify_invalidation_listeners("mt:dao:*")
+        return
+    for pattern in invalidation.get("patterns", []):
+        local.delete_matching(pattern)
+        _notify_invalidation_listeners(pattern)
+    if invalidation.get("keys"):
+        local.delete(*invalidation["keys"])
+
+
+def _on_invalidation_listener_error(exc, pubsub, thread) -> None:
+    """Pub/sub thread failed: stop serving L1 until the listener is re-established."""
+    global _invalidation_listener
+    logger.warning("dao_cache_invalidation_listener_error", error=str(exc))
+    if _local_cache is not None:
+        _local_cache.clear()
+    _invalidation_listener = None
+    thread.stop()
+    with contextlib.suppress(Exception):
+        pubsub.close()
+
+
+def _broadcast_invalidation(redis_client, patterns: tuple[str, ...] = (), keys: list[str] | None = None) -> None:
+    """Drop local L1 entries and tell every other process to do the same.
+
+    Must be called after the Redis delete, so a process that drops its L1 copy
+    re-reads the fresh (absent) value rather than the old one.
+    """
+    message = _drop_local_entries(patterns, keys)
+    if message is None:
+        return
+    try:
+        redis_client.publish(CACHE_INVALIDATION_CHANNEL, message)
+    except Exception as e:
+        logger.warning("dao_cache_invalidation_publish_error", patterns=patterns, error=str(e))
+
+
+def _drop_local_entries(patterns: tuple[str, ...], keys: list[str] | None) -> str | None:
+    """Drop this process's L1 entries; return the broadcast message, or None if there is nothing to send."""
+    if not _local_cache_enabled() or not (patterns or keys):
+        return None
+    if _local_cache is not None and _local_cache_pid == os.getpid():
+        for pattern in patterns:
+            _local_cache.delete_matching(pattern)
+        if keys:
+            _local_cache.delete(*keys)
+    return json.dumps({"patterns": list(patterns), "keys": list(keys or [])})
+
+
+def _cache_family(key: str) -> str | None:
+    """Return the family of a DAO cache key ("mt:dao:teams:all" -> "teams")."""
+    parts = key.split(":", 3)
+    if len(parts) >= 4 and parts[0] == "mt" and parts[1] == "dao":
+        return parts[2]
+    return None
+
+
+def _family_tag_for_pattern(pattern: str) -> str | None:
+    """Return the family tag a pattern is equivalent to, if any.
+
+    Only a plain "mt:dao:<family>:*" qualifies: the family's tag set holds
+    exactly the keys that pattern matches. Anything else needs a SCAN.
+    """
+    if not pattern.startswith("mt:dao:") or not pattern.endswith(":*"):
+        return None
+    family = pattern[len("mt:dao:") : -len(":*")]
+    if not family or family.startswith("_") or any(c in family for c in "*?[]:\\"):
+        return None
+    return family
+
+
+def _as_str(value: bytes | str) -> str:
+    """Decode a key or member returned by the binary-safe client."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _pop_tagged_keys(redis_client, tags) -> list[str]:
+    """Atomically read and delete the tag sets, returning the keys they listed."""
+    pipe = redis_client.pipeline(transaction=True)
+    for tag in tags:
+        tag_key = f"{CACHE_TAG_PREFIX}{tag}"
+        pipe.smembers(tag_key)
+        pipe.delete(tag_key)
+    results = pipe.execute()
+    keys: set[str] = set()
+    for members in results[0::2]:
+        keys.update(_as_str(member) for member in members or ())
+    return sorted(keys)
+
+
+def _unlink_keys(redis_client, keys: list[str], batch_size: int = 500) -> int:
+    """UNLINK keys in batches. Returns the number that existed."""
+    deleted = 0
+    for i in range(0, len(keys), batch_size):
+        deleted += redis_client.unlink(*keys[i : i + batch_size])
+    return deleted
+
+
+def _version_families_for_pattern(pattern: str) -> set[str]:
+    """Version families a clear_cache() pattern changes ("mt:dao:teams:*" -> {"teams"})."""
+    parts = pattern.split(":", 3)
+    if len(parts) < 3 or parts[0] != "mt" or parts[1] != "dao":
+        return set()
+    family = parts[2]
+    if not family or any(c in family for c in "*?["):
+        return {ALL_FAMILIES_VERSION}
+    return set() if family.startswith("_") else {family}
+
+
+def _version_families_for_tags(tags) -> set[str]:
+    """Version families a set of tags belongs to ("matches:team:7" -> {"matches"})."""
+    return {tag.split(":", 1)[0] for tag in tags if tag}
+
+
+def _queue_version_bumps(pipe, families) -> None:
+    """Queue increments of the families' version counters on a pipeline.
+
+    A counter that has to be created starts at the current time in ms, so one
+    lost with Redis comes back above every value it held and an old ETag can
+    never match again.
+    """
+    now_ms = time.time_ns() // 1_000_000
+    for family in sorted(families):
+        key = f"{CACHE_VERSION_PREFIX}{family}"
+        pipe.set(key, now_ms, nx=True)
+        pipe.incr(key)
+
+
+def _bump_versions(redis_client, families) -> None:
+    """Advance the data versions of the families (after their entries are gone)."""
+    if not families:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        _queue_version_bumps(pipe, families)
+        pipe.execute()
+    except Exception as e:
+        logger.warning("dao_cache_version_bump_error", families=sorted(families), error=str(e))
+
+
+def bump_data_versions(*families: str) -> None:
+    """Advance the data versions of families whose data is not cached.
+
+    For writes that change what an endpoint returns without going through
+    clear_cache() / invalidate_tags(), e.g. card events on the match list.
+    """
+    redis_client = get_redis_client()
+    if redis_client:
+        _bump_versions(redis_client, set(families))
+
+
+def get_data_versions(families) -> dict[str, int] | None:
+    """Current data version of each family, plus ALL_FAMILIES_VERSION.
+
+    A version changes whenever clear_cache() or invalidate_tags() invalidates
+    anything in its family, so the mapping identifies the state of the data
+    behind a response without reading it.
+
+    Args:
+        families: Cache families, e.g. ("matches", "teams")
+
+    Returns:
+        Family -> version, or None without Redis (versions must be shared by
+        every process, so an in-process fallback could match stale data)
+    """
+    read = _read_versions(families)
+    return None if read is None else read[0]
+
+
+def get_versioned_payload(key: str, families) -> tuple[dict[str, int], bytes | None] | None:
+    """get_data_versions() plus the raw value at key, in the same round trip.
+
+    For entries that record the versions they were built from (the HTTP
+    response cache): one MGET tells whether the entry is still current.
+
+    Returns:
+        (versions, payload or None), or None without Redis
+    """
+    return _read_versions(families, key)
+
+
+def _read_versions(families, payload_key: str | None = None) -> tuple[dict[str, int], bytes | None] | None:
+    redis_client = get_redis_client()
+    if not redis_client:
+        return None
+    pipe = redis_client.pipeline(transaction=True)
+    names = _queue_version_read(pipe, families, payload_key)
+    try:
+        values = pipe.execute()[-1]
+    except Exception as e:
+        logger.warning("dao_cache_version_read_error", families=names, error=str(e))
+        return None
+    return _parse_version_read(names, values, payload_key)
+
+
+def _queue_version_read(pipe, families, payload_key: str | None) -> list[str]:
+    """Queue the read of the families' versions (and payload_key) on a MULTI pipeline.
+
+    A missing counter is created as in _queue_version_bumps().
+
+    Returns:
+        The family names read, in the order of the MGET
+    """
+    names = sorted({*families, ALL_FAMILIES_VERSION})
+    keys = [f"{CACHE_VERSION_PREFIX}{family}" for family in names]
+    now_ms = time.time_ns() // 1_000_000
+    for key in keys:
+        pipe.set(key, now_ms, nx=True)
+    pipe.mget([*keys, payload_key] if payload_key else keys)
+    return names
+
+
+def _parse_version_read(names: list[str], values: list, payload_key: str | None) -> tuple[dict[str, int], bytes | None]:
+    """(versions, payload) from the MGET queued by _queue_version_read()."""
+    versions = {family: int(value) for family, value in zip(names, values, strict=False)}
+    return versions, values[len(names)] if payload_key else None
+
+
+def invalidate_tags(*tags: str) -> int:
+    """Delete every cache entry carrying any of the given tags.
+
+    Args:
+        *tags: Tag names, e.g. "matches" or "matches:season:12"
+
+    Returns:
+        Number of keys deleted
+    """
+    redis_client = get_redis_client()
+    if not redis_client or not tags:
+        return 0
+    keys: list[str] = []
+    deleted = 0
+    try:
+        keys = _pop_tagged_keys(redis_client, tags)
+        if keys:
+            deleted = _unlink_keys(redis_client, keys)
+        if deleted > 0:
+            logger.info("dao_cache_tags_invalidated", tags=tags, deleted=deleted)
+    except Exception as e:
+        logger.warning("dao_cache_tag_invalidation_error", tags=tags, error=str(e))
+    _broadcast_invalidation(redis_client, keys=keys)
+    _bump_versions(redis_client, _version_families_for_tags(tags))
+    return deleted
+
+
 def clear_cache(pattern: str) -> int:
     """Clear cache entries matching a pattern.
 
+    A plain family pattern ("mt:dao:clubs:*") is served from the family's tag
+    set; any other glob walks the keyspace with SCAN.
+
     Args:
         pattern: Redis key pattern (e.g., "mt:dao:clubs:*")
 
     Returns:
         Number of keys deleted
     """
+    _notify_invalidation_listeners(pattern)
     redis_client = get_redis_client()
     if not redis_client:
         return 0
+    deleted = 0
+    family = _family_tag_for_pattern(pattern)
     try:
-        cursor = 0
-        deleted = 0
-        while True:
-            cursor, keys = redis_client.scan(cursor, match=pattern, count=100)
+        if family:
+            keys = _pop_tagged_keys(redis_client, (family,))
             if keys:
-                deleted += redis_client.delete(*keys)
-            if cursor == 0:
-                break
+                deleted = _unlink_keys(redis_client, keys)
+        else:
+            cursor = 0
+            while True:
+                cursor, keys = redis_client.scan(cursor, match=pattern, count=100)
+                if keys:
+                    deleted += redis_client.delete(*keys)
+                if cursor == 0:
+                    break
         if deleted > 0:
             logger.info("dao_cache_cleared", pattern=pattern, deleted=deleted)
-        return deleted
     except Exception as e:
         logger.warning("dao_cache_clear_error", pattern=pattern, error=str(e))
-        return 0
+        cache_metrics.record_error(family or "other", "clear")
+    _broadcast_invalidation(redis_client, patterns=(pattern,))
+    _bump_versions(redis_client, _version_families_for_pattern(pattern))
+    return deleted
 
 
 def cache_get(key: str):
@@ -120,54 +594,358 @@ def cache_get(key: str):
     Returns:
         Deserialized value or None if not found/error
     """
+    payload = cache_get_payload(key)
+    return None if payload is None else cache_codec.decode(payload)
+
+
+def cache_get_payload(key: str) -> bytes | None:
+    """Get a cached payload still encoded (see dao/cache_codec.py), or None."""
     redis_client = get_redis_client()
     if not redis_client:
         return None
+    family = _cache_family(key) or "other"
+    started = time.perf_counter()
+    local = get_local_cache()
+    generation = None
+    if local is not None:
+        payload = local.get(key)
+        if payload is not None:
+            logger.debug("dao_cache_local_hit", key=key)
+            cache_metrics.record_lookup(family, "local", time.perf_counter() - started)
+            return payload
+        generation = local.generation
     try:
         cached = redis_client.get(key)
         if cached:
-            logger.info("dao_cache_hit", key=key)
-            return json.loads(cached)
+            logger.debug("dao_cache_hit", key=key)
+            cache_metrics.record_lookup(family, "redis", time.perf_counter() - started)
+            if local is not None:
+                local.set(key, cached, generation=generation)
+            return cached
+        cache_metrics.record_lookup(family, None, time.perf_counter() - started)
     except Exception as e:
         logger.warning("dao_cache_get_error", key=key, error=str(e))
+        cache_metrics.record_error(family, "get")
     return None
 
 
-def cache_set(key: str, value, ttl: int = 86400) -> bool:
+def cache_set(key: str, value, ttl: int = 86400, tags: tuple[str, ...] = (), pattern: str | None = None) -> bool:
     """Set a value in cache.
 
+    The key is registered under its family tag and any extra tags in the same
+    MULTI as the write, so an invalidation can never see the value without
+    its tags.
+
     Args:
         key: Cache key
-        value: Value to cache (will be JSON serialized)
+        value: Value to cache (encoded by dao/cache_codec.py)
         ttl: Time to live in seconds (default 24 hours)
+        tags: Extra tags to register the key under, e.g. ("matches:season:12",)
+        pattern: Key pattern to account the payload size under; defaults to
+                 the key's family, e.g. "qop:*"
 
     Returns:
         True if successful, False otherwise
     """
+    if not get_redis_client():
+        return False
+    try:
+        payload = cache_codec.encode(value)
+    except Exception as e:
+        logger.warning("dao_cache_set_error", key=key, error=str(e))
+        cache_metrics.record_error(_cache_family(key) or "other", "set")
+        return False
+    return cache_set_payload(key, payload, ttl, tags, pattern)
+
+
+def cache_set_payload(
+    key: str,
+    payload: bytes,
+    ttl: int = 86400,
+    tags: tuple[str, ...] = (),
+    pattern: str | None = None,
+    local: bool = True,
+) -> bool:
+    """Set an already-encoded payload (e.g. cache_codec.encode_response()); see cache_set().
+
+    local=False keeps it out of the L1 cache, for keys never read through cache_get().
+    """
     redis_client = get_redis_client()
     if not redis_client:
         return False
     try:
-        redis_client.setex(key, ttl, json.dumps(value, default=str))
-        logger.info("dao_cache_set", key=key)
+        pipe = redis_client.pipeline(transaction=True)
+        _queue_cache_write(pipe, key, payload, ttl, tags, pattern)
+        pipe.execute()
+        logger.debug("dao_cache_set", key=key, bytes=len(payload))
+        cache_metrics.record_set(_cache_family(key) or "other", len(payload))
+        local_cache = get_local_cache() if local else None
+        if local_cache is not None:
+            local_cache.set(key, payload)
         return True
     except Exception as e:
         logger.warning("dao_cache_set_error", key=key, error=str(e))
+        cache_metrics.record_error(_cache_family(key) or "other", "set")
         return False
 
 
+def _queue_cache_write(pipe, key: str, payload: bytes, ttl: int, tags: tuple[str, ...], pattern: str | None) -> None:
+    """Queue a value write, its tag registrations and size counters on a MULTI pipeline."""
+    family = _cache_family(key)
+    all_tags = (family, *tags) if family else tags
+    pipe.setex(key, ttl, payload)
+    for tag in all_tags:
+        tag_key = f"{CACHE_TAG_PREFIX}{tag}"
+        pipe.sadd(tag_key, key)
+        # A tag set must outlive every key in it: give a new set this
+        # key's TTL, and only ever extend an existing one.
+        pipe.expire(tag_key, ttl, nx=True)
+        pipe.expire(tag_key, ttl, gt=True)
+    size_pattern = pattern or (f"{family}:*" if family else key)
+    pipe.hincrby(CACHE_SIZES_KEY, f"{size_pattern}|writes", 1)
+    pipe.hincrby(CACHE_SIZES_KEY, f"{size_pattern}|bytes", len(payload))
+    pipe.hset(CACHE_SIZES_KEY, f"{size_pattern}|last", len(payload))
+
+
+def get_cache_size_stats() -> dict[str, dict]:
+    """Return payload size counters per key pattern, largest total first.
+
+    Returns:
+        {pattern: {"writes", "bytes_written", "avg_bytes", "last_bytes"}},
+        empty if caching is disabled or Redis is unavailable
+    """
+    redis_client = get_redis_client()
+    if not redis_client:
+        return {}
+    try:
+        raw = redis_client.hgetall(CACHE_SIZES_KEY)
+    except Exception as e:
+        logger.warning("dao_cache_size_stats_error", error=str(e))
+        return {}
+    stats: dict[str, dict] = {}
+    for field, value in raw.items():
+        size_pattern, _, counter = _as_str(field).rpartition("|")
+        entry = stats.setdefault(size_pattern, {"writes": 0, "bytes_written": 0, "last_bytes": 0})
+        entry[{"writes": "writes", "bytes": "bytes_written", "last": "last_bytes"}.get(counter, counter)] = int(value)
+    for entry in stats.values():
+        entry["avg_bytes"] = entry["bytes_written"] // entry["writes"] if entry["writes"] else 0
+    return dict(sorted(stats.items(), key=lambda item: item[1]["bytes_written"], reverse=True))
+
+
+def _compute_single_flight(
+    cache_key: str,
+    compute,
+    store,
+    lock_timeout: float,
+    wait_timeout: float,
+):
+    """Compute and cache a missed key once, sharing the result with concurrent callers.
+
+    The first caller in this process becomes the leader; later callers wait on
+    its future for up to wait_timeout. Across processes the leader holds a
+    Redis lock for lock_timeout and the others poll for its cached value.
+    store(value) writes a computed value to the cache.
+    """
+    with _inflight_lock:
+        future = _inflight.get(cache_key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[cache_key] = future
+
+    if not is_leader:
+        try:
+            return future.result(timeout=wait_timeout)
+        except FutureTimeoutError:
+            logger.warning("dao_cache_single_flight_wait_timeout", key=cache_key, scope="process")
+            return compute()
+
+    try:
+        result = _compute_under_redis_lock(cache_key, compute, store, lock_timeout, wait_timeout)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
+
+
+def _compute_under_redis_lock(
+    cache_key: str,
+    compute,
+    store,
+    lock_timeout: float,
+    wait_timeout: float,
+):
+    """Cross-process half of single-flight: lock, or wait for the lock holder's value."""
+    redis_client = get_redis_client()
+    if redis_client is None:
+        return compute()
+
+    lock_key = f"{CACHE_LOCK_PREFIX}{cache_key}"
+    token = uuid.uuid4().hex
+    try:
+        acquired = redis_client.set(lock_key, token, nx=True, px=int(lock_timeout * 1000))
+    except Exception as e:
+        logger.warning("dao_cache_lock_error", key=cache_key, error=str(e))
+        acquired = False
+        wait_timeout = 0
+
+    if not acquired:
+        deadline = time.monotonic() + wait_timeout
+        delay = 0.025
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
+            cached = cache_get(cache_key)
+            if cached is not None:
+                return cached
+            try:
+                if not redis_client.exists(lock_key):
+                    # Holder finished without caching anything (e.g. None result)
+                    break
+            except Exception:
+                break
+        else:
+            logger.warning("dao_cache_single_flight_wait_timeout", key=cache_key, scope="redis")
+        result = compute()
+        if result is not None:
+            store(result)
+        return result
+
+    try:
+        # Another process may have filled the key between our miss and the lock
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return cached
+        result = compute()
+        if result is not None:
+            store(result)
+        return result
+    finally:
+        try:
+            redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.warning("dao_cache_unlock_error", key=cache_key, error=str(e))
+
+
 # =============================================================================
 # CACHING DECORATORS
 # =============================================================================
 
 
-def dao_cache(key_pattern: str, ttl: int = 86400):
+def get_cache_computed_at() -> float | None:
+    """Return when the last stale_ttl cached value served in this context was computed.
+
+    Epoch seconds, or None if no stale_ttl-cached method has run in the
+    current request/context.
+    """
+    return _cache_computed_at.get()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """Return the background refresh pool, recreating it after a fork."""
+    global _refresh_executor, _refresh_executor_pid
+    with _refresh_lock:
+        if _refresh_executor is None or _refresh_executor_pid != os.getpid():
+            workers = int(os.getenv("CACHE_REFRESH_WORKERS", "2"))
+            _refresh_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dao-cache-refresh")
+            _refresh_executor_pid = os.getpid()
+            _refreshing.clear()
+        return _refresh_executor
+
+
+def _schedule_refresh(cache_key: str, compute, store, lock_timeout: float) -> bool:
+    """Queue a background recompute of a stale key unless one is already queued here.
+
+    Returns:
+        True if a refresh was queued
+    """
+    executor = _get_refresh_executor()
+    with _refresh_lock:
+        if cache_key in _refreshing:
+            return False
+        _refreshing.add(cache_key)
+    try:
+        executor.submit(_refresh_entry, cache_key, compute, store, lock_timeout)
+    except RuntimeError as e:
+        # Executor shut down (interpreter exiting)
+        logger.warning("dao_cache_refresh_error", key=cache_key, error=str(e))
+        with _refresh_lock:
+            _refreshing.discard(cache_key)
+        return False
+    return True
+
+
+def _refresh_entry(cache_key: str, compute, store, lock_timeout: float) -> None:
+    """Recompute and rewrite a stale key, unless another process is already doing so."""
+    try:
+        redis_client = get_redis_client()
+        if redis_client is None:
+            return
+        lock_key = f"{CACHE_LOCK_PREFIX}{cache_key}"
+        token = uuid.uuid4().hex
+        if not redis_client.set(lock_key, token, nx=True, px=int(lock_timeout * 1000)):
+            return
+        try:
+            entry = compute()
+            if entry is not None:
+                store(entry)
+                logger.debug("dao_cache_refreshed", key=cache_key)
+        finally:
+            redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+    except Exception as e:
+        logger.warning("dao_cache_refresh_error", key=cache_key, error=str(e))
+    finally:
+        with _refresh_lock:
+            _refreshing.discard(cache_key)
+
+
+def _bind_call_args(sig: inspect.Signature, args: tuple, kwargs: dict) -> dict:
+    """Map a method call's arguments (minus self) to names, defaults included."""
+    bound = sig.bind_partial(None, *args, **kwargs)
+    bound.apply_defaults()
+    values = dict(bound.arguments)
+    values.pop(next(iter(sig.parameters)), None)
+    return values
+
+
+def _build_cache_key(key_pattern: str, tags: tuple[str, ...], key_values: dict) -> tuple[str, tuple[str, ...]]:
+    """Fill a key pattern and its tag patterns from call arguments.
+
+    Raises:
+        KeyError: If a placeholder has no matching argument
+    """
+    cache_key = f"mt:dao:{key_pattern.format(**key_values)}"
+    return cache_key, tuple(tag.format(**key_values) for tag in tags)
+
+
+def dao_cache(
+    key_pattern: str,
+    ttl: int = 86400,
+    tags: tuple[str, ...] = (),
+    single_flight: bool = False,
+    lock_timeout: float = 10.0,
+    wait_timeout: float = 3.0,
+    stale_ttl: int = 0,
+):
     """Decorator to cache DAO method results.
 
     Args:
         key_pattern: Cache key pattern with optional {arg} placeholders.
                      e.g., "teams:all" or "teams:club:{club_id}"
         ttl: Time to live in seconds (default 24 hours)
+        tags: Extra tag patterns (same {arg} placeholders) the key is
+              registered under, on top of its family tag
+        single_flight: On a miss, let one caller recompute while concurrent
+                       callers wait for its result (for expensive aggregates)
+        lock_timeout: Seconds the single-flight Redis lock is held at most
+        wait_timeout: Seconds a waiter waits before computing the value itself
+        stale_ttl: Seconds past ttl an entry may still be served while it is
+                   refreshed in the background (0 disables stale-while-revalidate)
 
     Example:
         @dao_cache("teams:club:{club_id}")
@@ -183,25 +961,28 @@ def dao_cache(key_pattern: str, ttl: int = 86400):
     """
 
     def decorator(func):
+        sig = inspect.signature(func)
+
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             # Build cache key by substituting {arg_name} with actual values
-            # Get parameter names from function signature (skip 'self')
-            sig = inspect.signature(func)
-            param_names = list(sig.parameters.keys())[1:]
-
-            # Map positional args to their names
-            key_values = dict(zip(param_names, args, strict=False))
-            key_values.update(kwargs)
+            # (defaults included, so omitting an argument still caches)
+            key_values = _bind_call_args(sig, args, kwargs)
 
             # Build full cache key: mt:dao:{pattern with substitutions}
             try:
-                cache_key = f"mt:dao:{key_pattern.format(**key_values)}"
+                cache_key, cache_tags = _build_cache_key(key_pattern, tags, key_values)
             except KeyError as e:
                 # If pattern has placeholder not in args, skip caching
                 logger.warning("dao_cache_key_error", pattern=key_pattern, missing=str(e))
                 return func(self, *args, **kwargs)
 
+            if stale_ttl:
+                return _get_or_refresh(self, args, kwargs, cache_key, cache_tags)
+
+            def store(value):
+                return cache_set(cache_key, value, ttl, tags=cache_tags, pattern=key_pattern)
+
             # Try to get from cache
             cached = cache_get(cache_key)
             if cached is not None:
@@ -209,25 +990,68 @@ def dao_cache(key_pattern: str, ttl: int = 86400):
 
             # Cache miss - run the actual method
             logger.debug("dao_cache_miss", key=cache_key, method=func.__name__)
+            if single_flight:
+                return _compute_single_flight(
+                    cache_key,
+                    lambda: func(self, *args, **kwargs),
+                    store,
+                    lock_timeout,
+                    wait_timeout,
+                )
             result = func(self, *args, **kwargs)
 
             # Cache the result (only if not None)
             if result is not None:
-                cache_set(cache_key, result, ttl)
+                store(result)
 
             return result
 
+        def _get_or_refresh(self, args, kwargs, cache_key, cache_tags):
+            """Stale-while-revalidate read: serve any entry, refresh it once past ttl."""
+
+            def compute_entry():
+                value = func(self, *args, **kwargs)
+                if value is None:
+                    return None
+                return {_SWR_MARKER: 1, "v": value, "t": time.time()}
+
+            def store(entry):
+                return cache_set(cache_key, entry, ttl + stale_ttl, tags=cache_tags, pattern=key_pattern)
+
+            entry = cache_get(cache_key)
+            if not (isinstance(entry, dict) and entry.get(_SWR_MARKER)):
+                if entry is not None:
+                    # Written before this method used stale_ttl; treat as a miss
+                    logger.debug("dao_cache_unwrapped_entry", key=cache_key)
+                logger.debug("dao_cache_miss", key=cache_key, method=func.__name__)
+                if single_flight:
+                    entry = _compute_single_flight(cache_key, compute_entry, store, lock_timeout, wait_timeout)
+                else:
+                    entry = compute_entry()
+                    if entry is not None:
+                        store(entry)
+                if entry is None:
+                    return None
+            elif time.time() - entry["t"] > ttl:
+                logger.debug("dao_cache_stale_hit", key=cache_key, age=round(time.time() - entry["t"], 1))
+                _schedule_refresh(cache_key, compute_entry, store, lock_timeout)
+
+            _cache_computed_at.set(entry["t"])
+            return entry["v"]
+
         return wrapper
 
     return decorator
 
 
-def invalidates_cache(*patterns: str):
+def invalidates_cache(*patterns: str, tags: tuple[str, ...] = ()):
     """Decorator to clear cache after a write operation succeeds.
 
     Args:
         *patterns: One or more cache key patterns to clear.
                    e.g., "mt:dao:teams:*", "mt:dao:clubs:*"
+        tags: Tag patterns to invalidate, with {arg} placeholders filled from
+              the call, e.g. ("teams:club:{club_id}",)
 
     Example:
         @invalidates_cache("mt:dao:teams:*")
@@ -245,6 +1069,8 @@ def invalidates_cache(*patterns: str):
     """
 
     def decorator(func):
+        sig = inspect.signature(func)
+
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             # Run the actual method first
@@ -253,6 +1079,9 @@ def invalidates_cache(*patterns: str):
             # On success, invalidate cache patterns
             for pattern in patterns:
                 clear_cache(pattern)
+            if tags:
+                call_values = _bind_call_args(sig, args, kwargs)
+                invalidate_tags(*(tag.format(**call_values) for tag in tags))
 
             return result
 
@@ -0,0 +1,141 @@
+"""
+Value encoding for the DAO cache.
+
+Every payload written by cache_set starts with a one-byte format version:
+
+    0x01  JSON (UTF-8)
+    0x02  zlib-compressed JSON
+    0x03  gzip-compressed JSON
+
+Payloads of CACHE_COMPRESS_MIN_BYTES (default 1024) or more are compressed;
+full-season match lists and get_all_teams shrink several-fold. encode() uses
+zlib; encode_response() uses gzip, for pre-serialized API responses. Either
+way the bytes after the version byte are a valid HTTP body: zlib is the
+"deflate" content coding and gzip is "gzip" (see http_body()). JSON is
+produced by orjson when it is installed and by the stdlib otherwise; both
+read each other's output, so the version byte describes the format, not the
+library.
+
+Entries written before the version byte existed are plain JSON text. They
+start with a printable character, never 0x01/0x02, and decode as before.
+"""
+
+import gzip
+import json
+import os
+import zlib
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+FORMAT_JSON = 0x01
+FORMAT_ZLIB_JSON = 0x02
+FORMAT_GZIP_JSON = 0x03
+
+# HTTP Content-Encoding of each compressed format's body
+CONTENT_CODINGS = {FORMAT_ZLIB_JSON: "deflate", FORMAT_GZIP_JSON: "gzip"}
+
+COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", "1024"))
+COMPRESS_LEVEL = int(os.getenv("CACHE_COMPRESS_LEVEL", "6"))
+
+
+def dumps_json(value) -> bytes:
+    """Serialize value to JSON bytes, stringifying unknown types like json.dumps(default=str)."""
+    if orjson is not None:
+        # Passthrough keeps datetimes on default=str, matching the stdlib output
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+
+def loads_json(data: bytes | str):
+    """Parse JSON bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode(value) -> bytes:
+    """Encode a value for storage in Redis."""
+    body = dumps_json(value)
+    if len(body) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(body, COMPRESS_LEVEL)
+        if len(compressed) < len(body):
+            return bytes((FORMAT_ZLIB_JSON,)) + compressed
+    return bytes((FORMAT_JSON,)) + body
+
+
+def encode_response(value) -> bytes:
+    """Encode an API response body: gzip-compressed above COMPRESS_MIN_BYTES."""
+    return encode_http_body(dumps_json(value))
+
+
+def encode_http_body(body: bytes, coding: str | None = None) -> bytes:
+    """Encode an already-serialized JSON body (with its Content-Encoding, if any).
+
+    The inverse of http_body(): a compressed body is kept as it is, a plain
+    one is gzip-compressed above COMPRESS_MIN_BYTES.
+
+    Raises:
+        ValueError: If the body has a content coding other than gzip/deflate
+    """
+    if coding:
+        formats = {name: version for version, name in CONTENT_CODINGS.items()}
+        if coding not in formats:
+            raise ValueError(f"unsupported content coding {coding!r}")
+        return bytes((formats[coding],)) + body
+    if len(body) >= COMPRESS_MIN_BYTES:
+        return bytes((FORMAT_GZIP_JSON,)) + gzip.compress(body, COMPRESS_LEVEL)
+    return bytes((FORMAT_JSON,)) + body
+
+
+def http_body(payload: bytes) -> tuple[bytes, str | None]:
+    """The JSON body in a payload as sent over HTTP, with its Content-Encoding.
+
+    Compressed payloads come back still compressed, so a client that accepts
+    the coding can be sent them without touching the JSON.
+    """
+    if not payload or payload[0] >= 0x20:
+        return payload, None
+    version = payload[0]
+    if version == FORMAT_JSON:
+        return payload[1:], None
+    if version in CONTENT_CODINGS:
+        return payload[1:], CONTENT_CODINGS[version]
+    raise ValueError(f"unknown cache payload format {version:#04x}")
+
+
+def decompress_body(body: bytes, coding: str | None) -> bytes:
+    """Undo http_body()'s content coding, for clients that do not accept it."""
+    if coding == "gzip":
+        return gzip.decompress(body)
+    if coding == "deflate":
+        return zlib.decompress(body)
+    return body
+
+
+def decode(payload: bytes | str):
+    """Decode a stored payload, including unversioned JSON text from older writers.
+
+    Raises:
+        ValueError: If the payload carries an unknown format version
+    """
+    if isinstance(payload, str):
+        return loads_json(payload)
+    if not payload:
+        raise ValueError("empty cache payload")
+    version = payload[0]
+    if version == FORMAT_JSON:
+        return loads_json(payload[1:])
+    if version == FORMAT_ZLIB_JSON:
+        return loads_json(zlib.decompress(payload[1:]))
+    if version == FORMAT_GZIP_JSON:
+        return loads_json(gzip.decompress(payload[1:]))
+    if version < 0x20:
+        raise ValueError(f"unknown cache payload format {version:#04x}")
+    return loads_json(payload)
@@ -0,0 +1,77 @@
+"""
+Prometheus metrics for the DAO cache.
+
+Labelled by key family (the segment after ``mt:dao:``, e.g. "matches"; "other"
+for keys outside a family), so hit ratios and payload sizes can be compared
+per family when tuning TTLs:
+
+- dao_cache_hits_total{family, layer}: layer is "local" (L1) or "redis"
+- dao_cache_misses_total{family}
+- dao_cache_errors_total{family, operation}: operation is get, set or clear
+- dao_cache_set_bytes{family}: histogram of encoded payload sizes
+- dao_cache_lookup_duration_seconds{family}: histogram of cache_get latency
+
+Recording is off until enable() is called; setup_metrics() does that for the
+API, so CLIs and workers without a /metrics endpoint pay nothing. The metrics
+live in the default registry and are exposed on /metrics alongside the HTTP
+metrics.
+"""
+
+from prometheus_client import Counter, Histogram
+
+_enabled = False
+
+HITS = Counter("dao_cache_hits", "DAO cache hits", ["family", "layer"])
+MISSES = Counter("dao_cache_misses", "DAO cache misses", ["family"])
+ERRORS = Counter("dao_cache_errors", "DAO cache errors", ["family", "operation"])
+SET_BYTES = Histogram(
+    "dao_cache_set_bytes",
+    "Encoded size of values written to the DAO cache",
+    ["family"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+LOOKUP_SECONDS = Histogram(
+    "dao_cache_lookup_duration_seconds",
+    "DAO cache lookup latency in seconds",
+    ["family"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+
+def enable() -> None:
+    """Start recording cache metrics in this process."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording cache metrics in this process."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def record_lookup(family: str, layer: str | None, seconds: float) -> None:
+    """Record a cache_get outcome: layer is "local"/"redis" for a hit, None for a miss."""
+    if not _enabled:
+        return
+    if layer is None:
+        MISSES.labels(family=family).inc()
+    else:
+        HITS.labels(family=family, layer=layer).inc()
+    LOOKUP_SECONDS.labels(family=family).observe(seconds)
+
+
+def record_set(family: str, size: int) -> None:
+    """Record a successful cache_set of an encoded payload of size bytes."""
+    if _enabled:
+        SET_BYTES.labels(family=family).observe(size)
+
+
+def record_error(family: str, operation: str) -> None:
+    """Record a failed cache operation ("get", "set" or "clear")."""
+    if _enabled:
+        ERRORS.labels(family=family, operation=operation).inc()
@@ -0,0 +1,139 @@
+"""
+In-process LRU cache (L1) for the DAO cache.
+
+Sits in front of Redis so hot reference data (``seasons:current``,
+``age_groups:all``, ``divisions:all``) is served without a network round trip.
+Entries are bounded by count, by total payload size and by a short TTL.
+
+The cache stores the *serialized* payload, not the Python object. Callers
+decode on every hit, so a route that mutates the returned rows (``/api/table``
+adds QoP columns in place) can never corrupt the copy other requests see.
+
+Invalidation is driven from base_dao: ``clear_cache`` drops matching local
+entries and broadcasts the pattern over Redis pub/sub so every other worker
+process drops its copy too. The TTL is the backstop if a broadcast is missed.
+"""
+
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+
+
+class LocalCache:
+    """Thread-safe LRU + TTL cache of serialized payloads, bounded by entries and bytes."""
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 32 * 1024 * 1024, ttl: float = 30.0):
+        """
+        Args:
+            max_entries: Maximum number of entries held
+            max_bytes: Maximum total payload size across all entries
+            ttl: Seconds an entry may be served before it must be re-read from Redis
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str | bytes, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Bumped on every invalidation. A reader captures it before going to
+        # Redis and only populates L1 if it is unchanged afterwards, so a value
+        # read just before a concurrent invalidation is never pinned locally.
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> str | bytes | None:
+        """Return the payload for key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, payload, _size = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def set(self, key: str, payload: str | bytes, generation: int | None = None) -> bool:
+        """Store payload under key, evicting least recently used entries as needed.
+
+        Args:
+            key: Cache key
+            payload: Serialized value
+            generation: If given, the write is dropped when an invalidation has
+                happened since the caller captured this generation.
+
+        Returns:
+            True if stored, False if skipped (too large or raced an invalidation)
+        """
+        size = len(payload)
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, payload, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+            return True
+
+    def delete(self, *keys: str) -> int:
+        """Drop specific keys. Returns the number removed."""
+        with self._lock:
+            self.generation += 1
+            removed = 0
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+                    removed += 1
+            return removed
+
+    def delete_matching(self, pattern: str) -> int:
+        """Drop every key matching a Redis-style glob pattern. Returns the number removed."""
+        with self._lock:
+            self.generation += 1
+            if pattern.endswith("*") and not any(c in pattern[:-1] for c in "*?["):
+                prefix = pattern[:-1]
+                doomed = [k for k in self._entries if k.startswith(prefix)]
+            else:
+                doomed = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+            for key in doomed:
+                self._remove(key)
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Return counters for the admin cache endpoint."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        """Remove key and release its size. Caller must hold the lock."""
+        _expires_at, _payload, size = self._entries.pop(key)
+        self._bytes -= size
@@ -5,8 +5,12 @@ Provides data access objects for matches, teams, leagues, divisions, seasons,
 and related soccer/futbol data using Supabase.
 """
 
+import base64
+import binascii
+import json
 import os
-from datetime import UTC
+from collections.abc import Iterator
+from datetime import UTC, date
 
 import httpx
 import structlog
@@ -18,15 +22,23 @@ from dao.base_dao import (
     BaseDAO,
     clear_cache,
     dao_cache,
+    invalidate_tags,
     invalidates_cache,
 )
 from dao.exceptions import DuplicateRecordError
+from dao.match_fields import flatten_match_fields, match_list_select
+from dao.reference_registry import get_reference_registry
 from dao.standings import (
     calculate_standings_with_extras,
+    compute_standings_checkpoints,
     filter_by_match_type,
     filter_completed_matches,
     filter_same_division_matches,
+    standings_as_of,
+    standings_from_rows,
 )
+from dao.standings_batch import calculate_partition_standings
+from dao.standings_store import get_standings_store
 from supabase import create_client
 
 logger = structlog.get_logger()
@@ -36,6 +48,357 @@ MATCHES_CACHE_PATTERN = "mt:dao:matches:*"
 PLAYOFF_CACHE_PATTERN = "mt:dao:playoffs:*"
 TOURNAMENTS_CACHE_PATTERN = "mt:dao:tournaments:*"
 
+# Cached match reads are tagged so a write invalidates only what it can affect:
+#   matches:id:{match_id}                        get_match_by_id
+#   matches:scope:{season}:{age_group}:{division} get_league_table ("None" = unfiltered)
+#   matches:counts                               SeasonDAO.get_match_counts_by_season
+#   matches:team:{team_id}                       get_match_preview (both teams)
+MATCH_ID_TAG = "matches:id:{match_id}"
+MATCH_SCOPE_TAG = "matches:scope:{season_id}:{age_group_id}:{division_id}"
+MATCH_COUNTS_TAG = "matches:counts"
+MATCH_TEAM_TAG = "matches:team:{team_id}"
+MATCH_SCOPE_COLUMNS = "id,season_id,age_group_id,division_id,tournament_id,home_team_id,away_team_id"
+
+# Rows per request when get_all_matches() walks every page (PostgREST's max-rows default)
+MATCHES_PAGE_SIZE = 1000
+
+# Match columns + joins the standings calculation reads
+STANDINGS_MATCH_SELECT = """
+    *,
+    home_team:teams!matches_home_team_id_fkey(id, name, division_id, club:clubs(id, name, logo_url)),
+    away_team:teams!matches_away_team_id_fkey(id, name, division_id, club:clubs(id, name, logo_url)),
+    match_type:match_types(id, name)
+"""
+
+# Precomputed standings rows (supabase/migrations/20261016000000_league_standings.sql),
+# read by get_league_table() once the migration is deployed and the flag is on
+LEAGUE_STANDINGS_TABLE = "league_standings"
+LEAGUE_STANDINGS_SELECT = """
+    *,
+    match_type:match_types!inner(name),
+    team:teams(id, name, club:clubs(id, logo_url))
+"""
+
+
+def _league_standings_table_enabled() -> bool:
+    return os.getenv("LEAGUE_STANDINGS_TABLE_ENABLED", "false").lower() == "true"
+
+
+def encode_match_cursor(match_date: str, match_id: int) -> str:
+    """Opaque keyset cursor for the match after which the next page starts."""
+    return base64.urlsafe_b64encode(json.dumps([match_date, match_id]).encode()).decode()
+
+
+def decode_match_cursor(cursor: str) -> tuple[str, int]:
+    """Inverse of encode_match_cursor(); raises ValueError if the cursor is malformed."""
+    try:
+        match_date, match_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return date.fromisoformat(match_date).isoformat(), int(match_id)
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def _flatten_match(match: dict) -> dict:
+    """Flatten a match row with its joins, as get_all_matches() returns it."""
+    return {
+        "id": match["id"],
+        "match_date": match["match_date"],
+        "scheduled_kickoff": match.get("scheduled_kickoff"),
+        "home_team_id": match["home_team_id"],
+        "away_team_id": match["away_team_id"],
+        "home_team_name": match["home_team"]["name"] if match.get("home_team") else "Unknown",
+        "away_team_name": match["away_team"]["name"] if match.get("away_team") else "Unknown",
+        "home_team_club": match["home_team"].get("club") if match.get("home_team") else None,
+        "away_team_club": match["away_team"].get("club") if match.get("away_team") else None,
+        "home_score": match["home_score"],
+        "away_score": match["away_score"],
+        "season_id": match["season_id"],
+        "season_name": match["season"]["name"] if match.get("season") else "Unknown",
+        "season_start_date": match["season"].get("start_date") if match.get("season") else None,
+        "age_group_id": match["age_group_id"],
+        "age_group_name": match["age_group"]["name"] if match.get("age_group") else "Unknown",
+        "match_type_id": match["match_type_id"],
+        "match_type_name": match["match_type"]["name"] if match.get("match_type") else "Unknown",
+        "division_id": match.get("division_id"),
+        "division_name": match["division"]["name"] if match.get("division") else "Unknown",
+        "league_id": match["division"]["league_id"] if match.get("division") else None,
+        "league_name": match["division"]["leagues"]["name"]
+        if match.get("division") and match["division"].get("leagues")
+        else "Unknown",
+        "division": match.get("division"),  # Include full division object with leagues
+        "match_status": match.get("match_status"),
+        "created_by": match.get("created_by"),
+        "updated_by": match.get("updated_by"),
+        "source": match.get("source", "manual"),
+        "match_id": match.get("match_id"),  # External match identifier
+        "created_at": match["created_at"],
+        "updated_at": match["updated_at"],
+    }
+
+
+def _matches_page_query(
+    client,
+    season_id: int | None,
+    age_group_id: int | None,
+    division_id: int | None,
+    team_id: int | None,
+    match_type: str | None,
+    start_date: str | None,
+    end_date: str | None,
+    include_test: bool,
+    limit: int,
+    cursor: str | None,
+    fields: tuple[str, ...] | None,
+):
+    """The PostgREST query behind MatchDAO.get_matches_page(), on a sync or async client.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    # An inner join makes the match type name filterable in the query, so
+    # the limit counts only matching rows
+    if fields is not None:
+        select = match_list_select(
+            fields, extra_columns=("id", "match_date"), inner=("match_type",) if match_type else ()
+        )
+    else:
+        match_type_embed = "match_types!inner(id, name)" if match_type else "match_types(id, name)"
+        select = f"""
+            *,
+            home_team:teams!matches_home_team_id_fkey(id, name, club:clubs(id, name, logo_url)),
+            away_team:teams!matches_away_team_id_fkey(id, name, club:clubs(id, name, logo_url)),
+            season:seasons(id, name, start_date),
+            age_group:age_groups(id, name),
+            match_type:{match_type_embed},
+            division:divisions(id, name, league_id, leagues!divisions_league_id_fkey(id, name))
+        """
+    query = client.table(MATCHES_READ_RELATION).select(select)
+
+    # Apply filters
+    if not include_test:
+        query = query.eq("is_test", False)
+    if season_id:
+        query = query.eq("season_id", season_id)
+    if age_group_id:
+        query = query.eq("age_group_id", age_group_id)
+    if division_id:
+        query = query.eq("division_id", division_id)
+    if match_type:
+        query = query.eq("match_type.name", match_type)
+
+    # Date range filters
+    if start_date:
+        query = query.gte("match_date", start_date)
+    if end_date:
+        query = query.lte("match_date", end_date)
+
+    # For team_id, we need to match either home_team_id OR away_team_id.
+    # PostgREST takes one or= per request, so the team and keyset
+    # conditions are combined into a single tree.
+    conditions = []
+    if team_id:
+        conditions.append(f"or(home_team_id.eq.{team_id},away_team_id.eq.{team_id})")
+    if cursor:
+        after_date, after_id = decode_match_cursor(cursor)
+        conditions.append(f"or(match_date.lt.{after_date},and(match_date.eq.{after_date},id.lt.{after_id}))")
+    if conditions:
+        query = query.or_(f"and({','.join(conditions)})")
+
+    # One extra row tells whether there is a next page
+    return query.order("match_date", desc=True).order("id", desc=True).limit(limit + 1)
+
+
+def _matches_page(rows: list[dict], limit: int, fields: tuple[str, ...] | None) -> dict:
+    """Shape the rows of a _matches_page_query() as MatchDAO.get_matches_page() returns them."""
+    page_rows = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = page_rows[-1]
+        next_cursor = encode_match_cursor(last["match_date"], last["id"])
+    if fields is not None:
+        matches = [flatten_match_fields(match, fields) for match in page_rows]
+    else:
+        matches = [_flatten_match(match) for match in page_rows]
+    return {"matches": matches, "next_cursor": next_cursor}
+
+
+def _team_matches_query(
+    client,
+    team_id: int,
+    season_id: int | None,
+    age_group_id: int | None,
+    include_test: bool,
+    fields: tuple[str, ...] | None,
+):
+    """The PostgREST query behind MatchDAO.get_matches_by_team(), on a sync or async client."""
+    if fields is not None:
+        select = match_list_select(fields)
+    else:
+        select = """
+        *,
+        home_team:teams!matches_home_team_id_fkey(id, name, club:clubs(id, name, logo_url)),
+        away_team:teams!matches_away_team_id_fkey(id, name, club:clubs(id, name, logo_url)),
+        season:seasons(id, name, start_date),
+        age_group:age_groups(id, name),
+        match_type:match_types(id, name),
+        division:divisions(id, name)
+    """
+    query = client.table(MATCHES_READ_RELATION).select(select)
+
+    if not include_test:
+        query = query.eq("is_test", False)
+
+    query = query.or_(f"home_team_id.eq.{team_id},away_team_id.eq.{team_id}")
+
+    if season_id:
+        query = query.eq("season_id", season_id)
+
+    if age_group_id:
+        query = query.eq("age_group_id", age_group_id)
+
+    return query.order("match_date", desc=True)
+
+
+def _team_matches(rows: list[dict], fields: tuple[str, ...] | None) -> list[dict]:
+    """Shape the rows of a _team_matches_query() as MatchDAO.get_matches_by_team() returns them."""
+    if fields is not None:
+        return [flatten_match_fields(match, fields) for match in rows]
+    return [_flatten_team_match(match) for match in rows]
+
+
+def _flatten_team_match(match: dict) -> dict:
+    """Flatten a match row of a team's list (like _flatten_match, without the league)."""
+    return {
+        "id": match["id"],
+        "match_date": match["match_date"],
+        "scheduled_kickoff": match.get("scheduled_kickoff"),
+        "home_team_id": match["home_team_id"],
+        "away_team_id": match["away_team_id"],
+        "home_team_name": match["home_team"]["name"] if match.get("home_team") else "Unknown",
+        "away_team_name": match["away_team"]["name"] if match.get("away_team") else "Unknown",
+        "home_team_club": match["home_team"].get("club") if match.get("home_team") else None,
+        "away_team_club": match["away_team"].get("club") if match.get("away_team") else None,
+        "home_score": match["home_score"],
+        "away_score": match["away_score"],
+        "season_id": match["season_id"],
+        "season_name": match["season"]["name"] if match.get("season") else "Unknown",
+        "season_start_date": match["season"].get("start_date") if match.get("season") else None,
+        "age_group_id": match["age_group_id"],
+        "age_group_name": match["age_group"]["name"] if match.get("age_group") else "Unknown",
+        "match_type_id": match["match_type_id"],
+        "match_type_name": match["match_type"]["name"] if match.get("match_type") else "Unknown",
+        "division_id": match.get("division_id"),
+        "division_name": match["division"]["name"] if match.get("division") else "Unknown",
+        "division": match.get("division"),  # Include full division object with leagues
+        "match_status": match.get("match_status"),
+        "created_by": match.get("created_by"),
+        "updated_by": match.get("updated_by"),
+        "source": match.get("source", "manual"),
+        "match_id": match.get("match_id"),  # External match identifier
+        "created_at": match.get("created_at"),
+        "updated_at": match.get("updated_at"),
+    }
+
+
+def _live_matches_query(client, include_test: bool):
+    """The PostgREST query behind MatchDAO.get_live_matches(), on a sync or async client."""
+    query = (
+        client.table(MATCHES_READ_RELATION)
+        .select("""
+            id,
+            match_status,
+            match_date,
+            home_score,
+            away_score,
+            kickoff_time,
+            home_team:teams!matches_home_team_id_fkey(id, name),
+            away_team:teams!matches_away_team_id_fkey(id, name)
+        """)
+        .eq("match_status", "live")
+    )
+    if not include_test:
+        query = query.eq("is_test", False)
+    return query
+
+
+def _flatten_live_match(match: dict) -> dict:
+    """Minimal live match for the LIVE tab polling, as get_live_matches() returns it."""
+    return {
+        "match_id": match["id"],
+        "match_status": match["match_status"],
+        "match_date": match["match_date"],
+        "home_score": match["home_score"],
+        "away_score": match["away_score"],
+        "kickoff_time": match.get("kickoff_time"),
+        "home_team_name": match["home_team"]["name"] if match.get("home_team") else "Unknown",
+        "away_team_name": match["away_team"]["name"] if match.get("away_team") else "Unknown",
+    }
+
+
+def _table_matches(matches: list[dict], match_type: str, division_id: int | None) -> list[dict]:
+    """The fetched matches that count towards a league table."""
+    matches = filter_by_match_type(matches, match_type)
+    if division_id:
+        matches = filter_same_division_matches(matches, division_id)
+    return filter_completed_matches(matches)
+
+
+def _match_scope_tags(rows: list[dict] | None, counts_changed: bool = False) -> tuple[str, ...] | None:
+    """Cache tags a write to these match rows can affect.
+
+    A league table filtered on any subset of season/age group/division
+    contains the match, so each row maps to eight scope tags: every
+    combination of its own value and None (unfiltered). Rows that carry
+    their team IDs also map to a tag per team.
+
+    Args:
+        rows: Match rows before and/or after the write
+        counts_changed: True if matches were added, removed or moved between
+            seasons (per-season match counts are stale)
+
+    Returns:
+        Tags to invalidate, or None if a row lacks the scope columns (the
+        caller must then fall back to clearing every match key)
+    """
+    if not rows:
+        return None
+    tags = {MATCH_COUNTS_TAG} if counts_changed else set()
+    for row in rows:
+        if not row or any(col not in row for col in ("id", "season_id", "age_group_id", "division_id")):
+            return None
+        tags.add(MATCH_ID_TAG.format(match_id=row["id"]))
+        for team_id in (row.get("home_team_id"), row.get("away_team_id")):
+            if team_id:
+                tags.add(MATCH_TEAM_TAG.format(team_id=team_id))
+        for season_id in {row["season_id"] or None, None}:
+            for age_group_id in {row["age_group_id"] or None, None}:
+                for division_id in {row["division_id"] or None, None}:
+                    tags.add(
+                        MATCH_SCOPE_TAG.format(
+                            season_id=season_id, age_group_id=age_group_id, division_id=division_id
+                        )
+                    )
+    return tuple(sorted(tags))
+
+
+def _match_summaries_from_rpc(rows: list[dict]) -> list[dict]:
+    """Shape get_match_summary RPC rows like the Python summary, in the same order."""
+    summaries = [
+        {
+            "age_group": row["age_group"],
+            "league": row["league"],
+            "division": row["division"],
+            "total": row["total"],
+            "by_status": row["by_status"],
+            "needs_score": row["needs_score"],
+            "needs_kickoff": row["needs_kickoff"],
+            "date_range": {"earliest": row["earliest"], "latest": row["latest"]},
+            "last_played_date": row["last_played_date"],
+        }
+        for row in rows
+    ]
+    return sorted(summaries, key=lambda s: (s["age_group"], s["league"], s["division"]))
+
 
 def _birth_year_from_labels(age_group_name: str | None, season_name: str | None) -> int | None:
     """Derive a squad's birth year from its age group + season.
@@ -116,6 +479,67 @@ class SupabaseConnection:
 class MatchDAO(BaseDAO):
     """Data Access Object for match and league data using normalized schema."""
 
+    # === Cache Scope ===
+
+    def invalidate_match_rows(self, rows: list[dict] | None, counts_changed: bool = False) -> None:
+        """Bring cached reads up to date after a write to these match rows.
+
+        Applies the matches' standings deltas to the incremental standings
+        store, then invalidates the cached reads tagged with the rows' scope.
+        Falls back to clearing every mt:dao:matches:* key (standings stores
+        included) when the rows do not carry their season/age group/division
+        (e.g. an empty delete response).
+
+        Args:
+            rows: Match rows before and/or after the write
+            counts_changed: True if matches were added, removed or moved
+                between seasons
+        """
+        tags = _match_scope_tags(rows, counts_changed=counts_changed)
+        if tags is None:
+            clear_cache(MATCHES_CACHE_PATTERN)
+            return
+        self._sync_standings(rows)
+        invalidate_tags(*tags)
+
+    def _sync_standings(self, rows: list[dict]) -> None:
+        """Apply each written match to the standings stores of its old and new scope."""
+        store = get_standings_store()
+        if store is None:
+            return
+        scopes_by_match: dict[int, set[tuple]] = {}
+        for row in rows:
+            scope = (row["season_id"], row["age_group_id"], row["division_id"])
+            if all(scope):
+                scopes_by_match.setdefault(row["id"], set()).add(scope)
+        for match_id, scopes in scopes_by_match.items():
+            built = {scope: store.match_types(scope) for scope in scopes}
+            built = {scope: types for scope, types in built.items() if types}
+            if not built:
+                continue
+            try:
+                response = (
+                    self.client.table(MATCHES_READ_RELATION).select(STANDINGS_MATCH_SELECT).eq("id", match_id).execute()
+                )
+                match = response.data[0] if response.data else None
+            except Exception:
+                logger.exception("Error fetching match for standings update", match_id=match_id)
+                for scope, types in built.items():
+                    for match_type in types:
+                        store.drop(scope, match_type)
+                continue
+            for scope, types in built.items():
+                store.apply_match(scope, types, match_id, match)
+
+    def _get_match_scope(self, match_id: int) -> dict | None:
+        """Fetch just the columns that decide which cache entries a match feeds."""
+        try:
+            response = self.client.table("matches").select(MATCH_SCOPE_COLUMNS).eq("id", match_id).execute()
+            return response.data[0] if response.data else None
+        except Exception:
+            logger.exception("Error fetching match cache scope", match_id=match_id)
+            return None
+
     # === Core Match Methods ===
 
     def get_match_by_external_id(self, external_match_id: str) -> dict | None:
@@ -258,7 +682,7 @@ class MatchDAO(BaseDAO):
             logger.exception("Error getting match by teams and date")
             return None
 
-    @invalidates_cache(MATCHES_CACHE_PATTERN, PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
+    @invalidates_cache(PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
     def update_match_external_id(self, match_id: int, external_match_id: str) -> bool:
         """Update only the external match_id field on an existing match.
 
@@ -286,6 +710,7 @@ class MatchDAO(BaseDAO):
             )
 
             if response.data:
+                self.invalidate_match_rows(response.data)
                 logger.info(
                     "Updated match with external match_id",
                     match_id=match_id,
@@ -298,7 +723,7 @@ class MatchDAO(BaseDAO):
             logger.exception("Error updating match external_id")
             return False
 
-    @invalidates_cache(MATCHES_CACHE_PATTERN, PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
+    @invalidates_cache(PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
     def create_match(
         self,
         home_team_id: int,
@@ -365,6 +790,7 @@ class MatchDAO(BaseDAO):
             response = self.client.table("matches").insert(data).execute()
 
             if response.data and len(response.data) > 0:
+                self.invalidate_match_rows(response.data, counts_changed=True)
                 return response.data[0]["id"]
             return None
 
@@ -384,9 +810,14 @@ class MatchDAO(BaseDAO):
         start_date: str | None = None,
         end_date: str | None = None,
         include_test: bool = False,
+        fields: tuple[str, ...] | None = None,
     ) -> list[dict]:
         """Get all matches with optional filters.
 
+        Reads every page of get_matches_page(), so results are not cut off at
+        PostgREST's 1000-row default. Prefer get_matches_page() for anything
+        user-facing.
+
         Args:
             season_id: Filter by season ID
             age_group_id: Filter by age group ID
@@ -397,91 +828,127 @@ class MatchDAO(BaseDAO):
             end_date: Filter by end date (YYYY-MM-DD)
             include_test: SB-591 test partition. Real/anonymous viewers pass
                 False (test matches hidden); admins + test users pass True.
+            fields: Sparse fieldset (dao/match_fields.py); None for every field
         """
         try:
-            query = self.client.table(MATCHES_READ_RELATION).select("""
-                *,
-                home_team:teams!matches_home_team_id_fkey(id, name, club:clubs(id, name, logo_url)),
-                away_team:teams!matches_away_team_id_fkey(id, name, club:clubs(id, name, logo_url)),
-                season:seasons(id, name, start_date),
-                age_group:age_groups(id, name),
-                match_type:match_types(id, name),
-                division:divisions(id, name, league_id, leagues!divisions_league_id_fkey(id, name))
-            """)
-
-            # Apply filters
-            if not include_test:
-                query = query.eq("is_test", False)
-            if season_id:
-                query = query.eq("season_id", season_id)
-            if age_group_id:
-                query = query.eq("age_group_id", age_group_id)
-            if division_id:
-                query = query.eq("division_id", division_id)
+            matches: list[dict] = []
+            for page in self.iter_match_pages(
+                season_id=season_id,
+                age_group_id=age_group_id,
+                division_id=division_id,
+                team_id=team_id,
+                match_type=match_type,
+                start_date=start_date,
+                end_date=end_date,
+                include_test=include_test,
+                fields=fields,
+            ):
+                matches.extend(page)
+            return matches
 
-            # Date range filters
-            if start_date:
-                query = query.gte("match_date", start_date)
-            if end_date:
-                query = query.lte("match_date", end_date)
+        except Exception:
+            logger.exception("Error querying matches")
+            return []
 
-            # For team_id, we need to match either home_team_id OR away_team_id
-            if team_id:
-                query = query.or_(f"home_team_id.eq.{team_id},away_team_id.eq.{team_id}")
+    def iter_match_pages(
+        self,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        division_id: int | None = None,
+        team_id: int | None = None,
+        match_type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        include_test: bool = False,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> Iterator[list[dict]]:
+        """Yield every page of get_matches_page() in turn, newest first.
+
+        Only one page is held at a time, so streaming exports run in constant
+        memory however large the season. Takes the same filters as
+        get_all_matches(); cursor resumes after that match.
+
+        Raises:
+            ValueError: If the cursor is malformed
+            Exception: Any query error, mid-iteration
+        """
+        while True:
+            page = self.get_matches_page(
+                season_id=season_id,
+                age_group_id=age_group_id,
+                division_id=division_id,
+                team_id=team_id,
+                match_type=match_type,
+                start_date=start_date,
+                end_date=end_date,
+                include_test=include_test,
+                limit=MATCHES_PAGE_SIZE,
+                cursor=cursor,
+                fields=fields,
+            )
+            if page["matches"]:
+                yield page["matches"]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return
 
-            response = query.order("match_date", desc=True).execute()
+    def get_matches_page(
+        self,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        division_id: int | None = None,
+        team_id: int | None = None,
+        match_type: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        include_test: bool = False,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> dict:
+        """Get one page of matches, newest first, with keyset pagination.
 
-            # Filter by match_type name if specified (post-query filtering)
-            filtered_matches = response.data
-            if match_type:
-                filtered_matches = [
-                    match for match in response.data if match.get("match_type", {}).get("name") == match_type
-                ]
+        Pages are ordered by (match_date, id) descending and continue strictly
+        after the cursor's row, so inserts and deletes elsewhere in the list
+        never shift a page or repeat a row. The limit is applied in the query.
 
-            # Flatten the response for easier use
-            matches = []
-            for match in filtered_matches:
-                flat_match = {
-                    "id": match["id"],
-                    "match_date": match["match_date"],
-                    "scheduled_kickoff": match.get("scheduled_kickoff"),
-                    "home_team_id": match["home_team_id"],
-                    "away_team_id": match["away_team_id"],
-                    "home_team_name": match["home_team"]["name"] if match.get("home_team") else "Unknown",
-                    "away_team_name": match["away_team"]["name"] if match.get("away_team") else "Unknown",
-                    "home_team_club": match["home_team"].get("club") if match.get("home_team") else None,
-                    "away_team_club": match["away_team"].get("club") if match.get("away_team") else None,
-                    "home_score": match["home_score"],
-                    "away_score": match["away_score"],
-                    "season_id": match["season_id"],
-                    "season_name": match["season"]["name"] if match.get("season") else "Unknown",
-                    "season_start_date": match["season"].get("start_date") if match.get("season") else None,
-                    "age_group_id": match["age_group_id"],
-                    "age_group_name": match["age_group"]["name"] if match.get("age_group") else "Unknown",
-                    "match_type_id": match["match_type_id"],
-                    "match_type_name": match["match_type"]["name"] if match.get("match_type") else "Unknown",
-                    "division_id": match.get("division_id"),
-                    "division_name": match["division"]["name"] if match.get("division") else "Unknown",
-                    "league_id": match["division"]["league_id"] if match.get("division") else None,
-                    "league_name": match["division"]["leagues"]["name"]
-                    if match.get("division") and match["division"].get("leagues")
-                    else "Unknown",
-                    "division": match.get("division"),  # Include full division object with leagues
-                    "match_status": match.get("match_status"),
-                    "created_by": match.get("created_by"),
-                    "updated_by": match.get("updated_by"),
-                    "source": match.get("source", "manual"),
-                    "match_id": match.get("match_id"),  # External match identifier
-                    "created_at": match["created_at"],
-                    "updated_at": match["updated_at"],
-                }
-                matches.append(flat_match)
+        Args:
+            season_id: Filter by season ID
+            age_group_id: Filter by age group ID
+            division_id: Filter by division ID
+            team_id: Filter by team ID (home or away)
+            match_type: Filter by match type name
+            start_date: Filter by start date (YYYY-MM-DD)
+            end_date: Filter by end date (YYYY-MM-DD)
+            include_test: SB-591 test partition gate
+            limit: Page size
+            cursor: next_cursor of the previous page, or None for the first
+            fields: Sparse fieldset (dao/match_fields.py); only the columns and
+                embeds these fields read are selected. None for every field
 
-            return matches
+        Returns:
+            Dict with 'matches' (flattened as get_all_matches() returns them)
+            and 'next_cursor' (None on the last page)
 
-        except Exception:
-            logger.exception("Error querying matches")
-            return []
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = _matches_page_query(
+            self.client,
+            season_id=season_id,
+            age_group_id=age_group_id,
+            division_id=division_id,
+            team_id=team_id,
+            match_type=match_type,
+            start_date=start_date,
+            end_date=end_date,
+            include_test=include_test,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+        )
+        return _matches_page(query.execute().data, limit, fields)
 
     def get_match_summary(
         self,
@@ -489,11 +956,14 @@ class MatchDAO(BaseDAO):
         score_from: str | None = None,
         score_to: str | None = None,
         include_test: bool = False,
+        today: date | None = None,
     ) -> list[dict]:
         """Get match summary statistics grouped by age group, league, and division.
 
         Used by the match-scraper-agent to understand what MT already has
-        and make smart decisions about what to scrape.
+        and make smart decisions about what to scrape. Aggregated server-side
+        by the get_match_summary RPC; falls back to grouping the season's
+        matches in Python if the RPC fails.
 
         Args:
             season_name: Season name, e.g. '2025-2026'.
@@ -502,12 +972,45 @@ class MatchDAO(BaseDAO):
             include_test: SB-591 test partition. Defaults False so the scraper
                 agent's "what is missing" counts are not skewed by hand-created
                 test fixtures, which are never scraped.
+            today: The date needs_score and needs_kickoff are counted from;
+                defaults to today. Both the RPC and the fallback use it.
+        """
+        today = today or date.today()
+        # Aggregated in Postgres (supabase/migrations/20261016200000_match_summary_rpc.sql)
+        try:
+            response = self.client.rpc(
+                "get_match_summary",
+                {
+                    "p_season_name": season_name,
+                    "p_today": today.isoformat(),
+                    "p_score_from": score_from,
+                    "p_score_to": score_to,
+                    "p_include_test": include_test,
+                },
+            ).execute()
+            return _match_summaries_from_rpc(response.data)
+        except Exception as e:
+            logger.warning("match_summary_rpc_failed", error=str(e), season=season_name)
+
+        return self._get_match_summary_python(season_name, score_from, score_to, include_test, today)
+
+    def _get_match_summary_python(
+        self,
+        season_name: str,
+        score_from: str | None,
+        score_to: str | None,
+        include_test: bool,
+        today: date,
+    ) -> list[dict]:
+        """get_match_summary() computed client-side from every match of the season.
+
+        Fallback for when the get_match_summary RPC is not deployed or fails.
         """
         from collections import defaultdict
-        from datetime import date, timedelta
+        from datetime import timedelta
 
-        today = date.today().isoformat()
-        kickoff_horizon = (date.today() + timedelta(days=14)).isoformat()
+        kickoff_horizon = (today + timedelta(days=14)).isoformat()
+        today = today.isoformat()
 
         # Look up season by name
         season_resp = self.client.table("seasons").select("id").eq("name", season_name).limit(1).execute()
@@ -600,74 +1103,16 @@ class MatchDAO(BaseDAO):
         season_id: int | None = None,
         age_group_id: int | None = None,
         include_test: bool = False,
+        fields: tuple[str, ...] | None = None,
     ) -> list[dict]:
         """Get all matches for a specific team.
 
-        include_test gates the SB-591 test partition.
+        include_test gates the SB-591 test partition. fields is a sparse
+        fieldset (dao/match_fields.py); None returns every field.
         """
         try:
-            query = (
-                self.client.table(MATCHES_READ_RELATION)
-                .select("""
-                *,
-                home_team:teams!matches_home_team_id_fkey(id, name, club:clubs(id, name, logo_url)),
-                away_team:teams!matches_away_team_id_fkey(id, name, club:clubs(id, name, logo_url)),
-                season:seasons(id, name, start_date),
-                age_group:age_groups(id, name),
-                match_type:match_types(id, name),
-                division:divisions(id, name)
-            """)
-            )
-
-            if not include_test:
-                query = query.eq("is_test", False)
-
-            query = query.or_(f"home_team_id.eq.{team_id},away_team_id.eq.{team_id}")
-
-            if season_id:
-                query = query.eq("season_id", season_id)
-
-            if age_group_id:
-                query = query.eq("age_group_id", age_group_id)
-
-            response = query.order("match_date", desc=True).execute()
-
-            # Flatten response (same as get_all_matches)
-            matches = []
-            for match in response.data:
-                flat_match = {
-                    "id": match["id"],
-                    "match_date": match["match_date"],
-                    "scheduled_kickoff": match.get("scheduled_kickoff"),
-                    "home_team_id": match["home_team_id"],
-                    "away_team_id": match["away_team_id"],
-                    "home_team_name": match["home_team"]["name"] if match.get("home_team") else "Unknown",
-                    "away_team_name": match["away_team"]["name"] if match.get("away_team") else "Unknown",
-                    "home_team_club": match["home_team"].get("club") if match.get("home_team") else None,
-                    "away_team_club": match["away_team"].get("club") if match.get("away_team") else None,
-                    "home_score": match["home_score"],
-                    "away_score": match["away_score"],
-                    "season_id": match["season_id"],
-                    "season_name": match["season"]["name"] if match.get("season") else "Unknown",
-                    "season_start_date": match["season"].get("start_date") if match.get("season") else None,
-                    "age_group_id": match["age_group_id"],
-                    "age_group_name": match["age_group"]["name"] if match.get("age_group") else "Unknown",
-                    "match_type_id": match["match_type_id"],
-                    "match_type_name": match["match_type"]["name"] if match.get("match_type") else "Unknown",
-                    "division_id": match.get("division_id"),
-                    "division_name": match["division"]["name"] if match.get("division") else "Unknown",
-                    "division": match.get("division"),  # Include full division object with leagues
-                    "match_status": match.get("match_status"),
-                    "created_by": match.get("created_by"),
-                    "updated_by": match.get("updated_by"),
-                    "source": match.get("source", "manual"),
-                    "match_id": match.get("match_id"),  # External match identifier
-                    "created_at": match.get("created_at"),
-                    "updated_at": match.get("updated_at"),
-                }
-                matches.append(flat_match)
-
-            return matches
+            query = _team_matches_query(self.client, team_id, season_id, age_group_id, include_test, fields)
+            return _team_matches(query.execute().data, fields)
 
         except Exception:
             logger.exception("Error querying matches by team")
@@ -695,6 +1140,50 @@ class MatchDAO(BaseDAO):
         Returns:
             Dict with home_team_recent, away_team_recent, common_opponents, head_to_head
         """
+        preview = self._build_match_preview(
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            season_id=season_id,
+            age_group_id=age_group_id,
+            recent_count=recent_count,
+            include_test=include_test,
+        )
+        if preview is None:
+            return {
+                "home_team_id": home_team_id,
+                "away_team_id": away_team_id,
+                "home_team_recent": [],
+                "away_team_recent": [],
+                "common_opponents": [],
+                "head_to_head": [],
+            }
+        return preview
+
+    @dao_cache(
+        "matches:preview:{home_team_id}:{away_team_id}:{season_id}:{age_group_id}:{recent_count}:{include_test}",
+        tags=(
+            MATCH_TEAM_TAG.format(team_id="{home_team_id}"),
+            MATCH_TEAM_TAG.format(team_id="{away_team_id}"),
+        ),
+        ttl=3600,
+    )
+    def _build_match_preview(
+        self,
+        home_team_id: int,
+        away_team_id: int,
+        season_id: int | None,
+        age_group_id: int | None,
+        recent_count: int,
+        include_test: bool,
+    ) -> dict | None:
+        """Build the preview from three queries; None on error (not cached).
+
+        One query per team fetches its completed matches in scope, newest
+        first; recent form is the head of that list and common opponents are
+        found in the whole of it. Head-to-head filters on both team IDs in
+        the query. Cached under both teams' tags, so only a write to a match
+        either team played in invalidates it.
+        """
         select_str = """
             *,
             home_team:teams!matches_home_team_id_fkey(id, name),
@@ -732,62 +1221,35 @@ class MatchDAO(BaseDAO):
                 "updated_at": match.get("updated_at"),
             }
 
-        def build_base_query(team_id: int):
+        def completed_matches(team_filter: str, scoped: bool) -> list[dict]:
             q = (
                 self.client.table(MATCHES_READ_RELATION)
                 .select(select_str)
-                .or_(f"home_team_id.eq.{team_id},away_team_id.eq.{team_id}")
+                .or_(team_filter)
                 .in_("match_status", ["completed", "forfeit"])
             )
             if not include_test:
                 q = q.eq("is_test", False)
-            if season_id:
+            if scoped and season_id:
                 q = q.eq("season_id", season_id)
-            if age_group_id:
+            if scoped and age_group_id:
                 q = q.eq("age_group_id", age_group_id)
-            return q
-
-        def birth_year(age_group_name: str | None, season_name: str | None) -> int | None:
-            """Derive a squad's birth year from its age group + season.
-
-            Teams are stored per-club (one team_id shared across every age
-            group), so an age group label like "U14" only identifies a squad
-            when paired with the season it was played in. A U14 squad in
-            2025-2026 was born in 2026 - 14 = 2012, and that same group of kids
-            was U13 in 2024-2025 (2025 - 13 = 2012). Birth year therefore
-            follows the cohort as it ages up year to year.
-            """
-            try:
-                age_num = int(age_group_name.lstrip("Uu"))
-                end_year = int(season_name.split("-")[-1])
-            except (AttributeError, ValueError, TypeError, IndexError):
-                return None
-            return end_year - age_num
+            response = q.order("match_date", desc=True).execute()
+            return [flatten(m) for m in (response.data or [])]
+
+        def team_matches(team_id: int) -> list[dict]:
+            return completed_matches(f"home_team_id.eq.{team_id},away_team_id.eq.{team_id}", scoped=True)
 
         try:
-            # --- Recent form for each team (all match types) ---
-            home_resp = (
-                build_base_query(home_team_id)
-                .order("match_date", desc=True)
-                .limit(recent_count)
-                .execute()
-            )
-            away_resp = (
-                build_base_query(away_team_id)
-                .order("match_date", desc=True)
-                .limit(recent_count)
-                .execute()
-            )
-            home_recent = [flatten(m) for m in (home_resp.data or [])]
-            away_recent = [flatten(m) for m in (away_resp.data or [])]
+            # --- One fetch per team (season-scoped, all match types) ---
+            home_all = team_matches(home_team_id)
+            away_all = team_matches(away_team_id)
 
-            # --- Common opponents (season-scoped) ---
-            # Fetch all season matches for both teams to find shared opponents
-            home_all_resp = build_base_query(home_team_id).order("match_date", desc=True).execute()
-            away_all_resp = build_base_query(away_team_id).order("match_date", desc=True).execute()
-            home_all = [flatten(m) for m in (home_all_resp.data or [])]
-            away_all = [flatten(m) for m in (away_all_resp.data or [])]
+            # --- Recent form ---
+            home_recent = home_all[:recent_count]
+            away_recent = away_all[:recent_count]
 
+            # --- Common opponents ---
             def extract_opponents(matches: list[dict], team_id: int) -> dict[int, str]:
                 """Return {opponent_id: opponent_name} excluding the two preview teams."""
                 opps: dict[int, str] = {}
@@ -829,30 +1291,14 @@ class MatchDAO(BaseDAO):
             # unfiltered list rather than returning nothing.
             target_birth_year = None
             if age_group_id and season_id:
-                ag_lookup = (
-                    self.client.table("age_groups").select("name").eq("id", age_group_id).execute()
-                )
-                season_lookup = (
-                    self.client.table("seasons").select("name").eq("id", season_id).execute()
-                )
-                ag_name = ag_lookup.data[0]["name"] if ag_lookup.data else None
-                season_name = season_lookup.data[0]["name"] if season_lookup.data else None
+                ag_name, season_name = self._preview_scope_labels(home_all + away_all, season_id, age_group_id)
                 target_birth_year = _birth_year_from_labels(ag_name, season_name)
 
-            h2h_query = (
-                self.client.table(MATCHES_READ_RELATION)
-                .select(select_str)
-                .or_(f"home_team_id.eq.{home_team_id},away_team_id.eq.{home_team_id}")
-                .in_("match_status", ["completed", "forfeit"])
+            head_to_head = completed_matches(
+                f"and(home_team_id.eq.{home_team_id},away_team_id.eq.{away_team_id}),"
+                f"and(home_team_id.eq.{away_team_id},away_team_id.eq.{home_team_id})",
+                scoped=False,
             )
-            if not include_test:
-                h2h_query = h2h_query.eq("is_test", False)
-            h2h_resp = h2h_query.order("match_date", desc=True).execute()
-            head_to_head = [
-                flatten(m)
-                for m in (h2h_resp.data or [])
-                if away_team_id in (m["home_team_id"], m["away_team_id"])
-            ]
             if target_birth_year is not None:
                 head_to_head = [
                     m
@@ -871,16 +1317,26 @@ class MatchDAO(BaseDAO):
 
         except Exception:
             logger.exception("Error building match preview")
-            return {
-                "home_team_id": home_team_id,
-                "away_team_id": away_team_id,
-                "home_team_recent": [],
-                "away_team_recent": [],
-                "common_opponents": [],
-                "head_to_head": [],
-            }
+            return None
+
+    def _preview_scope_labels(
+        self, matches: list[dict], season_id: int, age_group_id: int
+    ) -> tuple[str | None, str | None]:
+        """Age group and season names for the preview scope.
 
-    @invalidates_cache(MATCHES_CACHE_PATTERN, PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
+        Every season-scoped match already carries both names, so the lookups
+        only run when neither team has played in the scope yet.
+        """
+        for m in matches:
+            if m["season_name"] != "Unknown" and m["age_group_name"] != "Unknown":
+                return m["age_group_name"], m["season_name"]
+        ag_lookup = self.client.table("age_groups").select("name").eq("id", age_group_id).execute()
+        season_lookup = self.client.table("seasons").select("name").eq("id", season_id).execute()
+        ag_name = ag_lookup.data[0]["name"] if ag_lookup.data else None
+        season_name = season_lookup.data[0]["name"] if season_lookup.data else None
+        return ag_name, season_name
+
+    @invalidates_cache(PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
     def add_match(
         self,
         home_team_id: int,
@@ -926,6 +1382,8 @@ class MatchDAO(BaseDAO):
 
             response = self.client.table("matches").insert(data).execute()
 
+            if response.data:
+                self.invalidate_match_rows(response.data, counts_changed=True)
             return bool(response.data)
 
         except APIError as e:
@@ -949,7 +1407,7 @@ class MatchDAO(BaseDAO):
             logger.exception("Error adding match")
             return False
 
-    @invalidates_cache(MATCHES_CACHE_PATTERN, PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
+    @invalidates_cache(PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
     def add_match_with_external_id(
         self,
         home_team_id: int,
@@ -985,7 +1443,7 @@ class MatchDAO(BaseDAO):
             external_match_id=external_match_id,
         )
 
-    @invalidates_cache(MATCHES_CACHE_PATTERN, PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
+    @invalidates_cache(PLAYOFF_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
     def update_match(
         self,
         match_id: int,
@@ -1035,6 +1493,10 @@ class MatchDAO(BaseDAO):
             if half_duration is not None:
                 data["half_duration"] = half_duration
 
+            # The edit may move the match to another season/age group/division;
+            # tables for the old scope must be invalidated as well as the new.
+            previous_scope = self._get_match_scope(match_id)
+
             # Execute update
             response = self.client.table("matches").update(data).eq("id", match_id).execute()
 
@@ -1047,7 +1509,9 @@ class MatchDAO(BaseDAO):
             # Clear cache BEFORE re-fetch to avoid returning stale cached data.
             # The @invalidates_cache decorator clears AFTER the function returns,
             # but get_match_by_id uses @dao_cache and would hit stale cache.
-            clear_cache(MATCHES_CACHE_PATTERN)
+            self.invalidate_match_rows(
+                [previous_scope, *response.data] if previous_scope else None, counts_changed=True
+            )
             clear_cache(PLAYOFF_CACHE_PATTERN)
             clear_cache(TOURNAMENTS_CACHE_PATTERN)
 
@@ -1061,7 +1525,7 @@ class MatchDAO(BaseDAO):
             logger.exception("Error updating match")
             return None
 
-    @dao_cache("matches:by_id:{match_id}:{include_test}")
+    @dao_cache("matches:by_id:{match_id}:{include_test}", tags=(MATCH_ID_TAG,))
     def get_match_by_id(self, match_id: int, include_test: bool = False) -> dict | None:
         """Get a single match by ID with all related data.
 
@@ -1177,19 +1641,27 @@ class MatchDAO(BaseDAO):
             logger.exception("Error retrieving match by ID")
             return None
 
-    @invalidates_cache(MATCHES_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
+    @invalidates_cache(TOURNAMENTS_CACHE_PATTERN)
     def delete_match(self, match_id: int) -> bool:
         """Delete a match."""
         try:
-            self.client.table("matches").delete().eq("id", match_id).execute()
+            response = self.client.table("matches").delete().eq("id", match_id).execute()
 
+            # Deleted rows carry their scope; an empty response clears all match keys
+            self.invalidate_match_rows(response.data, counts_changed=True)
             return True  # Supabase delete returns empty data even on success
 
         except Exception:
             logger.exception("Error deleting match")
             return False
 
-    @dao_cache("matches:table:{season_id}:{age_group_id}:{division_id}:{match_type}:{include_test}")
+    @dao_cache(
+        "matches:table:{season_id}:{age_group_id}:{division_id}:{match_type}:{include_test}",
+        tags=(MATCH_SCOPE_TAG,),
+        ttl=3600,
+        stale_ttl=86400,
+        single_flight=True,
+    )
     def get_league_table(
         self,
         season_id: int | None = None,
@@ -1217,6 +1689,23 @@ class MatchDAO(BaseDAO):
             List of team standings sorted by points, goal difference, goals scored
         """
         try:
+            scope = (season_id, age_group_id, division_id)
+            # Fully-filtered tables are maintained in Postgres (league_standings)
+            if all(scope) and _league_standings_table_enabled():
+                table = self._read_league_standings(scope, match_type, include_test)
+                if table is not None:
+                    return table
+
+            # Fully-filtered real tables are kept incrementally in the standings
+            # store (dao/standings_store.py); only a cold store refetches.
+            store = get_standings_store() if all(scope) and not include_test else None
+            token = None
+            if store is not None:
+                rows = store.load(scope, match_type)
+                if rows is not None:
+                    return standings_from_rows(rows)
+                token = store.begin_rebuild(scope, match_type)
+
             logger.info(
                 "generating league table from database",
                 season_id=season_id,
@@ -1228,20 +1717,151 @@ class MatchDAO(BaseDAO):
             matches = self._fetch_matches_for_standings(
                 season_id, age_group_id, division_id, include_test=include_test
             )
-
-            # Apply filters using pure functions
-            matches = filter_by_match_type(matches, match_type)
-            if division_id:
-                matches = filter_same_division_matches(matches, division_id)
-            matches = filter_completed_matches(matches)
+            if store is not None:
+                store.commit_rebuild(scope, match_type, token, matches)
 
             # Calculate standings using pure function (with form + movement)
-            return calculate_standings_with_extras(matches)
+            return calculate_standings_with_extras(_table_matches(matches, match_type, division_id))
 
         except Exception:
             logger.exception("Error generating league table")
             return []
 
+    def get_league_table_as_of(
+        self,
+        as_of: str,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        division_id: int | None = None,
+        match_type: str = "League",
+        include_test: bool = False,
+    ) -> list[dict]:
+        """
+        League table as it stood on a date.
+
+        Answered from the per-match-day checkpoints of
+        get_standings_checkpoints(), so any date of a season costs one cached
+        read rather than a recompute.
+
+        Args:
+            as_of: ISO date (YYYY-MM-DD); matches played on it are included
+            season_id: Filter by season
+            age_group_id: Filter by age group
+            division_id: Filter by division
+            match_type: Filter by match type name (default: "League")
+            include_test: SB-591 test partition gate
+
+        Returns:
+            Standings in get_league_table() format, with form and position
+            movement as of that date
+        """
+        checkpoints = self.get_standings_checkpoints(
+            season_id=season_id,
+            age_group_id=age_group_id,
+            division_id=division_id,
+            match_type=match_type,
+            include_test=include_test,
+        )
+        return standings_as_of([(c["match_date"], c["standings"]) for c in checkpoints], as_of)
+
+    @dao_cache(
+        "matches:table_history:{season_id}:{age_group_id}:{division_id}:{match_type}:{include_test}",
+        tags=(MATCH_SCOPE_TAG,),
+        ttl=3600,
+    )
+    def get_standings_checkpoints(
+        self,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        division_id: int | None = None,
+        match_type: str = "League",
+        include_test: bool = False,
+    ) -> list[dict]:
+        """
+        The league table at the end of every match day of a scope.
+
+        Uses the same fetch and filters as get_league_table(), and
+        compute_standings_checkpoints() walks the matches the same way
+        compute_standings_table() does, so the last checkpoint is today's
+        table.
+
+        Args:
+            season_id: Filter by season
+            age_group_id: Filter by age group
+            division_id: Filter by division
+            match_type: Filter by match type name (default: "League")
+            include_test: SB-591 test partition gate
+
+        Returns:
+            List of {match_date, standings} in date order
+        """
+        try:
+            matches = self._fetch_matches_for_standings(
+                season_id, age_group_id, division_id, include_test=include_test
+            )
+            checkpoints = compute_standings_checkpoints(_table_matches(matches, match_type, division_id))
+            return [{"match_date": match_date, "standings": standings} for match_date, standings in checkpoints]
+        except Exception:
+            logger.exception("Error generating standings checkpoints")
+            return []
+
+    def _read_league_standings(
+        self, scope: tuple[int, int, int], match_type: str, include_test: bool
+    ) -> list[dict] | None:
+        """
+        Read a precomputed league table from the league_standings table.
+
+        Args:
+            scope: (season_id, age_group_id, division_id)
+            match_type: Match type name
+            include_test: SB-591 audience; selects the real-only or the
+                real-and-test aggregate
+
+        Returns:
+            Standings in calculate_standings_with_extras() format, or None if
+            the read failed (the caller then computes the table itself)
+        """
+        season_id, age_group_id, division_id = scope
+        try:
+            response = (
+                self.client.table(LEAGUE_STANDINGS_TABLE)
+                .select(LEAGUE_STANDINGS_SELECT)
+                .eq("season_id", season_id)
+                .eq("age_group_id", age_group_id)
+                .eq("division_id", division_id)
+                .eq("include_test", include_test)
+                .eq("match_type.name", match_type)
+                .order("position")
+                .execute()
+            )
+        except Exception as e:
+            logger.warning("league_standings read failed, computing table", error=str(e), scope=scope)
+            return None
+
+        table = []
+        for row in response.data:
+            team = row.get("team") or {}
+            club = team.get("club") or {}
+            table.append(
+                {
+                    "team": team.get("name"),
+                    "team_id": row["team_id"],
+                    "club_id": club.get("id"),
+                    "logo_url": club.get("logo_url"),
+                    "played": row["played"],
+                    "wins": row["wins"],
+                    "draws": row["draws"],
+                    "losses": row["losses"],
+                    "goals_for": row["goals_for"],
+                    "goals_against": row["goals_against"],
+                    "goal_difference": row["goal_difference"],
+                    "points": row["points"],
+                    "form": row.get("form") or [],
+                    "position_change": row.get("position_change") or 0,
+                }
+            )
+        return table
+
     def _fetch_matches_for_standings(
         self,
         season_id: int | None = None,
@@ -1270,12 +1890,7 @@ class MatchDAO(BaseDAO):
             age_group_id=age_group_id,
             division_id=division_id,
         )
-        query = self.client.table(MATCHES_READ_RELATION).select("""
-            *,
-            home_team:teams!matches_home_team_id_fkey(id, name, division_id, club:clubs(id, name, logo_url)),
-            away_team:teams!matches_away_team_id_fkey(id, name, division_id, club:clubs(id, name, logo_url)),
-            match_type:match_types(id, name)
-        """)
+        query = self.client.table(MATCHES_READ_RELATION).select(STANDINGS_MATCH_SELECT)
 
         # Apply database-level filters
         if not include_test:
@@ -1287,9 +1902,71 @@ class MatchDAO(BaseDAO):
         if division_id:
             query = query.eq("division_id", division_id)
 
-        response = query.execute()
+        # In id order, so tied teams rank by first appearance as in league_standings
+        response = query.order("id").execute()
         return response.data
 
+    @dao_cache(
+        "matches:season_tables:{season_id}:{include_test}",
+        tags=("matches:scope:{season_id}:None:None",),
+        ttl=3600,
+    )
+    def get_season_standings(self, season_id: int, include_test: bool = False) -> list[dict]:
+        """
+        League tables for every age group, division and match type of a season.
+
+        Fetches the season's matches once and computes all tables together
+        (dao/standings_batch.py) instead of one get_league_table() call per
+        division. Each table is identical to get_league_table() with the same
+        filters.
+
+        Args:
+            season_id: Season to build tables for
+            include_test: SB-591 test partition gate
+
+        Returns:
+            List of {age_group_id, division_id, match_type, standings}, ordered
+            by age group, division and match type
+        """
+        try:
+            matches = self._fetch_season_matches_for_standings(season_id, include_test=include_test)
+            tables = calculate_partition_standings(matches)
+            return [
+                {
+                    "age_group_id": age_group_id,
+                    "division_id": division_id,
+                    "match_type": match_type,
+                    "standings": standings,
+                }
+                for (age_group_id, division_id, match_type), standings in sorted(
+                    tables.items(), key=lambda item: tuple(str(part) for part in item[0])
+                )
+            ]
+        except Exception:
+            logger.exception("Error generating season standings", season_id=season_id)
+            return []
+
+    def _fetch_season_matches_for_standings(self, season_id: int, include_test: bool = False) -> list[dict]:
+        """Fetch a whole season for standings, paginating past Supabase's 1000-row default."""
+        logger.info("fetching season matches for standings calculation from database", season_id=season_id)
+        page_size = 1000
+        offset = 0
+        matches: list[dict] = []
+        while True:
+            query = (
+                self.client.table(MATCHES_READ_RELATION)
+                .select(STANDINGS_MATCH_SELECT)
+                .eq("season_id", season_id)
+                .order("id")
+            )
+            if not include_test:
+                query = query.eq("is_test", False)
+            response = query.range(offset, offset + page_size - 1).execute()
+            matches.extend(response.data)
+            if len(response.data) < page_size:
+                return matches
+            offset += page_size
+
     # === Live Match Methods ===
 
     def get_live_matches(self, include_test: bool = False) -> list[dict]:
@@ -1302,40 +1979,8 @@ class MatchDAO(BaseDAO):
         LIVE tab.
         """
         try:
-            query = (
-                self.client.table(MATCHES_READ_RELATION)
-                .select("""
-                    id,
-                    match_status,
-                    match_date,
-                    home_score,
-                    away_score,
-                    kickoff_time,
-                    home_team:teams!matches_home_team_id_fkey(id, name),
-                    away_team:teams!matches_away_team_id_fkey(id, name)
-                """)
-                .eq("match_status", "live")
-            )
-            if not include_test:
-                query = query.eq("is_test", False)
-            response = query.execute()
-
-            # Flatten the response
-            result = []
-            for match in response.data or []:
-                result.append(
-                    {
-                        "match_id": match["id"],
-                        "match_status": match["match_status"],
-                        "match_date": match["match_date"],
-                        "home_score": match["home_score"],
-                        "away_score": match["away_score"],
-                        "kickoff_time": match.get("kickoff_time"),
-                        "home_team_name": match["home_team"]["name"] if match.get("home_team") else "Unknown",
-                        "away_team_name": match["away_team"]["name"] if match.get("away_team") else "Unknown",
-                    }
-                )
-            return result
+            response = _live_matches_query(self.client, include_test).execute()
+            return [_flatten_live_match(match) for match in response.data or []]
 
         except Exception:
             logger.exception("Error getting live matches")
@@ -1419,7 +2064,7 @@ class MatchDAO(BaseDAO):
             logger.exception("Error getting live match state", match_id=match_id)
             return None
 
-    @invalidates_cache(MATCHES_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
+    @invalidates_cache(TOURNAMENTS_CACHE_PATTERN)
     def update_match_clock(
         self,
         match_id: int,
@@ -1503,6 +2148,7 @@ class MatchDAO(BaseDAO):
             if not response.data:
                 logger.warning("Clock update failed - no rows affected", match_id=match_id)
                 return None
+            self.invalidate_match_rows(response.data)
 
             logger.info(
                 "match_clock_updated",
@@ -1524,7 +2170,7 @@ class MatchDAO(BaseDAO):
             logger.exception("Error updating match clock", match_id=match_id, action=action)
             return None
 
-    @invalidates_cache(MATCHES_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
+    @invalidates_cache(TOURNAMENTS_CACHE_PATTERN)
     def reopen_match(
         self,
         match_id: int,
@@ -1564,6 +2210,7 @@ class MatchDAO(BaseDAO):
             if not response.data:
                 logger.warning("Reopen failed - no rows affected", match_id=match_id)
                 return None
+            self.invalidate_match_rows(response.data)
 
             logger.info("match_reopened", match_id=match_id, updated_by=updated_by)
             # include_test=True — read-back of an authorised write (SB-649).
@@ -1573,7 +2220,7 @@ class MatchDAO(BaseDAO):
             logger.exception("Error reopening match", match_id=match_id)
             return None
 
-    @invalidates_cache(MATCHES_CACHE_PATTERN, TOURNAMENTS_CACHE_PATTERN)
+    @invalidates_cache(TOURNAMENTS_CACHE_PATTERN)
     def update_match_score(
         self,
         match_id: int,
@@ -1605,6 +2252,7 @@ class MatchDAO(BaseDAO):
             if not response.data:
                 logger.warning("Score update failed - no rows affected", match_id=match_id)
                 return None
+            self.invalidate_match_rows(response.data)
 
             logger.info(
                 "match_score_updated",
@@ -1650,52 +2298,88 @@ class MatchDAO(BaseDAO):
         Returns:
             List of match dicts with fields the audit comparator expects.
         """
+        results: list[dict] = []
+        try:
+            for page in self.iter_agent_matches(
+                team=team,
+                age_group=age_group,
+                league=league,
+                division=division,
+                season=season,
+                start_date=start_date,
+                end_date=end_date,
+                include_test=include_test,
+            ):
+                results.extend(page)
+        except Exception:
+            logger.exception("get_agent_matches.query_error", team=team)
+            return []
+
+        logger.info(
+            "get_agent_matches.done",
+            team=team,
+            age_group=age_group,
+            count=len(results),
+        )
+        return results
+
+    def iter_agent_matches(
+        self,
+        team: str,
+        age_group: str,
+        league: str,
+        division: str,
+        season: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        include_test: bool = False,
+    ) -> Iterator[list[dict]]:
+        """Yield get_agent_matches() rows a page at a time, oldest first.
+
+        Pages through the matches by (match_date, id) keyset, so only one page
+        is held at a time. Yields nothing if a name does not resolve.
+
+        Raises:
+            Exception: Any query error, mid-iteration
+        """
         # Resolve IDs for the reference dimensions
-        season_resp = self.client.table("seasons").select("id").eq("name", season).limit(1).execute()
-        if not season_resp.data:
+        registry = get_reference_registry(self.client)
+        season_row = registry.season(season)
+        if season_row is None:
             logger.warning("get_agent_matches.season_not_found", season=season)
-            return []
-        season_id = season_resp.data[0]["id"]
+            return
+        season_id = season_row["id"]
 
-        ag_resp = self.client.table("age_groups").select("id").eq("name", age_group).limit(1).execute()
-        if not ag_resp.data:
+        age_group_row = registry.age_group(age_group)
+        if age_group_row is None:
             logger.warning("get_agent_matches.age_group_not_found", age_group=age_group)
-            return []
-        age_group_id = ag_resp.data[0]["id"]
+            return
+        age_group_id = age_group_row["id"]
 
-        # Resolve division_id via league join
-        div_resp = (
-            self.client.table("divisions")
-            .select("id, leagues!divisions_league_id_fkey(name)")
-            .eq("name", division)
-            .execute()
-        )
-        division_id = None
-        for row in div_resp.data or []:
-            if row.get("leagues") and row["leagues"].get("name") == league:
-                division_id = row["id"]
-                break
-        if division_id is None:
+        division_row = registry.division(division, league=league)
+        if division_row is None:
             logger.warning("get_agent_matches.division_not_found", division=division, league=league)
-            return []
+            return
+        division_id = division_row["id"]
 
         # Resolve team IDs matching the given name
-        team_resp = self.client.table("teams").select("id").eq("name", team).execute()
-        team_ids = [r["id"] for r in (team_resp.data or [])]
+        team_ids = [t["id"] for t in registry.teams(team)]
         if not team_ids:
             logger.warning("get_agent_matches.team_not_found", team=team)
-            return []
+            return
 
-        # Build OR filter for home/away team membership
-        or_filter = ",".join(
+        # OR filter for home/away team membership; the keyset condition is
+        # combined with it, as PostgREST takes one or= per request
+        team_filter = ",".join(
             [f"home_team_id.eq.{tid}" for tid in team_ids] + [f"away_team_id.eq.{tid}" for tid in team_ids]
         )
 
-        try:
+        after = None
+        while True:
             query = (
                 self.client.table(MATCHES_READ_RELATION)
                 .select(
-                    "match_id, match_date, scheduled_kickoff, home_score, away_score, match_status, "
+                    "id, match_id, match_date, scheduled_kickoff, home_score, away_score, match_status, "
                     "home_team:teams!matches_home_team_id_fkey(name), "
                     "away_team:teams!matches_away_team_id_fkey(name)"
                 )
@@ -1710,49 +2394,55 @@ class MatchDAO(BaseDAO):
                 query = query.gte("match_date", start_date)
             if end_date:
                 query = query.lte("match_date", end_date)
-            response = query.or_(or_filter).order("match_date", desc=False).execute()
-        except Exception:
-            logger.exception("get_agent_matches.query_error", team=team)
-            return []
-
-        results = []
-        for m in response.data or []:
-            # Format match_time as "HH:MM" from scheduled_kickoff (UTC)
-            match_time = None
-            if m.get("scheduled_kickoff"):
-                try:
-                    from datetime import datetime
-
-                    kt = datetime.fromisoformat(m["scheduled_kickoff"].replace("Z", "+00:00"))
-                    if kt.hour or kt.minute:
-                        match_time = kt.strftime("%H:%M")
-                except (ValueError, AttributeError):
-                    pass
-
-            results.append(
-                {
-                    "external_match_id": m.get("match_id"),
-                    "home_team": m["home_team"]["name"] if m.get("home_team") else None,
-                    "away_team": m["away_team"]["name"] if m.get("away_team") else None,
-                    "match_date": m["match_date"],
-                    "match_time": match_time,
-                    "home_score": m.get("home_score"),
-                    "away_score": m.get("away_score"),
-                    "match_status": m.get("match_status"),
-                    "age_group": age_group,
-                    "league": league,
-                    "division": division,
-                    "season": season,
-                }
+            conditions = [f"or({team_filter})"]
+            if after:
+                after_date, after_id = after
+                conditions.append(f"or(match_date.gt.{after_date},and(match_date.eq.{after_date},id.gt.{after_id}))")
+            response = (
+                query.or_(f"and({','.join(conditions)})")
+                .order("match_date", desc=False)
+                .order("id", desc=False)
+                .limit(MATCHES_PAGE_SIZE)
+                .execute()
             )
+            rows = response.data or []
+
+            page = []
+            for m in rows:
+                # Format match_time as "HH:MM" from scheduled_kickoff (UTC)
+                match_time = None
+                if m.get("scheduled_kickoff"):
+                    try:
+                        from datetime import datetime
+
+                        kt = datetime.fromisoformat(m["scheduled_kickoff"].replace("Z", "+00:00"))
+                        if kt.hour or kt.minute:
+                            match_time = kt.strftime("%H:%M")
+                    except (ValueError, AttributeError):
+                        pass
+
+                page.append(
+                    {
+                        "external_match_id": m.get("match_id"),
+                        "home_team": m["home_team"]["name"] if m.get("home_team") else None,
+                        "away_team": m["away_team"]["name"] if m.get("away_team") else None,
+                        "match_date": m["match_date"],
+                        "match_time": match_time,
+                        "home_score": m.get("home_score"),
+                        "away_score": m.get("away_score"),
+                        "match_status": m.get("match_status"),
+                        "age_group": age_group,
+                        "league": league,
+                        "division": division,
+                        "season": season,
+                    }
+                )
+            if page:
+                yield page
 
-        logger.info(
-            "get_agent_matches.done",
-            team=team,
-            age_group=age_group,
-            count=len(results),
-        )
-        return results
+            if len(rows) < MATCHES_PAGE_SIZE:
+                return
+            after = (rows[-1]["match_date"], rows[-1]["id"])
 
     def cancel_match(
         self,
@@ -1772,37 +2462,27 @@ class MatchDAO(BaseDAO):
         Returns True if a match was found and cancelled, False if not found.
         """
         # Resolve dimension IDs (same pattern as get_agent_matches)
-        season_resp = self.client.table("seasons").select("id").eq("name", season).limit(1).execute()
-        if not season_resp.data:
+        registry = get_reference_registry(self.client)
+        season_row = registry.season(season)
+        if season_row is None:
             logger.warning("cancel_match.season_not_found", season=season)
             return False
-        season_id = season_resp.data[0]["id"]
+        season_id = season_row["id"]
 
-        ag_resp = self.client.table("age_groups").select("id").eq("name", age_group).limit(1).execute()
-        if not ag_resp.data:
+        age_group_row = registry.age_group(age_group)
+        if age_group_row is None:
             logger.warning("cancel_match.age_group_not_found", age_group=age_group)
             return False
-        age_group_id = ag_resp.data[0]["id"]
+        age_group_id = age_group_row["id"]
 
-        div_resp = (
-            self.client.table("divisions")
-            .select("id, leagues!divisions_league_id_fkey(name)")
-            .eq("name", division)
-            .execute()
-        )
-        division_id = None
-        for row in div_resp.data or []:
-            if row.get("leagues") and row["leagues"].get("name") == league:
-                division_id = row["id"]
-                break
-        if division_id is None:
+        division_row = registry.division(division, league=league)
+        if division_row is None:
             logger.warning("cancel_match.division_not_found", division=division, league=league)
             return False
+        division_id = division_row["id"]
 
-        home_resp = self.client.table("teams").select("id").eq("name", home_team).execute()
-        home_ids = [r["id"] for r in (home_resp.data or [])]
-        away_resp = self.client.table("teams").select("id").eq("name", away_team).execute()
-        away_ids = [r["id"] for r in (away_resp.data or [])]
+        home_ids = [t["id"] for t in registry.teams(home_team)]
+        away_ids = [t["id"] for t in registry.teams(away_team)]
         if not home_ids or not away_ids:
             logger.warning("cancel_match.team_not_found", home_team=home_team, away_team=away_team)
             return False
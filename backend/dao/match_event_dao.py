@@ -8,18 +8,32 @@ Handles all database operations related to live match events including:
 - Cleanup of expired messages
 """
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
 import structlog
 
-from dao.base_dao import BaseDAO
+from dao.base_dao import BaseDAO, bump_data_versions
 
 logger = structlog.get_logger()
 
+# Rows per request when iterating goal events (PostgREST's max-rows default)
+GOAL_EVENTS_PAGE_SIZE = 1000
+
+# Event types listed on matches (GET /api/matches red_cards/yellow_cards); a
+# write to one changes the match list's data version
+CARD_EVENT_TYPES = ("red_card", "yellow_card")
+
 
 class MatchEventDAO(BaseDAO):
     """Data access object for match event operations (live match activity stream)."""
 
+    @staticmethod
+    def _bump_card_version(rows: list[dict]) -> None:
+        """Advance the match_events data version if any written row is a card."""
+        if any(row.get("event_type") in CARD_EVENT_TYPES for row in rows):
+            bump_data_versions("match_events")
+
     def create_event(
         self,
         match_id: int,
@@ -91,6 +105,7 @@ class MatchEventDAO(BaseDAO):
             response = self.client.table("match_events").insert(data).execute()
 
             if response.data:
+                self._bump_card_version(response.data)
                 logger.info(
                     "match_event_created",
                     match_id=match_id,
@@ -211,6 +226,7 @@ class MatchEventDAO(BaseDAO):
             )
 
             if response.data:
+                self._bump_card_version(response.data)
                 logger.info(
                     "match_event_deleted",
                     event_id=event_id,
@@ -334,6 +350,7 @@ class MatchEventDAO(BaseDAO):
             )
 
             if response.data:
+                self._bump_card_version(response.data)
                 logger.info(
                     "match_event_updated",
                     event_id=event_id,
@@ -370,33 +387,10 @@ class MatchEventDAO(BaseDAO):
         """
         try:
             query = (
-                self.client.table("match_events")
-                .select(
-                    "*, match:matches!inner("
-                    "id, match_date, home_score, away_score, "
-                    "season_id, age_group_id, match_type_id, "
-                    "home_team:teams!matches_home_team_id_fkey(id, name), "
-                    "away_team:teams!matches_away_team_id_fkey(id, name), "
-                    "season:seasons(id, name), "
-                    "age_group:age_groups(id, name), "
-                    "match_type:match_types(id, name)"
-                    ")"
-                )
-                .eq("event_type", "goal")
-                .eq("is_deleted", False)
+                self._goal_events_query(season_id, age_group_id, match_type_id, team_id)
                 .order("created_at", desc=True)
                 .range(offset, offset + limit - 1)
             )
-
-            if season_id is not None:
-                query = query.eq("match.season_id", season_id)
-            if age_group_id is not None:
-                query = query.eq("match.age_group_id", age_group_id)
-            if match_type_id is not None:
-                query = query.eq("match.match_type_id", match_type_id)
-            if team_id is not None:
-                query = query.eq("team_id", team_id)
-
             response = query.execute()
             return response.data or []
 
@@ -404,6 +398,76 @@ class MatchEventDAO(BaseDAO):
             logger.exception("Error getting goal events")
             return []
 
+    def iter_goal_events(
+        self,
+        season_id: int | None = None,
+        age_group_id: int | None = None,
+        match_type_id: int | None = None,
+        team_id: int | None = None,
+    ) -> Iterator[list[dict]]:
+        """Yield every matching goal event, newest first, one page at a time.
+
+        Same rows and order as get_goal_events(), but paged by a
+        (created_at, id) keyset rather than an offset, so only one page is held
+        at a time and rows inserted meanwhile do not shift later pages.
+
+        Raises:
+            Exception: Any query error, mid-iteration
+        """
+        after = None
+        while True:
+            query = self._goal_events_query(season_id, age_group_id, match_type_id, team_id)
+            if after:
+                after_created_at, after_id = after
+                # Timestamps carry ':' and '+', so quote them inside the filter
+                query = query.or_(
+                    f'created_at.lt."{after_created_at}",and(created_at.eq."{after_created_at}",id.lt.{after_id})'
+                )
+            response = (
+                query.order("created_at", desc=True).order("id", desc=True).limit(GOAL_EVENTS_PAGE_SIZE).execute()
+            )
+            rows = response.data or []
+            if rows:
+                yield rows
+            if len(rows) < GOAL_EVENTS_PAGE_SIZE:
+                return
+            after = (rows[-1]["created_at"], rows[-1]["id"])
+
+    def _goal_events_query(
+        self,
+        season_id: int | None,
+        age_group_id: int | None,
+        match_type_id: int | None,
+        team_id: int | None,
+    ):
+        """Filtered goal-events query with match context, not yet ordered or limited."""
+        query = (
+            self.client.table("match_events")
+            .select(
+                "*, match:matches!inner("
+                "id, match_date, home_score, away_score, "
+                "season_id, age_group_id, match_type_id, "
+                "home_team:teams!matches_home_team_id_fkey(id, name), "
+                "away_team:teams!matches_away_team_id_fkey(id, name), "
+                "season:seasons(id, name), "
+                "age_group:age_groups(id, name), "
+                "match_type:match_types(id, name)"
+                ")"
+            )
+            .eq("event_type", "goal")
+            .eq("is_deleted", False)
+        )
+
+        if season_id is not None:
+            query = query.eq("match.season_id", season_id)
+        if age_group_id is not None:
+            query = query.eq("match.age_group_id", age_group_id)
+        if match_type_id is not None:
+            query = query.eq("match.match_type_id", match_type_id)
+        if team_id is not None:
+            query = query.eq("team_id", team_id)
+        return query
+
     def get_card_events_for_matches(self, match_ids: list[int]) -> dict[int, list[dict]]:
         """Get card events (red/yellow) for multiple matches in one query.
 
@@ -0,0 +1,147 @@
+"""
+Sparse fieldsets for match lists.
+
+A match list row (get_all_matches(), get_matches_by_team()) has ~35 keys built
+from the match columns and six embedded relations, but most views read a
+dozen of them. Each field here declares the columns and embeds it reads, so
+a `fields=` request selects only those from PostgREST and skips the rest of
+the joins entirely, and flatten_match_fields() builds the same values the
+full flattener would.
+"""
+
+# Embedded relations, (minimal, with nested join) forms. The nested form is
+# used when any requested field needs the nested join.
+MATCH_EMBEDS = {
+    "home_team": (
+        "home_team:teams!matches_home_team_id_fkey(id, name)",
+        "home_team:teams!matches_home_team_id_fkey(id, name, club:clubs(id, name, logo_url))",
+    ),
+    "away_team": (
+        "away_team:teams!matches_away_team_id_fkey(id, name)",
+        "away_team:teams!matches_away_team_id_fkey(id, name, club:clubs(id, name, logo_url))",
+    ),
+    "season": ("season:seasons(id, name, start_date)",) * 2,
+    "age_group": ("age_group:age_groups(id, name)",) * 2,
+    "match_type": ("match_type:match_types(id, name)",) * 2,
+    "division": (
+        "division:divisions(id, name)",
+        "division:divisions(id, name, league_id, leagues!divisions_league_id_fkey(id, name))",
+    ),
+}
+
+_NESTED = 1
+
+
+def _column(name: str, default=None):
+    return ((name,), (), lambda m: m.get(name, default))
+
+
+def _embedded(embed: str, key: str, nested: int = 0, default="Unknown"):
+    def value(m):
+        related = m.get(embed)
+        return related.get(key) if related else default
+
+    return ((), ((embed, nested),), value)
+
+
+def _league_name(m):
+    division = m.get("division")
+    return division["leagues"]["name"] if division and division.get("leagues") else "Unknown"
+
+
+# Field -> (match columns, (embed, nested) pairs, value from the fetched row)
+MATCH_LIST_FIELDS = {
+    "id": _column("id"),
+    "match_date": _column("match_date"),
+    "scheduled_kickoff": _column("scheduled_kickoff"),
+    "home_team_id": _column("home_team_id"),
+    "away_team_id": _column("away_team_id"),
+    "home_team_name": _embedded("home_team", "name"),
+    "away_team_name": _embedded("away_team", "name"),
+    "home_team_club": _embedded("home_team", "club", _NESTED, default=None),
+    "away_team_club": _embedded("away_team", "club", _NESTED, default=None),
+    "home_score": _column("home_score"),
+    "away_score": _column("away_score"),
+    "season_id": _column("season_id"),
+    "season_name": _embedded("season", "name"),
+    "season_start_date": _embedded("season", "start_date", default=None),
+    "age_group_id": _column("age_group_id"),
+    "age_group_name": _embedded("age_group", "name"),
+    "match_type_id": _column("match_type_id"),
+    "match_type_name": _embedded("match_type", "name"),
+    "division_id": _column("division_id"),
+    "division_name": _embedded("division", "name"),
+    "league_id": _embedded("division", "league_id", _NESTED, default=None),
+    "league_name": ((), (("division", _NESTED),), _league_name),
+    "division": ((), (("division", _NESTED),), lambda m: m.get("division")),
+    "match_status": _column("match_status"),
+    "created_by": _column("created_by"),
+    "updated_by": _column("updated_by"),
+    "source": _column("source", "manual"),
+    "match_id": _column("match_id"),
+    "created_at": _column("created_at"),
+    "updated_at": _column("updated_at"),
+}
+
+# Filled in by the API layer from match events, not from the match row
+CARD_FIELDS = ("red_cards", "yellow_cards")
+
+
+def parse_match_fields(fields: str | None) -> tuple[str, ...] | None:
+    """
+    Parse a comma-separated `fields=` value.
+
+    Args:
+        fields: e.g. "match_date,home_team_name,away_team_name", or None
+
+    Returns:
+        The requested fields, always including id, or None for every field
+
+    Raises:
+        ValueError: If a field is unknown
+    """
+    if fields is None:
+        return None
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = sorted(set(requested) - set(MATCH_LIST_FIELDS) - set(CARD_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(["id", *requested]))
+
+
+def match_list_select(fields: tuple[str, ...], extra_columns: tuple[str, ...] = (), inner: tuple[str, ...] = ()) -> str:
+    """
+    Minimal PostgREST select string for a sparse fieldset.
+
+    Args:
+        fields: Parsed fields (see parse_match_fields())
+        extra_columns: Columns the query itself needs (e.g. keyset ordering)
+        inner: Embeds to select as inner joins (filtered on in the query);
+            always included
+
+    Returns:
+        Select string with only the columns and embeds the fields read
+    """
+    columns = dict.fromkeys(extra_columns)
+    embeds: dict[str, int] = dict.fromkeys(inner, 0)
+    for field in fields:
+        if field not in MATCH_LIST_FIELDS:
+            continue
+        field_columns, field_embeds, _ = MATCH_LIST_FIELDS[field]
+        columns.update(dict.fromkeys(field_columns))
+        for embed, nested in field_embeds:
+            embeds[embed] = max(embeds.get(embed, 0), nested)
+    parts = list(columns)
+    for embed, nested in embeds.items():
+        part = MATCH_EMBEDS[embed][nested]
+        if embed in inner:
+            # alias:table!fk(...) -> alias:table!fk!inner(...)
+            head, _, rest = part.partition("(")
+            part = f"{head}!inner({rest}"
+        parts.append(part)
+    return ", ".join(parts)
+
+
+def flatten_match_fields(match: dict, fields: tuple[str, ...]) -> dict:
+    """Flatten a fetched match row to just the requested fields."""
+    return {field: MATCH_LIST_FIELDS[field][2](match) for field in fields if field in MATCH_LIST_FIELDS}
@@ -258,7 +258,12 @@ class PlayerStatsDAO(BaseDAO):
             logger.error("stats_team_error", team_id=team_id, season_id=season_id, error=str(e))
             return []
 
-    @dao_cache("stats:leaderboard:goals:s{season_id}:l{league_id}:d{division_id}:a{age_group_id}:mt{match_type_id}:t{tournament_id}:lim{limit}:test{include_test}")
+    @dao_cache(
+        "stats:leaderboard:goals:s{season_id}:l{league_id}:d{division_id}:a{age_group_id}:mt{match_type_id}:t{tournament_id}:lim{limit}:test{include_test}",
+        ttl=3600,
+        stale_ttl=86400,
+        single_flight=True,
+    )
     def get_goals_leaderboard(
         self,
         season_id: int,
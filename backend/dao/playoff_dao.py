@@ -36,7 +36,12 @@ class PlayoffDAO(BaseDAO):
 
     # === Bracket Query Methods ===
 
-    @dao_cache("playoffs:bracket:{league_id}:{season_id}:{age_group_id}")
+    @dao_cache(
+        "playoffs:bracket:{league_id}:{season_id}:{age_group_id}",
+        ttl=3600,
+        stale_ttl=86400,
+        single_flight=True,
+    )
     def get_bracket(
         self, league_id: int, season_id: int, age_group_id: int
     ) -> list[dict]:
@@ -24,6 +24,8 @@ from typing import Any
 
 import structlog
 
+from dao.reference_registry import get_reference_registry
+
 logger = structlog.get_logger()
 
 
@@ -97,48 +99,26 @@ class QoPRankingsDAO:
     @staticmethod
     def _resolve_division_id(client, division: str) -> int | None:
         """Resolve a division name to its database ID (case-insensitive)."""
-        try:
-            response = client.table("divisions").select("id, name").execute()
-            for row in response.data:
-                if row["name"].lower() == division.lower():
-                    return row["id"]
+        row = get_reference_registry(client).division(division)
+        if row is None:
             logger.warning("qop_rankings_division_not_found", division=division)
             return None
-        except Exception:
-            logger.exception("qop_rankings_division_lookup_error", division=division)
-            return None
+        return row["id"]
 
     @staticmethod
     def _resolve_age_group_id(client, age_group: str) -> int | None:
         """Resolve an age group name to its database ID (case-insensitive)."""
-        try:
-            response = client.table("age_groups").select("id, name").execute()
-            for row in response.data:
-                if row["name"].lower() == age_group.lower():
-                    return row["id"]
+        row = get_reference_registry(client).age_group(age_group)
+        if row is None:
             logger.warning("qop_rankings_age_group_not_found", age_group=age_group)
             return None
-        except Exception:
-            logger.exception("qop_rankings_age_group_lookup_error", age_group=age_group)
-            return None
+        return row["id"]
 
     @staticmethod
     def _resolve_team_id(client, team_name: str) -> int | None:
         """Resolve a team name to its database ID (case-insensitive)."""
-        try:
-            response = (
-                client.table("teams")
-                .select("id, name")
-                .ilike("name", team_name)
-                .limit(1)
-                .execute()
-            )
-            if response.data:
-                return response.data[0]["id"]
-            return None
-        except Exception:
-            logger.warning("qop_rankings_team_lookup_error", team_name=team_name)
-            return None
+        row = get_reference_registry(client).team(team_name)
+        return row["id"] if row else None
 
     # ── Snapshot fetch ───────────────────────────────────────────────────────
 
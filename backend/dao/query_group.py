@@ -0,0 +1,106 @@
+"""
+Concurrent independent queries for async endpoints.
+
+An endpoint that makes several queries which do not depend on each other
+spends the sum of their latencies awaiting them one by one. Spawned in a
+QueryGroup they run concurrently, so the endpoint waits for the slowest:
+
+    async with QueryGroup() as group:
+        table = group.spawn(ThreadpoolDAO(match_dao).get_league_table(...))
+        qop = group.spawn(offload(QoPRankingsDAO.get_latest_with_delta, ...), default=None)
+    standings, rankings = table.result(), qop.result()
+
+It is an asyncio.TaskGroup with two additions:
+
+- Every query has a timeout: QUERY_TIMEOUT_SECONDS unless spawn() is given
+  one (ENRICHMENT_TIMEOUT_SECONDS for optional enrichments). A query that
+  times out raises TimeoutError.
+- A query spawned with a default is optional: if it fails or times out, the
+  error is logged and its task returns the default. Any other failure cancels
+  the rest of the group and is raised from the ``async with`` as it is, not
+  wrapped in an ExceptionGroup, so an endpoint's ``except HTTPException`` and
+  ``except Exception`` clauses keep working.
+
+A timeout stops the wait, not the work: a query offloaded to a worker thread
+(offload(), ThreadpoolDAO) runs on in that thread until its HTTP call ends.
+"""
+
+import asyncio
+import inspect
+import os
+from collections.abc import Awaitable
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+QUERY_TIMEOUT_SECONDS = float(os.getenv("QUERY_TIMEOUT_SECONDS", "20"))
+# Shorter, for optional queries that only enrich a response (QoP ranks, recent games)
+ENRICHMENT_TIMEOUT_SECONDS = float(os.getenv("ENRICHMENT_TIMEOUT_SECONDS", "5"))
+
+_REQUIRED = object()
+
+
+class QueryGroup:
+    """Runs the queries spawned in it concurrently (see module docstring).
+
+    Args:
+        timeout: Default timeout in seconds of each query; None for no timeout
+    """
+
+    def __init__(self, timeout: float | None = QUERY_TIMEOUT_SECONDS):
+        self._timeout = timeout
+        self._group = asyncio.TaskGroup()
+
+    async def __aenter__(self) -> "QueryGroup":
+        await self._group.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool | None:
+        try:
+            return await self._group.__aexit__(exc_type, exc, tb)
+        except BaseExceptionGroup as errors:
+            # The first error is the one that cancelled the group
+            error = errors.exceptions[0]
+        # Outside the except clause, so the error keeps its own cause and context
+        raise error
+
+    def spawn(
+        self,
+        query: Awaitable,
+        *,
+        timeout: float | object | None = _REQUIRED,
+        default: Any = _REQUIRED,
+        name: str | None = None,
+    ) -> asyncio.Task:
+        """Start a query; await the returned task, or take its result() after the group.
+
+        Args:
+            query: The awaitable to run, e.g. a coroutine of an async DAO
+            timeout: Seconds the query may take; defaults to the group's timeout
+            default: Result if the query fails or times out. Without one, a
+                failure cancels the group.
+            name: Name of the query in logs
+
+        Returns:
+            The query's task
+        """
+        if timeout is _REQUIRED:
+            timeout = self._timeout
+        task = self._group.create_task(self._run(query, timeout, default, name), name=name)
+        if inspect.iscoroutine(query):
+            # A task cancelled before it starts (the group failed first) never awaits its query
+            task.add_done_callback(lambda _: query.close())
+        return task
+
+    @staticmethod
+    async def _run(query: Awaitable, timeout: float | None, default: Any, name: str | None) -> Any:
+        try:
+            async with asyncio.timeout(timeout):
+                return await query
+        except Exception:
+            if default is _REQUIRED:
+                raise
+            logger.warning("optional_query_failed", query=name, timeout=timeout, exc_info=True)
+            return default
@@ -0,0 +1,228 @@
+"""
+In-process registry of reference data for name -> id resolution.
+
+The scraper and agent paths resolve the same handful of names over and over:
+every scraped match looks up its teams, age group, division and the current
+season; every agent request resolves season, age group, league/division and
+team; every QoP snapshot resolves its division, age group and each ranked
+team. Each of those was its own tiny query.
+
+The registry loads each reference table (seasons, age groups, leagues,
+divisions, match types, teams) once per process, on first use, and indexes it
+by case-folded name. Lookups are then dict reads.
+
+It stays current the same way the L1 cache does:
+
+  * a write's clear_cache("mt:dao:<family>:*") marks that table stale (via
+    base_dao.add_invalidation_listener), in this process and, with the L1
+    pub/sub listener running, in every other one;
+  * a table is reloaded after REFERENCE_REGISTRY_TTL seconds regardless;
+  * a name that is not found reloads its table, at most once per
+    MISS_RELOAD_INTERVAL, so a row created elsewhere resolves promptly.
+
+One registry per Supabase client (get_reference_registry(client)).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from datetime import date
+
+import structlog
+
+from dao.base_dao import add_invalidation_listener
+
+logger = structlog.get_logger()
+
+# Rows per request when loading a table (PostgREST's max-rows default)
+PAGE_SIZE = 1000
+
+# Minimum seconds between reloads of a table caused by a lookup miss
+MISS_RELOAD_INTERVAL = 10.0
+
+# Table -> columns loaded. The table name is also its DAO cache family.
+REFERENCE_TABLES = {
+    "seasons": "id, name, start_date, end_date, is_current",
+    "age_groups": "id, name",
+    "leagues": "id, name",
+    "divisions": "id, name, league_id",
+    "match_types": "id, name",
+    "teams": "id, name, city, academy_team",
+}
+
+
+def _registry_ttl() -> float:
+    return float(os.getenv("REFERENCE_REGISTRY_TTL", "300"))
+
+
+def normalize_name(name: str | None) -> str:
+    """Case- and whitespace-insensitive lookup key for a reference name."""
+    return (name or "").strip().casefold()
+
+
+class _Table:
+    """One loaded reference table: rows by id and by normalized name."""
+
+    def __init__(self, rows: list[dict]):
+        self.loaded_at = time.monotonic()
+        self.rows = rows
+        self.by_id = {row["id"]: row for row in rows}
+        self.by_name: dict[str, list[dict]] = {}
+        for row in rows:
+            self.by_name.setdefault(normalize_name(row.get("name")), []).append(row)
+
+
+class ReferenceRegistry:
+    """Reference rows for one Supabase client, loaded lazily per table."""
+
+    def __init__(self, client):
+        self.client = client
+        self._tables: dict[str, _Table] = {}
+        self._lock = threading.Lock()
+
+    # === Invalidation ===
+
+    def invalidate(self, pattern: str) -> None:
+        """Mark the tables a DAO cache pattern covers as stale.
+
+        Args:
+            pattern: Invalidated key pattern, e.g. "mt:dao:teams:*"
+        """
+        family = pattern.split(":")[2] if pattern.startswith("mt:dao:") and pattern.count(":") >= 2 else ""
+        with self._lock:
+            if any(c in family for c in "*?["):
+                self._tables.clear()
+            else:
+                self._tables.pop(family, None)
+
+    # === Loading ===
+
+    def _load(self, table: str) -> _Table:
+        rows: list[dict] = []
+        offset = 0
+        while True:
+            response = (
+                self.client.table(table)
+                .select(REFERENCE_TABLES[table])
+                .order("id")
+                .range(offset, offset + PAGE_SIZE - 1)
+                .execute()
+            )
+            page = response.data or []
+            rows.extend(page)
+            if len(page) < PAGE_SIZE:
+                return _Table(rows)
+            offset += PAGE_SIZE
+
+    def _table(self, table: str, reload_older_than: float | None = None) -> _Table | None:
+        """The loaded table, (re)loading it if absent, expired or older than reload_older_than."""
+        with self._lock:
+            loaded = self._tables.get(table)
+            now = time.monotonic()
+            max_age = _registry_ttl() if reload_older_than is None else min(_registry_ttl(), reload_older_than)
+            if loaded is not None and now - loaded.loaded_at < max_age:
+                return loaded
+            try:
+                loaded = self._load(table)
+            except Exception as e:
+                logger.warning("reference_registry_load_failed", table=table, error=str(e))
+                return self._tables.get(table)
+            self._tables[table] = loaded
+            return loaded
+
+    def _find(self, table: str, name: str | None) -> list[dict]:
+        key = normalize_name(name)
+        loaded = self._table(table)
+        rows = loaded.by_name.get(key, []) if loaded else []
+        if not rows and key:
+            loaded = self._table(table, reload_older_than=MISS_RELOAD_INTERVAL)
+            rows = loaded.by_name.get(key, []) if loaded else []
+        return rows
+
+    # === Lookups ===
+
+    def season(self, name: str) -> dict | None:
+        """Season by name, e.g. "2025-2026"."""
+        rows = self._find("seasons", name)
+        return rows[0] if rows else None
+
+    def current_season(self) -> dict | None:
+        """The season flagged is_current, else the season spanning today (as SeasonDAO.get_current_season)."""
+        loaded = self._table("seasons")
+        if not loaded:
+            return None
+        flagged = [row for row in loaded.rows if row.get("is_current")]
+        if flagged:
+            return flagged[0]
+        today = date.today().isoformat()
+        for row in loaded.rows:
+            if row.get("start_date") and row.get("end_date") and row["start_date"] <= today <= row["end_date"]:
+                return row
+        return None
+
+    def age_group(self, name: str) -> dict | None:
+        """Age group by name, e.g. "U14"."""
+        rows = self._find("age_groups", name)
+        return rows[0] if rows else None
+
+    def league(self, name: str) -> dict | None:
+        """League by name, e.g. "Homegrown"."""
+        rows = self._find("leagues", name)
+        return rows[0] if rows else None
+
+    def division(self, name: str, league: str | None = None) -> dict | None:
+        """Division by name; division names repeat across leagues, so pass league to pick one.
+
+        Args:
+            name: Division name, e.g. "Northeast"
+            league: League name; None returns the first division with that name
+
+        Returns:
+            Division row (id, name, league_id), or None
+        """
+        rows = self._find("divisions", name)
+        if league is None:
+            return rows[0] if rows else None
+        league_row = self.league(league)
+        if league_row is None:
+            return None
+        return next((row for row in rows if row.get("league_id") == league_row["id"]), None)
+
+    def match_type(self, name: str) -> dict | None:
+        """Match type by name, e.g. "League"."""
+        rows = self._find("match_types", name)
+        return rows[0] if rows else None
+
+    def teams(self, name: str) -> list[dict]:
+        """Every team with this name (names are unique only within a division)."""
+        return list(self._find("teams", name))
+
+    def team(self, name: str) -> dict | None:
+        """First team with this name (lowest id)."""
+        rows = self._find("teams", name)
+        return rows[0] if rows else None
+
+
+_registries: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_registries_lock = threading.Lock()
+
+
+def _invalidate_registries(pattern: str) -> None:
+    for registry in list(_registries.values()):
+        registry.invalidate(pattern)
+
+
+add_invalidation_listener(_invalidate_registries)
+
+
+def get_reference_registry(client) -> ReferenceRegistry:
+    """The process's registry for this Supabase client, created on first use."""
+    with _registries_lock:
+        registry = _registries.get(client)
+        if registry is None:
+            registry = ReferenceRegistry(client)
+            _registries[client] = registry
+        return registry
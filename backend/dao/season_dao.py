@@ -168,8 +168,9 @@ class SeasonDAO(BaseDAO):
             return None
 
     # Cache key lives in the `matches:` namespace so it's invalidated by
-    # MATCHES_CACHE_PATTERN whenever any match is created/updated/deleted.
-    @dao_cache("matches:counts_by_season:{include_test}")
+    # MATCHES_CACHE_PATTERN, and is tagged so MatchDAO writes that add, remove
+    # or move a match invalidate it without clearing every match key.
+    @dao_cache("matches:counts_by_season:{include_test}", tags=("matches:counts",))
     def get_match_counts_by_season(self, include_test: bool = False) -> list[dict]:
         """Return [{season_id, match_count}] for every season.
 
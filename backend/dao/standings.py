@@ -8,7 +8,8 @@ These functions are used by MatchDAO.get_league_table() but can be
 unit tested independently.
 """
 
-from collections import defaultdict
+from bisect import bisect_right
+from collections import defaultdict, deque
 from datetime import date
 from operator import itemgetter
 
@@ -309,10 +310,13 @@ def calculate_standings_with_extras(matches: list[dict]) -> list[dict]:
     """
     Calculate standings enriched with position movement and recent form.
 
-    Wraps calculate_standings() and adds:
+    Same result as calculate_standings() plus:
         - form: list of last 5 results (e.g. ["W", "D", "L", "W", "W"])
         - position_change: int (positive = moved up, negative = down, 0 = same)
 
+    as get_team_form() and calculate_position_movement() would give, computed
+    in a single pass by compute_standings_table().
+
     Args:
         matches: List of completed match dicts
 
@@ -320,13 +324,449 @@ def calculate_standings_with_extras(matches: list[dict]) -> list[dict]:
         Same as calculate_standings() but each row also has 'form' and
         'position_change' keys.
     """
-    table = calculate_standings(matches)
-    form = get_team_form(matches)
-    movement = calculate_position_movement(matches)
+    return compute_standings_table(matches)
+
+
+def _new_record(appearance: int) -> dict:
+    return {
+        "played": 0,
+        "wins": 0,
+        "draws": 0,
+        "losses": 0,
+        "goals_for": 0,
+        "goals_against": 0,
+        "points": 0,
+        "first": appearance,
+        # (match index, value) of the team_id / club_id / logo_url the
+        # match-order pass in calculate_standings() would have kept
+        "team_id": (-1, None),
+        "club_id": (-1, None),
+        "logo_url": (-1, None),
+        "last_logo_url": (-1, None),
+        "form": None,
+    }
+
+
+def _keep_first(record: dict, field: str, index: int, value, truthy: bool = False) -> None:
+    """Keep the value from the earliest match (in input order) that has one."""
+    kept_index, kept = record[field]
+    has_value = bool(value) if truthy else value is not None
+    kept_has_value = bool(kept) if truthy else kept is not None
+    if has_value and (not kept_has_value or index < kept_index):
+        record[field] = (index, value)
+
+
+def _rank_values(records: dict[str, dict]) -> dict[str, tuple]:
+    """Team -> (points, goal difference, goals for, first appearance)."""
+    return {
+        team: (r["points"], r["goals_for"] - r["goals_against"], r["goals_for"], r["first"])
+        for team, r in records.items()
+    }
+
+
+def _scored_by_date(matches: list[dict]) -> list[tuple[int, dict]]:
+    """(input index, match) for fully-scored matches, stably sorted by date."""
+    scored = [
+        (index, match)
+        for index, match in enumerate(matches)
+        if match.get("home_score") is not None and match.get("away_score") is not None
+    ]
+    # Stable: matches on the same date keep their input order, as in get_team_form()
+    scored.sort(key=lambda item: item[1].get("match_date") or "")
+    return scored
+
+
+def _accumulate(records: dict[str, dict], index: int, match: dict, last_n: int) -> None:
+    """Add one scored match (at position index in the input) to the records."""
+    home_score = match["home_score"]
+    away_score = match["away_score"]
+    sides = (
+        (match["home_team"], home_score, away_score),
+        (match["away_team"], away_score, home_score),
+    )
+    for side, (team, goals_for, goals_against) in enumerate(sides):
+        # calculate_standings() lists teams in order of first appearance,
+        # home before away within a match
+        appearance = 2 * index + side
+        record = records.get(team["name"])
+        if record is None:
+            record = records[team["name"]] = _new_record(appearance)
+            record["form"] = deque(maxlen=last_n)
+        elif appearance < record["first"]:
+            record["first"] = appearance
+
+        club = team.get("club") or {}
+        _keep_first(record, "team_id", index, team.get("id"))
+        _keep_first(record, "club_id", index, club.get("id"))
+        _keep_first(record, "logo_url", index, club.get("logo_url"), truthy=True)
+        if index > record["last_logo_url"][0]:
+            record["last_logo_url"] = (index, club.get("logo_url"))
+
+        record["played"] += 1
+        record["goals_for"] += goals_for
+        record["goals_against"] += goals_against
+        if goals_for > goals_against:
+            record["wins"] += 1
+            record["points"] += 3
+            record["form"].append("W")
+        elif goals_for < goals_against:
+            record["losses"] += 1
+            record["form"].append("L")
+        else:
+            record["draws"] += 1
+            record["points"] += 1
+            record["form"].append("D")
+
+
+def _render_table(records: dict[str, dict], previous: dict[str, tuple] | None) -> list[dict]:
+    """Ranked standings rows from the records; previous gives position movement."""
+
+    def rank_key(item):
+        points, goal_difference, goals_for, first = item[1]
+        return (-points, -goal_difference, -goals_for, first)
+
+    current = _rank_values(records)
+    current_order = [team for team, _ in sorted(current.items(), key=rank_key)]
+    previous_positions = (
+        {team: i + 1 for i, (team, _) in enumerate(sorted(previous.items(), key=rank_key))} if previous else {}
+    )
+
+    table = []
+    for position, team in enumerate(current_order, start=1):
+        r = records[team]
+        logo_url = r["logo_url"][1] if r["logo_url"][1] else r["last_logo_url"][1]
+        previous_pos = previous_positions.get(team)
+        table.append(
+            {
+                "played": r["played"],
+                "wins": r["wins"],
+                "draws": r["draws"],
+                "losses": r["losses"],
+                "goals_for": r["goals_for"],
+                "goals_against": r["goals_against"],
+                "goal_difference": r["goals_for"] - r["goals_against"],
+                "points": r["points"],
+                "logo_url": logo_url,
+                "team_id": r["team_id"][1],
+                "club_id": r["club_id"][1],
+                "team": team,
+                "form": list(r["form"]),
+                "position_change": 0 if previous_pos is None else previous_pos - position,
+            }
+        )
+    return table
+
+
+def compute_standings_table(matches: list[dict], last_n: int = 5) -> list[dict]:
+    """
+    Standings, recent form and position movement in one pass.
+
+    Sorts the scored matches by date once, then accumulates each team's
+    record and rolling last_n form. The records are snapshotted just before
+    the latest match day, which gives the previous table for position
+    movement without a second calculation.
+
+    The output is identical to combining calculate_standings(),
+    get_team_form() and calculate_position_movement() on the same matches,
+    including the order of teams level on points, goal difference and goals
+    scored (first appearance in the input) and which match supplies a team's
+    team_id, club_id and logo_url.
+
+    Args:
+        matches: List of completed match dicts (see calculate_standings())
+        last_n: Number of recent results in the form guide
+
+    Returns:
+        Standings sorted like calculate_standings(), each row with 'form'
+        and 'position_change' keys
+    """
+    # Match days as calculate_position_movement() counts them (home score only)
+    match_dates = {m.get("match_date") for m in matches if m.get("match_date") and m.get("home_score") is not None}
+    latest_date = max(match_dates) if len(match_dates) >= 2 else None
+
+    records: dict[str, dict] = {}
+    previous: dict[str, tuple] | None = None
+    for index, match in _scored_by_date(matches):
+        if previous is None and latest_date is not None and match.get("match_date") == latest_date:
+            previous = _rank_values(records)
+        _accumulate(records, index, match, last_n)
+
+    if latest_date is not None and previous is None:
+        # Nothing countable was played on the latest match day
+        previous = _rank_values(records)
+
+    return _render_table(records, previous)
+
+
+def compute_standings_checkpoints(matches: list[dict], last_n: int = 5) -> list[tuple[str, list[dict]]]:
+    """
+    The standings table at the end of every match day.
+
+    The same date-ordered walk as compute_standings_table(), rendering the
+    table each time a match day closes. The records before a match day are
+    exactly the previous table position movement compares against, so every
+    checkpoint equals compute_standings_table() over the matches played up to
+    and including its date. A checkpoint per match day means any date is
+    answered by one checkpoint, with no matches to replay (see
+    standings_as_of()).
+
+    Undated matches cannot be placed in time and are ignored.
+
+    Args:
+        matches: List of completed match dicts (see calculate_standings())
+        last_n: Number of recent results in the form guide
+
+    Returns:
+        (match_date, standings) pairs in date order
+    """
+    matches = [m for m in matches if m.get("match_date")]
+    # Match days as calculate_position_movement() counts them (home score only)
+    match_dates = sorted({m["match_date"] for m in matches if m.get("home_score") is not None})
+    scored = _scored_by_date(matches)
+
+    checkpoints = []
+    records: dict[str, dict] = {}
+    position = 0
+    for day_number, match_date in enumerate(match_dates):
+        previous = _rank_values(records) if day_number else None
+        while position < len(scored) and scored[position][1]["match_date"] == match_date:
+            index, match = scored[position]
+            _accumulate(records, index, match, last_n)
+            position += 1
+        checkpoints.append((match_date, _render_table(records, previous)))
+    return checkpoints
+
+
+def standings_as_of(checkpoints: list[tuple[str, list[dict]]], as_of: str) -> list[dict]:
+    """
+    The standings table on a date, from compute_standings_checkpoints().
+
+    Args:
+        checkpoints: (match_date, standings) pairs in date order
+        as_of: ISO date (YYYY-MM-DD); matches on this date are included
+
+    Returns:
+        The table after the last match day on or before as_of (empty before
+        the first one)
+    """
+    position = bisect_right([match_date for match_date, _ in checkpoints], as_of)
+    if not position:
+        return []
+    return [{**row, "form": list(row["form"])} for row in checkpoints[position - 1][1]]
+
+
+# =============================================================================
+# INCREMENTAL STANDINGS
+# =============================================================================
+#
+# A standings "row set" maps team name -> row with the calculate_standings()
+# counters plus the team's scored results ({match_id: [match_date,
+# goals_for, goals_against]}). A match's contribution is applied or reverted
+# as a delta, so a score change touches two rows instead of recomputing the
+# table; form and position movement are derived from the stored results.
+
+
+def _team_identity(team: dict) -> dict:
+    club = team.get("club") or {}
+    return {
+        "team": team["name"],
+        "team_id": team.get("id"),
+        "club_id": club.get("id"),
+        "logo_url": club.get("logo_url"),
+    }
 
-    for row in table:
-        team = row["team"]
-        row["form"] = form.get(team, [])
-        row["position_change"] = movement.get(team, 0)
 
+def match_contribution(
+    match: dict,
+    season_id: int,
+    age_group_id: int,
+    division_id: int,
+    match_type: str,
+) -> dict | None:
+    """
+    What one match contributes to a fully-filtered league table.
+
+    Applies the same rules get_league_table() applies to the fetched match
+    list (match type, same-division teams, completed, scored), plus the
+    database filters (scope columns, test partition).
+
+    Args:
+        match: Match dict in _fetch_matches_for_standings() format
+        season_id: Table season
+        age_group_id: Table age group
+        division_id: Table division
+        match_type: Table match type name
+
+    Returns:
+        Dict with match_date, home/away team identity and scores, or None if
+        the match does not count towards this table
+    """
+    if match.get("is_test"):
+        return None
+    if (match.get("season_id"), match.get("age_group_id"), match.get("division_id")) != (
+        season_id,
+        age_group_id,
+        division_id,
+    ):
+        return None
+    counted = filter_completed_matches(
+        filter_same_division_matches(filter_by_match_type([match], match_type), division_id)
+    )
+    if not counted or match.get("home_score") is None or match.get("away_score") is None:
+        return None
+    return {
+        "match_date": match.get("match_date") or "",
+        "home": _team_identity(match["home_team"]),
+        "away": _team_identity(match["away_team"]),
+        "home_score": match["home_score"],
+        "away_score": match["away_score"],
+    }
+
+
+def _empty_row(identity: dict) -> dict:
+    return {
+        "team": identity["team"],
+        "played": 0,
+        "wins": 0,
+        "draws": 0,
+        "losses": 0,
+        "goals_for": 0,
+        "goals_against": 0,
+        "goal_difference": 0,
+        "points": 0,
+        "logo_url": None,
+        "team_id": None,
+        "club_id": None,
+        "results": {},
+    }
+
+
+def _apply_result(row: dict, goals_for: int, goals_against: int, sign: int) -> None:
+    row["played"] += sign
+    row["goals_for"] += sign * goals_for
+    row["goals_against"] += sign * goals_against
+    row["goal_difference"] = row["goals_for"] - row["goals_against"]
+    if goals_for > goals_against:
+        row["wins"] += sign
+        row["points"] += 3 * sign
+    elif goals_for < goals_against:
+        row["losses"] += sign
+    else:
+        row["draws"] += sign
+        row["points"] += sign
+
+
+def apply_contribution(rows: dict[str, dict], match_id: int | str, contribution: dict, sign: int = 1) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) one match's contribution in place.
+
+    Teams left with no matches are dropped, as calculate_standings() would
+    never have listed them.
+
+    Args:
+        rows: Team name -> standings row (mutated)
+        match_id: Match the contribution belongs to
+        contribution: Result of match_contribution()
+        sign: 1 to add, -1 to remove
+    """
+    key = str(match_id)
+    sides = (
+        (contribution["home"], contribution["home_score"], contribution["away_score"]),
+        (contribution["away"], contribution["away_score"], contribution["home_score"]),
+    )
+    for side, (identity, goals_for, goals_against) in enumerate(sides):
+        name = identity["team"]
+        row = rows.get(name)
+        if row is None:
+            if sign < 0:
+                continue
+            row = rows[name] = _empty_row(identity)
+        for field in ("team_id", "logo_url", "club_id"):
+            if not row[field]:
+                row[field] = identity[field]
+        _apply_result(row, goals_for, goals_against, sign)
+        if sign > 0:
+            row["results"][key] = [contribution["match_date"], goals_for, goals_against, side]
+        else:
+            row["results"].pop(key, None)
+        if row["played"] <= 0:
+            del rows[name]
+
+
+def build_standings_rows(contributions: dict) -> dict[str, dict]:
+    """
+    Build a row set from scratch.
+
+    Args:
+        contributions: Match id -> match_contribution() result
+
+    Returns:
+        Team name -> standings row
+    """
+    rows: dict[str, dict] = {}
+    for match_id, contribution in contributions.items():
+        apply_contribution(rows, match_id, contribution)
+    return rows
+
+
+def _first_appearance(results: dict, before: str | None = None) -> int:
+    """First appearance (match id order, home before away), as league_standings ranks ties.
+
+    Results stored before the side was recorded count as home.
+    """
+    return min(
+        2 * int(match_id) + (result[3] if len(result) > 3 else 0)
+        for match_id, result in results.items()
+        if before is None or result[0] < before
+    )
+
+
+def _rank(rows: list[dict]) -> list[dict]:
+    return sorted(rows, key=lambda x: (-x["points"], -x["goal_difference"], -x["goals_for"], x["first"]))
+
+
+def standings_from_rows(rows: dict[str, dict], last_n: int = 5) -> list[dict]:
+    """
+    Standings table from a row set, in calculate_standings_with_extras() format.
+
+    Position movement compares against the rows with the latest match day's
+    results reverted, like calculate_position_movement().
+
+    Args:
+        rows: Team name -> standings row
+        last_n: Number of recent results in the form guide
+
+    Returns:
+        Sorted standings with 'form' and 'position_change' keys
+    """
+    table = []
+    for row in rows.values():
+        results = sorted(row["results"].values(), key=itemgetter(0))
+        entry = {k: v for k, v in row.items() if k != "results"}
+        entry["form"] = ["W" if gf > ga else "L" if gf < ga else "D" for _, gf, ga, *_ in results[-last_n:]]
+        entry["first"] = _first_appearance(row["results"])
+        table.append(entry)
+    table = _rank(table)
+
+    match_dates = {date_ for row in rows.values() for date_, *_ in row["results"].values() if date_}
+    movement: dict[str, int] = {}
+    if len(match_dates) >= 2:
+        latest_date = max(match_dates)
+        previous = []
+        for row in rows.values():
+            prev = {k: v for k, v in row.items() if k != "results"}
+            for date_, goals_for, goals_against, *_ in row["results"].values():
+                if date_ == latest_date:
+                    _apply_result(prev, goals_for, goals_against, -1)
+            if prev["played"] > 0:
+                prev["first"] = _first_appearance(row["results"], before=latest_date)
+                previous.append(prev)
+        previous_positions = {row["team"]: i + 1 for i, row in enumerate(_rank(previous))}
+        for i, row in enumerate(table):
+            previous_pos = previous_positions.get(row["team"])
+            movement[row["team"]] = 0 if previous_pos is None else previous_pos - (i + 1)
+
+    for row in table:
+        del row["first"]
+        row["position_change"] = movement.get(row["team"], 0)
     return table
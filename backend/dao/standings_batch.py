@@ -0,0 +1,193 @@
+"""
+Batch league standings for every division of a season.
+
+get_league_table() computes one table per call, so building every table of a
+season (cache warmup, admin exports, the all-divisions view) costs one fetch
+and one Python recompute per (age group, division, match type). Here a
+season's matches are fetched once and all of its tables are computed
+together with NumPy: each (partition, team) pair gets an integer code,
+records are accumulated with bincount/ufunc.at, and each table is ranked
+with a lexsort on (points, goal difference, goals scored).
+
+Each table is identical to get_league_table() for the same filters: same
+rows, order, form and position movement.
+"""
+
+from collections import defaultdict
+
+import numpy as np
+
+from dao.standings import filter_completed_matches
+
+_RESULT = np.array(["L", "D", "W"])
+
+
+def calculate_partition_standings(matches: list[dict], last_n: int = 5) -> dict[tuple[int, int, str], list[dict]]:
+    """
+    Standings for every (age_group_id, division_id, match_type) in a match list.
+
+    Args:
+        matches: A season's matches in _fetch_matches_for_standings() format
+        last_n: Number of recent results in the form guide
+
+    Returns:
+        (age_group_id, division_id, match type name) -> standings in
+        calculate_standings_with_extras() format
+    """
+    # One Python pass to apply the row filters and integer-encode the matches
+    partitions: dict[tuple, int] = {}
+    teams: dict[tuple[int, str], int] = {}
+    team_info: list[tuple[int, str]] = []
+    cols = defaultdict(list)
+    for index, match in enumerate(filter_completed_matches(matches)):
+        division_id = match.get("division_id")
+        home, away = match.get("home_team") or {}, match.get("away_team") or {}
+        if not division_id or home.get("division_id") != division_id or away.get("division_id") != division_id:
+            continue
+        if match.get("home_score") is None:
+            continue
+        key = (match.get("age_group_id"), division_id, (match.get("match_type") or {}).get("name"))
+        part = partitions.setdefault(key, len(partitions))
+        codes = []
+        for side in ("home_team", "away_team"):
+            team_key = (part, match[side]["name"])
+            code = teams.get(team_key)
+            if code is None:
+                code = teams[team_key] = len(team_info)
+                team_info.append(team_key)
+            codes.append(code)
+        cols["part"].append(part)
+        cols["home"].append(codes[0])
+        cols["away"].append(codes[1])
+        cols["index"].append(index)
+        cols["date"].append(match.get("match_date") or "")
+        cols["home_score"].append(match["home_score"])
+        cols["away_score"].append(match.get("away_score"))
+        cols["match"].append(match)
+
+    if not partitions:
+        return {}
+
+    n_teams = len(team_info)
+    n_parts = len(partitions)
+    part = np.array(cols["part"])
+    # Matches with only a home score still count as a match day for movement
+    counted = np.array([score is not None for score in cols["away_score"]])
+    home = np.array(cols["home"])
+    away = np.array(cols["away"])
+    index = np.array(cols["index"])
+    unique_dates, date_code = np.unique(np.array(cols["date"]), return_inverse=True)
+    hs = np.array(cols["home_score"], dtype=np.int64)
+    as_ = np.array([score or 0 for score in cols["away_score"]], dtype=np.int64)
+
+    # Latest match day per partition, and whether it has two or more
+    has_date = unique_dates[date_code] != ""
+    latest = np.full(n_parts, -1)
+    np.maximum.at(latest, part[has_date], date_code[has_date])
+    day_pairs = np.unique(np.stack([part[has_date], date_code[has_date]]), axis=1)
+    days_per_part = np.bincount(day_pairs[0], minlength=n_parts)
+    on_latest = (date_code == latest[part]) & (days_per_part[part] >= 2)
+
+    # Appearance arrays: one entry per (match, side) that counts
+    scored = np.flatnonzero(counted)
+    app_team = np.concatenate([home[scored], away[scored]])
+    app_gf = np.concatenate([hs[scored], as_[scored]])
+    app_ga = np.concatenate([as_[scored], hs[scored]])
+    # calculate_standings() order of appearance: input order, home before away
+    app_order = np.concatenate([2 * index[scored], 2 * index[scored] + 1])
+    app_date = np.concatenate([date_code[scored], date_code[scored]])
+    app_latest = np.concatenate([on_latest[scored], on_latest[scored]])
+    outcome = np.sign(app_gf - app_ga) + 1  # 0 = loss, 1 = draw, 2 = win
+
+    def accumulate(mask):
+        t = app_team[mask]
+        played = np.bincount(t, minlength=n_teams)
+        goals_for = np.bincount(t, weights=app_gf[mask], minlength=n_teams).astype(np.int64)
+        goals_against = np.bincount(t, weights=app_ga[mask], minlength=n_teams).astype(np.int64)
+        wins = np.bincount(t, weights=outcome[mask] == 2, minlength=n_teams).astype(np.int64)
+        draws = np.bincount(t, weights=outcome[mask] == 1, minlength=n_teams).astype(np.int64)
+        first = np.full(n_teams, np.iinfo(np.int64).max)
+        np.minimum.at(first, t, app_order[mask])
+        return played, goals_for, goals_against, wins, draws, first
+
+    team_part = np.array([p for p, _ in team_info])
+
+    def rank(played, goals_for, goals_against, wins, draws, first):
+        points = 3 * wins + draws
+        listed = played > 0
+        order = np.lexsort((first, -goals_for, -(goals_for - goals_against), -points, team_part))
+        order = order[listed[order]]
+        position = np.zeros(n_teams, dtype=np.int64)
+        part_of = team_part[order]
+        starts = np.searchsorted(part_of, np.arange(n_parts))
+        position[order] = np.arange(len(order)) - starts[part_of] + 1
+        return order, position, points
+
+    everything = np.ones(len(app_team), dtype=bool)
+    played, goals_for, goals_against, wins, draws, first = accumulate(everything)
+    order, position, points = rank(played, goals_for, goals_against, wins, draws, first)
+    prev = accumulate(~app_latest)
+    _, prev_position, _ = rank(*prev)
+    moved = days_per_part[team_part] >= 2
+    prev_listed = prev[0] > 0
+
+    # Identity fields from the first appearance that has one (logo: first
+    # truthy, else the last appearance), as calculate_standings() keeps them
+    app_team_obj = [cols["match"][m]["home_team"] for m in scored] + [cols["match"][m]["away_team"] for m in scored]
+    app_club = [team.get("club") or {} for team in app_team_obj]
+    app_team_id = [team.get("id") for team in app_team_obj]
+    app_club_id = [club.get("id") for club in app_club]
+    app_logo = [club.get("logo_url") for club in app_club]
+    by_order = np.argsort(app_order, kind="stable")
+    rank_in_order = np.empty_like(by_order)
+    rank_in_order[by_order] = np.arange(len(by_order))
+
+    def first_value(values, truthy=False):
+        valid = np.array([bool(v) if truthy else v is not None for v in values], dtype=bool)
+        chosen = np.full(n_teams, np.iinfo(np.int64).max)
+        np.minimum.at(chosen, app_team[valid], rank_in_order[valid])
+        return chosen
+
+    id_pick = first_value(app_team_id)
+    club_pick = first_value(app_club_id)
+    logo_pick = first_value(app_logo, truthy=True)
+    logo_last = np.full(n_teams, -1)
+    np.maximum.at(logo_last, app_team, rank_in_order)
+
+    def value_at(values, picked):
+        return None if picked >= len(by_order) or picked < 0 else values[by_order[picked]]
+
+    # Form: each team's results by (date, input order), last_n of them
+    form_order = np.lexsort((app_order, app_date, app_team))
+    form_team = app_team[form_order]
+    form_end = np.searchsorted(form_team, np.arange(n_teams), side="right")
+    form_results = _RESULT[outcome[form_order]]
+
+    tables: dict[tuple, list[dict]] = {key: [] for key in partitions}
+    part_keys = list(partitions)
+    for code in order:
+        end = form_end[code]
+        start = max(end - last_n, np.searchsorted(form_team, code, side="left"))
+        logo = value_at(app_logo, logo_pick[code])
+        if not logo:
+            logo = value_at(app_logo, logo_last[code])
+        change = int(prev_position[code] - position[code]) if moved[code] and prev_listed[code] else 0
+        tables[part_keys[team_part[code]]].append(
+            {
+                "played": int(played[code]),
+                "wins": int(wins[code]),
+                "draws": int(draws[code]),
+                "losses": int(played[code] - wins[code] - draws[code]),
+                "goals_for": int(goals_for[code]),
+                "goals_against": int(goals_against[code]),
+                "goal_difference": int(goals_for[code] - goals_against[code]),
+                "points": int(points[code]),
+                "logo_url": logo,
+                "team_id": value_at(app_team_id, id_pick[code]),
+                "club_id": value_at(app_club_id, club_pick[code]),
+                "team": team_info[code][1],
+                "form": form_results[start:end].tolist(),
+                "position_change": change,
+            }
+        )
+    return tables
@@ -0,0 +1,280 @@
+"""
+Incremental league standings store.
+
+Keeps per-table standings rows in Redis, keyed by (season, age group,
+division, match type), and applies a match's contribution as a delta when
+the match is written, so a goal updates two team rows instead of refetching
+the division and recomputing the table. The rows are plain data built by the
+pure functions in dao/standings.py.
+
+Keys, all under mt:dao:matches:standings:{season}:{age_group}:{division}:
+
+- (no suffix): set of match type names with a built store for this scope
+- :{match_type}:teams: hash team name -> standings row
+- :{match_type}:matches: hash match id -> contribution (what the delta reverts)
+- :{match_type}:building: token of an in-progress rebuild
+
+Every key is registered in the "matches" family tag set, so any
+clear_cache("mt:dao:matches:*") drops the stores along with the cached
+tables and the next read rebuilds them.
+
+Only fully-filtered, non-test tables are stored. A store is built from
+scratch on the first read of its table (begin_rebuild / commit_rebuild); a
+write that lands while a rebuild is fetching cancels it, so a rebuild never
+persists rows older than a delta it missed. Writers serialise on a short
+Redis lock per store; if the lock cannot be taken the store is dropped
+rather than left behind. verify() rebuilds in memory and reports rows that
+differ from the stored ones.
+"""
+
+import os
+import time
+import uuid
+
+import structlog
+
+from dao import cache_codec
+from dao.base_dao import _RELEASE_LOCK_SCRIPT, CACHE_LOCK_PREFIX, CACHE_TAG_PREFIX, _as_str, get_redis_client
+from dao.standings import apply_contribution, build_standings_rows, match_contribution
+
+logger = structlog.get_logger(__name__)
+
+STANDINGS_KEY_PREFIX = "mt:dao:matches:standings:"
+_FAMILY_TAG = f"{CACHE_TAG_PREFIX}matches"
+_LOCK_TIMEOUT_MS = 5000
+_LOCK_WAIT_SECONDS = 1.0
+
+
+def standings_store_ttl() -> int:
+    """Seconds a store lives without being rebuilt (STANDINGS_STORE_TTL, default 1 day)."""
+    return int(os.getenv("STANDINGS_STORE_TTL", "86400"))
+
+
+def get_standings_store() -> "StandingsStore | None":
+    """Get the standings store, or None if it is disabled or Redis is unavailable."""
+    if os.getenv("STANDINGS_STORE_ENABLED", "true").lower() != "true":
+        return None
+    redis_client = get_redis_client()
+    if redis_client is None:
+        return None
+    return StandingsStore(redis_client)
+
+
+class StandingsStore:
+    """Redis-backed standings rows for fully-filtered league tables."""
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    @staticmethod
+    def scope_key(season_id: int, age_group_id: int, division_id: int) -> str:
+        return f"{STANDINGS_KEY_PREFIX}{season_id}:{age_group_id}:{division_id}"
+
+    def _keys(self, scope: tuple, match_type: str) -> tuple[str, str, str]:
+        base = f"{self.scope_key(*scope)}:{match_type}"
+        return f"{base}:teams", f"{base}:matches", f"{base}:building"
+
+    def load(self, scope: tuple, match_type: str) -> dict[str, dict] | None:
+        """Stored rows for a table, or None if the store has not been built."""
+        teams_key, matches_key, _ = self._keys(scope, match_type)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.exists(matches_key)
+            pipe.hgetall(teams_key)
+            built, rows = pipe.execute()
+        except Exception as e:
+            logger.warning("standings_store_load_error", scope=scope, error=str(e))
+            return None
+        if not built:
+            return None
+        return {_as_str(name): cache_codec.loads_json(row) for name, row in rows.items()}
+
+    def begin_rebuild(self, scope: tuple, match_type: str) -> str | None:
+        """Mark a rebuild in progress; any write before commit_rebuild cancels it."""
+        _, _, building_key = self._keys(scope, match_type)
+        registry_key = self.scope_key(*scope)
+        token = uuid.uuid4().hex
+        try:
+            # Registering the match type now lets apply_match() see (and
+            # cancel) a store that is still being built
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.set(building_key, token, ex=60)
+            pipe.sadd(registry_key, match_type)
+            pipe.expire(registry_key, standings_store_ttl())
+            pipe.sadd(_FAMILY_TAG, building_key, registry_key)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("standings_store_rebuild_error", scope=scope, error=str(e))
+            return None
+        return token
+
+    def commit_rebuild(self, scope: tuple, match_type: str, token: str | None, matches: list[dict]) -> bool:
+        """Persist rows built from a full fetch, unless a write cancelled the rebuild.
+
+        Args:
+            scope: (season_id, age_group_id, division_id)
+            match_type: Match type name
+            token: Value returned by begin_rebuild()
+            matches: Unfiltered matches as fetched for the table
+
+        Returns:
+            True if the store was written
+        """
+        if token is None:
+            return False
+        teams_key, matches_key, building_key = self._keys(scope, match_type)
+        contributions = self._contributions(scope, match_type, matches)
+        rows = build_standings_rows(contributions)
+        lock = self._lock(teams_key)
+        if lock is None:
+            return False
+        try:
+            if _as_str(self.redis.get(building_key) or b"") != token:
+                logger.debug("standings_store_rebuild_cancelled", scope=scope, match_type=match_type)
+                return False
+            ttl = standings_store_ttl()
+            registry_key = self.scope_key(*scope)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.delete(teams_key, matches_key, building_key)
+            pipe.hset(matches_key, "__built__", "1")
+            if contributions:
+                pipe.hset(
+                    matches_key,
+                    mapping={str(mid): cache_codec.dumps_json(c) for mid, c in contributions.items()},
+                )
+            if rows:
+                pipe.hset(teams_key, mapping={name: cache_codec.dumps_json(row) for name, row in rows.items()})
+            pipe.sadd(registry_key, match_type)
+            for key in (teams_key, matches_key, registry_key):
+                pipe.expire(key, ttl)
+            pipe.sadd(_FAMILY_TAG, teams_key, matches_key, registry_key)
+            pipe.expire(_FAMILY_TAG, ttl, nx=True)
+            pipe.expire(_FAMILY_TAG, ttl, gt=True)
+            pipe.execute()
+            logger.info("standings_store_rebuilt", scope=scope, match_type=match_type, matches=len(contributions))
+            return True
+        except Exception as e:
+            logger.warning("standings_store_rebuild_error", scope=scope, error=str(e))
+            return False
+        finally:
+            self._unlock(teams_key, lock)
+
+    def match_types(self, scope: tuple) -> list[str]:
+        """Match types with a store (built or being built) for a scope."""
+        try:
+            return sorted(_as_str(t) for t in self.redis.smembers(self.scope_key(*scope)))
+        except Exception as e:
+            logger.warning("standings_store_apply_error", scope=scope, error=str(e))
+            return []
+
+    def apply_match(self, scope: tuple, match_types: list[str], match_id: int, match: dict | None) -> None:
+        """Bring a scope's stores up to date with one written match.
+
+        Args:
+            scope: (season_id, age_group_id, division_id) the match is or was in
+            match_types: Stores to update, from match_types()
+            match_id: Match that was written
+            match: Match as it is now, in _fetch_matches_for_standings()
+                format, or None if it was deleted
+        """
+        for match_type in match_types:
+            contribution = match_contribution(match, *scope, match_type) if match else None
+            self._apply(scope, match_type, match_id, contribution)
+
+    def _apply(self, scope: tuple, match_type: str, match_id: int, contribution: dict | None) -> None:
+        teams_key, matches_key, building_key = self._keys(scope, match_type)
+        lock = self._lock(teams_key)
+        if lock is None:
+            self.drop(scope, match_type)
+            return
+        try:
+            # Cancels any rebuild fetched before this write
+            self.redis.delete(building_key)
+            if not self.redis.exists(matches_key):
+                return
+            old_raw = self.redis.hget(matches_key, str(match_id))
+            old = cache_codec.loads_json(old_raw) if old_raw else None
+            if old == contribution:
+                return
+            names = sorted({c[side]["team"] for c in (old, contribution) if c for side in ("home", "away")})
+            rows = {
+                name: cache_codec.loads_json(raw)
+                for name, raw in zip(names, self.redis.hmget(teams_key, names), strict=True)
+                if raw
+            }
+            if old:
+                apply_contribution(rows, match_id, old, sign=-1)
+            if contribution:
+                apply_contribution(rows, match_id, contribution)
+
+            pipe = self.redis.pipeline(transaction=True)
+            for name in names:
+                if name in rows:
+                    pipe.hset(teams_key, name, cache_codec.dumps_json(rows[name]))
+                else:
+                    pipe.hdel(teams_key, name)
+            if contribution:
+                pipe.hset(matches_key, str(match_id), cache_codec.dumps_json(contribution))
+            else:
+                pipe.hdel(matches_key, str(match_id))
+            pipe.execute()
+            logger.debug("standings_store_applied", scope=scope, match_type=match_type, match_id=match_id)
+        except Exception as e:
+            logger.warning("standings_store_apply_error", scope=scope, match_id=match_id, error=str(e))
+            self.drop(scope, match_type)
+        finally:
+            self._unlock(teams_key, lock)
+
+    def drop(self, scope: tuple, match_type: str) -> None:
+        """Delete a store; the next read of its table rebuilds it."""
+        try:
+            self.redis.delete(*self._keys(scope, match_type))
+        except Exception as e:
+            logger.warning("standings_store_drop_error", scope=scope, error=str(e))
+
+    def verify(self, scope: tuple, match_type: str, matches: list[dict]) -> list[str]:
+        """Compare the stored rows with rows rebuilt from a full fetch.
+
+        Returns:
+            Names of teams whose stored row differs (empty if consistent, or
+            if the store is not built)
+        """
+        stored = self.load(scope, match_type)
+        if stored is None:
+            return []
+        rebuilt = build_standings_rows(self._contributions(scope, match_type, matches))
+        return sorted(name for name in stored.keys() | rebuilt.keys() if stored.get(name) != rebuilt.get(name))
+
+    @staticmethod
+    def _contributions(scope: tuple, match_type: str, matches: list[dict]) -> dict[int, dict]:
+        contributions = {}
+        for match in matches:
+            contribution = match_contribution(match, *scope, match_type)
+            if contribution is not None:
+                contributions[match["id"]] = contribution
+        return contributions
+
+    def _lock(self, key: str) -> str | None:
+        """Take the store's write lock, waiting up to _LOCK_WAIT_SECONDS."""
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + _LOCK_WAIT_SECONDS
+        delay = 0.01
+        try:
+            while True:
+                if self.redis.set(f"{CACHE_LOCK_PREFIX}{key}", token, nx=True, px=_LOCK_TIMEOUT_MS):
+                    return token
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
+        except Exception as e:
+            logger.warning("standings_store_lock_error", key=key, error=str(e))
+            return None
+        logger.warning("standings_store_lock_timeout", key=key)
+        return None
+
+    def _unlock(self, key: str, token: str) -> None:
+        try:
+            self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"{CACHE_LOCK_PREFIX}{key}", token)
+        except Exception as e:
+            logger.warning("standings_store_lock_error", key=key, error=str(e))
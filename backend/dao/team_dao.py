@@ -19,70 +19,73 @@ logger = structlog.get_logger()
 TEAMS_CACHE_PATTERN = "mt:dao:teams:*"
 
 
-class TeamDAO(BaseDAO):
-    """Data access object for team operations."""
-
-    # === Team Query Methods ===
-
-    @dao_cache("teams:all")
-    def get_all_teams(self) -> list[dict]:
-        """Get all teams with their age groups."""
-        response = (
-            self.client.table("teams")
-            .select("""
-            *,
-            leagues!teams_league_id_fkey (
+def _all_teams_query(client):
+    """The PostgREST query behind TeamDAO.get_all_teams(), on a sync or async client."""
+    return (
+        client.table("teams")
+        .select("""
+        *,
+        leagues!teams_league_id_fkey (
+            id,
+            name,
+            sport_type
+        ),
+        team_mappings (
+            age_groups (
                 id,
-                name,
-                sport_type
+                name
             ),
-            team_mappings (
-                age_groups (
-                    id,
-                    name
-                ),
-                divisions (
+            divisions (
+                id,
+                name,
+                league_id,
+                leagues!divisions_league_id_fkey (
                     id,
                     name,
-                    league_id,
-                    leagues!divisions_league_id_fkey (
-                        id,
-                        name,
-                        sport_type
-                    )
+                    sport_type
                 )
             )
-        """)
-            .order("name")
-            .execute()
         )
+    """)
+        .order("name")
+    )
+
+
+def _flatten_team(team: dict) -> dict:
+    """Flatten a team's age groups and divisions, as get_all_teams() returns it."""
+    # Extract league_name from the joined leagues table
+    if team.get("leagues"):
+        team["league_name"] = team["leagues"]["name"]
+
+    age_groups = []
+    divisions_by_age_group = {}
+    if "team_mappings" in team:
+        for tag in team["team_mappings"]:
+            if tag.get("age_groups"):
+                age_group = tag["age_groups"]
+                age_groups.append(age_group)
+                if tag.get("divisions"):
+                    division = tag["divisions"]
+                    # Add league_name and sport_type to division for easy access in frontend
+                    if division.get("leagues"):
+                        division["league_name"] = division["leagues"]["name"]
+                        division["sport_type"] = division["leagues"].get("sport_type", "soccer")
+                    divisions_by_age_group[age_group["id"]] = division
+    team["age_groups"] = age_groups
+    team["divisions_by_age_group"] = divisions_by_age_group
+    return team
 
-        # Flatten the age groups and divisions for each team
-        teams = []
-        for team in response.data:
-            # Extract league_name from the joined leagues table
-            if team.get("leagues"):
-                team["league_name"] = team["leagues"]["name"]
 
-            age_groups = []
-            divisions_by_age_group = {}
-            if "team_mappings" in team:
-                for tag in team["team_mappings"]:
-                    if tag.get("age_groups"):
-                        age_group = tag["age_groups"]
-                        age_groups.append(age_group)
-                        if tag.get("divisions"):
-                            division = tag["divisions"]
-                            # Add league_name and sport_type to division for easy access in frontend
-                            if division.get("leagues"):
-                                division["league_name"] = division["leagues"]["name"]
-                                division["sport_type"] = division["leagues"].get("sport_type", "soccer")
-                            divisions_by_age_group[age_group["id"]] = division
-            team["age_groups"] = age_groups
-            team["divisions_by_age_group"] = divisions_by_age_group
-            teams.append(team)
+class TeamDAO(BaseDAO):
+    """Data access object for team operations."""
 
-        return teams
+    # === Team Query Methods ===
+
+    @dao_cache("teams:all")
+    def get_all_teams(self) -> list[dict]:
+        """Get all teams with their age groups."""
+        response = _all_teams_query(self.client).execute()
+        return [_flatten_team(team) for team in response.data]
 
     @dao_cache("teams:by_match_type:{match_type_id}:{age_group_id}:{division_id}")
     def get_teams_by_match_type_and_age_group(
@@ -0,0 +1,67 @@
+"""
+Fast JSON responses for the large list endpoints.
+
+FastJSONResponse serializes with orjson (via dao/cache_codec.py; stdlib json
+when orjson is not installed) instead of json.dumps. payload_response() sends
+a cache_codec payload as the body without parsing it: a compressed payload
+goes out with its Content-Encoding when the client accepts it, and is only
+decompressed (never re-serialized) when it does not.
+"""
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+from dao import cache_codec
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by cache_codec.dumps_json (orjson when available)."""
+
+    def render(self, content) -> bytes:
+        return cache_codec.dumps_json(content)
+
+
+def accepts_encoding(request: Request, coding: str) -> bool:
+    """Whether the request's Accept-Encoding allows the content coding (RFC 9110 12.5.3)."""
+    qualities: dict[str, float] = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, *params = (item.strip() for item in part.split(";"))
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.lower()] = quality
+    return qualities.get(coding, qualities.get("*", 0.0)) > 0
+
+
+def etag_matches(request: Request, etag: str | None) -> bool:
+    """Whether the request's If-None-Match names the ETag (weak comparison)."""
+    if not etag:
+        return False
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def payload_response(payload: bytes, request: Request, headers: dict[str, str] | None = None) -> Response:
+    """Send a cache_codec payload as an application/json response.
+
+    Args:
+        payload: Encoded value, e.g. from cache_codec.encode_response()
+        request: The request, for Accept-Encoding
+        headers: Extra response headers (ETag, Cache-Control, ...)
+    """
+    body, coding = cache_codec.http_body(payload)
+    headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+    if coding is not None:
+        if accepts_encoding(request, coding):
+            headers["Content-Encoding"] = coding
+        else:
+            body = cache_codec.decompress_body(body, coding)
+    return Response(content=body, media_type="application/json", headers=headers)
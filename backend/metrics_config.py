@@ -5,6 +5,8 @@ Exposes a /metrics endpoint with standard HTTP metrics:
 - http_requests_total: Counter of requests by method, path, status
 - http_request_duration_seconds: Histogram of request latency
 - http_requests_in_progress: Gauge of concurrent requests
+- dao_cache_*: DAO cache hits/misses/errors, payload sizes and lookup
+  latency per key family (see dao/cache_metrics.py)
 
 These metrics are scraped by Grafana Alloy and sent to Grafana Cloud.
 
@@ -18,6 +20,8 @@ import re
 from prometheus_fastapi_instrumentator import Instrumentator
 from prometheus_fastapi_instrumentator.metrics import latency, requests
 
+from dao import cache_metrics
+
 
 def normalize_path(path: str) -> str:
     """
@@ -45,6 +49,7 @@ def setup_metrics(app):
     - Request counts by method, path, status code
     - Request duration histograms
     - In-progress request gauge
+    - DAO cache metrics (recording is switched on here)
 
     Args:
         app: FastAPI application instance
@@ -89,6 +94,9 @@ def setup_metrics(app):
         )
     )
 
+    # DAO cache metrics share the default registry, so /metrics exposes them too
+    cache_metrics.enable()
+
     # Instrument the app and expose /metrics endpoint
     instrumentator.instrument(app).expose(
         app,
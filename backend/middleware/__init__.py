@@ -4,6 +4,7 @@ Backend Middleware
 Provides request processing middleware for the FastAPI application.
 """
 
+from .response_cache import CachedRoute, ResponseCacheMiddleware
 from .trace_middleware import TraceMiddleware, get_trace_context
 
-__all__ = ["TraceMiddleware", "get_trace_context"]
+__all__ = ["CachedRoute", "ResponseCacheMiddleware", "TraceMiddleware", "get_trace_context"]
@@ -0,0 +1,145 @@
+"""
+Response Cache Middleware - HTTP-level cache for public reads
+
+Many GET endpoints return the same body to every viewer in an audience (real
+vs test content, see auth.viewer_sees_test_content). For the routes it is
+given, this middleware caches the finished response in Redis under
+mt:dao:_http:<hash of path, query string and audience>, so a hit never
+enters the route: no auth dependency, no DAO, no serialization.
+
+Each entry records the data versions (dao/base_dao.py) of the cache families
+the route reads. The lookup reads the current versions and the entry in one
+MGET, and an entry whose versions differ is a miss: every DAO write that
+invalidates a family (@invalidates_cache, clear_cache, invalidate_tags)
+retires the responses built from it. The route's TTL bounds the rest
+(data that is cached without invalidation, e.g. stale-while-revalidate).
+
+The audience callback resolves a request's partition without a database
+read; when it cannot (first request of a user in this process, invalid
+token) the request simply goes to the route uncached. It may still block
+(a JWKS fetch to verify a token), so it runs in the threadpool; the Redis
+lookup and store use redis.asyncio (dao/async_cache.py).
+
+Order matters: add it before CORSMiddleware so the CORS headers are added
+per request rather than replayed from the cache.
+"""
+
+import hashlib
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import structlog
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from dao import cache_codec
+from dao.async_cache import async_cache_set_payload, async_get_versioned_payload
+from json_responses import etag_matches, payload_response
+
+logger = structlog.get_logger()
+
+# Key prefix of cached responses. The underscore keeps them out of the
+# per-family views and data versions; "mt:dao:" lets the deploy flush clear them.
+RESPONSE_CACHE_PREFIX = "mt:dao:_http:"
+
+# Response headers replayed on a hit (lower-case)
+STORED_HEADERS = ("etag", "cache-control", "x-cache-computed-at")
+
+
+@dataclass(frozen=True)
+class CachedRoute:
+    """A GET route whose responses are cached per audience.
+
+    Attributes:
+        path: Regular expression for the full request path
+        families: Cache families the response is built from
+        ttl: Seconds an entry is kept at most
+        public: True if anonymous viewers may read it (optional auth)
+    """
+
+    path: str
+    families: tuple[str, ...]
+    ttl: int = 300
+    public: bool = False
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """Serve cached responses for the configured routes (see module docstring).
+
+    Args:
+        routes: The cached routes
+        audience: (request, public) -> audience partition name, or None if the
+            viewer cannot be partitioned without running the route's auth
+    """
+
+    def __init__(self, app, routes: list[CachedRoute], audience: Callable[[Request, bool], str | None]):
+        super().__init__(app)
+        self.routes = [(re.compile(route.path), route) for route in routes]
+        self.audience = audience
+
+    def _route(self, request: Request) -> CachedRoute | None:
+        if request.method != "GET":
+            return None
+        for pattern, route in self.routes:
+            if pattern.fullmatch(request.url.path):
+                return route
+        return None
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        route = self._route(request)
+        audience = await run_in_threadpool(self.audience, request, route.public) if route else None
+        if audience is None:
+            return await call_next(request)
+
+        key = response_cache_key(request, audience)
+        lookup = await async_get_versioned_payload(key, route.families)
+        if lookup is None:
+            return await call_next(request)
+        versions, stored = lookup
+        entry = _decode_entry(stored, versions) if stored else None
+        if entry is not None:
+            headers, payload = entry
+            logger.debug("response_cache_hit", path=request.url.path, audience=audience)
+            if etag_matches(request, headers.get("etag")):
+                return Response(status_code=304, headers=headers)
+            return payload_response(payload, request, headers)
+
+        response = await call_next(request)
+        if response.status_code != 200 or not response.headers.get("content-type", "").startswith("application/json"):
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        try:
+            payload = cache_codec.encode_http_body(body, response.headers.get("content-encoding"))
+        except ValueError:
+            logger.debug("response_cache_skip", path=request.url.path, reason="content_encoding")
+        else:
+            headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+            envelope = cache_codec.dumps_json({"versions": versions, "headers": headers}) + b"\n" + payload
+            await async_cache_set_payload(key, envelope, route.ttl, pattern="_http:*", local=False)
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            background=response.background,
+        )
+
+
+def response_cache_key(request: Request, audience: str) -> str:
+    """Cache key of a request: its path, query string (order-insensitive) and audience."""
+    state = [request.url.path, sorted(request.query_params.multi_items()), audience]
+    return f"{RESPONSE_CACHE_PREFIX}{hashlib.sha256(cache_codec.dumps_json(state)).hexdigest()[:32]}"
+
+
+def _decode_entry(stored: bytes, versions: dict[str, int]) -> tuple[dict[str, str], bytes] | None:
+    """(headers, payload) of a stored entry, or None if it was built from other data versions."""
+    meta, _, payload = stored.partition(b"\n")
+    try:
+        header = cache_codec.loads_json(meta)
+    except ValueError:
+        return None
+    if header.get("versions") != versions:
+        return None
+    return header.get("headers", {}), payload
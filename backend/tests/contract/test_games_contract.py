@@ -82,6 +82,30 @@ class TestGamesWriteContract:
             # User may not have permission
             pytest.skip("User does not have permission to create games")
 
+    def test_get_games_pages_do_not_overlap(self, authenticated_api_client: MissingTableClient):
+        """Test that keyset pages of games follow each other without repeats."""
+        first = authenticated_api_client.get_games_page(limit=2)
+        assert isinstance(first["matches"], list)
+        assert len(first["matches"]) <= 2
+        if first["next_cursor"] is None:
+            pytest.skip("Not enough games for a second page")
+
+        second = authenticated_api_client.get_games_page(limit=2, cursor=first["next_cursor"])
+        first_ids = {game["id"] for game in first["matches"]}
+        assert not first_ids & {game["id"] for game in second["matches"]}
+
+    def test_get_games_sparse_fields(self, authenticated_api_client: MissingTableClient):
+        """Test that fields= returns only the requested keys (plus id)."""
+        games = authenticated_api_client.get_games(limit=5, fields=["match_date", "home_team_name"])
+        for game in games:
+            assert set(game) == {"id", "match_date", "home_team_name"}
+
+    def test_iter_games_streams_the_same_games_as_the_list(self, authenticated_api_client: MissingTableClient):
+        """Test that the NDJSON stream yields every game, in list order."""
+        season_games = authenticated_api_client.get_games(season_id=1, fields=["match_date"])
+        streamed = list(authenticated_api_client.iter_games(season_id=1, fields=["match_date"]))
+        assert [game["id"] for game in streamed] == [game["id"] for game in season_games]
+
     def test_update_game_full(self, authenticated_api_client: MissingTableClient):
         """Test full update of a game (PUT)."""
         # First get a game to update
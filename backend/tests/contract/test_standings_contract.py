@@ -19,6 +19,16 @@ class TestStandingsContract:
         table = authenticated_api_client.get_table(season_id=1)
         assert isinstance(table, list)
 
+    def test_get_table_as_of_date(self, authenticated_api_client: MissingTableClient):
+        """Test getting the league table as of a past date returns a list."""
+        table = authenticated_api_client.get_table(season_id=1, as_of="2025-10-01")
+        assert isinstance(table, list)
+
+    def test_get_all_tables_returns_tables(self, authenticated_api_client: MissingTableClient):
+        """Test getting every table of a season returns a list of tables."""
+        result = authenticated_api_client.get_all_tables(season_id=1)
+        assert isinstance(result["tables"], list)
+
 
 @pytest.mark.contract
 class TestLeaderboardsContract:
@@ -0,0 +1,188 @@
+"""Tests for the redis.asyncio DAO cache helpers and @async_dao_cache.
+
+Runs against a mocked async Redis client — no Redis.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import dao.async_cache as async_cache
+from dao import cache_codec
+from dao.async_cache import async_dao_cache, async_invalidates_cache
+from dao.base_dao import BaseDAO
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = MagicMock()
+    client.get = AsyncMock(return_value=None)
+    client.scan = AsyncMock()
+    client.delete = AsyncMock()
+    client.unlink = AsyncMock()
+    client.publish = AsyncMock()
+    client.pipeline.return_value.execute = AsyncMock(return_value=[])
+    monkeypatch.setattr(async_cache, "get_async_redis_client", AsyncMock(return_value=client))
+    monkeypatch.delenv("CACHE_L1_ENABLED", raising=False)
+    return client
+
+
+class TestAsyncCacheHelpers:
+    def test_get_decodes_codec_payloads(self, redis_client):
+        redis_client.get.return_value = cache_codec.encode([{"id": 1}])
+
+        assert _run(async_cache.async_cache_get("mt:dao:teams:all")) == [{"id": 1}]
+        redis_client.get.assert_awaited_once_with("mt:dao:teams:all")
+
+    def test_get_errors_degrade_to_a_miss(self, redis_client):
+        redis_client.get.side_effect = ConnectionError("redis gone")
+
+        assert _run(async_cache.async_cache_get("mt:dao:teams:all")) is None
+
+    def test_set_writes_value_tags_and_sizes_in_one_transaction(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+
+        assert _run(async_cache.async_cache_set("mt:dao:qop:10:20", {"has_data": True}, ttl=3600)) is True
+
+        redis_client.pipeline.assert_called_once_with(transaction=True)
+        pipe.setex.assert_called_once_with("mt:dao:qop:10:20", 3600, cache_codec.encode({"has_data": True}))
+        pipe.sadd.assert_called_once_with("mt:dao:_tag:qop", "mt:dao:qop:10:20")
+        pipe.hincrby.assert_any_call("mt:dao:_meta:sizes", "qop:*|writes", 1)
+        pipe.execute.assert_awaited_once()
+
+    def test_clear_family_pattern_uses_the_tag_set(self, redis_client):
+        redis_client.pipeline.return_value.execute.return_value = [{b"mt:dao:qop:10:20"}, 1]
+        redis_client.unlink.return_value = 1
+
+        assert _run(async_cache.async_clear_cache("mt:dao:qop:*")) == 1
+
+        redis_client.unlink.assert_awaited_once_with("mt:dao:qop:10:20")
+        redis_client.scan.assert_not_called()
+
+    def test_clear_other_globs_scan(self, redis_client):
+        redis_client.scan.return_value = (0, [b"mt:dao:qop:10:20"])
+        redis_client.delete.return_value = 1
+
+        assert _run(async_cache.async_clear_cache("mt:dao:qop:10:*")) == 1
+        redis_client.scan.assert_awaited_once_with(0, match="mt:dao:qop:10:*", count=100)
+
+    def test_payloads_stay_encoded(self, redis_client):
+        payload = cache_codec.encode_response([{"id": 1}])
+        redis_client.get.return_value = payload
+
+        assert _run(async_cache.async_cache_get_payload("mt:dao:matches:resp:abc")) == payload
+        assert _run(async_cache.async_cache_set_payload("mt:dao:matches:resp:abc", payload, 300)) is True
+        redis_client.pipeline.return_value.setex.assert_called_once_with("mt:dao:matches:resp:abc", 300, payload)
+
+    def test_data_versions_are_read_in_one_transaction(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.return_value = [False, True, [b"5", b"9"]]
+
+        assert _run(async_cache.async_get_data_versions(("matches",))) == {"*": 5, "matches": 9}
+        redis_client.pipeline.assert_called_once_with(transaction=True)
+        pipe.mget.assert_called_once_with(["mt:ver:*", "mt:ver:matches"])
+
+    def test_versioned_payload_rides_on_the_same_mget(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.return_value = [False, True, [b"5", b"9", b"entry"]]
+
+        assert _run(async_cache.async_get_versioned_payload("mt:dao:_http:abc", ("matches",))) == (
+            {"*": 5, "matches": 9},
+            b"entry",
+        )
+        pipe.mget.assert_called_once_with(["mt:ver:*", "mt:ver:matches", "mt:dao:_http:abc"])
+
+    def test_data_versions_are_none_on_redis_errors(self, redis_client):
+        redis_client.pipeline.return_value.execute.side_effect = ConnectionError("redis gone")
+
+        assert _run(async_cache.async_get_data_versions(("matches",))) is None
+
+
+class TestAsyncRedisClient:
+    def test_disabled_cache_returns_none(self, monkeypatch):
+        monkeypatch.setenv("CACHE_ENABLED", "false")
+        monkeypatch.setattr(async_cache, "_async_redis_client", None)
+
+        assert _run(async_cache.get_async_redis_client()) is None
+
+    def test_client_is_shared_within_a_loop_and_rebuilt_for_a_new_one(self, monkeypatch):
+        monkeypatch.setenv("CACHE_ENABLED", "true")
+        monkeypatch.setattr(async_cache, "_async_redis_client", None)
+        monkeypatch.setattr(async_cache, "_async_redis_loop", None)
+
+        async def twice():
+            return await async_cache.get_async_redis_client(), await async_cache.get_async_redis_client()
+
+        with patch("redis.asyncio.from_url", side_effect=lambda *a, **k: MagicMock(ping=AsyncMock())) as from_url:
+            first, second = _run(twice())
+            third, _ = _run(twice())
+
+        assert first is second
+        assert third is not first
+        assert from_url.call_count == 2
+        assert from_url.call_args.kwargs["decode_responses"] is False
+
+
+class _AsyncQoPDAO(BaseDAO):
+    def __init__(self):
+        self.calls = 0
+
+    @async_dao_cache("qop:{division_id}:{age_group_id}", ttl=3600, tags=("qop:division:{division_id}",))
+    async def get_rankings(self, division_id: int, age_group_id: int):
+        self.calls += 1
+        return {"division_id": division_id}
+
+    @async_invalidates_cache("mt:dao:qop:*", tags=("qop:division:{division_id}",))
+    async def record(self, division_id: int):
+        return True
+
+
+class TestAsyncDecorators:
+    def test_miss_runs_method_and_caches_under_the_sync_key_format(self):
+        dao = _AsyncQoPDAO()
+        with (
+            patch("dao.async_cache.async_cache_get", new_callable=AsyncMock, return_value=None),
+            patch("dao.async_cache.async_cache_set", new_callable=AsyncMock) as cache_set,
+        ):
+            assert _run(dao.get_rankings(10, age_group_id=20)) == {"division_id": 10}
+
+        cache_set.assert_awaited_once_with(
+            "mt:dao:qop:10:20",
+            {"division_id": 10},
+            3600,
+            tags=("qop:division:10",),
+            pattern="qop:{division_id}:{age_group_id}",
+        )
+
+    def test_hit_skips_the_method(self):
+        dao = _AsyncQoPDAO()
+        with patch("dao.async_cache.async_cache_get", new_callable=AsyncMock, return_value={"cached": True}):
+            assert _run(dao.get_rankings(10, 20)) == {"cached": True}
+        assert dao.calls == 0
+
+    def test_invalidates_patterns_and_tags_after_success(self):
+        dao = _AsyncQoPDAO()
+        with (
+            patch("dao.async_cache.async_clear_cache", new_callable=AsyncMock) as clear,
+            patch("dao.async_cache.async_invalidate_tags", new_callable=AsyncMock) as invalidate,
+        ):
+            _run(dao.record(division_id=10))
+
+        clear.assert_awaited_once_with("mt:dao:qop:*")
+        invalidate.assert_awaited_once_with("qop:division:10")
+
+    def test_rejects_sync_functions(self):
+        with pytest.raises(TypeError, match="async function"):
+
+            @async_dao_cache("qop:all")
+            def get_all(self):
+                return []
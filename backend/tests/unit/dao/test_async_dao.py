@@ -0,0 +1,167 @@
+"""Tests for the async DAO layer (dao/async_base_dao.py and the migrated DAOs).
+
+Runs against a mocked async Supabase client — no database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dao.async_base_dao import AsyncBaseDAO, ThreadpoolDAO, offload
+from dao.async_match_dao import AsyncMatchDAO
+from dao.async_team_dao import AsyncTeamDAO
+from dao.base_dao import _cache_computed_at, get_cache_computed_at
+from dao.match_dao import MatchDAO, decode_match_cursor
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _make_dao(dao_class, *pages: list[dict]):
+    client = MagicMock()
+    query = client.table.return_value.select.return_value
+    for method in ("eq", "gte", "lte", "or_", "order", "limit"):
+        getattr(query, method).return_value = query
+    query.execute = AsyncMock(side_effect=[MagicMock(data=page) for page in pages])
+    dao = dao_class.__new__(dao_class)
+    dao.connection_holder = MagicMock(get_client=AsyncMock(return_value=client))
+    return dao, client, query
+
+
+def row(match_id: int, match_date: str) -> dict:
+    return {
+        "id": match_id,
+        "match_date": match_date,
+        "home_team_id": 1,
+        "away_team_id": 2,
+        "home_score": None,
+        "away_score": None,
+        "season_id": 1,
+        "age_group_id": 1,
+        "match_type_id": 1,
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+    }
+
+
+class TestAsyncBaseDAO:
+    def test_get_by_id_awaits_the_query(self):
+        dao, client, query = _make_dao(AsyncBaseDAO, [{"id": 7, "name": "U14"}])
+
+        assert _run(dao.get_by_id("age_groups", 7)) == {"id": 7, "name": "U14"}
+        client.table.assert_called_once_with("age_groups")
+        query.eq.assert_called_once_with("id", 7)
+
+    def test_get_all_orders(self):
+        dao, _, query = _make_dao(AsyncBaseDAO, [{"id": 1}, {"id": 2}])
+
+        assert _run(dao.get_all("seasons", order_by="name")) == [{"id": 1}, {"id": 2}]
+        query.order.assert_called_once_with("name")
+
+    def test_rejects_a_sync_connection(self):
+        with pytest.raises(TypeError):
+            AsyncBaseDAO(MagicMock())
+
+
+class TestAsyncMatchDAO:
+    def test_page_matches_the_sync_dao(self):
+        rows = [row(3, "2026-03-08"), row(2, "2026-03-01"), row(1, "2026-03-01")]
+        dao, _, query = _make_dao(AsyncMatchDAO, rows)
+        sync_dao = MatchDAO.__new__(MatchDAO)
+        sync_dao.client = MagicMock()
+        sync_query = sync_dao.client.table.return_value.select.return_value
+        for method in ("eq", "gte", "lte", "or_", "order", "limit"):
+            getattr(sync_query, method).return_value = sync_query
+        sync_query.execute.return_value = MagicMock(data=rows)
+
+        page = _run(dao.get_matches_page(limit=2))
+
+        query.limit.assert_called_once_with(3)
+        assert page == sync_dao.get_matches_page(limit=2)
+        assert decode_match_cursor(page["next_cursor"]) == ("2026-03-01", 2)
+
+    def test_all_matches_follows_the_cursor(self, monkeypatch):
+        import dao.async_match_dao as async_match_dao
+
+        monkeypatch.setattr(async_match_dao, "MATCHES_PAGE_SIZE", 1)
+        dao, _, query = _make_dao(AsyncMatchDAO, [row(2, "2026-03-08"), row(1, "2026-03-01")], [row(1, "2026-03-01")])
+
+        matches = _run(dao.get_all_matches(season_id=1))
+
+        assert [m["id"] for m in matches] == [2, 1]
+        assert query.execute.await_count == 2
+
+    def test_live_matches_are_flattened(self):
+        live = {
+            "id": 5,
+            "match_status": "live",
+            "match_date": "2026-03-08",
+            "home_score": 1,
+            "away_score": 0,
+            "home_team": {"id": 1, "name": "Home"},
+            "away_team": None,
+        }
+        dao, _, query = _make_dao(AsyncMatchDAO, [live])
+
+        [match] = _run(dao.get_live_matches())
+
+        assert match["match_id"] == 5
+        assert (match["home_team_name"], match["away_team_name"]) == ("Home", "Unknown")
+        query.eq.assert_any_call("is_test", False)
+
+    def test_query_errors_return_empty(self):
+        dao, _, query = _make_dao(AsyncMatchDAO)
+        query.execute = AsyncMock(side_effect=RuntimeError("connection refused"))
+
+        assert _run(dao.get_live_matches()) == []
+        assert _run(dao.get_matches_by_team(1)) == []
+
+
+class TestAsyncTeamDAO:
+    def test_all_teams_are_flattened(self, monkeypatch):
+        import dao.async_cache as async_cache
+
+        monkeypatch.setattr(async_cache, "get_async_redis_client", AsyncMock(return_value=None))
+        team = {
+            "id": 1,
+            "name": "Team",
+            "leagues": {"name": "Homegrown"},
+            "team_mappings": [{"age_groups": {"id": 2, "name": "U14"}, "divisions": None}],
+        }
+        dao, _, _ = _make_dao(AsyncTeamDAO, [team])
+
+        [flat] = _run(dao.get_all_teams())
+
+        assert flat["league_name"] == "Homegrown"
+        assert flat["age_groups"] == [{"id": 2, "name": "U14"}]
+
+
+class TestThreadpoolDAO:
+    def test_methods_run_off_the_event_loop(self):
+        sync_dao = MagicMock()
+        sync_dao.get_current_season.side_effect = lambda: threading.current_thread()
+
+        worker = _run(ThreadpoolDAO(sync_dao).get_current_season())
+
+        assert worker is not threading.current_thread()
+
+    def test_only_the_cache_computed_at_reaches_the_caller(self):
+        var: contextvars.ContextVar[int | None] = contextvars.ContextVar("var", default=None)
+
+        def serve_cached():
+            _cache_computed_at.set(1700000000.0)
+            var.set(3)
+
+        async def call():
+            await offload(serve_cached)
+            return get_cache_computed_at(), var.get()
+
+        assert _run(call()) == (1700000000.0, None)
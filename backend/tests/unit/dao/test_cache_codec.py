@@ -0,0 +1,124 @@
+"""Tests for DAO cache value encoding and payload size accounting.
+
+Runs against a MagicMock Redis client — no Redis.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import zlib
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+import dao.base_dao as base_dao
+from dao import cache_codec
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+TEAMS = [{"id": i, "name": f"Team {i}", "team_mappings": [{"age_group_id": 2, "division_id": 5}]} for i in range(100)]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(cache_codec, "orjson", None)
+    elif cache_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestCodec:
+    def test_small_values_are_versioned_json(self, json_backend):
+        payload = cache_codec.encode({"id": 1})
+
+        assert payload[0] == cache_codec.FORMAT_JSON
+        assert json.loads(payload[1:]) == {"id": 1}
+        assert cache_codec.decode(payload) == {"id": 1}
+
+    def test_large_values_are_compressed(self, json_backend):
+        payload = cache_codec.encode(TEAMS)
+
+        assert payload[0] == cache_codec.FORMAT_ZLIB_JSON
+        assert len(payload) < len(json.dumps(TEAMS)) / 4
+        assert json.loads(zlib.decompress(payload[1:])) == TEAMS
+        assert cache_codec.decode(payload) == TEAMS
+
+    @pytest.mark.parametrize("legacy", [json.dumps(TEAMS), json.dumps(TEAMS).encode()])
+    def test_entries_written_before_the_version_byte_still_decode(self, legacy):
+        assert cache_codec.decode(legacy) == TEAMS
+
+    def test_unknown_format_is_rejected(self):
+        with pytest.raises(ValueError, match="unknown cache payload format"):
+            cache_codec.decode(b"\x07{}")
+
+    def test_unknown_types_are_stringified_like_json_default_str(self, json_backend):
+        kickoff = datetime(2026, 3, 14, 10, 30)
+
+        assert cache_codec.decode(cache_codec.encode({"kickoff": kickoff, 5: "x"})) == {
+            "kickoff": str(kickoff),
+            "5": "x",
+        }
+
+    def test_response_payloads_are_gzip_bodies(self, json_backend):
+        payload = cache_codec.encode_response(TEAMS)
+
+        assert payload[0] == cache_codec.FORMAT_GZIP_JSON
+        assert cache_codec.decode(payload) == TEAMS
+        body, coding = cache_codec.http_body(payload)
+        assert coding == "gzip"
+        assert json.loads(gzip.decompress(body)) == TEAMS
+
+    @pytest.mark.parametrize("encode", [cache_codec.encode, cache_codec.encode_response])
+    def test_http_body_round_trips_every_format(self, encode, json_backend):
+        for value in ({"id": 1}, TEAMS):
+            body, coding = cache_codec.http_body(encode(value))
+            assert json.loads(cache_codec.decompress_body(body, coding)) == value
+
+    def test_zlib_payloads_are_http_deflate_bodies(self, json_backend):
+        assert cache_codec.http_body(cache_codec.encode(TEAMS))[1] == "deflate"
+
+    def test_legacy_text_payloads_are_plain_bodies(self):
+        assert cache_codec.http_body(b'[{"id": 1}]') == (b'[{"id": 1}]', None)
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr(base_dao, "_redis_client", client)
+    monkeypatch.delenv("CACHE_L1_ENABLED", raising=False)
+    return client
+
+
+class TestSizeAccounting:
+    def test_cache_set_counts_payload_bytes_under_the_key_pattern(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+
+        base_dao.cache_set("mt:dao:teams:all", TEAMS, pattern="teams:all")
+
+        stored = pipe.setex.call_args.args[2]
+        pipe.hincrby.assert_any_call(base_dao.CACHE_SIZES_KEY, "teams:all|writes", 1)
+        pipe.hincrby.assert_any_call(base_dao.CACHE_SIZES_KEY, "teams:all|bytes", len(stored))
+        pipe.hset.assert_called_once_with(base_dao.CACHE_SIZES_KEY, "teams:all|last", len(stored))
+
+    def test_direct_writes_are_counted_under_their_family(self, redis_client):
+        base_dao.cache_set("mt:dao:qop:10:20", {"has_data": True}, ttl=3600)
+
+        redis_client.pipeline.return_value.hincrby.assert_any_call(base_dao.CACHE_SIZES_KEY, "qop:*|writes", 1)
+
+    def test_size_stats_are_aggregated_largest_first(self, redis_client):
+        redis_client.hgetall.return_value = {
+            b"qop:*|writes": b"2",
+            b"qop:*|bytes": b"300",
+            b"qop:*|last": b"140",
+            b"teams:all|writes": b"4",
+            b"teams:all|bytes": b"40000",
+            b"teams:all|last": b"10000",
+        }
+
+        stats = base_dao.get_cache_size_stats()
+
+        assert list(stats) == ["teams:all", "qop:*"]
+        assert stats["qop:*"] == {"writes": 2, "bytes_written": 300, "last_bytes": 140, "avg_bytes": 150}
@@ -0,0 +1,82 @@
+"""Tests for DAO cache Prometheus metrics.
+
+Runs against a MagicMock Redis client — no Redis. Reads samples back from the
+default registry, so assertions compare before/after deltas.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+import dao.base_dao as base_dao
+from dao import cache_metrics
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr(base_dao, "_redis_client", client)
+    monkeypatch.delenv("CACHE_L1_ENABLED", raising=False)
+    cache_metrics.enable()
+    yield client
+    cache_metrics.disable()
+
+
+class TestCacheMetrics:
+    def test_hits_and_misses_are_counted_per_family(self, redis_client):
+        hits = _sample("dao_cache_hits_total", family="matches", layer="redis")
+        misses = _sample("dao_cache_misses_total", family="matches")
+        lookups = _sample("dao_cache_lookup_duration_seconds_count", family="matches")
+
+        redis_client.get.return_value = json.dumps([{"id": 1}])
+        base_dao.cache_get("mt:dao:matches:table:1")
+        redis_client.get.return_value = None
+        base_dao.cache_get("mt:dao:matches:table:2")
+
+        assert _sample("dao_cache_hits_total", family="matches", layer="redis") == hits + 1
+        assert _sample("dao_cache_misses_total", family="matches") == misses + 1
+        assert _sample("dao_cache_lookup_duration_seconds_count", family="matches") == lookups + 2
+
+    def test_set_records_payload_size(self, redis_client):
+        before = _sample("dao_cache_set_bytes_sum", family="teams")
+
+        base_dao.cache_set("mt:dao:teams:all", [{"id": 1}])
+
+        stored = redis_client.pipeline.return_value.setex.call_args.args[2]
+        assert _sample("dao_cache_set_bytes_sum", family="teams") == before + len(stored)
+
+    def test_errors_are_counted_by_operation(self, redis_client):
+        before = _sample("dao_cache_errors_total", family="seasons", operation="get")
+        redis_client.get.side_effect = ConnectionError("redis gone")
+
+        assert base_dao.cache_get("mt:dao:seasons:current") is None
+        assert _sample("dao_cache_errors_total", family="seasons", operation="get") == before + 1
+
+    def test_nothing_is_recorded_until_enabled(self, redis_client):
+        cache_metrics.disable()
+        before = _sample("dao_cache_misses_total", family="clubs")
+        redis_client.get.return_value = None
+
+        base_dao.cache_get("mt:dao:clubs:all")
+
+        assert _sample("dao_cache_misses_total", family="clubs") == before
+
+    def test_setup_metrics_enables_recording(self, monkeypatch):
+        from fastapi import FastAPI
+
+        from metrics_config import setup_metrics
+
+        monkeypatch.setattr(cache_metrics, "_enabled", False)
+        setup_metrics(FastAPI())
+
+        assert cache_metrics.is_enabled()
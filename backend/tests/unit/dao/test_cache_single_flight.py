@@ -0,0 +1,162 @@
+"""Tests for single-flight recomputation of cold dao_cache keys.
+
+Concurrent misses on a single_flight key run the underlying query once:
+threads in one process share the leader's result, and other processes wait
+on the leader's Redis lock. Runs against a MagicMock Redis client — no Redis.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import dao.base_dao as base_dao
+from dao.base_dao import BaseDAO, dao_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = MagicMock()
+    client.set.return_value = True
+    monkeypatch.setattr(base_dao, "_redis_client", client)
+    monkeypatch.setattr(base_dao, "_inflight", {})
+    monkeypatch.delenv("CACHE_L1_ENABLED", raising=False)
+    return client
+
+
+class _SlowDAO(BaseDAO):
+    def __init__(self, delay: float = 0.2):
+        self.calls = 0
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    @dao_cache("table:{season_id}", single_flight=True)
+    def get_table(self, season_id: int):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return [{"season": season_id}]
+
+
+class _ImpatientDAO(_SlowDAO):
+    @dao_cache("table:{season_id}", single_flight=True, wait_timeout=0.05)
+    def get_table(self, season_id: int):
+        return _SlowDAO.get_table.__wrapped__(self, season_id)
+
+
+class TestSingleFlightInProcess:
+    def test_concurrent_misses_run_the_query_once(self, redis_client):
+        dao = _SlowDAO()
+        with (
+            patch("dao.base_dao.cache_get", return_value=None),
+            patch("dao.base_dao.cache_set") as cache_set,
+            ThreadPoolExecutor(max_workers=8) as pool,
+        ):
+            results = list(pool.map(lambda _: dao.get_table(12), range(8)))
+
+        assert dao.calls == 1
+        assert results == [[{"season": 12}]] * 8
+        cache_set.assert_called_once_with(
+            "mt:dao:table:12", [{"season": 12}], 86400, tags=(), pattern="table:{season_id}"
+        )
+        redis_client.set.assert_called_once()
+        assert base_dao._inflight == {}
+
+    def test_leader_error_reaches_waiters_and_is_not_cached(self, redis_client):
+        class _Boom(BaseDAO):
+            def __init__(self):
+                pass
+
+            @dao_cache("boom:{x}", single_flight=True)
+            def get(self, x):
+                time.sleep(0.1)
+                raise RuntimeError("db down")
+
+        dao = _Boom()
+        with (
+            patch("dao.base_dao.cache_get", return_value=None),
+            patch("dao.base_dao.cache_set") as cache_set,
+            ThreadPoolExecutor(max_workers=3) as pool,
+        ):
+            futures = [pool.submit(dao.get, 1) for _ in range(3)]
+            errors = [f.exception() for f in futures]
+
+        assert all(isinstance(e, RuntimeError) for e in errors)
+        cache_set.assert_not_called()
+        redis_client.eval.assert_called_once()  # lock released
+
+    def test_waiter_computes_itself_after_wait_timeout(self, redis_client):
+        dao = _ImpatientDAO(delay=0.3)
+        with (
+            patch("dao.base_dao.cache_get", return_value=None),
+            patch("dao.base_dao.cache_set"),
+            ThreadPoolExecutor(max_workers=2) as pool,
+        ):
+            leader = pool.submit(dao.get_table, 1)
+            time.sleep(0.05)
+            waiter = pool.submit(dao.get_table, 1)
+            assert waiter.result() == leader.result() == [{"season": 1}]
+
+        assert dao.calls == 2
+
+
+class TestSingleFlightAcrossProcesses:
+    def test_lock_is_taken_with_nx_and_released_with_owner_check(self, redis_client):
+        dao = _SlowDAO(delay=0)
+        with patch("dao.base_dao.cache_get", return_value=None), patch("dao.base_dao.cache_set"):
+            dao.get_table(3)
+
+        args, kwargs = redis_client.set.call_args
+        assert args[0] == "mt:dao:_lock:mt:dao:table:3"
+        assert kwargs == {"nx": True, "px": 10000}
+        token = args[1]
+        _script, numkeys, lock_key, release_token = redis_client.eval.call_args.args
+        assert (numkeys, lock_key, release_token) == (1, "mt:dao:_lock:mt:dao:table:3", token)
+
+    def test_lock_held_elsewhere_waits_for_the_cached_value(self, redis_client):
+        redis_client.set.return_value = None  # another process holds the lock
+        dao = _SlowDAO(delay=0)
+        with (
+            patch("dao.base_dao.cache_get", side_effect=[None, None, [{"season": 5}]]),
+            patch("dao.base_dao.cache_set") as cache_set,
+        ):
+            assert dao.get_table(5) == [{"season": 5}]
+
+        assert dao.calls == 0
+        cache_set.assert_not_called()
+        redis_client.eval.assert_not_called()
+
+    def test_released_lock_without_a_value_falls_back_to_computing(self, redis_client):
+        redis_client.set.return_value = None
+        redis_client.exists.return_value = 0
+        dao = _SlowDAO(delay=0)
+        with patch("dao.base_dao.cache_get", return_value=None), patch("dao.base_dao.cache_set") as cache_set:
+            assert dao.get_table(5) == [{"season": 5}]
+
+        assert dao.calls == 1
+        cache_set.assert_called_once()
+
+    def test_leader_double_checks_the_cache_after_locking(self, redis_client):
+        dao = _SlowDAO(delay=0)
+        with (
+            patch("dao.base_dao.cache_get", side_effect=[None, [{"season": 9}]]),
+            patch("dao.base_dao.cache_set") as cache_set,
+        ):
+            assert dao.get_table(9) == [{"season": 9}]
+
+        assert dao.calls == 0
+        cache_set.assert_not_called()
+
+    def test_no_redis_just_computes(self, monkeypatch):
+        monkeypatch.setattr(base_dao, "get_redis_client", lambda: None)
+        monkeypatch.setattr(base_dao, "_inflight", {})
+        dao = _SlowDAO(delay=0)
+
+        assert dao.get_table(1) == [{"season": 1}]
+        assert dao.calls == 1
@@ -0,0 +1,131 @@
+"""Tests for stale-while-revalidate dao_cache entries.
+
+A stale_ttl key is stored with its computed-at time. Past ttl it is still
+served, and one background refresh rewrites it. Runs against a MagicMock Redis
+client — no Redis.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import Request, Response
+
+import dao.base_dao as base_dao
+from dao.base_dao import BaseDAO, dao_cache, get_cache_computed_at
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = MagicMock()
+    client.set.return_value = True
+    monkeypatch.setattr(base_dao, "_redis_client", client)
+    monkeypatch.setattr(base_dao, "_refreshing", set())
+    monkeypatch.setattr(base_dao, "_refresh_executor", None)
+    monkeypatch.delenv("CACHE_L1_ENABLED", raising=False)
+    base_dao._cache_computed_at.set(None)
+    return client
+
+
+class _BracketDAO(BaseDAO):
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    @dao_cache("brackets:{league_id}", ttl=60, stale_ttl=600)
+    def get_bracket(self, league_id: int):
+        self.release.wait(5)
+        self.calls += 1
+        return [{"league": league_id, "version": self.calls}]
+
+
+def _entry(value, age: float) -> dict:
+    return {base_dao._SWR_MARKER: 1, "v": value, "t": time.time() - age}
+
+
+class TestStaleWhileRevalidate:
+    def test_miss_stores_value_with_computed_at_for_ttl_plus_stale_ttl(self, redis_client):
+        dao = _BracketDAO()
+        with patch("dao.base_dao.cache_get", return_value=None), patch("dao.base_dao.cache_set") as cache_set:
+            assert dao.get_bracket(1) == [{"league": 1, "version": 1}]
+
+        key, entry, ttl = cache_set.call_args.args
+        assert (key, ttl) == ("mt:dao:brackets:1", 660)
+        assert entry["v"] == [{"league": 1, "version": 1}]
+        assert get_cache_computed_at() == entry["t"]
+
+    def test_fresh_hit_does_not_refresh(self, redis_client):
+        dao = _BracketDAO()
+        entry = _entry([{"league": 1}], age=10)
+        with patch("dao.base_dao.cache_get", return_value=entry), patch("dao.base_dao._schedule_refresh") as refresh:
+            assert dao.get_bracket(1) == [{"league": 1}]
+
+        refresh.assert_not_called()
+        assert dao.calls == 0
+        assert get_cache_computed_at() == entry["t"]
+
+    def test_stale_hit_is_served_immediately_and_refreshed_once(self, redis_client):
+        dao = _BracketDAO()
+        dao.release.clear()  # hold the refresh until both reads are served
+        stale = _entry([{"league": 1, "version": 0}], age=120)
+        with patch("dao.base_dao.cache_get", return_value=stale), patch("dao.base_dao.cache_set") as cache_set:
+            assert dao.get_bracket(1) == [{"league": 1, "version": 0}]
+            assert dao.get_bracket(1) == [{"league": 1, "version": 0}]
+            dao.release.set()
+            base_dao._refresh_executor.shutdown(wait=True)
+
+        assert dao.calls == 1
+        key, entry, ttl = cache_set.call_args.args
+        assert (key, entry["v"], ttl) == ("mt:dao:brackets:1", [{"league": 1, "version": 1}], 660)
+        assert base_dao._refreshing == set()
+        redis_client.eval.assert_called_once()  # refresh lock released
+
+    def test_refresh_is_skipped_while_another_process_holds_the_lock(self, redis_client):
+        redis_client.set.return_value = None
+        compute, store = MagicMock(), MagicMock()
+
+        base_dao._refresh_entry("mt:dao:brackets:1", compute, store, 10.0)
+
+        compute.assert_not_called()
+        store.assert_not_called()
+
+    def test_refresh_errors_are_logged_not_raised(self, redis_client):
+        compute, store = MagicMock(side_effect=RuntimeError("db down")), MagicMock()
+
+        base_dao._refresh_entry("mt:dao:brackets:1", compute, store, 10.0)
+
+        store.assert_not_called()
+        redis_client.eval.assert_called_once()
+
+    def test_entry_without_envelope_is_recomputed(self, redis_client):
+        dao = _BracketDAO()
+        with patch("dao.base_dao.cache_get", return_value=[{"league": 1}]), patch("dao.base_dao.cache_set"):
+            assert dao.get_bracket(1) == [{"league": 1, "version": 1}]
+
+
+class TestComputedAtHeader:
+    def test_bracket_endpoint_reports_when_the_bracket_was_computed(self, redis_client):
+        entry = _entry([{"slot": 1}], age=0)
+        entry["t"] = 1_760_000_000.0
+        request = Request({"type": "http", "method": "GET", "path": "/api/playoffs/bracket", "headers": []})
+        with (
+            patch("dao.base_dao.cache_get", return_value=entry),
+            patch("dao.base_dao._schedule_refresh"),
+            patch("app.get_data_versions", return_value=None),
+        ):
+            from app import get_playoff_bracket
+
+            response = Response()
+            result = asyncio.run(
+                get_playoff_bracket(request, response, current_user={}, league_id=1, season_id=2, age_group_id=3)
+            )
+
+        assert result == [{"slot": 1}]
+        assert response.headers["X-Cache-Computed-At"] == "2025-10-09T08:53:20+00:00"
@@ -0,0 +1,125 @@
+"""Tests for tag-based DAO cache invalidation.
+
+cache_set registers each key in its family tag set (plus any extra tags) in
+the same MULTI as the write; clear_cache serves plain family patterns from
+the tag set instead of SCANning the keyspace. Runs against a MagicMock Redis
+client — no Redis.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+import dao.base_dao as base_dao
+from dao.base_dao import BaseDAO, dao_cache, invalidates_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr(base_dao, "_redis_client", client)
+    monkeypatch.delenv("CACHE_L1_ENABLED", raising=False)
+    return client
+
+
+class TestCacheSetRegistersTags:
+    def test_key_joins_its_family_tag_and_extra_tags_in_one_transaction(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+
+        base_dao.cache_set("mt:dao:matches:table:12:2:5", [], 600, tags=("matches:season:12",))
+
+        redis_client.pipeline.assert_called_once_with(transaction=True)
+        pipe.setex.assert_called_once_with("mt:dao:matches:table:12:2:5", 600, b"\x01[]")
+        pipe.sadd.assert_has_calls(
+            [
+                call("mt:dao:_tag:matches", "mt:dao:matches:table:12:2:5"),
+                call("mt:dao:_tag:matches:season:12", "mt:dao:matches:table:12:2:5"),
+            ]
+        )
+        pipe.expire.assert_any_call("mt:dao:_tag:matches", 600, nx=True)
+        pipe.expire.assert_any_call("mt:dao:_tag:matches", 600, gt=True)
+        pipe.execute.assert_called_once()
+
+
+class TestClearCache:
+    def test_family_pattern_uses_the_tag_set_not_scan(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.return_value = [{"mt:dao:matches:by_id:1:False", "mt:dao:matches:table:1"}, 1]
+        redis_client.unlink.return_value = 2
+
+        assert base_dao.clear_cache("mt:dao:matches:*") == 2
+
+        redis_client.scan.assert_not_called()
+        pipe.smembers.assert_called_once_with("mt:dao:_tag:matches")
+        pipe.delete.assert_called_once_with("mt:dao:_tag:matches")
+        redis_client.unlink.assert_called_once_with("mt:dao:matches:by_id:1:False", "mt:dao:matches:table:1")
+
+    @pytest.mark.parametrize("pattern", ["mt:dao:*", "mt:dao:matches:table:*", "mt:dao:tea?s:*"])
+    def test_other_globs_still_scan(self, redis_client, pattern):
+        redis_client.scan.return_value = (0, ["mt:dao:matches:table:1"])
+        redis_client.delete.return_value = 1
+
+        assert base_dao.clear_cache(pattern) == 1
+
+        redis_client.scan.assert_called_once_with(0, match=pattern, count=100)
+        redis_client.pipeline.return_value.smembers.assert_not_called()
+
+    def test_empty_tag_set_deletes_nothing(self, redis_client):
+        redis_client.pipeline.return_value.execute.return_value = [set(), 0]
+
+        assert base_dao.clear_cache("mt:dao:clubs:*") == 0
+        redis_client.unlink.assert_not_called()
+
+
+class TestInvalidateTags:
+    def test_unlinks_the_union_of_tag_members(self, redis_client):
+        redis_client.pipeline.return_value.execute.return_value = [{"a", "b"}, 1, {"b", "c"}, 1]
+        redis_client.unlink.return_value = 3
+
+        assert base_dao.invalidate_tags("matches:season:12", "matches:id:7") == 3
+        redis_client.unlink.assert_called_once_with("a", "b", "c")
+
+    def test_no_redis_is_a_no_op(self, monkeypatch):
+        monkeypatch.setattr(base_dao, "get_redis_client", lambda: None)
+        assert base_dao.invalidate_tags("matches") == 0
+
+
+class _FakeDAO(BaseDAO):
+    def __init__(self):
+        self.calls = 0
+
+    @dao_cache("widgets:by_owner:{owner_id}:{include_test}", tags=("widgets:owner:{owner_id}",))
+    def get_widgets(self, owner_id: int, include_test: bool = False):
+        self.calls += 1
+        return [owner_id]
+
+    @invalidates_cache("mt:dao:gadgets:*", tags=("widgets:owner:{owner_id}",))
+    def rename_widget(self, owner_id: int, name: str):
+        return True
+
+
+class TestDecoratorTags:
+    def test_dao_cache_formats_tags_from_call_arguments_and_defaults(self):
+        dao = _FakeDAO()
+        with patch("dao.base_dao.cache_get", return_value=None), patch("dao.base_dao.cache_set") as cache_set:
+            dao.get_widgets(4)
+
+        cache_set.assert_called_once_with(
+            "mt:dao:widgets:by_owner:4:False",
+            [4],
+            86400,
+            tags=("widgets:owner:4",),
+            pattern="widgets:by_owner:{owner_id}:{include_test}",
+        )
+
+    def test_invalidates_cache_clears_patterns_and_formatted_tags(self):
+        dao = _FakeDAO()
+        with patch("dao.base_dao.clear_cache") as clear_cache, patch("dao.base_dao.invalidate_tags") as invalidate:
+            dao.rename_widget(owner_id=4, name="x")
+
+        clear_cache.assert_called_once_with("mt:dao:gadgets:*")
+        invalidate.assert_called_once_with("widgets:owner:4")
@@ -0,0 +1,104 @@
+"""Tests for the per-family data versions behind the API's ETags.
+
+clear_cache() / invalidate_tags() bump mt:ver:<family> for every family they
+touch; get_data_versions() reads the counters in one transaction. Runs against
+a MagicMock Redis client — no Redis.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, call
+
+import pytest
+
+import dao.base_dao as base_dao
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr(base_dao, "_redis_client", client)
+    monkeypatch.delenv("CACHE_L1_ENABLED", raising=False)
+    return client
+
+
+class TestVersionFamilies:
+    @pytest.mark.parametrize(
+        ("pattern", "families"),
+        [
+            ("mt:dao:matches:*", {"matches"}),
+            ("mt:dao:qop:10:*", {"qop"}),
+            ("mt:dao:*", {"*"}),
+            ("mt:dao:tea?s:*", {"*"}),
+            ("mt:dao:_tag:*", set()),
+            ("other:*", set()),
+        ],
+    )
+    def test_pattern_families(self, pattern, families):
+        assert base_dao._version_families_for_pattern(pattern) == families
+
+    def test_tag_families(self):
+        assert base_dao._version_families_for_tags(("matches:season:12", "matches:id:7", "teams")) == {
+            "matches",
+            "teams",
+        }
+
+
+class TestBumps:
+    def test_clear_cache_bumps_the_family_version(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.return_value = [set(), 0]
+
+        base_dao.clear_cache("mt:dao:teams:*")
+
+        pipe.set.assert_called_once()
+        assert pipe.set.call_args.args[0] == "mt:ver:teams"
+        assert pipe.set.call_args.kwargs == {"nx": True}
+        pipe.incr.assert_called_once_with("mt:ver:teams")
+
+    def test_invalidate_tags_bumps_each_tag_family(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.return_value = [set(), 0]
+
+        base_dao.invalidate_tags("matches:season:12", "playoffs:bracket:3")
+
+        pipe.incr.assert_has_calls([call("mt:ver:matches"), call("mt:ver:playoffs")])
+
+    def test_bump_data_versions_without_redis_is_a_no_op(self, monkeypatch):
+        monkeypatch.setattr(base_dao, "get_redis_client", lambda: None)
+        base_dao.bump_data_versions("match_events")
+
+    def test_bump_errors_are_swallowed(self, redis_client):
+        redis_client.pipeline.return_value.execute.side_effect = ConnectionError("redis gone")
+        base_dao.bump_data_versions("match_events")
+
+
+class TestGetDataVersions:
+    def test_reads_the_families_and_the_wildcard_in_one_transaction(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.return_value = [False, True, [b"5", b"9"]]
+
+        assert base_dao.get_data_versions(("matches",)) == {"*": 5, "matches": 9}
+
+        redis_client.pipeline.assert_called_once_with(transaction=True)
+        pipe.mget.assert_called_once_with(["mt:ver:*", "mt:ver:matches"])
+
+    def test_none_without_redis(self, monkeypatch):
+        monkeypatch.setattr(base_dao, "get_redis_client", lambda: None)
+        assert base_dao.get_data_versions(("matches",)) is None
+
+    def test_none_on_redis_errors(self, redis_client):
+        redis_client.pipeline.return_value.execute.side_effect = ConnectionError("redis gone")
+        assert base_dao.get_data_versions(("matches",)) is None
+
+    def test_versioned_payload_rides_on_the_same_mget(self, redis_client):
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.return_value = [False, True, [b"5", b"9", b"entry"]]
+
+        assert base_dao.get_versioned_payload("mt:dao:_http:abc", ("matches",)) == (
+            {"*": 5, "matches": 9},
+            b"entry",
+        )
+        pipe.mget.assert_called_once_with(["mt:ver:*", "mt:ver:matches", "mt:dao:_http:abc"])
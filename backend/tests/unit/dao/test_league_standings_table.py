@@ -0,0 +1,146 @@
+"""Tests for get_league_table() reading the precomputed league_standings table.
+
+The table itself is maintained in Postgres; here the Supabase client is mocked
+and only the DAO's read path, row mapping and fallback are checked.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dao.match_dao import LEAGUE_STANDINGS_TABLE, MatchDAO
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+SCOPE = (1, 2, 3)
+
+ROWS = [
+    {
+        "season_id": 1,
+        "age_group_id": 2,
+        "division_id": 3,
+        "match_type_id": 1,
+        "include_test": False,
+        "team_id": 10,
+        "position": 1,
+        "played": 2,
+        "wins": 1,
+        "draws": 1,
+        "losses": 0,
+        "goals_for": 2,
+        "goals_against": 1,
+        "goal_difference": 1,
+        "points": 4,
+        "form": ["W", "D"],
+        "position_change": 1,
+        "match_type": {"name": "League"},
+        "team": {"id": 10, "name": "Team A", "club": {"id": 5, "logo_url": "a.png"}},
+    },
+    {
+        "season_id": 1,
+        "age_group_id": 2,
+        "division_id": 3,
+        "match_type_id": 1,
+        "include_test": False,
+        "team_id": 11,
+        "position": 2,
+        "played": 1,
+        "wins": 0,
+        "draws": 0,
+        "losses": 1,
+        "goals_for": 1,
+        "goals_against": 2,
+        "goal_difference": -1,
+        "points": 0,
+        "form": ["L"],
+        "position_change": -1,
+        "match_type": {"name": "League"},
+        "team": {"id": 11, "name": "Team B", "club": None},
+    },
+]
+
+
+def _make_dao() -> MatchDAO:
+    client = MagicMock()
+    dao = MatchDAO.__new__(MatchDAO)
+    dao.client = client
+    query = client.table.return_value.select.return_value
+    query.eq.return_value = query
+    query.order.return_value = query
+    query.execute.return_value = MagicMock(data=ROWS)
+    return dao
+
+
+@pytest.fixture
+def table_enabled(monkeypatch):
+    monkeypatch.setenv("LEAGUE_STANDINGS_TABLE_ENABLED", "true")
+
+
+class TestLeagueStandingsTable:
+    def test_reads_precomputed_rows(self, table_enabled):
+        dao = _make_dao()
+        with patch.object(dao, "_fetch_matches_for_standings") as fetch:
+            table = MatchDAO.get_league_table.__wrapped__(dao, *SCOPE)
+
+        fetch.assert_not_called()
+        dao.client.table.assert_called_once_with(LEAGUE_STANDINGS_TABLE)
+        query = dao.client.table.return_value.select.return_value
+        query.eq.assert_any_call("include_test", False)
+        query.eq.assert_any_call("match_type.name", "League")
+        assert table[0] == {
+            "team": "Team A",
+            "team_id": 10,
+            "club_id": 5,
+            "logo_url": "a.png",
+            "played": 2,
+            "wins": 1,
+            "draws": 1,
+            "losses": 0,
+            "goals_for": 2,
+            "goals_against": 1,
+            "goal_difference": 1,
+            "points": 4,
+            "form": ["W", "D"],
+            "position_change": 1,
+        }
+        assert table[1]["club_id"] is None
+
+    def test_test_audience_reads_its_own_aggregate(self, table_enabled):
+        dao = _make_dao()
+
+        MatchDAO.get_league_table.__wrapped__(dao, *SCOPE, include_test=True)
+
+        dao.client.table.return_value.select.return_value.eq.assert_any_call("include_test", True)
+
+    def test_failed_read_falls_back_to_computing(self, table_enabled):
+        dao = _make_dao()
+        dao.client.table.return_value.select.return_value.execute.side_effect = Exception("relation does not exist")
+        with (
+            patch("dao.match_dao.get_standings_store", return_value=None),
+            patch.object(dao, "_fetch_matches_for_standings", return_value=[]) as fetch,
+        ):
+            assert MatchDAO.get_league_table.__wrapped__(dao, *SCOPE) == []
+
+        fetch.assert_called_once()
+
+    @pytest.mark.parametrize("scope", [(1, 2, None), (None, 2, 3)])
+    def test_partial_scope_is_computed(self, table_enabled, scope):
+        dao = _make_dao()
+        with patch.object(dao, "_fetch_matches_for_standings", return_value=[]) as fetch:
+            MatchDAO.get_league_table.__wrapped__(dao, *scope)
+
+        fetch.assert_called_once()
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("LEAGUE_STANDINGS_TABLE_ENABLED", raising=False)
+        dao = _make_dao()
+        with (
+            patch("dao.match_dao.get_standings_store", return_value=None),
+            patch.object(dao, "_fetch_matches_for_standings", return_value=[]) as fetch,
+        ):
+            MatchDAO.get_league_table.__wrapped__(dao, *SCOPE)
+
+        fetch.assert_called_once()
+        dao.client.table.assert_not_called()
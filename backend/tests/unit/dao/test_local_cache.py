@@ -0,0 +1,142 @@
+"""Tests for the in-process L1 cache in front of Redis.
+
+LocalCache is exercised directly; the base_dao wiring runs against a
+MagicMock Redis client (no Redis), with the pub/sub listener stubbed out.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import dao.base_dao as base_dao
+from dao.local_cache import LocalCache
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+class TestLocalCache:
+    def test_evicts_least_recently_used_past_max_entries(self):
+        cache = LocalCache(max_entries=2, max_bytes=1024, ttl=60)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")  # a is now most recent
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.evictions == 1
+
+    def test_evicts_to_stay_within_max_bytes(self):
+        cache = LocalCache(max_entries=10, max_bytes=10, ttl=60)
+        cache.set("a", "x" * 6)
+        cache.set("b", "y" * 6)
+
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 6
+
+    def test_oversized_payload_is_not_stored(self):
+        cache = LocalCache(max_entries=10, max_bytes=4, ttl=60)
+        assert cache.set("a", "too long") is False
+        assert cache.get("a") is None
+
+    def test_expired_entries_are_not_served(self):
+        cache = LocalCache(ttl=10)
+        with patch("dao.local_cache.time.monotonic", return_value=100.0):
+            cache.set("a", "1")
+        with patch("dao.local_cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+
+    def test_delete_matching_uses_redis_glob_semantics(self):
+        cache = LocalCache()
+        cache.set("mt:dao:teams:all", "1")
+        cache.set("mt:dao:teams:by_id:5", "2")
+        cache.set("mt:dao:clubs:all:True", "3")
+
+        assert cache.delete_matching("mt:dao:teams:*") == 2
+        assert cache.get("mt:dao:clubs:all:True") == "3"
+        assert cache.delete_matching("mt:dao:clubs:all:?rue") == 1
+
+    def test_set_after_invalidation_with_stale_generation_is_dropped(self):
+        cache = LocalCache()
+        generation = cache.generation
+        cache.delete_matching("mt:dao:*")
+
+        assert cache.set("mt:dao:teams:all", "old", generation=generation) is False
+        assert cache.get("mt:dao:teams:all") is None
+
+
+@pytest.fixture
+def l1_redis(monkeypatch):
+    """Enable L1 over a mock Redis client and reset base_dao's module state."""
+    monkeypatch.setenv("CACHE_L1_ENABLED", "true")
+    redis_client = MagicMock()
+    monkeypatch.setattr(base_dao, "_redis_client", redis_client)
+    monkeypatch.setattr(base_dao, "_local_cache", None)
+    monkeypatch.setattr(base_dao, "_local_cache_pid", None)
+    monkeypatch.setattr(base_dao, "_invalidation_listener", None)
+    return redis_client
+
+
+class TestBaseDaoL1Wiring:
+    def test_second_read_is_served_without_redis(self, l1_redis):
+        l1_redis.get.return_value = json.dumps([{"id": 1}])
+
+        assert base_dao.cache_get("mt:dao:seasons:current") == [{"id": 1}]
+        assert base_dao.cache_get("mt:dao:seasons:current") == [{"id": 1}]
+
+        l1_redis.get.assert_called_once_with("mt:dao:seasons:current")
+
+    def test_hits_are_decoded_fresh_so_callers_can_mutate(self, l1_redis):
+        l1_redis.get.return_value = json.dumps([{"team": "IFA"}])
+
+        first = base_dao.cache_get("mt:dao:matches:table:1")
+        first[0]["qop_rank"] = 3
+
+        assert base_dao.cache_get("mt:dao:matches:table:1") == [{"team": "IFA"}]
+
+    def test_clear_cache_drops_local_copy_and_broadcasts(self, l1_redis):
+        l1_redis.pipeline.return_value.execute.return_value = [{"mt:dao:teams:all"}, 1]
+        base_dao.cache_set("mt:dao:teams:all", [{"id": 1}])
+
+        base_dao.clear_cache("mt:dao:teams:*")
+
+        assert base_dao.get_local_cache().get("mt:dao:teams:all") is None
+        channel, message = l1_redis.publish.call_args.args
+        assert channel == base_dao.CACHE_INVALIDATION_CHANNEL
+        assert json.loads(message) == {"patterns": ["mt:dao:teams:*"], "keys": []}
+
+    def test_broadcast_from_another_process_drops_local_copy(self, l1_redis):
+        base_dao.cache_set("mt:dao:divisions:all", [{"id": 1}])
+        base_dao.cache_set("mt:dao:matches:by_id:7:False", {"id": 7})
+
+        base_dao._on_invalidation_message({"data": json.dumps({"patterns": ["mt:dao:divisions:*"]})})
+        base_dao._on_invalidation_message({"data": json.dumps({"keys": ["mt:dao:matches:by_id:7:False"]})})
+
+        local = base_dao.get_local_cache()
+        assert local.get("mt:dao:divisions:all") is None
+        assert local.get("mt:dao:matches:by_id:7:False") is None
+
+    def test_unreadable_broadcast_drops_everything(self, l1_redis):
+        base_dao.cache_set("mt:dao:divisions:all", [{"id": 1}])
+
+        base_dao._on_invalidation_message({"data": "not json"})
+
+        assert base_dao.get_local_cache().get("mt:dao:divisions:all") is None
+
+    def test_l1_is_bypassed_while_the_listener_is_down(self, l1_redis):
+        l1_redis.pubsub.side_effect = ConnectionError("redis gone")
+
+        assert base_dao.get_local_cache() is None
+
+    def test_disabled_by_default(self, l1_redis, monkeypatch):
+        monkeypatch.delenv("CACHE_L1_ENABLED")
+        l1_redis.scan.return_value = (0, [])
+
+        base_dao.clear_cache("mt:dao:teams:*")
+
+        assert base_dao.get_local_cache() is None
+        l1_redis.publish.assert_not_called()
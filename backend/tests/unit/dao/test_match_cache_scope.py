@@ -0,0 +1,137 @@
+"""Tests for scoped match-cache invalidation.
+
+Match writes invalidate only the cached reads tagged with the written rows'
+match id and season/age group/division scope, instead of every
+mt:dao:matches:* key. Uses a mocked Supabase client (no DB) and patches the
+invalidation helpers (no Redis).
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dao.match_dao import MATCHES_CACHE_PATTERN, MatchDAO, _match_scope_tags
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+ROW = {"id": 7, "season_id": 12, "age_group_id": 2, "division_id": 5, "tournament_id": None}
+
+
+def _make_dao(rows) -> MatchDAO:
+    client = MagicMock()
+    dao = MatchDAO.__new__(MatchDAO)
+    dao.connection_holder = MagicMock(get_client=MagicMock(return_value=client))
+    dao.client = client
+    table = client.table.return_value
+    table.insert.return_value.execute.return_value = MagicMock(data=rows)
+    table.update.return_value.eq.return_value.execute.return_value = MagicMock(data=rows)
+    table.delete.return_value.eq.return_value.execute.return_value = MagicMock(data=rows)
+    return dao
+
+
+class TestMatchScopeTags:
+    def test_row_maps_to_its_id_and_every_filter_combination(self):
+        tags = _match_scope_tags([ROW])
+
+        assert "matches:id:7" in tags
+        assert "matches:scope:12:2:5" in tags
+        assert "matches:scope:12:None:None" in tags
+        assert "matches:scope:None:None:None" in tags
+        assert len([t for t in tags if t.startswith("matches:scope:")]) == 8
+        assert "matches:counts" not in tags
+
+    def test_moved_match_covers_both_scopes(self):
+        moved = {**ROW, "division_id": 6}
+
+        tags = _match_scope_tags([ROW, moved], counts_changed=True)
+
+        assert {"matches:scope:12:2:5", "matches:scope:12:2:6", "matches:counts"} <= set(tags)
+
+    @pytest.mark.parametrize("rows", [None, [], [{"id": 7}]])
+    def test_rows_without_scope_signal_a_full_clear(self, rows):
+        assert _match_scope_tags(rows) is None
+
+    def test_match_reads_are_registered_under_the_written_tags(self):
+        row = {
+            **ROW,
+            "match_date": "2026-05-30",
+            "home_team_id": 1,
+            "away_team_id": 2,
+            "home_score": None,
+            "away_score": None,
+            "match_type_id": 1,
+            "created_at": "2026-05-01T00:00:00Z",
+            "updated_at": "2026-05-01T00:00:00Z",
+        }
+        dao = _make_dao([ROW])
+        dao.client.table.return_value.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[row])
+        with (
+            patch("dao.base_dao.cache_get", return_value=None),
+            patch("dao.base_dao.cache_set") as cache_set,
+        ):
+            dao.get_match_by_id(7, include_test=True)
+
+        assert cache_set.call_args.kwargs["tags"] == ("matches:id:7",)
+
+
+class TestScopedInvalidation:
+    def test_score_update_invalidates_only_the_match_scope(self):
+        dao = _make_dao([ROW])
+        with (
+            patch("dao.match_dao.invalidate_tags") as invalidate,
+            patch("dao.match_dao.clear_cache") as clear,
+            patch("dao.base_dao.clear_cache") as decorator_clear,
+        ):
+            dao.update_match_score(7, home_score=1, away_score=0)
+
+        invalidate.assert_called_once_with(*_match_scope_tags([ROW]))
+        clear.assert_not_called()
+        assert MATCHES_CACHE_PATTERN not in [c.args[0] for c in decorator_clear.call_args_list]
+
+    def test_create_match_also_invalidates_match_counts(self):
+        dao = _make_dao([ROW])
+        with patch("dao.match_dao.invalidate_tags") as invalidate, patch("dao.base_dao.clear_cache"):
+            dao.create_match(home_team_id=1, away_team_id=2, match_date="2026-05-30", season_id=12)
+
+        assert "matches:counts" in invalidate.call_args.args
+
+    def test_update_match_invalidates_old_and_new_scope(self):
+        moved = {**ROW, "season_id": 13}
+        dao = _make_dao([moved])
+        dao.client.table.return_value.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[ROW])
+        with (
+            patch("dao.match_dao.invalidate_tags") as invalidate,
+            patch("dao.match_dao.clear_cache"),
+            patch("dao.base_dao.clear_cache"),
+            patch.object(MatchDAO, "get_match_by_id", return_value={"id": 7}),
+        ):
+            dao.update_match(
+                7,
+                home_team_id=1,
+                away_team_id=2,
+                match_date="2026-05-30",
+                home_score=1,
+                away_score=1,
+                season_id=13,
+                age_group_id=2,
+                match_type_id=1,
+                division_id=5,
+            )
+
+        tags = invalidate.call_args.args
+        assert "matches:scope:12:2:5" in tags
+        assert "matches:scope:13:2:5" in tags
+
+    def test_empty_delete_response_falls_back_to_clearing_all_matches(self):
+        dao = _make_dao([])
+        with (
+            patch("dao.match_dao.invalidate_tags") as invalidate,
+            patch("dao.match_dao.clear_cache") as clear,
+            patch("dao.base_dao.clear_cache"),
+        ):
+            assert dao.delete_match(7) is True
+
+        invalidate.assert_not_called()
+        clear.assert_called_once_with(MATCHES_CACHE_PATTERN)
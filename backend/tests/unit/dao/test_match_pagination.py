@@ -0,0 +1,137 @@
+"""Tests for keyset pagination of matches (MatchDAO.get_matches_page)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from dao.match_dao import MatchDAO, decode_match_cursor, encode_match_cursor
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+def row(match_id: int, match_date: str) -> dict:
+    return {
+        "id": match_id,
+        "match_date": match_date,
+        "home_team_id": 1,
+        "away_team_id": 2,
+        "home_score": None,
+        "away_score": None,
+        "season_id": 1,
+        "age_group_id": 1,
+        "match_type_id": 1,
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+    }
+
+
+def _make_dao(*pages: list[dict]) -> tuple[MatchDAO, MagicMock]:
+    client = MagicMock()
+    query = client.table.return_value.select.return_value
+    for method in ("eq", "gte", "lte", "or_", "order", "limit"):
+        getattr(query, method).return_value = query
+    query.execute.side_effect = [MagicMock(data=page) for page in pages]
+    dao = MatchDAO.__new__(MatchDAO)
+    dao.client = client
+    return dao, query
+
+
+class TestMatchCursor:
+    def test_round_trip(self):
+        assert decode_match_cursor(encode_match_cursor("2026-03-01", 42)) == ("2026-03-01", 42)
+
+    @pytest.mark.parametrize("cursor", ["", "not-base64!", encode_match_cursor("yesterday", 1), "WzFd"])
+    def test_malformed_cursor_is_rejected(self, cursor):
+        with pytest.raises(ValueError):
+            decode_match_cursor(cursor)
+
+
+class TestMatchesPage:
+    def test_limit_is_pushed_into_the_query(self):
+        dao, query = _make_dao([row(3, "2026-03-08"), row(2, "2026-03-01"), row(1, "2026-03-01")])
+
+        page = dao.get_matches_page(limit=2)
+
+        query.limit.assert_called_once_with(3)
+        assert [m["id"] for m in page["matches"]] == [3, 2]
+        assert decode_match_cursor(page["next_cursor"]) == ("2026-03-01", 2)
+
+    def test_last_page_has_no_cursor(self):
+        dao, _ = _make_dao([row(1, "2026-03-01")])
+
+        assert dao.get_matches_page(limit=2)["next_cursor"] is None
+
+    def test_cursor_and_team_filter_share_one_or(self):
+        dao, query = _make_dao([])
+
+        dao.get_matches_page(team_id=7, cursor=encode_match_cursor("2026-03-01", 2))
+
+        query.or_.assert_called_once_with(
+            "and(or(home_team_id.eq.7,away_team_id.eq.7),"
+            "or(match_date.lt.2026-03-01,and(match_date.eq.2026-03-01,id.lt.2)))"
+        )
+
+    def test_match_type_is_filtered_in_the_query(self):
+        dao, query = _make_dao([])
+
+        dao.get_matches_page(match_type="League")
+
+        query.eq.assert_any_call("match_type.name", "League")
+        assert "match_types!inner" in dao.client.table.return_value.select.call_args.args[0]
+
+
+class TestGetAllMatches:
+    def test_reads_past_the_row_cap(self, monkeypatch):
+        monkeypatch.setattr("dao.match_dao.MATCHES_PAGE_SIZE", 2)
+        dao, query = _make_dao(
+            [row(5, "2026-03-15"), row(4, "2026-03-08"), row(3, "2026-03-08")],
+            [row(3, "2026-03-08"), row(2, "2026-03-01"), row(1, "2026-03-01")],
+            [row(1, "2026-03-01")],
+        )
+
+        matches = dao.get_all_matches()
+
+        assert [m["id"] for m in matches] == [5, 4, 3, 2, 1]
+        assert query.execute.call_count == 3
+
+
+class TestSparseFields:
+    def test_page_selects_and_returns_only_the_fields(self):
+        dao, _ = _make_dao([row(2, "2026-03-08"), row(1, "2026-03-01")])
+
+        page = dao.get_matches_page(limit=1, fields=("id", "home_score"))
+
+        select = dao.client.table.return_value.select.call_args.args[0]
+        assert select == "id, match_date, home_score"
+        assert page["matches"] == [{"id": 2, "home_score": None}]
+        assert page["next_cursor"] == encode_match_cursor("2026-03-08", 2)
+
+    def test_team_matches_select_only_the_fields(self):
+        dao, _ = _make_dao([row(1, "2026-03-01")])
+
+        matches = dao.get_matches_by_team(1, fields=("id", "match_date"))
+
+        assert dao.client.table.return_value.select.call_args.args[0] == "id, match_date"
+        assert matches == [{"id": 1, "match_date": "2026-03-01"}]
+
+
+class TestIterMatchPages:
+    def test_pages_are_fetched_as_they_are_consumed(self, monkeypatch):
+        monkeypatch.setattr("dao.match_dao.MATCHES_PAGE_SIZE", 2)
+        dao, query = _make_dao(
+            [row(4, "2026-03-08"), row(3, "2026-03-08"), row(2, "2026-03-01")],
+            [row(2, "2026-03-01"), row(1, "2026-03-01")],
+        )
+
+        pages = dao.iter_match_pages()
+        assert [m["id"] for m in next(pages)] == [4, 3]
+        assert query.execute.call_count == 1
+        assert [[m["id"] for m in page] for page in pages] == [[2, 1]]
+
+    def test_resumes_after_the_cursor(self):
+        dao, query = _make_dao([])
+
+        assert list(dao.iter_match_pages(cursor=encode_match_cursor("2026-03-01", 2))) == []
+        query.or_.assert_called_once_with("and(or(match_date.lt.2026-03-01,and(match_date.eq.2026-03-01,id.lt.2)))")
@@ -0,0 +1,117 @@
+"""Tests for the match preview (MatchDAO.get_match_preview).
+
+The preview is built from one completed-matches fetch per team plus a
+head-to-head query filtered on both team IDs, and cached under both teams'
+tags. Uses a mocked Supabase client (no DB) and patches the cache helpers
+(no Redis).
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dao.match_dao import MatchDAO, _match_scope_tags
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+def row(match_id: int, home: int, away: int, season: str = "2025-2026", age_group: str = "U14") -> dict:
+    return {
+        "id": match_id,
+        "match_date": f"2026-03-{match_id:02d}",
+        "home_team_id": home,
+        "away_team_id": away,
+        "home_team": {"id": home, "name": f"Team {home}"},
+        "away_team": {"id": away, "name": f"Team {away}"},
+        "home_score": 1,
+        "away_score": 0,
+        "season_id": 1,
+        "season": {"id": 1, "name": season},
+        "age_group_id": 1,
+        "age_group": {"id": 1, "name": age_group},
+        "match_type_id": 1,
+        "match_status": "completed",
+    }
+
+
+def _make_dao(*results) -> tuple[MatchDAO, MagicMock]:
+    client = MagicMock()
+    query = client.table.return_value.select.return_value
+    for method in ("eq", "in_", "or_", "order"):
+        getattr(query, method).return_value = query
+    query.execute.side_effect = [r if isinstance(r, Exception) else MagicMock(data=r) for r in results]
+    dao = MatchDAO.__new__(MatchDAO)
+    dao.client = client
+    return dao, query
+
+
+def _preview(dao: MatchDAO, **kwargs) -> dict:
+    with patch("dao.base_dao.cache_get", return_value=None), patch("dao.base_dao.cache_set"):
+        return dao.get_match_preview(1, 2, **kwargs)
+
+
+class TestMatchPreview:
+    def test_built_from_one_fetch_per_team_and_a_head_to_head_query(self):
+        home = [row(9, 1, 3), row(8, 1, 2), row(7, 4, 1)]
+        away = [row(8, 1, 2), row(6, 2, 3), row(5, 5, 2)]
+        dao, query = _make_dao(home, away, [row(8, 1, 2)])
+
+        preview = _preview(dao, season_id=1, recent_count=2)
+
+        assert query.execute.call_count == 3
+        assert [m["id"] for m in preview["home_team_recent"]] == [9, 8]
+        assert [m["id"] for m in preview["away_team_recent"]] == [8, 6]
+        assert [c["opponent_id"] for c in preview["common_opponents"]] == [3]
+        assert [m["id"] for m in preview["head_to_head"]] == [8]
+        query.or_.assert_called_with(
+            "and(home_team_id.eq.1,away_team_id.eq.2),and(home_team_id.eq.2,away_team_id.eq.1)"
+        )
+
+    def test_head_to_head_follows_the_cohort_without_label_lookups(self):
+        h2h = [row(8, 1, 2), row(4, 2, 1, season="2024-2025", age_group="U13"), row(3, 1, 2, age_group="U15")]
+        dao, _ = _make_dao([row(8, 1, 2)], [row(8, 1, 2)], h2h)
+
+        preview = _preview(dao, season_id=1, age_group_id=1)
+
+        assert [m["id"] for m in preview["head_to_head"]] == [8, 4]
+        tables = [c.args[0] for c in dao.client.table.call_args_list]
+        assert "age_groups" not in tables
+        assert "seasons" not in tables
+
+    def test_labels_are_looked_up_when_neither_team_has_played_in_scope(self):
+        dao, _ = _make_dao([], [], [{"name": "U14"}], [{"name": "2025-2026"}], [])
+
+        _preview(dao, season_id=1, age_group_id=1)
+
+        tables = [c.args[0] for c in dao.client.table.call_args_list]
+        assert "age_groups" in tables
+        assert "seasons" in tables
+
+    def test_cached_under_both_team_tags(self):
+        dao, _ = _make_dao([], [], [])
+
+        with patch("dao.base_dao.cache_get", return_value=None), patch("dao.base_dao.cache_set") as cache_set:
+            dao.get_match_preview(1, 2)
+
+        assert cache_set.call_args.kwargs["tags"] == ("matches:team:1", "matches:team:2")
+
+    def test_error_returns_an_empty_preview_that_is_not_cached(self):
+        dao, _ = _make_dao(RuntimeError("boom"))
+
+        with patch("dao.base_dao.cache_get", return_value=None), patch("dao.base_dao.cache_set") as cache_set:
+            preview = dao.get_match_preview(1, 2)
+
+        assert preview["home_team_recent"] == []
+        assert preview["head_to_head"] == []
+        cache_set.assert_not_called()
+
+
+class TestMatchTeamTags:
+    def test_write_invalidates_both_teams(self):
+        tags = _match_scope_tags(
+            [{"id": 7, "season_id": 1, "age_group_id": 2, "division_id": 3, "home_team_id": 4, "away_team_id": 5}]
+        )
+
+        assert {"matches:team:4", "matches:team:5"} <= set(tags)
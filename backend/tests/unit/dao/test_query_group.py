@@ -0,0 +1,107 @@
+"""Tests for QueryGroup (dao/query_group.py): concurrent queries with timeouts."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from dao.async_base_dao import offload
+from dao.query_group import QueryGroup
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+async def _query(value, delay: float = 0.0):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _failing(error: Exception, delay: float = 0.0):
+    await asyncio.sleep(delay)
+    raise error
+
+
+class TestQueryGroup:
+    def test_queries_run_concurrently(self):
+        async def call():
+            async with QueryGroup() as group:
+                first = group.spawn(offload(time.sleep, 0.2))
+                second = group.spawn(offload(time.sleep, 0.2))
+                third = group.spawn(_query("done", 0.2))
+            return first.result(), second.result(), third.result()
+
+        started = time.monotonic()
+        assert _run(call()) == (None, None, "done")
+        assert time.monotonic() - started < 0.5
+
+    def test_a_failure_cancels_the_group_and_is_raised_unwrapped(self):
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def call():
+            async with QueryGroup() as group:
+                group.spawn(slow())
+                group.spawn(_failing(ValueError("bad"), 0.01))
+
+        with pytest.raises(ValueError, match="bad"):
+            _run(call())
+        assert cancelled == [True]
+
+    def test_an_error_in_the_body_is_raised_unwrapped(self):
+        query = _query(1, 5)
+
+        async def call():
+            async with QueryGroup() as group:
+                group.spawn(query)
+                raise HTTPException(status_code=404, detail="Player not found")
+
+        with pytest.raises(HTTPException) as raised:
+            _run(call())
+        assert raised.value.status_code == 404
+        # Cancelled before it started, and closed rather than left unawaited
+        assert inspect.getcoroutinestate(query) == inspect.CORO_CLOSED
+
+    def test_a_timeout_raises(self):
+        async def call():
+            async with QueryGroup(timeout=0.01) as group:
+                group.spawn(_query(1, 5))
+
+        with pytest.raises(TimeoutError):
+            _run(call())
+
+    def test_optional_queries_fall_back_to_their_default(self):
+        async def call():
+            async with QueryGroup() as group:
+                failed = group.spawn(_failing(RuntimeError("down")), default=None)
+                timed_out = group.spawn(_query(1, 5), timeout=0.01, default=[])
+                ok = group.spawn(_query(2), default=0)
+            return failed.result(), timed_out.result(), ok.result()
+
+        assert _run(call()) == (None, [], 2)
+
+    def test_a_task_can_await_another(self):
+        async def call():
+            async with QueryGroup() as group:
+                profile = group.spawn(_query({"team_id": 3}, 0.01))
+
+                async def matches():
+                    return ["match of team", (await profile)["team_id"]]
+
+                games = group.spawn(matches())
+            return games.result()
+
+        assert _run(call()) == ["match of team", 3]
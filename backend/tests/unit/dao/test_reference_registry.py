@@ -0,0 +1,144 @@
+"""Tests for the in-process reference-data registry (dao/reference_registry.py).
+
+Uses a mocked Supabase client (no DB); invalidation goes through
+clear_cache() with Redis disabled.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from dao.base_dao import clear_cache
+from dao.reference_registry import ReferenceRegistry, get_reference_registry
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+TABLES = {
+    "seasons": [
+        {"id": 1, "name": "2024-2025", "start_date": "2024-08-01", "end_date": "2025-07-31", "is_current": False},
+        {"id": 2, "name": "2025-2026", "start_date": "2025-08-01", "end_date": "2026-07-31", "is_current": True},
+    ],
+    "age_groups": [{"id": 3, "name": "U14"}],
+    "leagues": [{"id": 4, "name": "Homegrown"}, {"id": 5, "name": "Academy"}],
+    "divisions": [{"id": 6, "name": "Northeast", "league_id": 5}, {"id": 7, "name": "Northeast", "league_id": 4}],
+    "match_types": [{"id": 1, "name": "League"}],
+    "teams": [{"id": 8, "name": "IFA"}, {"id": 9, "name": "IFA"}, {"id": 10, "name": "NEFC"}],
+}
+
+
+def _make_client(tables: dict[str, list[dict]]) -> MagicMock:
+    """Client whose table(name) pages through tables[name] by .range()."""
+    client = MagicMock()
+
+    def table(name):
+        query = MagicMock()
+        query.select.return_value = query
+        query.order.return_value = query
+
+        def page(start, end):
+            paged = MagicMock()
+            paged.execute.return_value = MagicMock(data=tables.get(name, [])[start : end + 1])
+            return paged
+
+        query.range.side_effect = page
+        return query
+
+    client.table.side_effect = table
+    return client
+
+
+def _loads(client: MagicMock, table: str) -> int:
+    return [c.args[0] for c in client.table.call_args_list].count(table)
+
+
+class TestLookups:
+    def test_names_are_case_and_whitespace_insensitive(self):
+        registry = ReferenceRegistry(_make_client(TABLES))
+
+        assert registry.age_group(" u14 ")["id"] == 3
+        assert registry.season("2025-2026")["id"] == 2
+        assert registry.match_type("league")["id"] == 1
+        assert registry.age_group("U99") is None
+
+    def test_each_table_loads_once(self):
+        client = _make_client(TABLES)
+        registry = ReferenceRegistry(client)
+
+        for _ in range(3):
+            registry.age_group("U14")
+            registry.team("NEFC")
+
+        assert _loads(client, "age_groups") == 1
+        assert _loads(client, "teams") == 1
+        assert _loads(client, "divisions") == 0
+
+    def test_division_is_picked_by_league(self):
+        registry = ReferenceRegistry(_make_client(TABLES))
+
+        assert registry.division("Northeast", league="homegrown")["id"] == 7
+        assert registry.division("Northeast", league="Academy")["id"] == 6
+        assert registry.division("Northeast", league="Nowhere") is None
+
+    def test_teams_returns_every_team_with_the_name(self):
+        registry = ReferenceRegistry(_make_client(TABLES))
+
+        assert [t["id"] for t in registry.teams("ifa")] == [8, 9]
+        assert registry.team("IFA")["id"] == 8
+
+    def test_current_season_prefers_the_flag(self):
+        registry = ReferenceRegistry(_make_client(TABLES))
+
+        assert registry.current_season()["id"] == 2
+
+    def test_tables_past_one_page_are_read_in_full(self, monkeypatch):
+        monkeypatch.setattr("dao.reference_registry.PAGE_SIZE", 2)
+        registry = ReferenceRegistry(_make_client(TABLES))
+
+        assert registry.team("NEFC")["id"] == 10
+
+
+class TestRefresh:
+    def test_invalidation_reloads_only_that_table(self, monkeypatch):
+        monkeypatch.delenv("CACHE_ENABLED", raising=False)
+        client = _make_client(TABLES)
+        registry = get_reference_registry(client)
+        registry.team("IFA")
+        registry.age_group("U14")
+
+        clear_cache("mt:dao:teams:*")
+        registry.team("IFA")
+        registry.age_group("U14")
+
+        assert _loads(client, "teams") == 2
+        assert _loads(client, "age_groups") == 1
+
+    def test_miss_reloads_the_table_at_most_once_per_interval(self):
+        tables = {**TABLES, "teams": list(TABLES["teams"])}
+        client = _make_client(tables)
+        registry = ReferenceRegistry(client)
+        registry.team("IFA")
+
+        assert registry.team("New FC") is None
+        assert _loads(client, "teams") == 1
+
+        registry._tables["teams"].loaded_at -= 60
+        tables["teams"].append({"id": 11, "name": "New FC"})
+        assert registry.team("New FC")["id"] == 11
+        assert _loads(client, "teams") == 2
+
+    def test_failed_load_keeps_the_previous_rows(self):
+        client = _make_client(TABLES)
+        registry = ReferenceRegistry(client)
+        registry.age_group("U14")
+        registry._tables["age_groups"].loaded_at -= 3600
+        client.table.side_effect = RuntimeError("connection reset")
+
+        assert registry.age_group("U14")["id"] == 3
+
+    def test_one_registry_per_client(self):
+        client = _make_client(TABLES)
+
+        assert get_reference_registry(client) is get_reference_registry(client)
+        assert get_reference_registry(client) is not get_reference_registry(_make_client(TABLES))
@@ -0,0 +1,69 @@
+"""Tests for MatchDAO.get_league_table_as_of() and its match-day checkpoints."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from dao.match_dao import MatchDAO
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+def match(match_id, home, away, home_score, away_score, match_date, **overrides):
+    return {
+        "id": match_id,
+        "season_id": 1,
+        "age_group_id": 2,
+        "division_id": 3,
+        "match_date": match_date,
+        "home_team": {"id": ord(home[-1]), "name": home, "division_id": 3, "club": None},
+        "away_team": {"id": ord(away[-1]), "name": away, "division_id": 3, "club": None},
+        "match_type": {"name": "League"},
+        "home_score": home_score,
+        "away_score": away_score,
+        "match_status": "completed",
+        **overrides,
+    }
+
+
+MATCHES = [
+    match(1, "Team A", "Team B", 2, 0, "2026-03-01"),
+    match(2, "Team B", "Team A", 3, 0, "2026-03-08"),
+    match(3, "Team B", "Team C", 1, 1, "2026-03-08", match_type={"name": "Friendly"}),
+    match(4, "Team A", "Team B", None, None, "2026-03-15", match_status="scheduled"),
+]
+
+
+def _make_dao() -> MatchDAO:
+    dao = MatchDAO.__new__(MatchDAO)
+    dao.get_standings_checkpoints = lambda **kwargs: MatchDAO.get_standings_checkpoints.__wrapped__(dao, **kwargs)
+    dao._fetch_matches_for_standings = MagicMock(return_value=MATCHES)
+    return dao
+
+
+class TestLeagueTableAsOf:
+    def test_checkpoint_per_match_day(self):
+        dao = _make_dao()
+
+        checkpoints = MatchDAO.get_standings_checkpoints.__wrapped__(dao, 1, 2, 3)
+
+        assert [c["match_date"] for c in checkpoints] == ["2026-03-01", "2026-03-08"]
+        assert [row["team"] for row in checkpoints[-1]["standings"]] == ["Team B", "Team A"]
+
+    @pytest.mark.parametrize(
+        ("as_of", "leader", "position_change"),
+        [("2026-03-01", "Team A", 0), ("2026-03-05", "Team A", 0), ("2026-03-20", "Team B", 1)],
+    )
+    def test_table_on_a_date(self, as_of, leader, position_change):
+        dao = _make_dao()
+
+        table = dao.get_league_table_as_of(as_of, season_id=1, age_group_id=2, division_id=3)
+
+        assert table[0]["team"] == leader
+        assert table[0]["position_change"] == position_change
+        assert {row["team"] for row in table} == {"Team A", "Team B"}
+
+    def test_before_the_first_match_day(self):
+        assert _make_dao().get_league_table_as_of("2026-02-01", season_id=1, age_group_id=2, division_id=3) == []
@@ -0,0 +1,209 @@
+"""Tests for the incremental standings store and its MatchDAO wiring.
+
+Uses a small dict-backed stand-in for the handful of Redis commands the store
+issues — no Redis — and a mocked Supabase client.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dao.match_dao import MatchDAO
+from dao.standings import calculate_standings_with_extras, filter_completed_matches
+from dao.standings_store import StandingsStore
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+SCOPE = (1, 2, 3)
+
+
+class _FakeRedis:
+    """Strings, hashes and sets; pipelines run their commands on execute()."""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, *keys):
+        return sum(self.data.pop(k, None) is not None for k in keys)
+
+    def expire(self, key, ttl, nx=False, gt=False):
+        return key in self.data
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value.encode()
+        return True
+
+    def eval(self, script, numkeys, key, token):
+        return self.delete(key) if self.data.get(key) == token.encode() else 0
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        fields = dict(mapping or {})
+        if field is not None:
+            fields[field] = value
+        h = self.data.setdefault(key, {})
+        h.update({k.encode(): v if isinstance(v, bytes) else str(v).encode() for k, v in fields.items()})
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field.encode())
+
+    def hmget(self, key, fields):
+        return [self.hget(key, f) for f in fields]
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hdel(self, key, *fields):
+        h = self.data.get(key, {})
+        for f in fields:
+            h.pop(f.encode(), None)
+        if not h:
+            self.data.pop(key, None)
+
+    def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(m.encode() for m in members)
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *a, **k: self.calls.append((name, a, k))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*a, **k) for name, a, k in self.calls]
+
+
+def match(match_id, home, away, home_score, away_score, match_date, **overrides):
+    return {
+        "id": match_id,
+        "season_id": 1,
+        "age_group_id": 2,
+        "division_id": 3,
+        "is_test": False,
+        "match_date": match_date,
+        "home_team": {"id": match_id * 2, "name": home, "division_id": 3, "club": None},
+        "away_team": {"id": match_id * 2 + 1, "name": away, "division_id": 3, "club": None},
+        "match_type": {"name": "League"},
+        "home_score": home_score,
+        "away_score": away_score,
+        "match_status": "completed",
+        **overrides,
+    }
+
+
+MATCHES = [
+    match(1, "Team A", "Team B", 2, 1, "2026-03-01"),
+    match(2, "Team C", "Team A", 0, 0, "2026-03-08"),
+]
+
+
+@pytest.fixture
+def store():
+    return StandingsStore(_FakeRedis())
+
+
+def _built(store, matches=MATCHES):
+    token = store.begin_rebuild(SCOPE, "League")
+    assert store.commit_rebuild(SCOPE, "League", token, matches)
+    return store
+
+
+class TestStandingsStore:
+    def test_unbuilt_store_loads_none(self, store):
+        assert store.load(SCOPE, "League") is None
+
+    def test_rebuild_then_load(self, store):
+        rows = _built(store).load(SCOPE, "League")
+
+        assert rows["Team A"]["points"] == 4
+        assert store.match_types(SCOPE) == ["League"]
+
+    def test_score_change_updates_rows_to_the_rebuilt_state(self, store):
+        _built(store)
+        corrected = [MATCHES[0], {**MATCHES[1], "home_score": 2}]
+
+        store.apply_match(SCOPE, ["League"], 2, corrected[1])
+
+        assert store.load(SCOPE, "League")["Team C"]["wins"] == 1
+        assert store.verify(SCOPE, "League", corrected) == []
+        assert store.verify(SCOPE, "League", MATCHES) == ["Team A", "Team C"]
+
+    def test_deleted_match_is_reverted(self, store):
+        _built(store)
+
+        store.apply_match(SCOPE, ["League"], 2, None)
+
+        assert "Team C" not in store.load(SCOPE, "League")
+        assert store.verify(SCOPE, "League", MATCHES[:1]) == []
+
+    def test_write_during_rebuild_cancels_it(self, store):
+        token = store.begin_rebuild(SCOPE, "League")
+        store.apply_match(SCOPE, store.match_types(SCOPE), 2, MATCHES[1])
+
+        assert store.commit_rebuild(SCOPE, "League", token, MATCHES) is False
+        assert store.load(SCOPE, "League") is None
+
+    def test_store_keys_are_cleared_with_the_matches_family(self, store):
+        _built(store)
+
+        tagged = store.redis.smembers("mt:dao:_tag:matches")
+
+        assert b"mt:dao:matches:standings:1:2:3:League:teams" in tagged
+        assert b"mt:dao:matches:standings:1:2:3:League:matches" in tagged
+
+
+def _make_dao(matches) -> MatchDAO:
+    client = MagicMock()
+    dao = MatchDAO.__new__(MatchDAO)
+    dao.connection_holder = MagicMock(get_client=MagicMock(return_value=client))
+    dao.client = client
+    query = client.table.return_value.select.return_value
+    query.eq.return_value = query
+    query.order.return_value = query
+    query.execute.return_value = MagicMock(data=matches)
+    return dao
+
+
+class TestLeagueTableFromStore:
+    def test_cold_store_is_built_and_warm_store_skips_the_fetch(self, store):
+        dao = _make_dao(MATCHES)
+        expected = calculate_standings_with_extras(filter_completed_matches(MATCHES))
+        with patch("dao.match_dao.get_standings_store", return_value=store):
+            cold = MatchDAO.get_league_table.__wrapped__(dao, *SCOPE)
+            dao.client.table.reset_mock()
+            warm = MatchDAO.get_league_table.__wrapped__(dao, *SCOPE)
+
+        assert cold == expected
+        assert warm == expected
+        dao.client.table.assert_not_called()
+
+    def test_match_write_applies_its_delta(self, store):
+        _built(store)
+        updated = {**MATCHES[1], "away_score": 1}
+        dao = _make_dao([updated])
+        with (
+            patch("dao.match_dao.get_standings_store", return_value=store),
+            patch("dao.match_dao.invalidate_tags") as invalidate,
+        ):
+            dao.invalidate_match_rows([updated])
+
+        assert store.load(SCOPE, "League")["Team A"]["points"] == 6
+        assert "matches:scope:1:2:3" in invalidate.call_args.args
@@ -0,0 +1,131 @@
+"""Tests for the keyset iterators behind the NDJSON exports.
+
+MatchDAO.iter_agent_matches (/api/agent/matches) and
+MatchEventDAO.iter_goal_events (/api/admin/goals), with a mocked client.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from dao.match_dao import MatchDAO
+from dao.match_event_dao import MatchEventDAO
+
+pytestmark = [pytest.mark.unit, pytest.mark.backend, pytest.mark.dao]
+
+
+def _make_query(client: MagicMock, *pages: list[dict]) -> MagicMock:
+    query = client.table.return_value.select.return_value
+    for method in ("eq", "neq", "gte", "lte", "or_", "order", "limit"):
+        getattr(query, method).return_value = query
+    query.execute.side_effect = [MagicMock(data=page) for page in pages]
+    return query
+
+
+def agent_row(match_id: int, match_date: str) -> dict:
+    return {
+        "id": match_id,
+        "match_id": f"ext-{match_id}",
+        "match_date": match_date,
+        "scheduled_kickoff": f"{match_date}T14:30:00+00:00",
+        "home_score": 2,
+        "away_score": 1,
+        "match_status": "completed",
+        "home_team": {"name": "IFA"},
+        "away_team": {"name": "NEFC"},
+    }
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = MagicMock()
+    registry.season.return_value = {"id": 1}
+    registry.age_group.return_value = {"id": 2}
+    registry.division.return_value = {"id": 3}
+    registry.teams.return_value = [{"id": 8}, {"id": 9}]
+    monkeypatch.setattr("dao.match_dao.get_reference_registry", lambda client: registry)
+    return registry
+
+
+def _agent_dao(*pages: list[dict]) -> tuple[MatchDAO, MagicMock]:
+    dao = MatchDAO.__new__(MatchDAO)
+    dao.client = MagicMock()
+    return dao, _make_query(dao.client, *pages)
+
+
+def _iter_agent(dao: MatchDAO):
+    return dao.iter_agent_matches(
+        team="IFA", age_group="U14", league="Homegrown", division="Northeast", season="2025-2026"
+    )
+
+
+class TestIterAgentMatches:
+    def test_pages_by_date_and_id(self, registry, monkeypatch):
+        monkeypatch.setattr("dao.match_dao.MATCHES_PAGE_SIZE", 2)
+        dao, query = _agent_dao(
+            [agent_row(1, "2026-03-01"), agent_row(2, "2026-03-01")],
+            [agent_row(3, "2026-03-08")],
+        )
+
+        pages = list(_iter_agent(dao))
+
+        assert [[m["external_match_id"] for m in page] for page in pages] == [["ext-1", "ext-2"], ["ext-3"]]
+        teams = "or(home_team_id.eq.8,home_team_id.eq.9,away_team_id.eq.8,away_team_id.eq.9)"
+        assert query.or_.call_args_list[0].args == (f"and({teams})",)
+        assert query.or_.call_args_list[1].args == (
+            f"and({teams},or(match_date.gt.2026-03-01,and(match_date.eq.2026-03-01,id.gt.2)))",
+        )
+
+    def test_rows_are_flattened(self, registry):
+        dao, _ = _agent_dao([agent_row(1, "2026-03-01")])
+
+        [[match]] = list(_iter_agent(dao))
+
+        assert match["home_team"] == "IFA"
+        assert match["match_time"] == "14:30"
+        assert match["league"] == "Homegrown"
+        assert "id" not in match
+
+    def test_unknown_team_yields_nothing(self, registry):
+        registry.teams.return_value = []
+        dao, query = _agent_dao()
+
+        assert list(_iter_agent(dao)) == []
+        query.execute.assert_not_called()
+
+    def test_list_form_swallows_errors(self, registry):
+        dao, query = _agent_dao()
+        query.execute.side_effect = RuntimeError("connection reset")
+
+        assert (
+            dao.get_agent_matches(
+                team="IFA", age_group="U14", league="Homegrown", division="Northeast", season="2025-2026"
+            )
+            == []
+        )
+
+
+def goal_row(event_id: int, created_at: str) -> dict:
+    return {"id": event_id, "created_at": created_at, "event_type": "goal", "match": {"id": 1}}
+
+
+class TestIterGoalEvents:
+    def test_pages_by_created_at_and_id(self, monkeypatch):
+        monkeypatch.setattr("dao.match_event_dao.GOAL_EVENTS_PAGE_SIZE", 2)
+        dao = MatchEventDAO.__new__(MatchEventDAO)
+        dao.client = MagicMock()
+        query = _make_query(
+            dao.client,
+            [goal_row(9, "2026-03-08T15:00:00+00:00"), goal_row(7, "2026-03-08T15:00:00+00:00")],
+            [goal_row(4, "2026-03-01T15:00:00+00:00")],
+        )
+
+        pages = list(dao.iter_goal_events(season_id=1))
+
+        assert [[g["id"] for g in page] for page in pages] == [[9, 7], [4]]
+        query.or_.assert_called_once_with(
+            'created_at.lt."2026-03-08T15:00:00+00:00",and(created_at.eq."2026-03-08T15:00:00+00:00",id.lt.7)'
+        )
+        query.eq.assert_any_call("match.season_id", 1)
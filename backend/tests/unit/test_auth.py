@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import Mock, patch
 
 import jwt
@@ -93,6 +94,43 @@ class TestAuthManager:
         # Assert
         assert result is None
 
+    @patch('backend.auth.jwt.get_unverified_header', return_value={'alg': 'HS256'})
+    @patch('backend.auth.jwt.decode')
+    def test_viewer_audience_is_remembered_by_verify_token(self, mock_jwt_decode, mock_get_header):
+        '''Verify that a verified user's audience is known without another profile read'''
+        # Arrange
+        mock_jwt_decode.return_value = {'sub': 'user123'}
+        mock_supabase = Mock()
+        mock_response = Mock()
+        mock_response.data = [{'id': 'user123', 'username': 'testuser', 'role': 'team-fan', 'is_test': True}]
+        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_response
+        auth_manager = AuthManager(supabase_client=mock_supabase)
+
+        # Act / Assert
+        assert auth_manager.viewer_audience('token') is None
+        auth_manager.verify_token('token')
+        assert auth_manager.viewer_audience('token') is True
+        assert mock_supabase.table.call_count == 1
+
+    @patch('backend.auth.jwt.decode', side_effect=jwt.ExpiredSignatureError)
+    def test_viewer_audience_of_an_invalid_token_is_none(self, mock_jwt_decode):
+        '''Verify that the audience lookup still checks the token'''
+        auth_manager = AuthManager(supabase_client=Mock())
+        auth_manager._audiences['user123'] = (False, float('inf'))
+
+        assert auth_manager.viewer_audience('expired_token') is None
+
+    def test_expired_audiences_are_evicted_on_insert(self):
+        '''Verify that the audience cache holds only users seen within the TTL'''
+        auth_manager = AuthManager(supabase_client=Mock())
+        auth_manager._audiences['gone'] = (False, 0.0)
+        auth_manager._audiences['still-here'] = (True, float('inf'))
+
+        auth_manager._remember_audience('user123', False)
+        auth_manager._remember_audience('still-here', True)
+
+        assert list(auth_manager._audiences) == ['user123', 'still-here']
+
     @patch('backend.auth.logger')
     @patch('backend.auth.AuthManager.verify_token')
     def test_get_current_user_valid_token(self, mock_verify_token, mock_logger):
@@ -370,6 +408,22 @@ class TestCheckUsernameAvailable:
         # Assert
         mock_supabase.table.return_value.select.return_value.eq.assert_called_with('username', 'uppercase')
 
+    @pytest.mark.asyncio
+    async def test_username_check_runs_off_the_event_loop(self):
+        '''Verify the query runs in a worker thread, not on the event loop'''
+        # Arrange
+        query_threads = []
+        mock_supabase = Mock()
+        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.side_effect = (
+            lambda: query_threads.append(threading.get_ident()) or Mock(data=[])
+        )
+
+        # Act
+        await check_username_available(mock_supabase, 'newuser')
+
+        # Assert
+        assert query_threads and query_threads[0] != threading.get_ident()
+
     @pytest.mark.asyncio
     async def test_username_check_database_error(self):
         '''Verify database error is raised'''
@@ -0,0 +1,123 @@
+"""Conditional GET (ETag / If-None-Match) on the polled read endpoints.
+
+The ETag is derived from the URL, the viewer's audience and the data versions
+of the cache families behind the response, so a matching If-None-Match is
+answered with 304 before any DAO is called.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+VERSIONS = {"*": 1, "matches": 7, "teams": 3, "match_events": 2}
+
+
+def _client(role="team-fan"):
+    from app import app
+    from auth import get_current_user_required
+
+    app.dependency_overrides[get_current_user_required] = lambda: {"user_id": "u1", "role": role}
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestMatchesConditionalGet:
+    def teardown_method(self):
+        from app import app
+
+        app.dependency_overrides.clear()
+
+    def _get(self, match_dao, versions=VERSIONS, headers=None, params=None, role="team-fan"):
+        event_dao = MagicMock()
+        event_dao.get_card_events_for_matches.return_value = {}
+        with (
+            patch("app.match_dao", match_dao),
+            patch("app.async_match_dao", match_dao),
+            patch("app.match_event_dao", event_dao),
+            patch("app.async_get_data_versions", AsyncMock(return_value=versions)),
+        ):
+            return _client(role).get("/api/matches", headers=headers, params=params)
+
+    def test_response_carries_an_etag(self):
+        match_dao = MagicMock()
+        match_dao.get_all_matches = AsyncMock(return_value=[{"id": 1}])
+
+        response = self._get(match_dao)
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_matching_if_none_match_is_a_304_without_dao_calls(self):
+        match_dao = MagicMock()
+        match_dao.get_all_matches = AsyncMock(return_value=[{"id": 1}])
+        etag = self._get(match_dao).headers["etag"]
+        match_dao.reset_mock()
+
+        response = self._get(match_dao, headers={"If-None-Match": f'"other", {etag}'})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        match_dao.get_all_matches.assert_not_called()
+
+    def test_etag_changes_with_data_versions_query_and_audience(self):
+        match_dao = MagicMock()
+        match_dao.get_all_matches = AsyncMock(return_value=[])
+        etag = self._get(match_dao).headers["etag"]
+
+        assert self._get(match_dao, versions={**VERSIONS, "matches": 8}).headers["etag"] != etag
+        assert self._get(match_dao, params={"season_id": 3}).headers["etag"] != etag
+        assert self._get(match_dao, role="admin").headers["etag"] != etag
+
+    def test_cached_payload_is_sent_without_dao_calls(self):
+        from dao import cache_codec
+
+        match_dao = MagicMock()
+        payload = cache_codec.encode_response([{"id": i} for i in range(500)])
+        with patch("app.async_cache_get_payload", AsyncMock(return_value=payload)) as cache_get_payload:
+            response = self._get(match_dao)
+
+        assert response.status_code == 200
+        assert [m["id"] for m in response.json()] == list(range(500))
+        assert cache_get_payload.await_args.args[0].startswith("mt:dao:matches:resp:")
+        match_dao.get_all_matches.assert_not_called()
+
+    def test_no_etag_without_versions(self):
+        match_dao = MagicMock()
+        match_dao.get_all_matches = AsyncMock(return_value=[{"id": 1}])
+
+        response = self._get(match_dao, versions=None, headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+    def test_ndjson_is_not_conditional(self):
+        match_dao = MagicMock()
+        match_dao.iter_match_pages.return_value = iter([[{"id": 1}]])
+
+        response = self._get(match_dao, headers={"Accept": "application/x-ndjson", "If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+
+@pytest.mark.unit
+class TestReferenceConditionalGet:
+    def teardown_method(self):
+        from app import app
+
+        app.dependency_overrides.clear()
+
+    def test_seasons_304(self):
+        season_dao = MagicMock()
+        season_dao.get_all_seasons.return_value = [{"id": 1, "name": "2025-2026"}]
+        with patch("app.season_dao", season_dao), patch("app.get_data_versions", return_value={"*": 1, "seasons": 4}):
+            client = _client()
+            etag = client.get("/api/seasons").headers["etag"]
+            season_dao.reset_mock()
+            response = client.get("/api/seasons", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        season_dao.get_all_seasons.assert_not_called()
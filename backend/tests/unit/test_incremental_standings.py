@@ -0,0 +1,145 @@
+"""
+Incremental Standings Tests - Testing Pure Functions
+
+Applying and reverting match contributions (dao/standings.py) must give the
+same table as calculating it from scratch with
+calculate_standings_with_extras().
+
+Usage:
+    pytest tests/unit/test_incremental_standings.py -v
+"""
+
+import pytest
+
+from dao.standings import (
+    apply_contribution,
+    build_standings_rows,
+    calculate_standings_with_extras,
+    filter_completed_matches,
+    match_contribution,
+    standings_from_rows,
+)
+
+SCOPE = (1, 2, 3)
+
+
+def match(
+    match_id: int,
+    home: str,
+    away: str,
+    home_score: int | None,
+    away_score: int | None,
+    match_date: str,
+    status: str = "completed",
+    **overrides,
+) -> dict:
+    """Match dict in _fetch_matches_for_standings() format."""
+    return {
+        "id": match_id,
+        "season_id": 1,
+        "age_group_id": 2,
+        "division_id": 3,
+        "is_test": False,
+        "match_date": match_date,
+        "home_team": {"id": ord(home[-1]), "name": home, "division_id": 3, "club": {"id": 9, "logo_url": None}},
+        "away_team": {"id": ord(away[-1]), "name": away, "division_id": 3, "club": {"id": 9, "logo_url": None}},
+        "match_type": {"name": "League"},
+        "home_score": home_score,
+        "away_score": away_score,
+        "match_status": status,
+        **overrides,
+    }
+
+
+MATCHES = [
+    match(1, "Team A", "Team B", 2, 1, "2026-03-01"),
+    match(2, "Team C", "Team D", 0, 0, "2026-03-01"),
+    match(3, "Team A", "Team C", 1, 3, "2026-03-08"),
+    match(4, "Team B", "Team D", 4, 0, "2026-03-08"),
+    match(5, "Team D", "Team A", 1, 1, "2026-03-15"),
+]
+
+
+def _contributions(matches: list[dict]) -> dict:
+    contributions = {}
+    for m in matches:
+        contribution = match_contribution(m, *SCOPE, "League")
+        if contribution:
+            contributions[m["id"]] = contribution
+    return contributions
+
+
+def _by_team(table: list[dict]) -> dict[str, dict]:
+    return {row["team"]: row for row in table}
+
+
+class TestMatchContribution:
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"match_status": "scheduled"},
+            {"home_score": None},
+            {"is_test": True},
+            {"division_id": 4},
+            {"match_type": {"name": "Friendly"}},
+        ],
+        ids=["not_completed", "unscored", "test_match", "other_division", "other_match_type"],
+    )
+    def test_matches_outside_the_table_contribute_nothing(self, overrides):
+        assert match_contribution({**MATCHES[0], **overrides}, *SCOPE, "League") is None
+
+    def test_forfeit_counts(self):
+        assert match_contribution({**MATCHES[0], "match_status": "forfeit"}, *SCOPE, "League") is not None
+
+
+class TestIncrementalStandings:
+    def test_rows_match_from_scratch_calculation(self):
+        expected = calculate_standings_with_extras(filter_completed_matches(MATCHES))
+
+        table = standings_from_rows(build_standings_rows(_contributions(MATCHES)))
+
+        assert _by_team(table) == _by_team(expected)
+        assert [row["team"] for row in table] == [row["team"] for row in expected]
+
+    def test_score_change_is_a_revert_and_apply(self):
+        rows = build_standings_rows(_contributions(MATCHES))
+        corrected = [*MATCHES[:4], {**MATCHES[4], "home_score": 3}]
+
+        old = match_contribution(MATCHES[4], *SCOPE, "League")
+        new = match_contribution(corrected[4], *SCOPE, "League")
+        apply_contribution(rows, 5, old, sign=-1)
+        apply_contribution(rows, 5, new)
+
+        assert rows == build_standings_rows(_contributions(corrected))
+        assert _by_team(standings_from_rows(rows)) == _by_team(calculate_standings_with_extras(corrected))
+
+    def test_removing_a_teams_only_match_drops_the_team(self):
+        rows = build_standings_rows(_contributions(MATCHES[:1]))
+
+        apply_contribution(rows, 1, match_contribution(MATCHES[0], *SCOPE, "League"), sign=-1)
+
+        assert rows == {}
+
+    def test_single_match_day_has_no_movement(self):
+        table = standings_from_rows(build_standings_rows(_contributions(MATCHES[:2])))
+
+        assert {row["position_change"] for row in table} == {0}
+
+    def test_tied_teams_rank_by_first_appearance_in_both_paths(self):
+        # Every team ends level on points, goal difference and goals scored;
+        # match ids, not team names, decide the order (home before away)
+        tied = [
+            match(7, "Team D", "Team B", 1, 1, "2026-03-01"),
+            match(8, "Team C", "Team A", 1, 1, "2026-03-01"),
+            match(9, "Team D", "Team C", 2, 2, "2026-03-08"),
+            match(10, "Team B", "Team A", 2, 2, "2026-03-08"),
+        ]
+        expected = calculate_standings_with_extras(filter_completed_matches(tied))
+        rows = build_standings_rows(_contributions(tied))
+        # A Redis hash hands the rows back in no particular order
+        shuffled = dict(reversed(list(rows.items())))
+
+        table = standings_from_rows(shuffled)
+
+        assert [row["team"] for row in expected] == ["Team D", "Team B", "Team C", "Team A"]
+        assert table == expected
@@ -0,0 +1,66 @@
+"""
+Unit tests for the matches.is_test drift check's pure logic (SB-591).
+
+The psycopg fetch runs in the scheduled CI job against prod, not here. The
+script lives at repo-root scripts/check_is_test_drift.py and is loaded by file
+path, registered in sys.modules before exec_module so its dataclass resolves.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[3] / "scripts" / "check_is_test_drift.py"
+_spec = importlib.util.spec_from_file_location("check_is_test_drift", _SCRIPT)
+check = importlib.util.module_from_spec(_spec)
+sys.modules["check_is_test_drift"] = check
+_spec.loader.exec_module(check)
+
+
+@pytest.mark.unit
+class TestSummarizeDrift:
+    def test_no_rows_is_in_sync(self):
+        assert check.summarize_drift([]).in_sync
+
+    def test_splits_by_direction(self):
+        drift = check.summarize_drift([(9, True, False), (3, False, True), (1, False, True)])
+
+        assert drift.leaked == [1, 3]
+        assert drift.hidden == [9]
+        assert not drift.in_sync
+
+    def test_agreeing_rows_are_ignored(self):
+        assert check.summarize_drift([(1, True, True), (2, False, False)]).in_sync
+
+
+@pytest.mark.unit
+class TestRenderReport:
+    def test_in_sync_message(self):
+        out = check.render_report("prod", check.IsTestDrift())
+        assert "in sync" in out
+        assert "prod" in out
+
+    def test_drift_lists_both_directions(self):
+        out = check.render_report("prod", check.IsTestDrift(leaked=[1, 2], hidden=[7]))
+        assert "DRIFT DETECTED" in out
+        assert "Test matches stored as real (2)" in out
+        assert "1, 2" in out
+        assert "Real matches stored as test (1)" in out
+
+    def test_long_lists_are_truncated(self):
+        out = check.render_report("prod", check.IsTestDrift(leaked=list(range(check.MAX_LISTED + 5))))
+        assert "(+5 more)" in out
+
+
+@pytest.mark.unit
+class TestMain:
+    def test_missing_db_url_is_a_config_error(self, monkeypatch):
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        assert check.main(["--env", "local"]) == 2
+
+    @pytest.mark.parametrize(("rows", "code"), [([], 0), ([(5, False, True)], 1)])
+    def test_exit_code(self, monkeypatch, rows, code):
+        monkeypatch.setattr(check, "fetch_drift_rows", lambda db_url: rows)
+        assert check.main(["--db-url", "postgresql://x"]) == code
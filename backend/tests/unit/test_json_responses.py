@@ -0,0 +1,72 @@
+"""Fast JSON responses: orjson rendering and sending cached payloads as bodies."""
+
+import gzip
+import json
+
+import pytest
+from starlette.requests import Request
+
+from dao import cache_codec
+from json_responses import FastJSONResponse, accepts_encoding, payload_response
+
+TEAMS = [{"id": i, "name": f"Team {i}"} for i in range(200)]
+
+
+def _request(accept_encoding: str | None = None) -> Request:
+    headers = [] if accept_encoding is None else [(b"accept-encoding", accept_encoding.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/api/teams", "headers": headers})
+
+
+@pytest.mark.unit
+class TestAcceptsEncoding:
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("gzip, deflate, br", True),
+            ("br;q=1.0, gzip;q=0.5", True),
+            ("gzip;q=0", False),
+            ("*", True),
+            ("*;q=0, gzip", True),
+            ("br", False),
+            (None, False),
+        ],
+    )
+    def test_gzip(self, header, expected):
+        assert accepts_encoding(_request(header), "gzip") is expected
+
+
+@pytest.mark.unit
+class TestPayloadResponse:
+    def test_compressed_payload_is_sent_as_is_when_accepted(self):
+        payload = cache_codec.encode_response(TEAMS)
+
+        response = payload_response(payload, _request("gzip"), {"ETag": '"abc"'})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == '"abc"'
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.body == payload[1:]
+        assert json.loads(gzip.decompress(response.body)) == TEAMS
+
+    def test_compressed_payload_is_decompressed_otherwise(self):
+        response = payload_response(cache_codec.encode_response(TEAMS), _request())
+
+        assert "content-encoding" not in response.headers
+        assert json.loads(response.body) == TEAMS
+
+    def test_zlib_dao_payloads_go_out_as_deflate(self):
+        response = payload_response(cache_codec.encode(TEAMS), _request("gzip, deflate"))
+
+        assert response.headers["content-encoding"] == "deflate"
+
+    def test_small_payload_is_plain_json(self):
+        response = payload_response(cache_codec.encode_response({"id": 1}), _request("gzip"))
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(response.body) == {"id": 1}
+
+
+@pytest.mark.unit
+def test_fast_json_response_matches_the_stdlib_output():
+    assert json.loads(FastJSONResponse(TEAMS).body) == TEAMS
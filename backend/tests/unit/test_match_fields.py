@@ -0,0 +1,90 @@
+"""
+Match Sparse Fieldset Tests - Testing Pure Functions
+
+A fields= request (dao/match_fields.py) must select only what its fields read
+and return exactly the values the full match flattener returns for them.
+
+Usage:
+    pytest tests/unit/test_match_fields.py -v
+"""
+
+import pytest
+
+from dao.match_dao import _flatten_match
+from dao.match_fields import (
+    MATCH_LIST_FIELDS,
+    flatten_match_fields,
+    match_list_select,
+    parse_match_fields,
+)
+
+ROW = {
+    "id": 7,
+    "match_date": "2026-03-01",
+    "scheduled_kickoff": "2026-03-01T15:00:00Z",
+    "home_team_id": 1,
+    "away_team_id": 2,
+    "home_score": 2,
+    "away_score": 1,
+    "season_id": 3,
+    "age_group_id": 4,
+    "match_type_id": 5,
+    "division_id": 6,
+    "match_status": "completed",
+    "created_by": None,
+    "updated_by": None,
+    "match_id": "ext-7",
+    "created_at": "2026-01-01T00:00:00Z",
+    "updated_at": "2026-01-02T00:00:00Z",
+    "home_team": {"id": 1, "name": "Team A", "club": {"id": 9, "name": "Club", "logo_url": "a.png"}},
+    "away_team": None,
+    "season": {"id": 3, "name": "2025-2026", "start_date": "2025-08-01"},
+    "age_group": {"id": 4, "name": "U14"},
+    "match_type": {"id": 5, "name": "League"},
+    "division": {"id": 6, "name": "Northeast", "league_id": 8, "leagues": {"id": 8, "name": "Homegrown"}},
+}
+
+
+class TestParseMatchFields:
+    def test_none_means_every_field(self):
+        assert parse_match_fields(None) is None
+
+    def test_id_is_always_included_once(self):
+        assert parse_match_fields("match_date, id,home_score,match_date") == ("id", "match_date", "home_score")
+
+    def test_card_fields_are_accepted(self):
+        assert parse_match_fields("red_cards") == ("id", "red_cards")
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError, match="password"):
+            parse_match_fields("match_date,password")
+
+
+class TestMatchListSelect:
+    def test_columns_only_skip_every_embed(self):
+        assert match_list_select(("id", "match_date", "home_score")) == "id, match_date, home_score"
+
+    def test_embed_uses_the_nested_form_only_when_needed(self):
+        names = match_list_select(("id", "home_team_name"))
+        clubs = match_list_select(("id", "home_team_name", "home_team_club"))
+
+        assert names == "id, home_team:teams!matches_home_team_id_fkey(id, name)"
+        assert clubs == "id, home_team:teams!matches_home_team_id_fkey(id, name, club:clubs(id, name, logo_url))"
+
+    def test_filtered_embed_is_an_inner_join(self):
+        select = match_list_select(("id",), extra_columns=("match_date",), inner=("match_type",))
+
+        assert select == "match_date, id, match_type:match_types!inner(id, name)"
+
+
+class TestFlattenMatchFields:
+    def test_every_field_matches_the_full_flattener(self):
+        full = _flatten_match(ROW)
+
+        assert flatten_match_fields(ROW, tuple(MATCH_LIST_FIELDS)) == full
+
+    def test_only_requested_fields(self):
+        assert flatten_match_fields(ROW, ("id", "away_team_name", "red_cards")) == {
+            "id": 7,
+            "away_team_name": "Unknown",
+        }
@@ -0,0 +1,101 @@
+"""
+Unit tests for POST /api/match-scraper/matches (add_or_update_scraped_match).
+
+Covers:
+- Existing external_match_id → match updated, no insert
+- New external_match_id → match inserted
+- The DAO calls, and check_match's scan of all matches, run off the event loop
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _match(**overrides):
+    match = {
+        "home_team_id": 1,
+        "away_team_id": 2,
+        "match_date": "2026-04-18",
+        "home_score": 2,
+        "away_score": 1,
+        "season_id": 3,
+        "age_group_id": 4,
+        "match_type_id": 5,
+        "division_id": 6,
+    }
+    match.update(overrides)
+    return MagicMock(**match, model_dump=MagicMock(return_value=match))
+
+
+@pytest.mark.unit
+class TestAddOrUpdateScrapedMatch:
+    """Update-or-insert by external_match_id."""
+
+    def test_existing_match_is_updated(self):
+        existing = {"id": 77, "external_match_id": "ext-1"}
+        with patch("app.match_type_dao") as mock_types, patch("app.match_dao") as mock_dao:
+            mock_types.get_match_type_by_id.return_value = {"name": "League"}
+            mock_dao.get_all_matches.return_value = [existing]
+            mock_dao.update_match.return_value = existing
+            from app import add_or_update_scraped_match
+
+            result = _run(
+                add_or_update_scraped_match(
+                    MagicMock(), _match(), external_match_id="ext-1", current_user={"user_id": "u1"}
+                )
+            )
+
+            assert result["action"] == "updated"
+            assert result["match_id"] == 77
+            mock_dao.update_match.assert_called_once()
+            mock_dao.add_match_with_external_id.assert_not_called()
+
+    def test_new_match_is_inserted(self):
+        with patch("app.match_type_dao") as mock_types, patch("app.match_dao") as mock_dao:
+            mock_types.get_match_type_by_id.return_value = {"name": "League"}
+            mock_dao.get_all_matches.return_value = []
+            mock_dao.add_match_with_external_id.return_value = True
+            from app import add_or_update_scraped_match
+
+            result = _run(
+                add_or_update_scraped_match(
+                    MagicMock(), _match(), external_match_id="ext-2", current_user={"user_id": "u1"}
+                )
+            )
+
+            assert result["action"] == "created"
+            mock_dao.add_match_with_external_id.assert_called_once()
+            assert mock_dao.add_match_with_external_id.call_args.kwargs["external_match_id"] == "ext-2"
+
+    def test_dao_calls_run_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        dao_threads = []
+
+        def record(result):
+            def call(*args, **kwargs):
+                dao_threads.append(threading.get_ident())
+                return result
+
+            return call
+
+        with patch("app.match_type_dao") as mock_types, patch("app.match_dao") as mock_dao:
+            mock_types.get_match_type_by_id.side_effect = record({"name": "League"})
+            mock_dao.get_all_matches.side_effect = record([])
+            mock_dao.add_match_with_external_id.side_effect = record(True)
+            from app import add_or_update_scraped_match
+
+            _run(
+                add_or_update_scraped_match(
+                    MagicMock(), _match(), external_match_id="ext-3", current_user={"user_id": "u1"}
+                )
+            )
+
+            assert len(dao_threads) == 4
+            assert loop_thread not in dao_threads
@@ -1,5 +1,6 @@
 """Unit tests for the agent match-summary endpoint."""
 
+from datetime import date
 from unittest.mock import MagicMock
 
 import pytest
@@ -20,6 +21,8 @@ class TestGetMatchSummary:
         dao = object.__new__(MatchDAO)
         dao.connection_holder = MagicMock()
         dao.client = MagicMock()
+        # RPC not deployed: exercises the Python fallback
+        dao.client.rpc.return_value.execute.side_effect = Exception("function get_match_summary does not exist")
         return dao
 
     def test_returns_empty_for_unknown_season(self):
@@ -208,6 +211,72 @@ class TestGetMatchSummary:
         assert groups["U16"]["needs_score"] == 2  # Both are past unscored matches
 
 
+@pytest.mark.unit
+class TestGetMatchSummaryRpc:
+    """MatchDAO.get_match_summary() aggregated by the get_match_summary RPC."""
+
+    RPC_ROW = {
+        "age_group": "U14",
+        "league": "Homegrown",
+        "division": "Northeast",
+        "total": 2,
+        "by_status": {"completed": 1, "scheduled": 1},
+        "needs_score": 0,
+        "needs_kickoff": 1,
+        "earliest": "2026-03-01",
+        "latest": "2026-03-15",
+        "last_played_date": "2026-03-01",
+    }
+
+    def _make_dao(self, rows):
+        from dao.match_dao import MatchDAO
+
+        dao = object.__new__(MatchDAO)
+        dao.connection_holder = MagicMock()
+        dao.client = MagicMock()
+        dao.client.rpc.return_value.execute.return_value = MagicMock(data=rows)
+        return dao
+
+    def test_rows_are_shaped_like_the_python_summary(self):
+        dao = self._make_dao([self.RPC_ROW])
+
+        result = dao.get_match_summary("2025-2026", score_from="2026-03-01", include_test=True, today=date(2026, 3, 10))
+
+        assert result == [
+            {
+                "age_group": "U14",
+                "league": "Homegrown",
+                "division": "Northeast",
+                "total": 2,
+                "by_status": {"completed": 1, "scheduled": 1},
+                "needs_score": 0,
+                "needs_kickoff": 1,
+                "date_range": {"earliest": "2026-03-01", "latest": "2026-03-15"},
+                "last_played_date": "2026-03-01",
+            }
+        ]
+        name, params = dao.client.rpc.call_args.args
+        assert name == "get_match_summary"
+        assert params["p_season_name"] == "2025-2026"
+        assert params["p_score_from"] == "2026-03-01"
+        assert params["p_include_test"] is True
+        assert params["p_today"] == "2026-03-10"
+        dao.client.table.assert_not_called()
+
+    def test_groups_are_sorted_like_the_python_summary(self):
+        dao = self._make_dao([{**self.RPC_ROW, "age_group": "U16"}, {**self.RPC_ROW, "division": "Mid-Atlantic"}])
+
+        result = dao.get_match_summary("2025-2026")
+
+        assert [(r["age_group"], r["division"]) for r in result] == [("U14", "Mid-Atlantic"), ("U16", "Northeast")]
+
+    def test_unknown_season_returns_no_groups(self):
+        dao = self._make_dao([])
+
+        assert dao.get_match_summary("9999-00") == []
+        dao.client.table.assert_not_called()
+
+
 @pytest.mark.unit
 class TestMatchSummaryEndpoint:
     """Tests for GET /api/agent/match-summary endpoint."""
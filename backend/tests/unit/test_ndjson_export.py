@@ -0,0 +1,77 @@
+"""NDJSON streaming of the bulk list endpoints (Accept: application/x-ndjson).
+
+GET /api/matches streams every matching match page by page instead of
+building the whole list in memory; errors before the first page are still
+ordinary HTTP errors.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+def _client():
+    from app import app
+    from auth import get_current_user_required
+
+    app.dependency_overrides[get_current_user_required] = lambda: {"user_id": "u1", "role": "team-fan"}
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestMatchesNdjson:
+    def teardown_method(self):
+        from app import app
+
+        app.dependency_overrides.clear()
+
+    def _get(self, match_dao, headers=NDJSON, params=None):
+        event_dao = MagicMock()
+        event_dao.get_card_events_for_matches.return_value = {}
+        with (
+            patch("app.match_dao", match_dao),
+            patch("app.async_match_dao", match_dao),
+            patch("app.match_event_dao", event_dao),
+        ):
+            return _client().get("/api/matches", headers=headers, params=params)
+
+    def test_streams_one_object_per_line(self):
+        match_dao = MagicMock()
+        match_dao.iter_match_pages.return_value = iter([[{"id": 3}, {"id": 2}], [{"id": 1}]])
+
+        response = self._get(match_dao, params={"limit": 1})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert [json.loads(line)["id"] for line in response.text.splitlines()] == [3, 2, 1]
+        assert response.text.endswith("\n")
+        match_dao.get_all_matches.assert_not_called()
+        match_dao.get_matches_page.assert_not_called()
+
+    def test_empty_result_is_an_empty_body(self):
+        match_dao = MagicMock()
+        match_dao.iter_match_pages.return_value = iter([])
+
+        response = self._get(match_dao)
+
+        assert response.status_code == 200
+        assert response.text == ""
+
+    def test_first_page_failure_is_an_http_error(self):
+        match_dao = MagicMock()
+        match_dao.iter_match_pages.side_effect = RuntimeError("connection refused")
+
+        assert self._get(match_dao).status_code == 503
+
+    def test_json_is_still_the_default(self):
+        match_dao = MagicMock()
+        match_dao.get_all_matches = AsyncMock(return_value=[{"id": 1}])
+
+        response = self._get(match_dao, headers={})
+
+        assert [m["id"] for m in response.json()] == [1]
+        match_dao.iter_match_pages.assert_not_called()
@@ -10,7 +10,7 @@ Same shape as SB-793: authorization built on one source of affiliation, which
 most real accounts do not have.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -60,7 +60,7 @@ class TestPlayerProfileAccess:
         with (
             patch("app.player_dao", player_dao),
             patch("app.team_dao", team_dao),
-            patch("app.match_dao", MagicMock()),
+            patch("app.async_match_dao", MagicMock(get_matches_by_team=AsyncMock(return_value=[]))),
         ):
             return _client(viewer).get(f"/api/players/{TARGET_ID}/profile")
 
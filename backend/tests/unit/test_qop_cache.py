@@ -12,7 +12,8 @@ Covers:
 """
 
 import asyncio
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -27,8 +28,8 @@ class TestGetQoPRankingsCache:
 
     def test_cache_hit_returns_cached_without_dao_call(self):
         cached_payload = {"has_data": True, "week_of": "2026-04-18", "rankings": []}
-        with patch("dao.base_dao.cache_get", return_value=cached_payload) as mock_get, \
-             patch("dao.base_dao.cache_set") as mock_set, \
+        with patch("dao.async_cache.async_cache_get", new_callable=AsyncMock, return_value=cached_payload) as mock_get, \
+             patch("dao.async_cache.async_cache_set", new_callable=AsyncMock) as mock_set, \
              patch("dao.qop_rankings_dao.QoPRankingsDAO.get_with_delta") as mock_dao:
             from app import get_qop_rankings
 
@@ -41,8 +42,8 @@ class TestGetQoPRankingsCache:
 
     def test_cache_miss_calls_dao_and_caches_result(self):
         dao_result = {"has_data": True, "week_of": "2026-04-18", "rankings": [{"rank": 1}]}
-        with patch("dao.base_dao.cache_get", return_value=None), \
-             patch("dao.base_dao.cache_set") as mock_set, \
+        with patch("dao.async_cache.async_cache_get", new_callable=AsyncMock, return_value=None), \
+             patch("dao.async_cache.async_cache_set", new_callable=AsyncMock) as mock_set, \
              patch("dao.qop_rankings_dao.QoPRankingsDAO.get_with_delta", return_value=dao_result) as mock_dao:
             from app import get_qop_rankings
 
@@ -52,10 +53,26 @@ class TestGetQoPRankingsCache:
             mock_dao.assert_called_once()
             mock_set.assert_called_once_with("mt:dao:qop:10:20", dao_result, ttl=3600)
 
+    def test_dao_runs_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        dao_threads = []
+
+        def get_with_delta(*args):
+            dao_threads.append(threading.get_ident())
+            return {"has_data": False, "week_of": None, "rankings": []}
+
+        with patch("dao.async_cache.async_cache_get", new_callable=AsyncMock, return_value=None), \
+             patch("dao.qop_rankings_dao.QoPRankingsDAO.get_with_delta", side_effect=get_with_delta):
+            from app import get_qop_rankings
+
+            _run(get_qop_rankings(division_id=10, age_group_id=20, snapshot_id=None))
+
+            assert dao_threads and dao_threads[0] != loop_thread
+
     def test_cache_miss_with_no_data_does_not_cache(self):
         dao_result = {"has_data": False, "week_of": None, "rankings": []}
-        with patch("dao.base_dao.cache_get", return_value=None), \
-             patch("dao.base_dao.cache_set") as mock_set, \
+        with patch("dao.async_cache.async_cache_get", new_callable=AsyncMock, return_value=None), \
+             patch("dao.async_cache.async_cache_set", new_callable=AsyncMock) as mock_set, \
              patch("dao.qop_rankings_dao.QoPRankingsDAO.get_with_delta", return_value=dao_result):
             from app import get_qop_rankings
 
@@ -66,7 +83,7 @@ class TestGetQoPRankingsCache:
 
     def test_explicit_snapshot_id_in_cache_key(self):
         cached_payload = {"has_data": True, "rankings": []}
-        with patch("dao.base_dao.cache_get", return_value=cached_payload) as mock_get, \
+        with patch("dao.async_cache.async_cache_get", new_callable=AsyncMock, return_value=cached_payload) as mock_get, \
              patch("dao.qop_rankings_dao.QoPRankingsDAO.get_with_delta"):
             from app import get_qop_rankings
 
@@ -93,7 +110,7 @@ class TestIngestQoPRankingsInvalidation:
         )
 
     def test_inserted_triggers_cache_clear(self):
-        with patch("dao.base_dao.clear_cache") as mock_clear, \
+        with patch("dao.async_cache.async_clear_cache", new_callable=AsyncMock) as mock_clear, \
              patch(
                  "dao.qop_rankings_dao.QoPRankingsDAO.record_snapshot",
                  return_value={"status": "inserted", "snapshot_id": 99, "rankings_count": 5},
@@ -105,7 +122,7 @@ class TestIngestQoPRankingsInvalidation:
             mock_clear.assert_called_once_with("mt:dao:qop:*")
 
     def test_unchanged_skips_cache_clear(self):
-        with patch("dao.base_dao.clear_cache") as mock_clear, \
+        with patch("dao.async_cache.async_clear_cache", new_callable=AsyncMock) as mock_clear, \
              patch(
                  "dao.qop_rankings_dao.QoPRankingsDAO.record_snapshot",
                  return_value={"status": "unchanged", "snapshot_id": 99, "rankings_count": 0},
@@ -38,6 +38,7 @@ def _make_chain(response_data: list[dict]):
     chain.order.return_value = chain
     chain.ilike.return_value = chain
     chain.limit.return_value = chain
+    chain.range.return_value = chain
     chain.execute.return_value = mock_resp
     return chain
 
@@ -0,0 +1,130 @@
+"""HTTP response cache middleware (middleware/response_cache.py).
+
+Runs a small FastAPI app behind the middleware with a dict standing in for
+Redis: entries are keyed by path, query and audience, and are served only
+while the data versions they were built from are current.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from middleware import response_cache
+from middleware.response_cache import CachedRoute, ResponseCacheMiddleware
+
+
+class _FakeStore:
+    def __init__(self):
+        self.entries: dict[str, bytes] = {}
+        self.versions = {"*": 1, "matches": 1}
+        self.reads = 0
+
+    async def get_versioned_payload(self, key, families):
+        self.reads += 1
+        return dict(self.versions), self.entries.get(key)
+
+    async def cache_set_payload(self, key, payload, ttl, pattern=None, local=True):
+        self.entries[key] = payload
+        return True
+
+
+@pytest.fixture
+def store():
+    fake = _FakeStore()
+    with (
+        patch.object(response_cache, "async_get_versioned_payload", fake.get_versioned_payload),
+        patch.object(response_cache, "async_cache_set_payload", fake.cache_set_payload),
+    ):
+        yield fake
+
+
+def _client(calls: list):
+    app = FastAPI()
+
+    @app.get("/api/table")
+    def table(season_id: int = 1):
+        calls.append(season_id)
+        return {"season_id": season_id, "standings": [{"team": f"T{i}"} for i in range(100)]}
+
+    @app.get("/api/other")
+    def other():
+        calls.append("other")
+        return {}
+
+    def audience(request, public):
+        token = request.headers.get("authorization")
+        return {"Bearer admin": "test", "Bearer fan": "real"}.get(token, "real" if public else None)
+
+    app.add_middleware(ResponseCacheMiddleware, routes=[CachedRoute(r"/api/table", ("matches",))], audience=audience)
+    return TestClient(app)
+
+
+AUTH = {"Authorization": "Bearer fan"}
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    def test_second_request_is_served_without_entering_the_route(self, store):
+        calls = []
+        client = _client(calls)
+
+        first = client.get("/api/table", headers=AUTH)
+        second = client.get("/api/table", headers=AUTH)
+
+        assert calls == [1]
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert store.reads == 2
+
+    def test_entries_are_partitioned_by_query_and_audience(self, store):
+        calls = []
+        client = _client(calls)
+
+        client.get("/api/table", headers=AUTH)
+        client.get("/api/table", params={"season_id": 2}, headers=AUTH)
+        client.get("/api/table", headers={"Authorization": "Bearer admin"})
+
+        assert calls == [1, 2, 1]
+
+    def test_a_version_bump_retires_the_entry(self, store):
+        calls = []
+        client = _client(calls)
+
+        client.get("/api/table", headers=AUTH)
+        store.versions["matches"] = 2
+        client.get("/api/table", headers=AUTH)
+
+        assert calls == [1, 1]
+
+    def test_unknown_viewers_and_other_routes_go_to_the_route(self, store):
+        calls = []
+        client = _client(calls)
+
+        client.get("/api/table")
+        client.get("/api/table")
+        client.get("/api/other", headers=AUTH)
+
+        assert calls == [1, 1, "other"]
+        assert store.reads == 0
+
+    def test_compressed_entries_honour_accept_encoding(self, store):
+        client = _client([])
+        client.get("/api/table", headers=AUTH)
+
+        gzipped = client.get("/api/table", headers={**AUTH, "Accept-Encoding": "gzip"})
+        plain = client.get("/api/table", headers={**AUTH, "Accept-Encoding": "identity"})
+
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers
+        assert plain.json() == gzipped.json()
+
+    def test_no_redis_passes_through(self):
+        calls = []
+        with patch.object(response_cache, "async_get_versioned_payload", AsyncMock(return_value=None)):
+            client = _client(calls)
+            client.get("/api/table", headers=AUTH)
+            client.get("/api/table", headers=AUTH)
+
+        assert calls == [1, 1]
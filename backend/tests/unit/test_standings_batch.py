@@ -0,0 +1,123 @@
+"""
+Batch Standings Tests
+
+calculate_partition_standings() (dao/standings_batch.py) computes every
+(age group, division, match type) table of a season at once. Each table must
+equal what get_league_table() computes for the same filters.
+
+Usage:
+    pytest tests/unit/test_standings_batch.py -v
+"""
+
+from unittest.mock import MagicMock
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from dao.match_dao import MatchDAO
+from dao.standings import (
+    calculate_standings_with_extras,
+    filter_by_match_type,
+    filter_completed_matches,
+    filter_same_division_matches,
+)
+from dao.standings_batch import calculate_partition_standings
+
+TEAMS = ["Team A", "Team B", "Team C", "Team D"]
+
+
+@st.composite
+def match(draw):
+    division_id = draw(st.sampled_from([1, 2, None]))
+    home = draw(st.sampled_from(TEAMS))
+    away = draw(st.sampled_from([t for t in TEAMS if t != home]))
+
+    def side(name):
+        return {
+            "name": name,
+            "id": draw(st.one_of(st.none(), st.integers(1, 3))),
+            # Mostly in the match's division, sometimes a cross-division opponent
+            "division_id": draw(st.sampled_from([division_id, division_id, 3])),
+            "club": draw(
+                st.one_of(
+                    st.none(),
+                    st.fixed_dictionaries(
+                        {
+                            "id": st.one_of(st.none(), st.integers(1, 3)),
+                            "logo_url": st.sampled_from([None, "", "a.png", "b.png"]),
+                        }
+                    ),
+                )
+            ),
+        }
+
+    return {
+        "age_group_id": draw(st.sampled_from([1, 2])),
+        "division_id": division_id,
+        "home_team": side(home),
+        "away_team": side(away),
+        "match_type": {"name": draw(st.sampled_from(["League", "Friendly"]))},
+        "home_score": draw(st.one_of(st.none(), st.integers(0, 3))),
+        "away_score": draw(st.one_of(st.none(), st.integers(0, 3))),
+        "match_status": draw(st.sampled_from(["completed", "forfeit", "scheduled"])),
+        "match_date": draw(st.sampled_from(["2026-03-01", "2026-03-08", "2026-03-15"])),
+    }
+
+
+def _league_table(matches, age_group_id, division_id, match_type):
+    """get_league_table()'s filtering and calculation for one partition."""
+    scoped = [m for m in matches if m["age_group_id"] == age_group_id and m["division_id"] == division_id]
+    scoped = filter_same_division_matches(filter_by_match_type(scoped, match_type), division_id)
+    return calculate_standings_with_extras(filter_completed_matches(scoped))
+
+
+class TestPartitionStandings:
+    @settings(max_examples=200, deadline=None)
+    @given(st.lists(match(), max_size=30))
+    def test_every_partition_matches_get_league_table(self, matches):
+        tables = calculate_partition_standings(matches)
+
+        partitions = {
+            (m["age_group_id"], m["division_id"], m["match_type"]["name"]) for m in matches if m["division_id"]
+        }
+        for key in partitions:
+            assert tables.get(key, []) == _league_table(matches, *key)
+        assert set(tables) <= partitions
+
+    def test_no_matches(self):
+        assert calculate_partition_standings([]) == {}
+
+
+class TestGetSeasonStandings:
+    def test_season_is_paged_in_and_split_into_tables(self):
+        rows = [
+            {
+                "id": i,
+                "age_group_id": 1,
+                "division_id": 1 + i % 2,
+                "home_team": {"name": f"Team {i % 4}", "division_id": 1 + i % 2},
+                "away_team": {"name": f"Team {(i + 1) % 4}", "division_id": 1 + i % 2},
+                "match_type": {"name": "League"},
+                "home_score": 1,
+                "away_score": 0,
+                "match_status": "completed",
+                "match_date": "2026-03-01",
+            }
+            for i in range(1001)
+        ]
+        client = MagicMock()
+        query = client.table.return_value.select.return_value
+        query.eq.return_value = query
+        query.order.return_value = query
+        query.range.return_value.execute.side_effect = [MagicMock(data=rows[:1000]), MagicMock(data=rows[1000:])]
+        dao = MatchDAO.__new__(MatchDAO)
+        dao.client = client
+
+        tables = MatchDAO.get_season_standings.__wrapped__(dao, 7)
+
+        assert query.range.call_count == 2
+        assert [(t["age_group_id"], t["division_id"], t["match_type"]) for t in tables] == [
+            (1, 1, "League"),
+            (1, 2, "League"),
+        ]
+        assert sum(row["played"] for t in tables for row in t["standings"]) == 2 * 1001
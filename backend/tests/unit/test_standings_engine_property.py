@@ -0,0 +1,120 @@
+"""
+Standings Engine Property Tests
+
+compute_standings_table() must give exactly what the separate passes give:
+calculate_standings() enriched with get_team_form() and
+calculate_position_movement(), including the order of tied teams and which
+match supplies each team's identity fields. Each match-day checkpoint from
+compute_standings_checkpoints() must equal compute_standings_table() over the
+matches played up to that date.
+
+Usage:
+    pytest tests/unit/test_standings_engine_property.py -v
+"""
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from dao.standings import (
+    calculate_position_movement,
+    calculate_standings,
+    calculate_standings_with_extras,
+    compute_standings_checkpoints,
+    compute_standings_table,
+    get_team_form,
+    standings_as_of,
+)
+
+TEAMS = ["Team A", "Team B", "Team C", "Team D", "Team E"]
+DATES = ["2026-03-01", "2026-03-08", "2026-03-15", "2026-03-22"]
+
+
+@st.composite
+def team_side(draw):
+    club = draw(
+        st.one_of(
+            st.none(),
+            st.fixed_dictionaries(
+                {
+                    "id": st.one_of(st.none(), st.integers(1, 3)),
+                    "logo_url": st.sampled_from([None, "", "a.png", "b.png"]),
+                }
+            ),
+        )
+    )
+    return {"name": draw(st.sampled_from(TEAMS)), "id": draw(st.one_of(st.none(), st.integers(1, 9))), "club": club}
+
+
+@st.composite
+def match(draw):
+    home = draw(team_side())
+    away = draw(team_side().filter(lambda t: t["name"] != home["name"]))
+    return {
+        "home_team": home,
+        "away_team": away,
+        "home_score": draw(st.one_of(st.none(), st.integers(0, 4))),
+        "away_score": draw(st.one_of(st.none(), st.integers(0, 4))),
+        "match_date": draw(st.sampled_from(DATES)),
+    }
+
+
+def _reference(matches: list[dict]) -> list[dict]:
+    """The pre-engine implementation: three separate calculations."""
+    table = calculate_standings(matches)
+    form = get_team_form(matches)
+    movement = calculate_position_movement(matches)
+    for row in table:
+        row["form"] = form.get(row["team"], [])
+        row["position_change"] = movement.get(row["team"], 0)
+    return table
+
+
+class TestStandingsEngine:
+    @settings(max_examples=200, deadline=None)
+    @given(st.lists(match(), max_size=25))
+    def test_matches_the_separate_calculations(self, matches):
+        assert compute_standings_table(matches) == _reference(matches)
+
+    def test_extras_wrapper_uses_the_engine(self):
+        matches = [
+            {
+                "home_team": {"name": "Team A", "id": 1},
+                "away_team": {"name": "Team B", "id": 2},
+                "home_score": 1,
+                "away_score": 0,
+                "match_date": "2026-03-01",
+            }
+        ]
+        assert calculate_standings_with_extras(matches) == compute_standings_table(matches)
+
+    @pytest.mark.parametrize("last_n", [1, 3])
+    def test_form_length(self, last_n):
+        matches = [
+            {
+                "home_team": {"name": "Team A"},
+                "away_team": {"name": "Team B"},
+                "home_score": i % 3,
+                "away_score": 1,
+                "match_date": f"2026-03-0{i + 1}",
+            }
+            for i in range(5)
+        ]
+        table = compute_standings_table(matches, last_n=last_n)
+        assert all(len(row["form"]) == last_n for row in table)
+
+
+class TestStandingsCheckpoints:
+    @settings(max_examples=200, deadline=None)
+    @given(st.lists(match(), max_size=25))
+    def test_every_date_matches_a_from_scratch_table(self, matches):
+        checkpoints = compute_standings_checkpoints(matches)
+
+        assert [d for d, _ in checkpoints] == sorted({m["match_date"] for m in matches if m["home_score"] is not None})
+        for as_of in ["2026-02-28", *DATES, "2026-03-10"]:
+            played = [m for m in matches if m["match_date"] <= as_of]
+            assert standings_as_of(checkpoints, as_of) == compute_standings_table(played)
+
+    def test_no_matches(self):
+        assert compute_standings_checkpoints([]) == []
+        assert standings_as_of([], "2026-03-01") == []
@@ -0,0 +1,118 @@
+"""ThreadpoolRoute: async def endpoints that never await run in the threadpool.
+
+Uses a small app of its own, so no DAO or Redis is involved.
+"""
+
+import threading
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Query
+from fastapi.testclient import TestClient
+
+from threadpool_route import ThreadpoolRoute, in_threadpool, never_awaits
+
+
+async def _loop_thread() -> int:
+    """Async dependencies run on the event loop."""
+    return threading.get_ident()
+
+
+def _app():
+    app = FastAPI()
+    app.router.route_class = ThreadpoolRoute
+
+    @app.get("/blocking")
+    async def blocking(team_id: int = Query(...), loop_thread: int = Depends(_loop_thread)):
+        """Only sync work, like a route on the sync DAOs."""
+        return {"team_id": team_id, "on_loop": threading.get_ident() == loop_thread}
+
+    @app.get("/awaiting")
+    async def awaiting(loop_thread: int = Depends(_loop_thread)):
+        await _noop()
+        return {"on_loop": threading.get_ident() == loop_thread}
+
+    # Included routers keep their own route class, not the app's
+    router = APIRouter(prefix="/api/invites", route_class=ThreadpoolRoute)
+
+    @router.get("/blocking")
+    async def router_blocking(loop_thread: int = Depends(_loop_thread)):
+        return {"on_loop": threading.get_ident() == loop_thread}
+
+    app.include_router(router)
+    return app
+
+
+async def _noop():
+    return None
+
+
+@pytest.mark.unit
+class TestThreadpoolRoute:
+    def test_awaitless_endpoint_runs_off_the_event_loop(self):
+        client = TestClient(_app())
+
+        assert client.get("/awaiting").json() == {"on_loop": True}
+        assert client.get("/blocking", params={"team_id": 3}).json() == {"team_id": 3, "on_loop": False}
+
+    def test_included_router_endpoint_runs_off_the_event_loop(self):
+        client = TestClient(_app())
+
+        assert client.get("/api/invites/blocking").json() == {"on_loop": False}
+
+    def test_api_routers_use_threadpool_route(self):
+        from api import (
+            admin_attention,
+            admin_emails,
+            channel_requests,
+            club_notifications,
+            invite_requests,
+            invites,
+            push,
+            webhooks_email,
+        )
+
+        for module in (
+            admin_attention,
+            admin_emails,
+            channel_requests,
+            club_notifications,
+            invite_requests,
+            invites,
+            push,
+            webhooks_email,
+        ):
+            assert module.router.route_class is ThreadpoolRoute, module.__name__
+            assert all(isinstance(route, ThreadpoolRoute) for route in module.router.routes), module.__name__
+
+    def test_signature_and_docs_are_kept(self):
+        operation = _app().openapi()["paths"]["/blocking"]["get"]
+
+        assert operation["operationId"].startswith("blocking")
+        assert operation["description"] == "Only sync work, like a route on the sync DAOs."
+        assert [p["name"] for p in operation["parameters"]] == ["team_id"]
+
+    def test_string_annotations_resolve_in_the_endpoint_module(self):
+        from api.admin_emails import StatusUpdateRequest, patch_status
+
+        signature = in_threadpool(patch_status).__signature__
+
+        assert signature.parameters["request"].annotation is StatusUpdateRequest
+
+    def test_never_awaits(self):
+        async def plain():
+            return [i * 2 for i in range(3)]
+
+        async def streaming(items):
+            return [i async for i in items]
+
+        def sync():
+            return None
+
+        assert never_awaits(plain)
+        assert not never_awaits(_noop_caller)
+        assert not never_awaits(streaming)
+        assert not never_awaits(sync)
+
+
+async def _noop_caller():
+    await _noop()
@@ -0,0 +1,57 @@
+"""
+Threadpool offload for ``async def`` routes that never await.
+
+Most routes in app.py are ``async def`` but only call sync DAOs, so FastAPI
+runs them on the event loop and every PostgREST round trip blocks it. With
+ThreadpoolRoute as the router's route class, such an endpoint is detected
+when the route is added (its code has no await, async for or async with)
+and is run to completion in FastAPI's threadpool, as a ``def`` endpoint
+would be. Endpoints that do await - those on the async DAOs of
+dao/async_base_dao.py - stay on the event loop.
+
+    app.router.route_class = ThreadpoolRoute
+"""
+
+import dis
+import inspect
+
+from fastapi.routing import APIRoute
+
+# Opcodes of await, async for and async with
+_AWAIT_OPCODES = frozenset({"GET_AWAITABLE", "GET_AITER", "GET_ANEXT", "BEFORE_ASYNC_WITH", "END_ASYNC_FOR", "SEND"})
+
+
+def never_awaits(endpoint) -> bool:
+    """Whether endpoint is an ``async def`` function whose own body contains no await."""
+    if not inspect.iscoroutinefunction(endpoint) or not hasattr(endpoint, "__code__"):
+        return False
+    return not any(instruction.opname in _AWAIT_OPCODES for instruction in dis.get_instructions(endpoint))
+
+
+def in_threadpool(endpoint):
+    """Sync version of an awaitless ``async def`` endpoint, which FastAPI runs in its threadpool."""
+
+    def run(*args, **kwargs):
+        coroutine = endpoint(*args, **kwargs)
+        try:
+            coroutine.send(None)
+        except StopIteration as done:
+            return done.value
+        coroutine.close()
+        raise RuntimeError(f"{endpoint.__qualname__} awaited in the threadpool")
+
+    # Not functools.wraps: FastAPI unwraps __wrapped__ to decide whether to await
+    for name in ("__module__", "__name__", "__qualname__", "__doc__"):
+        setattr(run, name, getattr(endpoint, name))
+    # Resolved here: FastAPI would look string annotations up in this module's globals
+    run.__signature__ = inspect.signature(endpoint, eval_str=True)
+    return run
+
+
+class ThreadpoolRoute(APIRoute):
+    """APIRoute that runs awaitless ``async def`` endpoints in the threadpool (see module docstring)."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if never_awaits(endpoint):
+            endpoint = in_threadpool(endpoint)
+        super().__init__(path, endpoint, **kwargs)
@@ -765,9 +765,11 @@ export const useAuthStore = () => {
       defaultHeaders.Authorization = `Bearer ${token}`;
     }
 
+    // 'no-cache' keeps bodies but revalidates every call: endpoints with an
+    // ETag answer an unchanged poll with an empty 304.
     const response = await fetchWithTimeout(endpoint, {
       ...options,
-      cache: 'no-store',
+      cache: 'no-cache',
       headers: {
         ...defaultHeaders,
         ...options.headers,
@@ -786,7 +788,7 @@ export const useAuthStore = () => {
           defaultHeaders.Authorization = `Bearer ${retryToken}`;
           const retryResponse = await fetchWithTimeout(endpoint, {
             ...options,
-            cache: 'no-store',
+            cache: 'no-cache',
             headers: {
               ...defaultHeaders,
               ...options.headers,
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+matches.is_test drift check (SB-591).
+
+matches.is_test is a denormalised copy of the SB-591 derivation, kept current
+by triggers on matches, teams, clubs, divisions, leagues and tournaments
+(supabase/migrations/20261016100000_matches_is_test_column.sql). A missed
+trigger path would silently show test fixtures to real users — or hide real
+ones — so this job diffs the column against the reference derivation
+(`matches_is_test_drift()`, over the `matches_is_test_derived` view).
+
+Same split as check_migration_drift.py, so the report logic stays pure and
+unit-testable with no DB:
+  - summarize_drift() / render_report()   → pure, no IO
+  - fetch_drift_rows()                    → the only DB touch
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/check_is_test_drift.py --env prod
+
+Exits 0 when the column matches, 1 on any drift, 2 on misconfiguration.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from dataclasses import dataclass, field
+
+# Match ids listed per direction in the report; the rest are counted
+MAX_LISTED = 20
+
+
+@dataclass
+class IsTestDrift:
+    """Matches whose stored is_test disagrees with the derivation."""
+
+    leaked: list[int] = field(default_factory=list)  # derived test, stored real: shown to real users
+    hidden: list[int] = field(default_factory=list)  # derived real, stored test: hidden from real users
+
+    @property
+    def in_sync(self) -> bool:
+        return not self.leaked and not self.hidden
+
+
+def summarize_drift(rows: list[tuple[int, bool, bool]]) -> IsTestDrift:
+    """Split (match_id, stored, derived) rows by which way the flag is wrong."""
+    drift = IsTestDrift()
+    for match_id, stored, derived in sorted(rows):
+        if stored == derived:
+            continue
+        (drift.leaked if derived else drift.hidden).append(match_id)
+    return drift
+
+
+def fetch_drift_rows(db_url: str) -> list[tuple[int, bool, bool]]:
+    """Read the mismatching matches from matches_is_test_drift()."""
+    import psycopg2  # imported lazily so the pure logic stays import-light
+
+    conn = psycopg2.connect(db_url)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT match_id, stored, derived FROM public.matches_is_test_drift()")
+            return [tuple(row) for row in cur.fetchall()]
+    finally:
+        conn.close()
+
+
+def _ids(match_ids: list[int]) -> str:
+    listed = ", ".join(str(i) for i in match_ids[:MAX_LISTED])
+    more = len(match_ids) - MAX_LISTED
+    return f"{listed} (+{more} more)" if more > 0 else listed
+
+
+def render_report(env: str, drift: IsTestDrift) -> str:
+    """Human-readable summary for CI logs."""
+    lines = [f"matches.is_test drift check — env: {env}"]
+    if drift.in_sync:
+        lines.append("✓ in sync — matches.is_test equals the SB-591 derivation for every match")
+        return "\n".join(lines)
+
+    lines.append("✗ DRIFT DETECTED — a trigger path is missing or broken")
+    if drift.leaked:
+        lines.append("")
+        lines.append(f"  Test matches stored as real ({len(drift.leaked)}) — visible to real users:")
+        lines.append(f"    {_ids(drift.leaked)}")
+    if drift.hidden:
+        lines.append("")
+        lines.append(f"  Real matches stored as test ({len(drift.hidden)}) — hidden from real users:")
+        lines.append(f"    {_ids(drift.hidden)}")
+    lines.append("")
+    lines.append("  Repair: UPDATE public.matches SET is_test = is_test WHERE id IN (...)  (the trigger re-derives)")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="matches.is_test drift check (SB-591)")
+    parser.add_argument(
+        "--env",
+        default=os.getenv("APP_ENV", "local"),
+        help="Environment label for the report (local/prod). Default: $APP_ENV or local.",
+    )
+    parser.add_argument(
+        "--db-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Postgres connection string. Default: $DATABASE_URL.",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.db_url:
+        print("error: no database URL (set DATABASE_URL or pass --db-url)", file=sys.stderr)
+        return 2
+
+    drift = summarize_drift(fetch_drift_rows(args.db_url))
+    print(render_report(args.env, drift))
+    return 0 if drift.in_sync else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+-- Precomputed league standings (league_standings)
+--
+-- Every league table read that misses the cache pulls every match of the
+-- (season, age group, division) through matches_with_test, with the joined
+-- teams and clubs, and recomputes the table in Python (dao/standings.py). The
+-- table barely changes between reads — only a score or status change moves it —
+-- so keep it here instead: one row per team per (season, age group, division,
+-- match type), recomputed whenever a match in that scope changes. A table read
+-- is then a single primary-key range scan.
+--
+-- Test partition (SB-591). A test match must not move a real team's points, so
+-- each scope is aggregated twice, keyed by include_test:
+--
+--   * include_test = false   real matches only (what non-test viewers see)
+--   * include_test = true    real and test matches (the admin/test audience)
+--
+-- is_test still comes from matches_with_test at refresh time, so there is no
+-- second copy of the derivation rule. What the triggers below must do instead is
+-- refresh the affected scopes when any input of that rule changes: the match
+-- itself, a team's club/league/division, or the is_test flag of a club, league
+-- or tournament.
+--
+-- Scope-level recompute rather than +/- deltas: a scope is a few hundred matches
+-- at most, the recompute is one aggregate over an indexed range, and it cannot
+-- drift the way applied deltas can.
+--
+-- Row semantics mirror calculate_standings_with_extras():
+--
+--   * counted matches: match_status completed/forfeit (or, for legacy rows with
+--     no status, match_date <= today), both scores set, and both teams
+--     currently in the scope's division (filter_same_division_matches)
+--   * points 3/1/0; ranked by points, goal difference, goals scored, then first
+--     appearance (match id order, home before away)
+--   * form: the last five results, oldest first
+--   * position_change: rank before the latest match day minus rank now; 0 when
+--     the scope has fewer than two match days or the team had not yet played
+
+CREATE TABLE IF NOT EXISTS public.league_standings (
+    season_id        integer NOT NULL,
+    age_group_id     integer NOT NULL,
+    division_id      integer NOT NULL,
+    match_type_id    integer NOT NULL REFERENCES public.match_types(id) ON DELETE CASCADE,
+    include_test     boolean NOT NULL,
+    team_id          integer NOT NULL REFERENCES public.teams(id) ON DELETE CASCADE,
+    position         integer NOT NULL,
+    played           integer NOT NULL,
+    wins             integer NOT NULL,
+    draws            integer NOT NULL,
+    losses           integer NOT NULL,
+    goals_for        integer NOT NULL,
+    goals_against    integer NOT NULL,
+    goal_difference  integer NOT NULL,
+    points           integer NOT NULL,
+    form             text[]  NOT NULL DEFAULT '{}',
+    position_change  integer NOT NULL DEFAULT 0,
+    updated_at       timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (season_id, age_group_id, division_id, match_type_id, include_test, team_id)
+);
+
+COMMENT ON TABLE public.league_standings IS
+    'Precomputed league tables, one row per team per (season, age group, division, match type, '
+    'include_test audience). Maintained by refresh_league_standings() from triggers on matches, '
+    'teams, divisions, clubs, leagues and tournaments. Read by MatchDAO.get_league_table().';
+
+-- The primary key already serves the read: the first five columns are the
+-- equality filters of a table lookup.
+
+-- RLS on, read-only for clients: standings are public, and the same rows are
+-- what /api/table serves. Writes only happen in the SECURITY DEFINER refresh.
+ALTER TABLE public.league_standings ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY league_standings_public_read ON public.league_standings
+    FOR SELECT USING (NOT include_test);
+
+GRANT SELECT ON public.league_standings TO anon, authenticated, service_role;
+
+
+-- Recompute one (season, age group, division) scope: every match type, both
+-- audiences. Idempotent, so triggers may call it for a scope more than once.
+CREATE OR REPLACE FUNCTION public.refresh_league_standings(
+    p_season_id integer,
+    p_age_group_id integer,
+    p_division_id integer
+)
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+BEGIN
+    IF p_season_id IS NULL OR p_age_group_id IS NULL OR p_division_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    DELETE FROM public.league_standings
+    WHERE season_id = p_season_id
+      AND age_group_id = p_age_group_id
+      AND division_id = p_division_id;
+
+    INSERT INTO public.league_standings (
+        season_id, age_group_id, division_id, match_type_id, include_test, team_id,
+        position, played, wins, draws, losses, goals_for, goals_against,
+        goal_difference, points, form, position_change
+    )
+    WITH counted AS (
+        SELECT m.id, m.match_type_id, m.match_date, m.is_test,
+               m.home_team_id, m.away_team_id, m.home_score, m.away_score
+        FROM public.matches_with_test m
+        JOIN public.teams ht ON ht.id = m.home_team_id
+        JOIN public.teams at ON at.id = m.away_team_id
+        WHERE m.season_id = p_season_id
+          AND m.age_group_id = p_age_group_id
+          AND m.division_id = p_division_id
+          AND ht.division_id = p_division_id
+          AND at.division_id = p_division_id
+          AND m.home_score IS NOT NULL
+          AND m.away_score IS NOT NULL
+          AND (m.match_status IN ('completed', 'forfeit')
+               OR (m.match_status IS NULL AND m.match_date <= CURRENT_DATE))
+    ),
+    audiences(include_test) AS (
+        VALUES (false), (true)
+    ),
+    -- One row per team per counted match per audience
+    results AS (
+        SELECT a.include_test, c.match_type_id, c.match_date, c.home_team_id AS team_id,
+               c.home_score AS gf, c.away_score AS ga, 2 * c.id::bigint AS appearance
+        FROM counted c
+        JOIN audiences a ON a.include_test OR NOT c.is_test
+        UNION ALL
+        SELECT a.include_test, c.match_type_id, c.match_date, c.away_team_id,
+               c.away_score, c.home_score, 2 * c.id::bigint + 1
+        FROM counted c
+        JOIN audiences a ON a.include_test OR NOT c.is_test
+    ),
+    match_days AS (
+        SELECT include_test, match_type_id,
+               max(match_date) AS latest_date,
+               count(DISTINCT match_date) AS days
+        FROM results
+        GROUP BY include_test, match_type_id
+    ),
+    totals AS (
+        SELECT r.include_test, r.match_type_id, r.team_id, d.days,
+               count(*)::integer AS played,
+               count(*) FILTER (WHERE r.gf > r.ga)::integer AS wins,
+               count(*) FILTER (WHERE r.gf = r.ga)::integer AS draws,
+               count(*) FILTER (WHERE r.gf < r.ga)::integer AS losses,
+               sum(r.gf)::integer AS goals_for,
+               sum(r.ga)::integer AS goals_against,
+               min(r.appearance) AS first_appearance,
+               array_agg(CASE WHEN r.gf > r.ga THEN 'W' WHEN r.gf < r.ga THEN 'L' ELSE 'D' END
+                         ORDER BY r.match_date, r.appearance) AS results,
+               -- The same record before the latest match day, for movement
+               count(*) FILTER (WHERE r.match_date < d.latest_date) AS prev_played,
+               coalesce(sum(CASE WHEN r.gf > r.ga THEN 3 WHEN r.gf = r.ga THEN 1 ELSE 0 END)
+                        FILTER (WHERE r.match_date < d.latest_date), 0) AS prev_points,
+               coalesce(sum(r.gf - r.ga) FILTER (WHERE r.match_date < d.latest_date), 0) AS prev_gd,
+               coalesce(sum(r.gf) FILTER (WHERE r.match_date < d.latest_date), 0) AS prev_gf,
+               min(r.appearance) FILTER (WHERE r.match_date < d.latest_date) AS prev_first
+        FROM results r
+        JOIN match_days d USING (include_test, match_type_id)
+        GROUP BY r.include_test, r.match_type_id, r.team_id, d.days
+    ),
+    ranked AS (
+        SELECT t.*,
+               3 * t.wins + t.draws AS points,
+               row_number() OVER (
+                   PARTITION BY t.include_test, t.match_type_id
+                   ORDER BY 3 * t.wins + t.draws DESC, t.goals_for - t.goals_against DESC,
+                            t.goals_for DESC, t.first_appearance
+               )::integer AS position,
+               row_number() OVER (
+                   PARTITION BY t.include_test, t.match_type_id, t.prev_played > 0
+                   ORDER BY t.prev_points DESC, t.prev_gd DESC, t.prev_gf DESC, t.prev_first
+               )::integer AS prev_position
+        FROM totals t
+    )
+    SELECT p_season_id, p_age_group_id, p_division_id, r.match_type_id, r.include_test, r.team_id,
+           r.position, r.played, r.wins, r.draws, r.losses, r.goals_for, r.goals_against,
+           r.goals_for - r.goals_against, r.points,
+           r.results[greatest(r.played - 4, 1):],
+           CASE WHEN r.days >= 2 AND r.prev_played > 0 THEN r.prev_position - r.position ELSE 0 END
+    FROM ranked r;
+END;
+$function$;
+
+COMMENT ON FUNCTION public.refresh_league_standings(integer, integer, integer) IS
+    'Recompute league_standings for one (season, age group, division): all match types, both '
+    'include_test audiences.';
+
+
+-- Rebuild every scope. Used for the backfill below, and by anyone who needs to
+-- resync by hand (e.g. legacy status-less matches whose date has since passed).
+CREATE OR REPLACE FUNCTION public.refresh_all_league_standings()
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+DECLARE
+    scope record;
+    refreshed integer := 0;
+BEGIN
+    DELETE FROM public.league_standings WHERE true;
+    FOR scope IN
+        SELECT DISTINCT season_id, age_group_id, division_id
+        FROM public.matches
+        WHERE division_id IS NOT NULL
+    LOOP
+        PERFORM public.refresh_league_standings(scope.season_id, scope.age_group_id, scope.division_id);
+        refreshed := refreshed + 1;
+    END LOOP;
+    RETURN refreshed;
+END;
+$function$;
+
+
+-- matches: statement-level, so a bulk import refreshes each scope once rather
+-- than once per row. Transition tables cannot be combined with multiple events
+-- or UPDATE OF column lists, hence three triggers sharing one function, and the
+-- column filter done by hand for UPDATE: live-clock writes (kickoff_time,
+-- halftime_start, ...) and scraper bookkeeping do not touch a table.
+CREATE OR REPLACE FUNCTION public.league_standings_on_matches()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+DECLARE
+    scope record;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        FOR scope IN
+            SELECT DISTINCT season_id, age_group_id, division_id FROM new_rows
+        LOOP
+            PERFORM public.refresh_league_standings(scope.season_id, scope.age_group_id, scope.division_id);
+        END LOOP;
+    ELSIF TG_OP = 'DELETE' THEN
+        FOR scope IN
+            SELECT DISTINCT season_id, age_group_id, division_id FROM old_rows
+        LOOP
+            PERFORM public.refresh_league_standings(scope.season_id, scope.age_group_id, scope.division_id);
+        END LOOP;
+    ELSE
+        FOR scope IN
+            WITH changed AS (
+                SELECT o.id
+                FROM old_rows o
+                JOIN new_rows n ON n.id = o.id
+                WHERE (o.home_score, o.away_score, o.match_status, o.match_date, o.match_type_id,
+                       o.home_team_id, o.away_team_id, o.season_id, o.age_group_id, o.division_id,
+                       o.tournament_id)
+                      IS DISTINCT FROM
+                      (n.home_score, n.away_score, n.match_status, n.match_date, n.match_type_id,
+                       n.home_team_id, n.away_team_id, n.season_id, n.age_group_id, n.division_id,
+                       n.tournament_id)
+            )
+            SELECT season_id, age_group_id, division_id FROM old_rows WHERE id IN (SELECT id FROM changed)
+            UNION
+            SELECT season_id, age_group_id, division_id FROM new_rows WHERE id IN (SELECT id FROM changed)
+        LOOP
+            PERFORM public.refresh_league_standings(scope.season_id, scope.age_group_id, scope.division_id);
+        END LOOP;
+    END IF;
+    RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER league_standings_matches_insert
+    AFTER INSERT ON public.matches
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.league_standings_on_matches();
+
+CREATE TRIGGER league_standings_matches_update
+    AFTER UPDATE ON public.matches
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.league_standings_on_matches();
+
+CREATE TRIGGER league_standings_matches_delete
+    AFTER DELETE ON public.matches
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.league_standings_on_matches();
+
+
+-- The other inputs of a table: which division a team is in (the same-division
+-- filter) and every path of the SB-591 is_test rule, including a division
+-- moving to another league. Each is an admin edit, so
+-- row-level triggers that refresh the scopes of the affected matches are fine.
+CREATE OR REPLACE FUNCTION public.league_standings_on_reference_change()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+DECLARE
+    scope record;
+BEGIN
+    FOR scope IN
+        SELECT DISTINCT m.season_id, m.age_group_id, m.division_id
+        FROM public.matches m
+        LEFT JOIN public.teams ht ON ht.id = m.home_team_id
+        LEFT JOIN public.teams at ON at.id = m.away_team_id
+        LEFT JOIN public.divisions d ON d.id = m.division_id
+        WHERE m.division_id IS NOT NULL
+          AND CASE TG_TABLE_NAME
+                WHEN 'divisions' THEN NEW.id = m.division_id
+                WHEN 'teams' THEN NEW.id IN (m.home_team_id, m.away_team_id)
+                WHEN 'clubs' THEN NEW.id IN (ht.club_id, at.club_id)
+                WHEN 'leagues' THEN NEW.id IN (d.league_id, ht.league_id, at.league_id)
+                WHEN 'tournaments' THEN NEW.id = m.tournament_id
+              END
+    LOOP
+        PERFORM public.refresh_league_standings(scope.season_id, scope.age_group_id, scope.division_id);
+    END LOOP;
+    RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER league_standings_teams_update
+    AFTER UPDATE OF division_id, club_id, league_id ON public.teams
+    FOR EACH ROW
+    WHEN ((OLD.division_id, OLD.club_id, OLD.league_id) IS DISTINCT FROM (NEW.division_id, NEW.club_id, NEW.league_id))
+    EXECUTE FUNCTION public.league_standings_on_reference_change();
+
+CREATE TRIGGER league_standings_divisions_league
+    AFTER UPDATE OF league_id ON public.divisions
+    FOR EACH ROW WHEN (OLD.league_id IS DISTINCT FROM NEW.league_id)
+    EXECUTE FUNCTION public.league_standings_on_reference_change();
+
+CREATE TRIGGER league_standings_clubs_is_test
+    AFTER UPDATE OF is_test ON public.clubs
+    FOR EACH ROW WHEN (OLD.is_test IS DISTINCT FROM NEW.is_test)
+    EXECUTE FUNCTION public.league_standings_on_reference_change();
+
+CREATE TRIGGER league_standings_leagues_is_test
+    AFTER UPDATE OF is_test ON public.leagues
+    FOR EACH ROW WHEN (OLD.is_test IS DISTINCT FROM NEW.is_test)
+    EXECUTE FUNCTION public.league_standings_on_reference_change();
+
+CREATE TRIGGER league_standings_tournaments_is_test
+    AFTER UPDATE OF is_test ON public.tournaments
+    FOR EACH ROW WHEN (OLD.is_test IS DISTINCT FROM NEW.is_test)
+    EXECUTE FUNCTION public.league_standings_on_reference_change();
+
+
+-- Only the triggers and the service role run the refresh functions.
+REVOKE EXECUTE ON FUNCTION public.refresh_league_standings(integer, integer, integer) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.refresh_all_league_standings() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.refresh_league_standings(integer, integer, integer) TO service_role;
+GRANT EXECUTE ON FUNCTION public.refresh_all_league_standings() TO service_role;
+
+-- Backfill
+SELECT public.refresh_all_league_standings();
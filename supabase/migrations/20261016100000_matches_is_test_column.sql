@@ -0,0 +1,272 @@
+-- Denormalised matches.is_test, maintained by triggers (SB-591 follow-up)
+--
+-- Phase 2 (20260810000000_is_test_partition_phase2_matches.sql) derived is_test
+-- in the matches_with_test view, joining divisions, leagues, tournaments, both
+-- teams, both clubs and both teams' leagues on every read. Every hot match read
+-- (standings, live, leaderboards, tournaments) goes through that view, so all of
+-- them pay the nine joins just to filter on one boolean.
+--
+-- That migration named the alternative and its risk: a column on matches kept
+-- by triggers over five tables, which "drifts silently the moment one is
+-- missed". This migration takes the column and addresses the risk twice:
+--
+--   * the rule lives in one function, derive_match_is_test(), used by a BEFORE
+--     trigger on matches and by the fan-out triggers on every input table;
+--   * matches_is_test_derived keeps the original view's join verbatim, and
+--     matches_is_test_drift() diffs the column against it. The daily job
+--     scripts/check_is_test_drift.py fails when they disagree.
+--
+-- matches_with_test keeps its name and columns, so no read path changes; it is
+-- now a plain pass-through of public.matches, which the planner inlines.
+
+ALTER TABLE public.matches
+    ADD COLUMN IF NOT EXISTS is_test boolean NOT NULL DEFAULT false;
+
+COMMENT ON COLUMN public.matches.is_test IS
+    'Test content (SB-591): the match''s league, tournament, either club or either team''s league is '
+    'is_test. Maintained by triggers from derive_match_is_test(); not writable directly.';
+
+-- The test set is small; mirror the Phase 1 partial-index convention.
+CREATE INDEX IF NOT EXISTS idx_matches_is_test
+    ON public.matches (id) WHERE is_test;
+
+
+-- The SB-591 derivation rule, for one match's foreign keys.
+CREATE OR REPLACE FUNCTION public.derive_match_is_test(
+    p_division_id integer,
+    p_tournament_id integer,
+    p_home_team_id integer,
+    p_away_team_id integer
+)
+RETURNS boolean
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $function$
+    SELECT
+        COALESCE(l.is_test,  false)   -- division -> league
+     OR COALESCE(tr.is_test, false)   -- tournament
+     OR COALESCE(hc.is_test, false)   -- home team -> club
+     OR COALESCE(ac.is_test, false)   -- away team -> club
+     OR COALESCE(hl.is_test, false)   -- home team -> league
+     OR COALESCE(al.is_test, false)   -- away team -> league
+    FROM (SELECT 1) AS one
+    LEFT JOIN public.divisions   d  ON d.id  = p_division_id
+    LEFT JOIN public.leagues     l  ON l.id  = d.league_id
+    LEFT JOIN public.tournaments tr ON tr.id = p_tournament_id
+    LEFT JOIN public.teams       ht ON ht.id = p_home_team_id
+    LEFT JOIN public.clubs       hc ON hc.id = ht.club_id
+    LEFT JOIN public.leagues     hl ON hl.id = ht.league_id
+    LEFT JOIN public.teams       at ON at.id = p_away_team_id
+    LEFT JOIN public.clubs       ac ON ac.id = at.club_id
+    LEFT JOIN public.leagues     al ON al.id = at.league_id;
+$function$;
+
+
+-- Backfill before the triggers exist, in one statement.
+UPDATE public.matches m
+SET is_test = true
+WHERE public.derive_match_is_test(m.division_id, m.tournament_id, m.home_team_id, m.away_team_id);
+
+
+-- matches: derive on every insert and on any change to an input column. is_test
+-- is in the column list so a direct write to it is overridden, not stored.
+CREATE OR REPLACE FUNCTION public.matches_set_is_test()
+RETURNS trigger
+LANGUAGE plpgsql
+SET search_path = public
+AS $function$
+BEGIN
+    NEW.is_test := public.derive_match_is_test(NEW.division_id, NEW.tournament_id, NEW.home_team_id, NEW.away_team_id);
+    RETURN NEW;
+END;
+$function$;
+
+CREATE TRIGGER matches_set_is_test
+    BEFORE INSERT OR UPDATE OF division_id, tournament_id, home_team_id, away_team_id, is_test
+    ON public.matches
+    FOR EACH ROW EXECUTE FUNCTION public.matches_set_is_test();
+
+
+-- Fan-out: a change to any other input re-derives the matches it reaches,
+-- touching only rows whose flag actually changes.
+CREATE OR REPLACE FUNCTION public.matches_is_test_on_reference_change()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+BEGIN
+    UPDATE public.matches m
+    SET is_test = public.derive_match_is_test(m.division_id, m.tournament_id, m.home_team_id, m.away_team_id)
+    WHERE m.is_test IS DISTINCT FROM
+          public.derive_match_is_test(m.division_id, m.tournament_id, m.home_team_id, m.away_team_id)
+      AND CASE TG_TABLE_NAME
+            WHEN 'teams' THEN NEW.id IN (m.home_team_id, m.away_team_id)
+            WHEN 'clubs' THEN EXISTS (
+                SELECT 1 FROM public.teams t
+                WHERE t.club_id = NEW.id AND t.id IN (m.home_team_id, m.away_team_id))
+            WHEN 'divisions' THEN m.division_id = NEW.id
+            WHEN 'tournaments' THEN m.tournament_id = NEW.id
+            WHEN 'leagues' THEN
+                EXISTS (SELECT 1 FROM public.divisions d WHERE d.league_id = NEW.id AND d.id = m.division_id)
+                OR EXISTS (
+                    SELECT 1 FROM public.teams t
+                    WHERE t.league_id = NEW.id AND t.id IN (m.home_team_id, m.away_team_id))
+          END;
+    RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER matches_is_test_teams
+    AFTER UPDATE OF club_id, league_id ON public.teams
+    FOR EACH ROW WHEN ((OLD.club_id, OLD.league_id) IS DISTINCT FROM (NEW.club_id, NEW.league_id))
+    EXECUTE FUNCTION public.matches_is_test_on_reference_change();
+
+CREATE TRIGGER matches_is_test_divisions
+    AFTER UPDATE OF league_id ON public.divisions
+    FOR EACH ROW WHEN (OLD.league_id IS DISTINCT FROM NEW.league_id)
+    EXECUTE FUNCTION public.matches_is_test_on_reference_change();
+
+CREATE TRIGGER matches_is_test_clubs
+    AFTER UPDATE OF is_test ON public.clubs
+    FOR EACH ROW WHEN (OLD.is_test IS DISTINCT FROM NEW.is_test)
+    EXECUTE FUNCTION public.matches_is_test_on_reference_change();
+
+CREATE TRIGGER matches_is_test_leagues
+    AFTER UPDATE OF is_test ON public.leagues
+    FOR EACH ROW WHEN (OLD.is_test IS DISTINCT FROM NEW.is_test)
+    EXECUTE FUNCTION public.matches_is_test_on_reference_change();
+
+CREATE TRIGGER matches_is_test_tournaments
+    AFTER UPDATE OF is_test ON public.tournaments
+    FOR EACH ROW WHEN (OLD.is_test IS DISTINCT FROM NEW.is_test)
+    EXECUTE FUNCTION public.matches_is_test_on_reference_change();
+
+
+-- matches_with_test: same name, matches.* now carries is_test itself, no joins.
+-- Dropped and recreated because a view's * is expanded when it is created.
+DROP VIEW public.matches_with_test;
+
+CREATE VIEW public.matches_with_test
+WITH (security_invoker = true)
+AS
+SELECT m.* FROM public.matches m;
+
+COMMENT ON VIEW public.matches_with_test IS
+    'public.matches, including the trigger-maintained is_test flag (SB-591). Read path only; write to '
+    'public.matches. Non-test, non-admin viewers must filter is_test = false.';
+
+GRANT SELECT ON public.matches_with_test TO anon, authenticated, service_role;
+
+
+-- The original Phase 2 derivation, kept verbatim as the reference the column is
+-- checked against. Not for hot reads.
+CREATE VIEW public.matches_is_test_derived
+WITH (security_invoker = true)
+AS
+SELECT
+    m.id,
+    (
+        COALESCE(l.is_test,  false)   -- division -> league
+     OR COALESCE(tr.is_test, false)   -- tournament
+     OR COALESCE(hc.is_test, false)   -- home team -> club
+     OR COALESCE(ac.is_test, false)   -- away team -> club
+     OR COALESCE(hl.is_test, false)   -- home team -> league
+     OR COALESCE(al.is_test, false)   -- away team -> league
+    ) AS is_test
+FROM public.matches m
+LEFT JOIN public.divisions   d  ON d.id  = m.division_id
+LEFT JOIN public.leagues     l  ON l.id  = d.league_id
+LEFT JOIN public.tournaments tr ON tr.id = m.tournament_id
+LEFT JOIN public.teams       ht ON ht.id = m.home_team_id
+LEFT JOIN public.clubs       hc ON hc.id = ht.club_id
+LEFT JOIN public.leagues     hl ON hl.id = ht.league_id
+LEFT JOIN public.teams       at ON at.id = m.away_team_id
+LEFT JOIN public.clubs       ac ON ac.id = at.club_id
+LEFT JOIN public.leagues     al ON al.id = at.league_id;
+
+COMMENT ON VIEW public.matches_is_test_derived IS
+    'Reference SB-591 is_test derivation (the Phase 2 view join). Compared against matches.is_test by '
+    'matches_is_test_drift().';
+
+-- Matches whose stored flag disagrees with the reference derivation.
+CREATE OR REPLACE FUNCTION public.matches_is_test_drift()
+RETURNS TABLE(match_id integer, stored boolean, derived boolean)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $function$
+    SELECT m.id, m.is_test, d.is_test
+    FROM public.matches m
+    JOIN public.matches_is_test_derived d ON d.id = m.id
+    WHERE m.is_test IS DISTINCT FROM d.is_test
+    ORDER BY m.id;
+$function$;
+
+REVOKE ALL ON public.matches_is_test_derived FROM anon, authenticated;
+GRANT SELECT ON public.matches_is_test_derived TO service_role;
+REVOKE EXECUTE ON FUNCTION public.matches_is_test_drift() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.matches_is_test_drift() TO service_role;
+
+
+-- league_standings (20261016000000): is_test is now a matches column, so a flip
+-- arrives as an UPDATE on matches. Add it to the columns that refresh a scope,
+-- and drop the reference triggers the fan-out above now covers. The team
+-- division trigger stays: division membership is not an is_test input.
+CREATE OR REPLACE FUNCTION public.league_standings_on_matches()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+DECLARE
+    scope record;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        FOR scope IN
+            SELECT DISTINCT season_id, age_group_id, division_id FROM new_rows
+        LOOP
+            PERFORM public.refresh_league_standings(scope.season_id, scope.age_group_id, scope.division_id);
+        END LOOP;
+    ELSIF TG_OP = 'DELETE' THEN
+        FOR scope IN
+            SELECT DISTINCT season_id, age_group_id, division_id FROM old_rows
+        LOOP
+            PERFORM public.refresh_league_standings(scope.season_id, scope.age_group_id, scope.division_id);
+        END LOOP;
+    ELSE
+        FOR scope IN
+            WITH changed AS (
+                SELECT o.id
+                FROM old_rows o
+                JOIN new_rows n ON n.id = o.id
+                WHERE (o.home_score, o.away_score, o.match_status, o.match_date, o.match_type_id,
+                       o.home_team_id, o.away_team_id, o.season_id, o.age_group_id, o.division_id,
+                       o.tournament_id, o.is_test)
+                      IS DISTINCT FROM
+                      (n.home_score, n.away_score, n.match_status, n.match_date, n.match_type_id,
+                       n.home_team_id, n.away_team_id, n.season_id, n.age_group_id, n.division_id,
+                       n.tournament_id, n.is_test)
+            )
+            SELECT season_id, age_group_id, division_id FROM old_rows WHERE id IN (SELECT id FROM changed)
+            UNION
+            SELECT season_id, age_group_id, division_id FROM new_rows WHERE id IN (SELECT id FROM changed)
+        LOOP
+            PERFORM public.refresh_league_standings(scope.season_id, scope.age_group_id, scope.division_id);
+        END LOOP;
+    END IF;
+    RETURN NULL;
+END;
+$function$;
+
+DROP TRIGGER IF EXISTS league_standings_divisions_league ON public.divisions;
+DROP TRIGGER IF EXISTS league_standings_clubs_is_test ON public.clubs;
+DROP TRIGGER IF EXISTS league_standings_leagues_is_test ON public.leagues;
+DROP TRIGGER IF EXISTS league_standings_tournaments_is_test ON public.tournaments;
+DROP TRIGGER IF EXISTS league_standings_teams_update ON public.teams;
+
+CREATE TRIGGER league_standings_teams_division
+    AFTER UPDATE OF division_id ON public.teams
+    FOR EACH ROW WHEN (OLD.division_id IS DISTINCT FROM NEW.division_id)
+    EXECUTE FUNCTION public.league_standings_on_reference_change();
@@ -0,0 +1,106 @@
+-- Server-side match summary for the scraper agent (get_match_summary)
+--
+-- /api/agent/match-summary tells the match-scraper-agent what MT already has
+-- for a season: per (age group, league, division), the match totals, counts by
+-- status, how many past matches still need a score, how many upcoming matches
+-- need a kickoff time, and the date range. MatchDAO.get_match_summary() built it
+-- by paging the whole season through matches_with_test 1000 rows at a time, with
+-- age groups, divisions and leagues embedded, then grouping in Python. The agent
+-- calls it repeatedly and the season keeps growing, so every call moves the whole
+-- season over the wire to return a few dozen rows.
+--
+-- This function returns those rows directly. Semantics mirror the Python path,
+-- which stays as the fallback while this migration is not deployed:
+--
+--   * matches of the named season with match_status <> 'cancelled', gated on
+--     is_test unless p_include_test (SB-591)
+--   * needs_score: before p_today, status scheduled/tbd, no home score, and
+--     within [p_score_from, p_score_to] when those are given
+--   * needs_kickoff: status scheduled/tbd, between p_today and p_today + 14
+--     days, no scheduled_kickoff
+--   * last_played_date: latest completed/forfeit match date
+--
+-- p_today is passed by the caller so "today" is the API's date, not the
+-- database server's.
+
+CREATE OR REPLACE FUNCTION public.get_match_summary(
+    p_season_name text,
+    p_today date DEFAULT CURRENT_DATE,
+    p_score_from date DEFAULT NULL,
+    p_score_to date DEFAULT NULL,
+    p_include_test boolean DEFAULT false
+)
+RETURNS TABLE(
+    age_group text,
+    league text,
+    division text,
+    total bigint,
+    by_status jsonb,
+    needs_score bigint,
+    needs_kickoff bigint,
+    earliest date,
+    latest date,
+    last_played_date date
+)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $function$
+    WITH season_matches AS (
+        SELECT
+            COALESCE(ag.name::text, 'Unknown') AS age_group,
+            COALESCE(l.name::text, 'Unknown') AS league,
+            COALESCE(d.name::text, 'Unknown') AS division,
+            m.match_date,
+            m.match_status,
+            m.home_score,
+            m.scheduled_kickoff
+        FROM public.matches_with_test m
+        LEFT JOIN public.age_groups ag ON ag.id = m.age_group_id
+        LEFT JOIN public.divisions  d  ON d.id  = m.division_id
+        LEFT JOIN public.leagues    l  ON l.id  = d.league_id
+        WHERE m.season_id = (SELECT s.id FROM public.seasons s WHERE s.name = p_season_name LIMIT 1)
+          AND m.match_status <> 'cancelled'
+          AND (p_include_test OR NOT m.is_test)
+    ),
+    status_counts AS (
+        SELECT sc.age_group, sc.league, sc.division, jsonb_object_agg(sc.match_status, sc.n) AS by_status
+        FROM (
+            SELECT sm.age_group, sm.league, sm.division, sm.match_status, count(*) AS n
+            FROM season_matches sm
+            GROUP BY sm.age_group, sm.league, sm.division, sm.match_status
+        ) sc
+        GROUP BY sc.age_group, sc.league, sc.division
+    )
+    SELECT
+        sm.age_group,
+        sm.league,
+        sm.division,
+        count(*) AS total,
+        sc.by_status,
+        count(*) FILTER (
+            WHERE sm.match_date < p_today
+              AND sm.match_status IN ('scheduled', 'tbd')
+              AND sm.home_score IS NULL
+              AND (p_score_from IS NULL OR sm.match_date >= p_score_from)
+              AND (p_score_to IS NULL OR sm.match_date <= p_score_to)
+        ) AS needs_score,
+        count(*) FILTER (
+            WHERE sm.match_status IN ('scheduled', 'tbd')
+              AND sm.match_date BETWEEN p_today AND p_today + 14
+              AND sm.scheduled_kickoff IS NULL
+        ) AS needs_kickoff,
+        min(sm.match_date) AS earliest,
+        max(sm.match_date) AS latest,
+        max(sm.match_date) FILTER (WHERE sm.match_status IN ('completed', 'forfeit')) AS last_played_date
+    FROM season_matches sm
+    JOIN status_counts sc USING (age_group, league, division)
+    GROUP BY sm.age_group, sm.league, sm.division, sc.by_status;
+$function$;
+
+COMMENT ON FUNCTION public.get_match_summary(text, date, date, date, boolean) IS
+    'Per (age group, league, division) match counts for one season, for the match-scraper-agent '
+    '(/api/agent/match-summary). Mirrors MatchDAO.get_match_summary().';
+
+REVOKE EXECUTE ON FUNCTION public.get_match_summary(text, date, date, date, boolean) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.get_match_summary(text, date, date, date, boolean) TO authenticated, service_role;